@@ -6,10 +6,9 @@ import contextlib
 import functools
 import io
 import platform
-import re
 import sys
 from datetime import timedelta
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from grpclib.exceptions import GRPCError, StreamTerminatedError
 from rich.console import Console, Group, RenderableType
@@ -101,21 +100,29 @@ def download_progress_bar() -> Progress:
 class LineBufferedOutput(io.StringIO):
     """Output stream that buffers lines and passes them to a callback."""
 
-    LINE_REGEX = re.compile("(\r\n|\r|\n)")
-
     def __init__(self, callback: Callable[[str], None]):
         self._callback = callback
-        self._buf = ""
+        # Pending chunks of the current line, joined only once a line terminator arrives so that
+        # many small writes don't repeatedly copy the buffer.
+        self._buf: List[str] = []
 
     def write(self, data: str):
-        chunks = self.LINE_REGEX.split(self._buf + data)
-
-        # re.split("(<exp>)") returns the matched groups, and also the separators.
-        # e.g. re.split("(+)", "a+b") returns ["a", "+", "b"].
-        # This means that chunks is guaranteed to be odd in length.
-
-        completed_lines = "".join(chunks[:-1])
-        remainder = chunks[-1]
+        # Everything up to and including the last line terminator ("\r\n", "\r" or "\n") is
+        # completed output, the rest is kept in the buffer.
+        end = max(data.rfind("\n"), data.rfind("\r")) + 1
+        buf = self._buf
+        if not end:
+            if data:
+                buf.append(data)
+            return
+
+        if buf:
+            buf.append(data[:end])
+            completed_lines = "".join(buf)
+        else:
+            # Common case of whole lines being written with nothing pending, no need to join
+            completed_lines = data[:end]
+        remainder = data[end:]
 
         # Partially completed lines end with a carriage return. Append a newline so that they
         # are not overwritten by the `rich.Live` and prefix the inverse operation to the remaining
@@ -127,15 +134,15 @@ class LineBufferedOutput(io.StringIO):
             remainder = "\x1b[1A\r" + remainder
 
         self._callback(completed_lines)
-        self._buf = remainder
+        self._buf = [remainder] if remainder else []
 
     def flush(self):
         pass
 
     def finalize(self):
         if self._buf:
-            self._callback(self._buf)
-            self._buf = ""
+            self._callback("".join(self._buf))
+            self._buf = []
 
 
 class OutputManager:
@@ -243,7 +243,8 @@ async def queue_batch_iterator(q: asyncio.Queue, max_batch_size=100, debounce_ti
             item_list = []
             await asyncio.sleep(debounce_time)
 
-        res = await q.get()
+        # don't go through the awaitable get() for items that are already queued
+        res = await q.get() if q.empty() else q.get_nowait()
 
         if len(item_list) >= max_batch_size:
             yield item_list
@@ -278,8 +278,8 @@ async def blob_upload(payload: bytes, stub) -> str:
     return await _blob_upload(upload_hashes, payload, stub)
 
 
-async def blob_upload_file(file_obj: BinaryIO, stub) -> str:
-    upload_hashes = get_upload_hashes(file_obj)
+async def blob_upload_file(file_obj: BinaryIO, stub, sha256_hex: Optional[str] = None) -> str:
+    upload_hashes = get_upload_hashes(file_obj, sha256_hex)
     return await _blob_upload(upload_hashes, file_obj, stub)
 
 
@@ -2,9 +2,11 @@
 import base64
 import dataclasses
 import hashlib
-from typing import BinaryIO, Callable, List, Union
+from typing import BinaryIO, Callable, List, Optional, Union
 
-HASH_CHUNK_SIZE = 4096
+# hashlib's OpenSSL backend (SHA-NI/AVX2 where available) is fast enough that small reads make
+# per-chunk Python overhead dominate, so hash file objects in large chunks.
+HASH_CHUNK_SIZE = 1024 * 1024  # 1 MiB
 
 
 def _update(hashers: List[Callable[[bytes], None]], data: Union[bytes, BinaryIO]) -> None:
@@ -14,10 +16,11 @@ def _update(hashers: List[Callable[[bytes], None]], data: Union[bytes, BinaryIO]
     else:
         assert not isinstance(data, (bytearray, memoryview))  # https://github.com/microsoft/pyright/issues/5697
         pos = data.tell()
+        empty = data.read(0)
+        if not isinstance(empty, bytes):
+            raise ValueError(f"Only accepts bytes or byte buffer objects, not {type(empty)} buffers")
         while True:
             chunk = data.read(HASH_CHUNK_SIZE)
-            if not isinstance(chunk, bytes):
-                raise ValueError(f"Only accepts bytes or byte buffer objects, not {type(chunk)} buffers")
             if not chunk:
                 break
             for hasher in hashers:
@@ -49,11 +52,17 @@ class UploadHashes:
     sha256_base64: str
 
 
-def get_upload_hashes(data: Union[bytes, BinaryIO]) -> UploadHashes:
+def get_upload_hashes(data: Union[bytes, BinaryIO], sha256_hex: Optional[str] = None) -> UploadHashes:
     md5 = hashlib.md5()
-    sha256 = hashlib.sha256()
-    _update([md5.update, sha256.update], data)
+    if sha256_hex is None:
+        sha256 = hashlib.sha256()
+        _update([md5.update, sha256.update], data)
+        sha256_digest = sha256.digest()
+    else:
+        # sha256 is already known (e.g. from computing a mount file spec), so only read the data for md5
+        _update([md5.update], data)
+        sha256_digest = bytes.fromhex(sha256_hex)
     return UploadHashes(
         md5_base64=base64.b64encode(md5.digest()).decode("ascii"),
-        sha256_base64=base64.b64encode(sha256.digest()).decode("ascii"),
+        sha256_base64=base64.b64encode(sha256_digest).decode("ascii"),
     )
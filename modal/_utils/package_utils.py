@@ -1,32 +1,31 @@
 # Copyright Modal Labs 2022
+import functools
 import importlib
 import importlib.util
 import typing
-from importlib.metadata import PackageNotFoundError, files
 from pathlib import Path
 
 from ..exception import ModuleNotMountable
 
 
-def get_file_formats(module):
+@functools.lru_cache(maxsize=None)  # installed file lists don't change during the lifetime of the process
+def get_file_formats(module) -> typing.FrozenSet[str]:
+    from importlib.metadata import PackageNotFoundError, files  # deferred, only needed for package mounts
+
     try:
         module_files = files(module)
-        if not module_files:
-            return []
-
-        endings = [str(p).split(".")[-1] for p in module_files if "." in str(p)]
-        return list(set(endings))
     except PackageNotFoundError:
-        return []
+        return frozenset()
+    return frozenset(p.suffix[1:] for p in module_files or () if p.suffix)
 
 
-BINARY_FORMATS = ["so", "S", "s", "asm"]  # TODO
+BINARY_FORMATS = frozenset(["so", "S", "s", "asm"])  # TODO
 
 
 def get_module_mount_info(module_name: str) -> typing.Sequence[typing.Tuple[bool, Path]]:
     """Returns a list of tuples [(is_dir, path)] describing how to mount a given module."""
     file_formats = get_file_formats(module_name)
-    if set(BINARY_FORMATS) & set(file_formats):
+    if not BINARY_FORMATS.isdisjoint(file_formats):
         raise ModuleNotMountable(f"{module_name} can't be mounted because it contains binary file(s).")
     try:
         spec = importlib.util.find_spec(module_name)
@@ -31,14 +31,13 @@ class ImportRef:
 
 
 def parse_import_ref(object_ref: str) -> ImportRef:
-    if object_ref.find("::") > 1:
-        file_or_module, object_path = object_ref.split("::", 1)
+    file_or_module, sep, object_path = object_ref.partition("::")
+    if sep and len(file_or_module) > 1:
+        return ImportRef(file_or_module, object_path)
     elif object_ref.find(":") > 1:
         raise modal.exception.InvalidError(f"Invalid object reference: {object_ref}. Did you mean '::' instead of ':'?")
     else:
-        file_or_module, object_path = object_ref, None
-
-    return ImportRef(file_or_module, object_path)
+        return ImportRef(object_ref, None)
 
 
 DEFAULT_STUB_NAME = "stub"
@@ -55,7 +54,10 @@ def import_file_or_module(file_or_module: str):
     if file_or_module.endswith(".py"):
         # when using a script path, that scripts directory should also be on the path as it is with `python some/script.py`
         full_path = Path(file_or_module).resolve()
-        sys.path.insert(0, str(full_path.parent))
+        script_dir = str(full_path.parent)
+        if not sys.path or sys.path[0] != script_dir:
+            # avoid piling up duplicate entries (and slower imports) when importing the same script repeatedly
+            sys.path.insert(0, script_dir)
 
         module_name = inspect.getmodulename(file_or_module)
         # Import the module - see https://docs.python.org/3/library/importlib.html#importing-a-source-file-directly
@@ -7,6 +7,7 @@ from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
 import grpclib.client
 from aiohttp import ClientConnectorError, ClientResponseError
 from google.protobuf import empty_pb2
+from google.protobuf.internal import api_implementation
 from grpclib import GRPCError, Status
 from synchronicity.async_wrap import asynccontextmanager
 
@@ -141,7 +142,9 @@ class _Client:
 
     async def _init(self):
         """Connect to server and retrieve version information; raise appropriate error for various failures."""
-        logger.debug("Client: Starting")
+        # Message construction and parsing is much slower with the pure-python protobuf backend
+        # (e.g. if PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python is set), so note which one is in use.
+        logger.debug(f"Client: Starting (protobuf implementation: {api_implementation.Type()})")
         _check_config()
         try:
             req = empty_pb2.Empty()
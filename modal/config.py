@@ -58,6 +58,10 @@ Other possible configuration options are:
 * `traceback` (in the .toml file) / `MODAL_TRACEBACK` (as an env var).
   Defaults to False. Enables printing full tracebacks on unexpected CLI
   errors, which can be useful for debugging client issues.
+* `uvloop` (in the .toml file) / `MODAL_UVLOOP` (as an env var).
+  Defaults to False. Uses `uvloop` as the asyncio event loop if it's
+  installed, which can speed up clients that make many concurrent calls
+  (e.g. large `.map()`s). Note that this sets the global event loop policy.
 
 Meta-configuration
 ------------------
@@ -70,6 +74,7 @@ Some "meta-options" are set using environment variables only:
   and switch between them. It defaults to "default".
 """
 
+import asyncio
 import logging
 import os
 import typing
@@ -202,6 +207,8 @@ _SETTINGS = {
     "force_build": _Setting(False, transform=lambda x: x not in ("", "0")),
     "traceback": _Setting(False, transform=lambda x: x not in ("", "0")),
     "image_builder_version": _Setting(),
+    # Parsed strictly since it changes the process-wide event loop policy: toml `false` must mean off
+    "uvloop": _Setting(False, transform=lambda x: x is True or (isinstance(x, str) and x.lower() in ("1", "true"))),
 }
 
 
@@ -259,6 +266,16 @@ config = Config()
 logger = logging.getLogger("modal-client")
 configure_logger(logger, config["loglevel"], config["log_format"])
 
+# Event loop
+
+if config["uvloop"]:
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("uvloop is enabled in the config but not installed, using the default event loop instead")
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 # Utils to write config
 
 
@@ -1,5 +1,6 @@
 # Copyright Modal Labs 2023
 import asyncio
+import collections
 import inspect
 import time
 import warnings
@@ -14,6 +15,7 @@ from typing import (
     AsyncIterator,
     Callable,
     Collection,
+    Deque,
     Dict,
     List,
     Literal,
@@ -156,6 +158,10 @@ async def _process_result(result: api_pb2.GenericResult, data_format: int, stub,
         )
 
 
+# Calls without any arguments are common (e.g. `f.remote()`), so only pickle their payload once
+_EMPTY_ARGS_SERIALIZED = serialize(((), {}))
+
+
 async def _create_input(args, kwargs, client, idx: Optional[int] = None) -> api_pb2.FunctionPutInputsItem:
     """Serialize function arguments and create a FunctionInput protobuf,
     uploading to blob storage if needed.
@@ -163,7 +169,10 @@ async def _create_input(args, kwargs, client, idx: Optional[int] = None) -> api_
     if idx is None:
         idx = 0
 
-    args_serialized = serialize((args, kwargs))
+    if args == () and not kwargs:
+        args_serialized = _EMPTY_ARGS_SERIALIZED
+    else:
+        args_serialized = serialize((args, kwargs))
 
     if len(args_serialized) > MAX_OBJECT_SIZE_BYTES:
         args_blob_id = await blob_upload(args_serialized, client.stub)
@@ -263,8 +272,8 @@ class _Invocation:
 
     async def pop_function_call_outputs(
         self, timeout: Optional[float], clear_on_success: bool
-    ) -> AsyncIterator[api_pb2.FunctionGetOutputsItem]:
-        t0 = time.time()
+    ) -> List[api_pb2.FunctionGetOutputsItem]:
+        deadline = time.monotonic() + timeout if timeout is not None else None
         if timeout is None:
             backend_timeout = OUTPUTS_TIMEOUT
         else:
@@ -284,20 +293,18 @@ class _Invocation:
                 attempt_timeout=backend_timeout + ATTEMPT_TIMEOUT_GRACE_PERIOD,
             )
             if len(response.outputs) > 0:
-                for item in response.outputs:
-                    yield item
-                return
+                return list(response.outputs)
 
-            if timeout is not None:
+            if deadline is not None:
                 # update timeout in retry loop
-                backend_timeout = min(OUTPUTS_TIMEOUT, t0 + timeout - time.time())
+                backend_timeout = min(OUTPUTS_TIMEOUT, deadline - time.monotonic())
                 if backend_timeout < 0:
-                    break
+                    return []
 
     async def run_function(self) -> Any:
         # waits indefinitely for a single result for the function, and clear the outputs buffer after
         item: api_pb2.FunctionGetOutputsItem = (
-            await stream.list(self.pop_function_call_outputs(timeout=None, clear_on_success=True))
+            await self.pop_function_call_outputs(timeout=None, clear_on_success=True)
         )[0]
         assert not item.result.gen_status
         return await _process_result(item.result, item.data_format, self.stub, self.client)
@@ -308,8 +315,8 @@ class _Invocation:
         If timeout is `None`, waits indefinitely. This function is not
         cancellation-safe.
         """
-        items: List[api_pb2.FunctionGetOutputsItem] = await stream.list(
-            self.pop_function_call_outputs(timeout=timeout, clear_on_success=False)
+        items: List[api_pb2.FunctionGetOutputsItem] = await self.pop_function_call_outputs(
+            timeout=timeout, clear_on_success=False
         )
 
         if len(items) == 0:
@@ -337,6 +344,9 @@ class _Invocation:
 
 
 MAP_INVOCATION_CHUNK_SIZE = 49
+# Max number of serialized inputs buffered ahead of FunctionPutInputs calls, so that a fast input
+# iterator applies back-pressure instead of holding all of its serialized inputs in memory.
+MAP_INVOCATION_INPUT_BUFFER_SIZE = 2 * MAP_INVOCATION_CHUNK_SIZE
 
 
 async def _map_invocation(
@@ -365,7 +375,7 @@ async def _map_invocation(
     pending_outputs: Dict[str, int] = {}  # Map input_id -> next expected gen_index value
     completed_outputs: Set[str] = set()  # Set of input_ids whose outputs are complete (expecting no more values)
 
-    input_queue: asyncio.Queue = asyncio.Queue()
+    input_queue: asyncio.Queue = asyncio.Queue(maxsize=MAP_INVOCATION_INPUT_BUFFER_SIZE)
 
     async def create_input(arg: Any) -> api_pb2.FunctionPutInputsItem:
         nonlocal num_inputs
@@ -392,10 +402,11 @@ async def _map_invocation(
     async def pump_inputs():
         assert client.stub
         nonlocal have_all_inputs
+        # the request is reused across chunks, which is safe since each one is awaited before the next
+        request = api_pb2.FunctionPutInputsRequest(function_id=function_id, function_call_id=function_call_id)
         async for items in queue_batch_iterator(input_queue, MAP_INVOCATION_CHUNK_SIZE):
-            request = api_pb2.FunctionPutInputsRequest(
-                function_id=function_id, inputs=items, function_call_id=function_call_id
-            )
+            del request.inputs[:]
+            request.inputs.extend(items)
             logger.debug(
                 f"Pushing {len(items)} inputs to server. Num queued inputs awaiting push is {input_queue.qsize()}."
             )
@@ -474,10 +485,14 @@ async def _map_invocation(
 
     async def poll_outputs():
         outputs = stream.iterate(get_all_outputs_and_clean_up())
-        outputs_fetched = outputs | pipe.map(fetch_output, ordered=True, task_limit=BLOB_MAX_PARALLELISM)  # type: ignore
-
-        # map to store out-of-order outputs received
-        received_outputs = {}
+        # Results are fetched concurrently (e.g. blob downloads) and emitted as soon as they are done,
+        # since ordering by input index (if requested) is handled below using the returned idx.
+        outputs_fetched = outputs | pipe.map(fetch_output, ordered=False, task_limit=BLOB_MAX_PARALLELISM)  # type: ignore
+
+        # out-of-order outputs received, where received_outputs[i] is the output for input output_idx + i.
+        # A dense deque is much more compact than a dict keyed by idx when many outputs are held back.
+        MISSING = object()
+        received_outputs: Deque[Any] = collections.deque()
         output_idx = 0
 
         async with outputs_fetched.stream() as streamer:
@@ -486,12 +501,18 @@ async def _map_invocation(
                     count_update_callback(num_outputs, num_inputs)
                 if not order_outputs:
                     yield _OutputValue(output)
+                elif idx == output_idx and not received_outputs:
+                    # fast path: outputs arriving in order don't need to be buffered
+                    yield _OutputValue(output)
+                    output_idx += 1
                 else:
                     # hold on to outputs for function maps, so we can reorder them correctly.
-                    received_outputs[idx] = output
-                    while output_idx in received_outputs:
-                        output = received_outputs.pop(output_idx)
-                        yield _OutputValue(output)
+                    offset = idx - output_idx
+                    if offset >= len(received_outputs):
+                        received_outputs.extend([MISSING] * (offset + 1 - len(received_outputs)))
+                    received_outputs[offset] = output
+                    while received_outputs and received_outputs[0] is not MISSING:
+                        yield _OutputValue(received_outputs.popleft())
                         output_idx += 1
 
         assert len(received_outputs) == 0
@@ -4,6 +4,7 @@ import asyncio
 import concurrent.futures
 import dataclasses
 import os
+import platform
 import time
 import typing
 from pathlib import Path, PurePosixPath
@@ -27,6 +28,10 @@ from .object import _get_environment_name, _Object
 
 ROOT_DIR: PurePosixPath = PurePosixPath("/root")
 MOUNT_PUT_FILE_CLIENT_TIMEOUT = 10 * 60  # 10 min max for transferring files
+# DirEntry.inode() is served from the readdir buffer on POSIX, but needs an extra stat() call on Windows
+_SORT_BY_INODE = platform.system() != "Windows"
+# Hashing is a mix of disk I/O and GIL-releasing OpenSSL work, so oversubscribe the CPUs a bit
+MOUNT_HASH_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 # Supported releases and versions for python-build-standalone.
 #
@@ -80,11 +85,43 @@ class _MountEntry(metaclass=abc.ABCMeta):
         ...
 
 
+def _walk_files(path: str) -> typing.Iterator[str]:
+    # Equivalent to iterating os.walk(path) without building per-directory name lists. DirEntry caches
+    # the file type from the readdir call, so no extra stat() is needed per entry on most platforms.
+    try:
+        with os.scandir(path) as scandir_it:
+            entries = list(scandir_it)
+    except OSError:
+        return  # os.walk silently skips unreadable directories too
+
+    if _SORT_BY_INODE:
+        # Visiting entries in inode order roughly follows on-disk layout, which reduces seeks on
+        # spinning disks and some network file systems when the files are read for hashing later.
+        entries.sort(key=os.DirEntry.inode)
+
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            yield entry.path
+        elif not entry.is_symlink():
+            # like os.walk(followlinks=False), don't descend into symlinked directories
+            yield from _walk_files(entry.path)
+
+
+def _include_all(path: str) -> bool:
+    # Default condition for directory mounts, special-cased in _MountDir to skip the per-file call
+    return True
+
+
 def _select_files(entries: List[_MountEntry]) -> List[Tuple[Path, PurePosixPath]]:
     # TODO: make this async
-    all_files: typing.Set[Tuple[Path, PurePosixPath]] = set()
+    # Deduplicate with a dict rather than a set to keep the traversal order for reading files
+    all_files: typing.Dict[Tuple[Path, PurePosixPath], None] = {}
     for entry in entries:
-        all_files |= set(entry.get_files_to_upload())
+        all_files.update(dict.fromkeys(entry.get_files_to_upload()))
     return list(all_files)
 
 
@@ -132,14 +169,18 @@ class _MountDir(_MountEntry):
             raise NotADirectoryError(local_dir)
 
         if self.recursive:
-            gen = (os.path.join(root, name) for root, dirs, files in os.walk(local_dir) for name in files)
+            gen = _walk_files(str(local_dir))
         else:
             gen = (dir_entry.path for dir_entry in os.scandir(local_dir) if dir_entry.is_file())
 
+        # All yielded paths are `local_dir` joined with a relative path, so strip the prefix
+        # instead of constructing and resolving a Path object for every matching file.
+        prefix_len = len(os.path.join(local_dir, ""))
+        condition = None if self.condition is _include_all else self.condition
         for local_filename in gen:
-            if self.condition(local_filename):
-                local_relpath = Path(local_filename).expanduser().absolute().relative_to(local_dir)
-                mount_path = self.remote_path / local_relpath.as_posix()
+            if condition is None or condition(local_filename):
+                local_relpath = local_filename[prefix_len:].replace(os.sep, "/")
+                mount_path = self.remote_path / local_relpath
                 yield local_filename, mount_path
 
     def watch_entry(self):
@@ -149,12 +190,16 @@ class _MountDir(_MountEntry):
         return [(self.local_dir, self.remote_path)]
 
 
-def module_mount_condition(f: str):
-    path = Path(f)
-    if path.suffix == ".pyc":
-        return False
-    if any(p.name.startswith(".") or p.name == "__pycache__" for p in path.parents):
+def module_mount_condition(f: str) -> bool:
+    if f.endswith(".pyc"):
         return False
+    if os.altsep:
+        f = f.replace(os.altsep, os.sep)
+    # Exclude anything inside hidden or __pycache__ directories. Works on the plain string since this
+    # is called for every file in a package; "" and "." components are skipped like `Path` would.
+    for part in f.split(os.sep)[:-1]:
+        if (part[:1] == "." and part != ".") or part == "__pycache__":
+            return False
     return True
 
 
@@ -173,25 +218,25 @@ class _MountedPythonModule(_MountEntry):
 
     def _proxy_entries(self) -> List[_MountEntry]:
         mount_infos = get_module_mount_info(self.module_name)
+        module_path = self.module_name.split(".")
+        condition = self.condition or module_mount_condition
         entries = []
-        for mount_info in mount_infos:
-            is_package, base_path = mount_info
+        for is_package, base_path in mount_infos:
             if is_package:
-                remote_dir = PurePosixPath(self.remote_dir, *self.module_name.split("."))
+                remote_dir = PurePosixPath(self.remote_dir, *module_path)
                 entries.append(
                     _MountDir(
-                        Path(base_path),
+                        base_path,
                         remote_path=remote_dir,
-                        condition=self.condition or module_mount_condition,
+                        condition=condition,
                         recursive=True,
                     )
                 )
             else:
-                path_segments = self.module_name.split(".")[:-1]
-                remote_path = PurePosixPath(self.remote_dir, *path_segments, Path(base_path).name)
+                remote_path = PurePosixPath(self.remote_dir, *module_path[:-1], base_path.name)
                 entries.append(
                     _MountFile(
-                        local_file=Path(base_path),
+                        local_file=base_path,
                         remote_path=remote_path,
                     )
                 )
@@ -308,11 +353,7 @@ class _Mount(_Object, type_prefix="mo"):
             remote_path = local_path.name
         remote_path = PurePosixPath("/", remote_path)
         if condition is None:
-
-            def include_all(path):
-                return True
-
-            condition = include_all
+            condition = _include_all
 
         return self._extend(
             _MountDir(
@@ -393,7 +434,7 @@ class _Mount(_Object, type_prefix="mo"):
     @staticmethod
     async def _get_files(entries: List[_MountEntry]) -> AsyncGenerator[FileUploadSpec, None]:
         loop = asyncio.get_event_loop()
-        with concurrent.futures.ThreadPoolExecutor() as exe:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MOUNT_HASH_MAX_WORKERS) as exe:
             all_files = await loop.run_in_executor(exe, _select_files, entries)
 
             futs = []
@@ -452,7 +493,7 @@ class _Mount(_Object, type_prefix="mo"):
             if file_spec.use_blob:
                 logger.debug(f"Creating blob file for {file_spec.source_description} ({file_spec.size} bytes)")
                 with file_spec.source() as fp:
-                    blob_id = await blob_upload_file(fp, resolver.client.stub)
+                    blob_id = await blob_upload_file(fp, resolver.client.stub, sha256_hex=file_spec.sha256_hex)
                 logger.debug(f"Uploading blob file {file_spec.source_description} as {remote_filename}")
                 request2 = api_pb2.MountPutFileRequest(data_blob_id=blob_id, sha256_hex=file_spec.sha256_hex)
             else:
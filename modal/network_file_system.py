@@ -254,7 +254,7 @@ class _NetworkFileSystem(_Object, type_prefix="sv"):
         data_size = fp.tell()
         fp.seek(0)
         if data_size > LARGE_FILE_LIMIT:
-            blob_id = await blob_upload_file(fp, self._client.stub)
+            blob_id = await blob_upload_file(fp, self._client.stub, sha256_hex=sha_hash)
             req = api_pb2.SharedVolumePutFileRequest(
                 shared_volume_id=self.object_id,
                 path=remote_path,
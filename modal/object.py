@@ -157,10 +157,9 @@ class _Object:
             prefix = cls._type_prefix
         else:
             # This is called on the base class, e.g. Handle.from_id
-            parts = object_id.split("-")
-            if len(parts) != 2:
+            prefix, sep, rest = object_id.partition("-")
+            if not sep or "-" in rest:
                 raise InvalidError(f"Object id {object_id} has no dash in it")
-            prefix = parts[0]
             if prefix not in cls._prefix_to_type:
                 raise InvalidError(f"Object prefix {prefix} does not correspond to a type")
 
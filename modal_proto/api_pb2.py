@@ -0,0 +1,696 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: modal_proto/api.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from modal_proto import options_pb2 as modal__proto_dot_options__pb2
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x15modal_proto/api.proto\x12\x0cmodal.client\x1a\x19modal_proto/options.proto\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1egoogle/protobuf/wrappers.proto\"\xec\x01\n\x10\x43loudBucketMount\x12\x13\n\x0b\x62ucket_name\x18\x01 \x01(\t\x12\x12\n\nmount_path\x18\x02 \x01(\t\x12\x1d\n\x15\x63redentials_secret_id\x18\x03 \x01(\t\x12\x11\n\tread_only\x18\x04 \x01(\x08\x12\x16\n\x0erequester_pays\x18\x06 \x01(\x08\x12>\n\x0b\x62ucket_type\x18\x05 \x01(\x0e\x32).modal.client.CloudBucketMount.BucketType\"%\n\nBucketType\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x06\n\x02S3\x10\x01\"r\n\x1a\x41ppClientDisconnectRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x31\n\x06reason\x18\x02 \x01(\x0e\x32!.modal.client.AppDisconnectReason\x12\x11\n\texception\x18\x03 \x01(\t\"\xb3\x01\n\x10\x41ppCreateRequest\x12\x17\n\tclient_id\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x12\n\x06\x64\x65tach\x18\x03 \x01(\x08\x42\x02\x18\x01\x12\x18\n\x0cinitializing\x18\x04 \x01(\x08\x42\x02\x18\x01\x12\x18\n\x10\x65nvironment_name\x18\x05 \x01(\t\x12)\n\tapp_state\x18\x06 \x01(\x0e\x32\x16.modal.client.AppState\"9\n\x11\x41ppCreateResponse\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x14\n\x0c\x61pp_logs_url\x18\x02 \x01(\t\"S\n\x0e\x41ppStopRequest\x12\x14\n\x06\x61pp_id\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\x12+\n\x06source\x18\x02 \x01(\x0e\x32\x1b.modal.client.AppStopSource\"\xba\x01\n\x10\x41ppDeployRequest\x12\x14\n\x06\x61pp_id\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x15\n\robject_entity\x18\x04 \x01(\t\x12\x35\n\nvisibility\x18\x05 \x01(\x0e\x32!.modal.client.AppDeployVisibility\" \n\x11\x41ppDeployResponse\x12\x0b\n\x03url\x18\x01 \x01(\t\"\x8f\x01\n\x1c\x41ppDeploySingleObjectRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x18\n\x10\x65nvironment_name\x18\x03 \x01(\t\x12\x11\n\tobject_id\x18\x04 \x01(\t\"/\n\x1d\x41ppDeploySingleObjectResponse\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\"}\n\x1d\x41ppGetByDeploymentNameRequest\x12\x34\n\tnamespace\x18\x01 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x18\n\x10\x65nvironment_name\x18\x04 \x01(\t\"0\n\x1e\x41ppGetByDeploymentNameResponse\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\"\xba\x01\n\x11\x41ppGetLogsRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x02\x12\x15\n\rlast_entry_id\x18\x04 \x01(\t\x12\x13\n\x0b\x66unction_id\x18\x05 \x01(\t\x12\x10\n\x08input_id\x18\x06 \x01(\t\x12\x0f\n\x07task_id\x18\x07 \x01(\t\x12\x35\n\x0f\x66ile_descriptor\x18\x08 \x01(\x0e\x32\x1c.modal.client.FileDescriptor\"A\n\x14\x41ppGetObjectsRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x19\n\x11include_unindexed\x18\x02 \x01(\x08\"F\n\x11\x41ppGetObjectsItem\x12\x0b\n\x03tag\x18\x01 \x01(\t\x12$\n\x06object\x18\x06 \x01(\x0b\x32\x14.modal.client.Object\"G\n\x15\x41ppGetObjectsResponse\x12.\n\x05items\x18\x02 \x03(\x0b\x32\x1f.modal.client.AppGetObjectsItem\"%\n\x13\x41ppHeartbeatRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\"*\n\x0e\x41ppListRequest\x12\x18\n\x10\x65nvironment_name\x18\x01 \x01(\t\"7\n\x0f\x41ppListResponse\x12$\n\x04\x61pps\x18\x01 \x03(\x0b\x32\x16.modal.client.AppStats\"\xb8\x01\n\x16\x41ppLookupObjectRequest\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x10\n\x08\x61pp_name\x18\x03 \x01(\t\x12\x12\n\nobject_tag\x18\x04 \x01(\t\x12\x11\n\tobject_id\x18\x05 \x01(\t\x12\x15\n\robject_entity\x18\x06 \x01(\t\x12\x18\n\x10\x65nvironment_name\x18\x07 \x01(\t\"O\n\x17\x41ppLookupObjectResponse\x12$\n\x06object\x18\x06 \x01(\x0b\x32\x14.modal.client.Object\x12\x0e\n\x06\x61pp_id\x18\x07 \x01(\t\"\xaf\x02\n\x14\x41ppSetObjectsRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12T\n\x12indexed_object_ids\x18\x02 \x03(\x0b\x32\x38.modal.client.AppSetObjectsRequest.IndexedObjectIdsEntry\x12\x11\n\tclient_id\x18\x03 \x01(\t\x12\x1c\n\x14unindexed_object_ids\x18\x04 \x03(\t\x12-\n\rnew_app_state\x18\x05 \x01(\x0e\x32\x16.modal.client.AppState\x12\x18\n\x10single_object_id\x18\x06 \x01(\t\x1a\x37\n\x15IndexedObjectIdsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xd1\x01\n\x08\x41ppStats\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12%\n\x05state\x18\x04 \x01(\x0e\x32\x16.modal.client.AppState\x12\x12\n\ncreated_at\x18\x05 \x01(\x01\x12\x12\n\nstopped_at\x18\x06 \x01(\x01\x12\x17\n\x0fn_running_tasks\x18\x08 \x01(\x05\x12\x15\n\robject_entity\x18\t \x01(\t\x12\x0c\n\x04name\x18\n \x01(\t\x12\x13\n\x0b\x64\x65ployed_at\x18\x0b \x01(\x01\"\xa3\x0e\n\x04\x41sgi\x12\'\n\x04http\x18\x01 \x01(\x0b\x32\x17.modal.client.Asgi.HttpH\x00\x12\x36\n\x0chttp_request\x18\x02 \x01(\x0b\x32\x1e.modal.client.Asgi.HttpRequestH\x00\x12\x43\n\x13http_response_start\x18\x03 \x01(\x0b\x32$.modal.client.Asgi.HttpResponseStartH\x00\x12\x41\n\x12http_response_body\x18\x04 \x01(\x0b\x32#.modal.client.Asgi.HttpResponseBodyH\x00\x12I\n\x16http_response_trailers\x18\x05 \x01(\x0b\x32\'.modal.client.Asgi.HttpResponseTrailersH\x00\x12<\n\x0fhttp_disconnect\x18\x06 \x01(\x0b\x32!.modal.client.Asgi.HttpDisconnectH\x00\x12\x31\n\twebsocket\x18\x07 \x01(\x0b\x32\x1c.modal.client.Asgi.WebsocketH\x00\x12@\n\x11websocket_connect\x18\x08 \x01(\x0b\x32#.modal.client.Asgi.WebsocketConnectH\x00\x12>\n\x10websocket_accept\x18\t \x01(\x0b\x32\".modal.client.Asgi.WebsocketAcceptH\x00\x12@\n\x11websocket_receive\x18\n \x01(\x0b\x32#.modal.client.Asgi.WebsocketReceiveH\x00\x12:\n\x0ewebsocket_send\x18\x0b \x01(\x0b\x32 .modal.client.Asgi.WebsocketSendH\x00\x12\x46\n\x14websocket_disconnect\x18\x0c \x01(\x0b\x32&.modal.client.Asgi.WebsocketDisconnectH\x00\x12<\n\x0fwebsocket_close\x18\r \x01(\x0b\x32!.modal.client.Asgi.WebsocketCloseH\x00\x1a\xc5\x01\n\x04Http\x12\x14\n\x0chttp_version\x18\x01 \x01(\t\x12\x0e\n\x06method\x18\x02 \x01(\t\x12\x0e\n\x06scheme\x18\x03 \x01(\t\x12\x0c\n\x04path\x18\x04 \x01(\t\x12\x14\n\x0cquery_string\x18\x05 \x01(\x0c\x12\x0f\n\x07headers\x18\x06 \x03(\x0c\x12\x18\n\x0b\x63lient_host\x18\x07 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x63lient_port\x18\x08 \x01(\rH\x01\x88\x01\x01\x42\x0e\n\x0c_client_hostB\x0e\n\x0c_client_port\x1a.\n\x0bHttpRequest\x12\x0c\n\x04\x62ody\x18\x01 \x01(\x0c\x12\x11\n\tmore_body\x18\x02 \x01(\x08\x1a\x46\n\x11HttpResponseStart\x12\x0e\n\x06status\x18\x01 \x01(\r\x12\x0f\n\x07headers\x18\x02 \x03(\x0c\x12\x10\n\x08trailers\x18\x03 \x01(\x08\x1a\x33\n\x10HttpResponseBody\x12\x0c\n\x04\x62ody\x18\x01 \x01(\x0c\x12\x11\n\tmore_body\x18\x02 \x01(\x08\x1a>\n\x14HttpResponseTrailers\x12\x0f\n\x07headers\x18\x01 \x03(\x0c\x12\x15\n\rmore_trailers\x18\x02 \x01(\x08\x1a\x10\n\x0eHttpDisconnect\x1a\xd0\x01\n\tWebsocket\x12\x14\n\x0chttp_version\x18\x01 \x01(\t\x12\x0e\n\x06scheme\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t\x12\x14\n\x0cquery_string\x18\x04 \x01(\x0c\x12\x0f\n\x07headers\x18\x05 \x03(\x0c\x12\x18\n\x0b\x63lient_host\x18\x06 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x63lient_port\x18\x07 \x01(\rH\x01\x88\x01\x01\x12\x14\n\x0csubprotocols\x18\x08 \x03(\tB\x0e\n\x0c_client_hostB\x0e\n\x0c_client_port\x1a\x12\n\x10WebsocketConnect\x1aL\n\x0fWebsocketAccept\x12\x18\n\x0bsubprotocol\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x0f\n\x07headers\x18\x02 \x03(\x0c\x42\x0e\n\x0c_subprotocol\x1a>\n\x10WebsocketReceive\x12\x0f\n\x05\x62ytes\x18\x01 \x01(\x0cH\x00\x12\x0e\n\x04text\x18\x02 \x01(\tH\x00\x42\t\n\x07\x63ontent\x1a;\n\rWebsocketSend\x12\x0f\n\x05\x62ytes\x18\x01 \x01(\x0cH\x00\x12\x0e\n\x04text\x18\x02 \x01(\tH\x00\x42\t\n\x07\x63ontent\x1a\x31\n\x13WebsocketDisconnect\x12\x11\n\x04\x63ode\x18\x01 \x01(\rH\x00\x88\x01\x01\x42\x07\n\x05_code\x1a<\n\x0eWebsocketClose\x12\x11\n\x04\x63ode\x18\x01 \x01(\rH\x00\x88\x01\x01\x12\x0e\n\x06reason\x18\x02 \x01(\tB\x07\n\x05_codeB\x06\n\x04type\"7\n\tBaseImage\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x12\n\ndocker_tag\x18\x02 \x01(\tJ\x04\x08\x04\x10\x05\"_\n\x11\x42lobCreateRequest\x12\x13\n\x0b\x63ontent_md5\x18\x01 \x01(\t\x12\x1d\n\x15\x63ontent_sha256_base64\x18\x02 \x01(\t\x12\x16\n\x0e\x63ontent_length\x18\x03 \x01(\x03\"\x84\x01\n\x12\x42lobCreateResponse\x12\x0f\n\x07\x62lob_id\x18\x02 \x01(\t\x12\x14\n\nupload_url\x18\x01 \x01(\tH\x00\x12\x32\n\tmultipart\x18\x03 \x01(\x0b\x32\x1d.modal.client.MultiPartUploadH\x00\x42\x13\n\x11upload_type_oneof\"!\n\x0e\x42lobGetRequest\x12\x0f\n\x07\x62lob_id\x18\x01 \x01(\t\"\'\n\x0f\x42lobGetResponse\x12\x14\n\x0c\x64ownload_url\x18\x01 \x01(\t\"i\n\x0e\x43heckpointInfo\x12\x10\n\x08\x63hecksum\x18\x01 \x01(\t\x12.\n\x06status\x18\x02 \x01(\x0e\x32\x1e.modal.client.CheckpointStatus\x12\x15\n\rcheckpoint_id\x18\x03 \x01(\t\"q\n\x12\x43lassCreateRequest\x12\x14\n\x06\x61pp_id\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\x12\x19\n\x11\x65xisting_class_id\x18\x02 \x01(\t\x12*\n\x07methods\x18\x03 \x03(\x0b\x32\x19.modal.client.ClassMethod\"c\n\x13\x43lassCreateResponse\x12\x10\n\x08\x63lass_id\x18\x01 \x01(\t\x12:\n\x0fhandle_metadata\x18\x02 \x01(\x0b\x32!.modal.client.ClassHandleMetadata\"\xb9\x01\n\x0f\x43lassGetRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x12\n\nobject_tag\x18\x02 \x01(\t\x12\x34\n\tnamespace\x18\x03 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x18\n\x10\x65nvironment_name\x18\x04 \x01(\t\x12\x18\n\x10lookup_published\x18\x08 \x01(\x08\x12\x16\n\x0eworkspace_name\x18\t \x01(\t\"`\n\x10\x43lassGetResponse\x12\x10\n\x08\x63lass_id\x18\x01 \x01(\t\x12:\n\x0fhandle_metadata\x18\x02 \x01(\x0b\x32!.modal.client.ClassHandleMetadata\"A\n\x13\x43lassHandleMetadata\x12*\n\x07methods\x18\x01 \x03(\x0b\x32\x19.modal.client.ClassMethod\"\x81\x01\n\x0b\x43lassMethod\x12\x15\n\rfunction_name\x18\x01 \x01(\t\x12\x13\n\x0b\x66unction_id\x18\x02 \x01(\t\x12\x46\n\x18\x66unction_handle_metadata\x18\x03 \x01(\x0b\x32$.modal.client.FunctionHandleMetadata\"[\n\x13\x43lientCreateRequest\x12\x33\n\x0b\x63lient_type\x18\x01 \x01(\x0e\x32\x18.modal.client.ClientTypeB\x04\x80\xb5\x18\x01\x12\x0f\n\x07version\x18\x02 \x01(\t\"U\n\x14\x43lientCreateResponse\x12\x11\n\tclient_id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x1b\n\x13\x64\x65precation_warning\x18\x03 \x01(\t\"E\n\x13\x43lientHelloResponse\x12\x0f\n\x07warning\x18\x01 \x01(\t\x12\x1d\n\x15image_builder_version\x18\x02 \x01(\t\"g\n\x16\x43lientHeartbeatRequest\x12\x11\n\tclient_id\x18\x01 \x01(\t\x12\x18\n\x10\x63urrent_input_id\x18\x03 \x01(\t\x12 \n\x18\x63urrent_input_started_at\x18\x04 \x01(\x01\"\x9f\x03\n\x12\x43ontainerArguments\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x13\n\x0b\x66unction_id\x18\x02 \x01(\t\x12\x0e\n\x06\x61pp_id\x18\x04 \x01(\t\x12,\n\x0c\x66unction_def\x18\x07 \x01(\x0b\x32\x16.modal.client.Function\x12+\n\nproxy_info\x18\x08 \x01(\x0b\x32\x17.modal.client.ProxyInfo\x12M\n\x0ftracing_context\x18\t \x03(\x0b\x32\x34.modal.client.ContainerArguments.TracingContextEntry\x12\x19\n\x11serialized_params\x18\n \x01(\x0c\x12\x0f\n\x07runtime\x18\x0b \x01(\t\x12\x18\n\x10\x65nvironment_name\x18\r \x01(\t\x12\x1a\n\rcheckpoint_id\x18\x0e \x01(\tH\x00\x88\x01\x01\x1a\x35\n\x13TracingContextEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x10\n\x0e_checkpoint_id\"%\n\x10\x43\x61ncelInputEvent\x12\x11\n\tinput_ids\x18\x01 \x03(\t\"t\n\x1a\x43ontainerHeartbeatResponse\x12?\n\x12\x63\x61ncel_input_event\x18\x01 \x01(\x0b\x32\x1e.modal.client.CancelInputEventH\x00\x88\x01\x01\x42\x15\n\x13_cancel_input_event\"\x85\x01\n\x19\x43ontainerHeartbeatRequest\x12\x18\n\x10\x63urrent_input_id\x18\x01 \x01(\t\x12 \n\x18\x63urrent_input_started_at\x18\x02 \x01(\x01\x12,\n$supports_graceful_input_cancellation\x18\x03 \x01(\x08\"3\n\x1a\x43ontainerCheckpointRequest\x12\x15\n\rcheckpoint_id\x18\x01 \x01(\t\"\x9d\x01\n\x14\x43ontainerExecRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x0f\n\x07\x63ommand\x18\x02 \x03(\t\x12\'\n\x08pty_info\x18\x03 \x01(\x0b\x32\x15.modal.client.PTYInfo\x12#\n\x1bterminate_container_on_exit\x18\x04 \x01(\x08\x12\x15\n\rruntime_debug\x18\x05 \x01(\x08\"[\n\x1d\x43ontainerExecGetOutputRequest\x12\x0f\n\x07\x65xec_id\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x02\x12\x18\n\x10last_batch_index\x18\x03 \x01(\x04\"a\n\x1c\x43ontainerExecPutInputRequest\x12\x0f\n\x07\x65xec_id\x18\x01 \x01(\t\x12\x30\n\x05input\x18\x02 \x01(\x0b\x32!.modal.client.RuntimeInputMessage\"(\n\x15\x43ontainerExecResponse\x12\x0f\n\x07\x65xec_id\x18\x01 \x01(\t\"\"\n\x12\x43ustomDomainConfig\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x1f\n\x10\x43ustomDomainInfo\x12\x0b\n\x03url\x18\x01 \x01(\t\"\x7f\n\tDataChunk\x12-\n\x0b\x64\x61ta_format\x18\x01 \x01(\x0e\x32\x18.modal.client.DataFormat\x12\x0e\n\x04\x64\x61ta\x18\x02 \x01(\x0cH\x00\x12\x16\n\x0c\x64\x61ta_blob_id\x18\x03 \x01(\tH\x00\x12\r\n\x05index\x18\x04 \x01(\x04\x42\x0c\n\ndata_oneof\"#\n\x10\x44ictClearRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\"3\n\x13\x44ictContainsRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\x0c\"%\n\x14\x44ictContainsResponse\x12\r\n\x05\x66ound\x18\x01 \x01(\x08\"j\n\x11\x44ictCreateRequest\x12%\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x17.modal.client.DictEntry\x12\x14\n\x06\x61pp_id\x18\x02 \x01(\tB\x04\x80\xb5\x18\x01\x12\x18\n\x10\x65xisting_dict_id\x18\x03 \x01(\t\"%\n\x12\x44ictCreateResponse\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\"\xe8\x01\n\x16\x44ictGetOrCreateRequest\x12\x17\n\x0f\x64\x65ployment_name\x18\x01 \x01(\t\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x18\n\x10\x65nvironment_name\x18\x03 \x01(\t\x12>\n\x14object_creation_type\x18\x04 \x01(\x0e\x32 .modal.client.ObjectCreationType\x12%\n\x04\x64\x61ta\x18\x05 \x03(\x0b\x32\x17.modal.client.DictEntry\"*\n\x17\x44ictGetOrCreateResponse\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\"\'\n\tDictEntry\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\r\n\x05value\x18\x02 \x01(\x0c\".\n\x0e\x44ictGetRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\x0c\">\n\x0f\x44ictGetResponse\x12\r\n\x05\x66ound\x18\x01 \x01(\x08\x12\x12\n\x05value\x18\x02 \x01(\x0cH\x00\x88\x01\x01\x42\x08\n\x06_value\"\'\n\x14\x44ictHeartbeatRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\"!\n\x0e\x44ictLenRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\"\x1e\n\x0f\x44ictLenResponse\x12\x0b\n\x03len\x18\x01 \x01(\x05\".\n\x0e\x44ictPopRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\x0c\">\n\x0f\x44ictPopResponse\x12\r\n\x05\x66ound\x18\x01 \x01(\x08\x12\x12\n\x05value\x18\x02 \x01(\x0cH\x00\x88\x01\x01\x42\x08\n\x06_value\"N\n\x11\x44ictUpdateRequest\x12\x0f\n\x07\x64ict_id\x18\x01 \x01(\t\x12(\n\x07updates\x18\x02 \x03(\x0b\x32\x17.modal.client.DictEntry\"\x14\n\x12\x44ictUpdateResponse\"S\n\tDNSRecord\x12)\n\x04type\x18\x01 \x01(\x0e\x32\x1b.modal.client.DNSRecordType\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\"0\n\x13\x44omainCreateRequest\x12\x19\n\x0b\x64omain_name\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\"W\n\x14\x44omainCreateResponse\x12\x11\n\tdomain_id\x18\x01 \x01(\t\x12,\n\x0b\x64ns_records\x18\x02 \x03(\x0b\x32\x17.modal.client.DNSRecord\"\x13\n\x11\x44omainListRequest\"\xaf\x01\n\x06\x44omain\x12\x11\n\tdomain_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64omain_name\x18\x02 \x01(\t\x12\x12\n\ncreated_at\x18\x03 \x01(\x01\x12;\n\x12\x63\x65rtificate_status\x18\x04 \x01(\x0e\x32\x1f.modal.client.CertificateStatus\x12,\n\x0b\x64ns_records\x18\x05 \x03(\x0b\x32\x17.modal.client.DNSRecord\";\n\x12\x44omainListResponse\x12%\n\x07\x64omains\x18\x01 \x03(\x0b\x32\x14.modal.client.Domain\"3\n\x1e\x44omainCertificateVerifyRequest\x12\x11\n\tdomain_id\x18\x01 \x01(\t\"G\n\x1f\x44omainCertificateVerifyResponse\x12$\n\x06\x64omain\x18\x01 \x01(\x0b\x32\x14.modal.client.Domain\"(\n\x18\x45nvironmentCreateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"(\n\x18\x45nvironmentDeleteRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\";\n\x13\x45nvironmentListItem\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x16\n\x0ewebhook_suffix\x18\x02 \x01(\t\"K\n\x17\x45nvironmentListResponse\x12\x30\n\x05items\x18\x02 \x03(\x0b\x32!.modal.client.EnvironmentListItem\"\x8e\x01\n\x18\x45nvironmentUpdateRequest\x12\x14\n\x0c\x63urrent_name\x18\x01 \x01(\t\x12*\n\x04name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x30\n\nweb_suffix\x18\x03 \x01(\x0b\x32\x1c.google.protobuf.StringValue\"d\n\x1a\x46unctionCallPutDataRequest\x12\x18\n\x10\x66unction_call_id\x18\x01 \x01(\t\x12,\n\x0b\x64\x61ta_chunks\x18\x02 \x03(\x0b\x32\x17.modal.client.DataChunk\"J\n\x1a\x46unctionCallGetDataRequest\x12\x18\n\x10\x66unction_call_id\x18\x01 \x01(\t\x12\x12\n\nlast_index\x18\x02 \x01(\x04\"\xf4\x0e\n\x08\x46unction\x12\x13\n\x0bmodule_name\x18\x01 \x01(\t\x12\x15\n\rfunction_name\x18\x02 \x01(\t\x12\x11\n\tmount_ids\x18\x03 \x03(\t\x12\x10\n\x08image_id\x18\x04 \x01(\t\x12\x1b\n\x13\x66unction_serialized\x18\x06 \x01(\x0c\x12>\n\x0f\x64\x65\x66inition_type\x18\x07 \x01(\x0e\x32%.modal.client.Function.DefinitionType\x12:\n\rfunction_type\x18\x08 \x01(\x0e\x32#.modal.client.Function.FunctionType\x12*\n\tresources\x18\t \x01(\x0b\x32\x17.modal.client.Resources\x12\x12\n\nsecret_ids\x18\n \x03(\t\x12+\n\nrate_limit\x18\x0b \x01(\x0b\x32\x17.modal.client.RateLimit\x12\x33\n\x0ewebhook_config\x18\x0f \x01(\x0b\x32\x1b.modal.client.WebhookConfig\x12=\n\x14shared_volume_mounts\x18\x10 \x03(\x0b\x32\x1f.modal.client.SharedVolumeMount\x12\x15\n\x08proxy_id\x18\x11 \x01(\tH\x00\x88\x01\x01\x12\x37\n\x0cretry_policy\x18\x12 \x01(\x0b\x32!.modal.client.FunctionRetryPolicy\x12\x19\n\x11\x63oncurrency_limit\x18\x13 \x01(\r\x12\x11\n\tkeep_warm\x18\x14 \x01(\x08\x12\x14\n\x0ctimeout_secs\x18\x15 \x01(\r\x12\'\n\x08pty_info\x18\x16 \x01(\x0b\x32\x15.modal.client.PTYInfo\x12\x18\n\x10\x63lass_serialized\x18\x17 \x01(\x0c\x12\x1e\n\x16task_idle_timeout_secs\x18\x19 \x01(\r\x12\x38\n\x0e\x63loud_provider\x18\x1a \x01(\x0e\x32\x1b.modal.client.CloudProviderH\x01\x88\x01\x01\x12\x16\n\x0ewarm_pool_size\x18\x1b \x01(\r\x12\x0f\n\x07web_url\x18\x1c \x01(\t\x12.\n\x0cweb_url_info\x18\x1d \x01(\x0b\x32\x18.modal.client.WebUrlInfo\x12\x0f\n\x07runtime\x18\x1e \x01(\t\x12\x11\n\tstub_name\x18\x1f \x01(\t\x12\x30\n\rvolume_mounts\x18! \x03(\x0b\x32\x19.modal.client.VolumeMount\x12\x1f\n\x17\x61llow_concurrent_inputs\x18\" \x01(\r\x12:\n\x12\x63ustom_domain_info\x18# \x03(\x0b\x32\x1e.modal.client.CustomDomainInfo\x12\x11\n\tworker_id\x18$ \x01(\t\x12\x15\n\rruntime_debug\x18% \x01(\x08\x12\x1b\n\x13is_builder_function\x18  \x01(\x08\x12\x18\n\x10is_auto_snapshot\x18& \x01(\x08\x12\x11\n\tis_method\x18\' \x01(\x08\x12!\n\x19is_checkpointing_function\x18( \x01(\x08\x12\x1d\n\x15\x63heckpointing_enabled\x18) \x01(\x08\x12\x30\n\ncheckpoint\x18* \x01(\x0b\x32\x1c.modal.client.CheckpointInfo\x12;\n\x13object_dependencies\x18+ \x03(\x0b\x32\x1e.modal.client.ObjectDependency\x12\x15\n\rblock_network\x18, \x01(\x08\x12\x12\n\nmax_inputs\x18. \x01(\r\x12(\n\ts3_mounts\x18/ \x03(\x0b\x32\x15.modal.client.S3Mount\x12;\n\x13\x63loud_bucket_mounts\x18\x33 \x03(\x0b\x32\x1e.modal.client.CloudBucketMount\x12\x1b\n\x13_experimental_boost\x18\x30 \x01(\x08\x12\x1f\n\x17_experimental_scheduler\x18\x31 \x01(\x08\x12P\n!_experimental_scheduler_placement\x18\x32 \x01(\x0b\x32 .modal.client.SchedulerPlacementH\x02\x88\x01\x01\"k\n\x0e\x44\x65\x66initionType\x12\x1f\n\x1b\x44\x45\x46INITION_TYPE_UNSPECIFIED\x10\x00\x12\x1e\n\x1a\x44\x45\x46INITION_TYPE_SERIALIZED\x10\x01\x12\x18\n\x14\x44\x45\x46INITION_TYPE_FILE\x10\x02\"f\n\x0c\x46unctionType\x12\x1d\n\x19\x46UNCTION_TYPE_UNSPECIFIED\x10\x00\x12\x1b\n\x17\x46UNCTION_TYPE_GENERATOR\x10\x01\x12\x1a\n\x16\x46UNCTION_TYPE_FUNCTION\x10\x02\x42\x0b\n\t_proxy_idB\x11\n\x0f_cloud_providerB$\n\"X_experimental_scheduler_placement\"|\n\x12SchedulerPlacement\x12\x14\n\x07_region\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05_zone\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x17\n\n_lifecycle\x18\x03 \x01(\tH\x02\x88\x01\x01\x42\n\n\x08X_regionB\x08\n\x06X_zoneB\r\n\x0bX_lifecycle\"\x8f\x01\n\x16\x46unctionHandleMetadata\x12\x15\n\rfunction_name\x18\x02 \x01(\t\x12:\n\rfunction_type\x18\x08 \x01(\x0e\x32#.modal.client.Function.FunctionType\x12\x0f\n\x07web_url\x18\x1c \x01(\t\x12\x11\n\tis_method\x18\' \x01(\x08\"\x9f\x01\n\x15\x46unctionCreateRequest\x12(\n\x08\x66unction\x18\x01 \x01(\x0b\x32\x16.modal.client.Function\x12\x14\n\x06\x61pp_id\x18\x02 \x01(\tB\x04\x80\xb5\x18\x01\x12(\n\x08schedule\x18\x06 \x01(\x0b\x32\x16.modal.client.Schedule\x12\x1c\n\x14\x65xisting_function_id\x18\x07 \x01(\t\"\xc7\x04\n\x0f\x46unctionOptions\x12\x12\n\nsecret_ids\x18\x01 \x03(\t\x12\x11\n\tmount_ids\x18\x02 \x03(\t\x12/\n\tresources\x18\x03 \x01(\x0b\x32\x17.modal.client.ResourcesH\x00\x88\x01\x01\x12<\n\x0cretry_policy\x18\x04 \x01(\x0b\x32!.modal.client.FunctionRetryPolicyH\x01\x88\x01\x01\x12\x1e\n\x11\x63oncurrency_limit\x18\x05 \x01(\rH\x02\x88\x01\x01\x12\x19\n\x0ctimeout_secs\x18\x06 \x01(\rH\x03\x88\x01\x01\x12#\n\x16task_idle_timeout_secs\x18\x07 \x01(\rH\x04\x88\x01\x01\x12\x1b\n\x0ewarm_pool_size\x18\x08 \x01(\rH\x05\x88\x01\x01\x12\x30\n\rvolume_mounts\x18\t \x03(\x0b\x32\x19.modal.client.VolumeMount\x12$\n\x17\x61llow_concurrent_inputs\x18\n \x01(\rH\x06\x88\x01\x01\x12\x1d\n\x15replace_volume_mounts\x18\x0b \x01(\x08\x12\x1a\n\x12replace_secret_ids\x18\x0c \x01(\x08\x42\x0c\n\n_resourcesB\x0f\n\r_retry_policyB\x14\n\x12_concurrency_limitB\x0f\n\r_timeout_secsB\x19\n\x17_task_idle_timeout_secsB\x11\n\x0f_warm_pool_sizeB\x1a\n\x18_allow_concurrent_inputs\"\xd6\x01\n\x18\x46unctionPrecreateRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x1b\n\rfunction_name\x18\x02 \x01(\tB\x04\x80\xb5\x18\x01\x12\x1c\n\x14\x65xisting_function_id\x18\x03 \x01(\t\x12:\n\rfunction_type\x18\x04 \x01(\x0e\x32#.modal.client.Function.FunctionType\x12\x33\n\x0ewebhook_config\x18\x05 \x01(\x0b\x32\x1b.modal.client.WebhookConfig\"o\n\x19\x46unctionPrecreateResponse\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12=\n\x0fhandle_metadata\x18\x02 \x01(\x0b\x32$.modal.client.FunctionHandleMetadata\"\x9e\x01\n\x19\x46unctionBindParamsRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12\x19\n\x11serialized_params\x18\x02 \x01(\x0c\x12\x37\n\x10\x66unction_options\x18\x03 \x01(\x0b\x32\x1d.modal.client.FunctionOptions\x12\x18\n\x10\x65nvironment_name\x18\x04 \x01(\t\"v\n\x1a\x46unctionBindParamsResponse\x12\x19\n\x11\x62ound_function_id\x18\x01 \x01(\t\x12=\n\x0fhandle_metadata\x18\x02 \x01(\x0b\x32$.modal.client.FunctionHandleMetadata\"\xd7\x01\n\x16\x46unctionCreateResponse\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12\x0f\n\x07web_url\x18\x02 \x01(\t\x12.\n\x0cweb_url_info\x18\x03 \x01(\x0b\x32\x18.modal.client.WebUrlInfo\x12(\n\x08\x66unction\x18\x04 \x01(\x0b\x32\x16.modal.client.Function\x12=\n\x0fhandle_metadata\x18\x05 \x01(\x0b\x32$.modal.client.FunctionHandleMetadata\"\x8a\x01\n\x12\x46unctionGetRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x12\n\nobject_tag\x18\x02 \x01(\t\x12\x34\n\tnamespace\x18\x03 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x18\n\x10\x65nvironment_name\x18\x04 \x01(\t\"i\n\x13\x46unctionGetResponse\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12=\n\x0fhandle_metadata\x18\x02 \x01(\x0b\x32$.modal.client.FunctionHandleMetadata\"]\n%FunctionUpdateSchedulingParamsRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12\x1f\n\x17warm_pool_size_override\x18\x02 \x01(\r\"(\n&FunctionUpdateSchedulingParamsResponse\"\x8a\x01\n\x15\x46unctionGetInputsItem\x12\x10\n\x08input_id\x18\x01 \x01(\t\x12*\n\x05input\x18\x02 \x01(\x0b\x32\x1b.modal.client.FunctionInput\x12\x13\n\x0bkill_switch\x18\x03 \x01(\x08\x12\x18\n\x10\x66unction_call_id\x18\x05 \x01(\tJ\x04\x08\x04\x10\x05\"y\n\x18\x46unctionGetInputsRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12\x12\n\nmax_values\x18\x03 \x01(\x05\x12\x19\n\x11\x61verage_call_time\x18\x05 \x01(\x02\x12\x19\n\x11input_concurrency\x18\x06 \x01(\x05\"s\n\x19\x46unctionGetInputsResponse\x12\x33\n\x06inputs\x18\x03 \x03(\x0b\x32#.modal.client.FunctionGetInputsItem\x12!\n\x19rate_limit_sleep_duration\x18\x04 \x01(\x02\"\xa6\x01\n\x16\x46unctionGetOutputsItem\x12+\n\x06result\x18\x01 \x01(\x0b\x32\x1b.modal.client.GenericResult\x12\x0b\n\x03idx\x18\x02 \x01(\x05\x12\x10\n\x08input_id\x18\x03 \x01(\t\x12\x11\n\tgen_index\x18\x04 \x01(\x05\x12-\n\x0b\x64\x61ta_format\x18\x05 \x01(\x0e\x32\x18.modal.client.DataFormat\"\x8b\x01\n\x19\x46unctionGetOutputsRequest\x12\x18\n\x10\x66unction_call_id\x18\x01 \x01(\t\x12\x12\n\nmax_values\x18\x02 \x01(\x05\x12\x0f\n\x07timeout\x18\x03 \x01(\x02\x12\x15\n\rlast_entry_id\x18\x06 \x01(\t\x12\x18\n\x10\x63lear_on_success\x18\x07 \x01(\x08\"x\n\x1a\x46unctionGetOutputsResponse\x12\x0c\n\x04idxs\x18\x03 \x03(\x05\x12\x35\n\x07outputs\x18\x04 \x03(\x0b\x32$.modal.client.FunctionGetOutputsItem\x12\x15\n\rlast_entry_id\x18\x05 \x01(\t\"3\n\x1c\x46unctionGetSerializedRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\"V\n\x1d\x46unctionGetSerializedResponse\x12\x1b\n\x13\x66unction_serialized\x18\x01 \x01(\x0c\x12\x18\n\x10\x63lass_serialized\x18\x02 \x01(\x0c\"\x89\x01\n\rFunctionInput\x12\x0e\n\x04\x61rgs\x18\x01 \x01(\x0cH\x00\x12\x16\n\x0c\x61rgs_blob_id\x18\x07 \x01(\tH\x00\x12\x13\n\x0b\x66inal_input\x18\t \x01(\x08\x12-\n\x0b\x64\x61ta_format\x18\n \x01(\x0e\x32\x18.modal.client.DataFormatB\x0c\n\nargs_oneof\"\xd8\x01\n\x12\x46unctionMapRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12\x17\n\x0fparent_input_id\x18\x02 \x01(\t\x12\x19\n\x11return_exceptions\x18\x03 \x01(\x08\x12:\n\x12\x66unction_call_type\x18\x04 \x01(\x0e\x32\x1e.modal.client.FunctionCallType\x12=\n\x10pipelined_inputs\x18\x05 \x03(\x0b\x32#.modal.client.FunctionPutInputsItem\"v\n\x13\x46unctionMapResponse\x12\x18\n\x10\x66unction_call_id\x18\x01 \x01(\t\x12\x45\n\x10pipelined_inputs\x18\x02 \x03(\x0b\x32+.modal.client.FunctionPutInputsResponseItem\"P\n\x15\x46unctionPutInputsItem\x12\x0b\n\x03idx\x18\x01 \x01(\x05\x12*\n\x05input\x18\x02 \x01(\x0b\x32\x1b.modal.client.FunctionInput\"~\n\x18\x46unctionPutInputsRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\x12\x18\n\x10\x66unction_call_id\x18\x03 \x01(\t\x12\x33\n\x06inputs\x18\x04 \x03(\x0b\x32#.modal.client.FunctionPutInputsItem\">\n\x1d\x46unctionPutInputsResponseItem\x12\x0b\n\x03idx\x18\x01 \x01(\x05\x12\x10\n\x08input_id\x18\x02 \x01(\t\"X\n\x19\x46unctionPutInputsResponse\x12;\n\x06inputs\x18\x01 \x03(\x0b\x32+.modal.client.FunctionPutInputsResponseItem\"\xce\x01\n\x16\x46unctionPutOutputsItem\x12\x10\n\x08input_id\x18\x01 \x01(\t\x12+\n\x06result\x18\x02 \x01(\x0b\x32\x1b.modal.client.GenericResult\x12\x18\n\x10input_started_at\x18\x03 \x01(\x01\x12\x19\n\x11output_created_at\x18\x04 \x01(\x01\x12\x11\n\tgen_index\x18\x06 \x01(\x05\x12-\n\x0b\x64\x61ta_format\x18\x07 \x01(\x0e\x32\x18.modal.client.DataFormat\"R\n\x19\x46unctionPutOutputsRequest\x12\x35\n\x07outputs\x18\x04 \x03(\x0b\x32$.modal.client.FunctionPutOutputsItem\"s\n\x13\x46unctionRetryPolicy\x12\x1b\n\x13\x62\x61\x63koff_coefficient\x18\x01 \x01(\x02\x12\x18\n\x10initial_delay_ms\x18\x02 \x01(\r\x12\x14\n\x0cmax_delay_ms\x18\x03 \x01(\r\x12\x0f\n\x07retries\x18\x12 \x01(\r\"7\n\x1b\x46unctionGetCallGraphRequest\x12\x18\n\x10\x66unction_call_id\x18\x02 \x01(\t\"\x8c\x01\n\x12InputCallGraphInfo\x12\x10\n\x08input_id\x18\x01 \x01(\t\x12\x39\n\x06status\x18\x02 \x01(\x0e\x32).modal.client.GenericResult.GenericStatus\x12\x18\n\x10\x66unction_call_id\x18\x03 \x01(\t\x12\x0f\n\x07task_id\x18\x04 \x01(\t\"z\n\x19\x46unctionCallCallGraphInfo\x12\x18\n\x10\x66unction_call_id\x18\x01 \x01(\t\x12\x17\n\x0fparent_input_id\x18\x02 \x01(\t\x12\x15\n\rfunction_name\x18\x03 \x01(\t\x12\x13\n\x0bmodule_name\x18\x04 \x01(\t\"\x91\x01\n\x1c\x46unctionGetCallGraphResponse\x12\x30\n\x06inputs\x18\x01 \x03(\x0b\x32 .modal.client.InputCallGraphInfo\x12?\n\x0e\x66unction_calls\x18\x02 \x03(\x0b\x32\'.modal.client.FunctionCallCallGraphInfo\"5\n\x19\x46unctionCallCancelRequest\x12\x18\n\x10\x66unction_call_id\x18\x01 \x01(\t\".\n\x17\x46unctionCallListRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\"\xc3\x03\n\x10\x46unctionCallInfo\x12\x18\n\x10\x66unction_call_id\x18\x01 \x01(\t\x12\x0b\n\x03idx\x18\x02 \x01(\x05\x12\x12\n\ncreated_at\x18\x06 \x01(\x01\x12\x14\n\x0cscheduled_at\x18\x07 \x01(\x01\x12\x37\n\x0epending_inputs\x18\x0c \x01(\x0b\x32\x1f.modal.client.InputCategoryInfo\x12\x36\n\rfailed_inputs\x18\r \x01(\x0b\x32\x1f.modal.client.InputCategoryInfo\x12\x39\n\x10succeeded_inputs\x18\x0e \x01(\x0b\x32\x1f.modal.client.InputCategoryInfo\x12\x37\n\x0etimeout_inputs\x18\x0f \x01(\x0b\x32\x1f.modal.client.InputCategoryInfo\x12\x39\n\x10\x63\x61ncelled_inputs\x18\x10 \x01(\x0b\x32\x1f.modal.client.InputCategoryInfo\x12\x14\n\x0ctotal_inputs\x18\x11 \x01(\x05J\x04\x08\x03\x10\x04J\x04\x08\x04\x10\x05J\x04\x08\x05\x10\x06J\x04\x08\x08\x10\tJ\x04\x08\t\x10\nJ\x04\x08\n\x10\x0bJ\x04\x08\x0b\x10\x0c\"R\n\x18\x46unctionCallListResponse\x12\x36\n\x0e\x66unction_calls\x18\x01 \x03(\x0b\x32\x1e.modal.client.FunctionCallInfo\"5\n\x1e\x46unctionGetCurrentStatsRequest\x12\x13\n\x0b\x66unction_id\x18\x01 \x01(\t\"S\n\rFunctionStats\x12\x0f\n\x07\x62\x61\x63klog\x18\x01 \x01(\r\x12\x18\n\x10num_active_tasks\x18\x02 \x01(\r\x12\x17\n\x0fnum_total_tasks\x18\x03 \x01(\r\"$\n\rGeneratorDone\x12\x13\n\x0bitems_total\x18\x01 \x01(\x04\"\xfe\x04\n\rGenericResult\x12\x39\n\x06status\x18\x01 \x01(\x0e\x32).modal.client.GenericResult.GenericStatus\x12\x11\n\texception\x18\x02 \x01(\t\x12\x10\n\x08\x65xitcode\x18\x03 \x01(\x05\x12\x11\n\ttraceback\x18\x04 \x01(\t\x12\x15\n\rserialized_tb\x18\x0b \x01(\x0c\x12\x15\n\rtb_line_cache\x18\x0c \x01(\x0c\x12\x0e\n\x04\x64\x61ta\x18\x05 \x01(\x0cH\x00\x12\x16\n\x0c\x64\x61ta_blob_id\x18\n \x01(\tH\x00\x12?\n\ngen_status\x18\x07 \x01(\x0e\x32+.modal.client.GenericResult.GeneratorStatus\x12\x1a\n\x12propagation_reason\x18\r \x01(\t\"\xc3\x01\n\rGenericStatus\x12\x1e\n\x1aGENERIC_STATUS_UNSPECIFIED\x10\x00\x12\x1a\n\x16GENERIC_STATUS_SUCCESS\x10\x01\x12\x1a\n\x16GENERIC_STATUS_FAILURE\x10\x02\x12\x1d\n\x19GENERIC_STATUS_TERMINATED\x10\x03\x12\x1a\n\x16GENERIC_STATUS_TIMEOUT\x10\x04\x12\x1f\n\x1bGENERIC_STATUS_INIT_FAILURE\x10\x05\"s\n\x0fGeneratorStatus\x12 \n\x1cGENERATOR_STATUS_UNSPECIFIED\x10\x00\x12\x1f\n\x1bGENERATOR_STATUS_INCOMPLETE\x10\x01\x12\x1d\n\x19GENERATOR_STATUS_COMPLETE\x10\x02\x42\x0c\n\ndata_oneof\"O\n\tGPUConfig\x12#\n\x04type\x18\x01 \x01(\x0e\x32\x15.modal.client.GPUType\x12\r\n\x05\x63ount\x18\x02 \x01(\r\x12\x0e\n\x06memory\x18\x03 \x01(\r\"`\n\rBuildFunction\x12\x12\n\ndefinition\x18\x01 \x01(\t\x12\x0f\n\x07globals\x18\x02 \x01(\x0c\x12*\n\x05input\x18\x03 \x01(\x0b\x32\x1b.modal.client.FunctionInput\"\xdd\x03\n\x05Image\x12,\n\x0b\x62\x61se_images\x18\x05 \x03(\x0b\x32\x17.modal.client.BaseImage\x12\x1b\n\x13\x64ockerfile_commands\x18\x06 \x03(\t\x12\x35\n\rcontext_files\x18\x07 \x03(\x0b\x32\x1e.modal.client.ImageContextFile\x12\x0f\n\x07version\x18\x0b \x01(\t\x12\x12\n\nsecret_ids\x18\x0c \x03(\t\x12\x0b\n\x03gpu\x18\r \x01(\x08\x12\x18\n\x10\x63ontext_mount_id\x18\x0f \x01(\t\x12+\n\ngpu_config\x18\x10 \x01(\x0b\x32\x17.modal.client.GPUConfig\x12@\n\x15image_registry_config\x18\x11 \x01(\x0b\x32!.modal.client.ImageRegistryConfig\x12\x1a\n\x12\x62uild_function_def\x18\x0e \x01(\t\x12\x1e\n\x16\x62uild_function_globals\x18\x12 \x01(\x0c\x12\x0f\n\x07runtime\x18\x13 \x01(\t\x12\x15\n\rruntime_debug\x18\x14 \x01(\x08\x12\x33\n\x0e\x62uild_function\x18\x15 \x01(\x0b\x32\x1b.modal.client.BuildFunction\"2\n\x10ImageContextFile\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"\xed\x01\n\x17ImageGetOrCreateRequest\x12\"\n\x05image\x18\x02 \x01(\x0b\x32\x13.modal.client.Image\x12\x14\n\x06\x61pp_id\x18\x04 \x01(\tB\x04\x80\xb5\x18\x01\x12\x19\n\x11\x65xisting_image_id\x18\x05 \x01(\t\x12\x19\n\x11\x62uild_function_id\x18\x06 \x01(\t\x12\x13\n\x0b\x66orce_build\x18\x07 \x01(\x08\x12\x34\n\tnamespace\x18\x08 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x17\n\x0f\x62uilder_version\x18\t \x01(\t\",\n\x18ImageGetOrCreateResponse\x12\x10\n\x08image_id\x18\x01 \x01(\t\"U\n\x19ImageJoinStreamingRequest\x12\x10\n\x08image_id\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x02\x12\x15\n\rlast_entry_id\x18\x03 \x01(\t\"\x93\x01\n\x1aImageJoinStreamingResponse\x12+\n\x06result\x18\x01 \x01(\x0b\x32\x1b.modal.client.GenericResult\x12)\n\ttask_logs\x18\x02 \x03(\x0b\x32\x16.modal.client.TaskLogs\x12\x10\n\x08\x65ntry_id\x18\x03 \x01(\t\x12\x0b\n\x03\x65of\x18\x04 \x01(\x08\"d\n\x13ImageRegistryConfig\x12:\n\x12registry_auth_type\x18\x01 \x01(\x0e\x32\x1e.modal.client.RegistryAuthType\x12\x11\n\tsecret_id\x18\x02 \x01(\t\"\x99\x01\n\tInputInfo\x12\x10\n\x08input_id\x18\x01 \x01(\t\x12\x0b\n\x03idx\x18\x02 \x01(\x05\x12\x0f\n\x07task_id\x18\x03 \x01(\t\x12\x12\n\nstarted_at\x18\x04 \x01(\x01\x12\x13\n\x0b\x66inished_at\x18\x05 \x01(\x01\x12\x19\n\x11task_startup_time\x18\x06 \x01(\x01\x12\x18\n\x10task_first_input\x18\x07 \x01(\x08\"K\n\x11InputCategoryInfo\x12\r\n\x05total\x18\x01 \x01(\x05\x12\'\n\x06latest\x18\x02 \x03(\x0b\x32\x17.modal.client.InputInfo\"l\n\x11MountBuildRequest\x12\x14\n\x06\x61pp_id\x18\x02 \x01(\tB\x04\x80\xb5\x18\x01\x12\x19\n\x11\x65xisting_mount_id\x18\x03 \x01(\t\x12&\n\x05\x66iles\x18\x04 \x03(\x0b\x32\x17.modal.client.MountFile\"b\n\x12MountBuildResponse\x12\x10\n\x08mount_id\x18\x01 \x01(\t\x12:\n\x0fhandle_metadata\x18\x02 \x01(\x0b\x32!.modal.client.MountHandleMetadata\"\xfa\x01\n\x17MountGetOrCreateRequest\x12\x17\n\x0f\x64\x65ployment_name\x18\x01 \x01(\t\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x18\n\x10\x65nvironment_name\x18\x03 \x01(\t\x12>\n\x14object_creation_type\x18\x04 \x01(\x0e\x32 .modal.client.ObjectCreationType\x12&\n\x05\x66iles\x18\x05 \x03(\x0b\x32\x17.modal.client.MountFile\x12\x0e\n\x06\x61pp_id\x18\x06 \x01(\t\"h\n\x18MountGetOrCreateResponse\x12\x10\n\x08mount_id\x18\x01 \x01(\t\x12:\n\x0fhandle_metadata\x18\x02 \x01(\x0b\x32!.modal.client.MountHandleMetadata\":\n\x13MountHandleMetadata\x12#\n\x1b\x63ontent_checksum_sha256_hex\x18\x01 \x01(\t\"i\n\tMountFile\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x12\n\nsha256_hex\x18\x03 \x01(\t\x12\x11\n\x04size\x18\x04 \x01(\x04H\x00\x88\x01\x01\x12\x11\n\x04mode\x18\x05 \x01(\rH\x01\x88\x01\x01\x42\x07\n\x05_sizeB\x07\n\x05_mode\"_\n\x13MountPutFileRequest\x12\x12\n\nsha256_hex\x18\x02 \x01(\t\x12\x0e\n\x04\x64\x61ta\x18\x03 \x01(\x0cH\x00\x12\x16\n\x0c\x64\x61ta_blob_id\x18\x05 \x01(\tH\x00\x42\x0c\n\ndata_oneof\"&\n\x14MountPutFileResponse\x12\x0e\n\x06\x65xists\x18\x02 \x01(\x08\"S\n\x0fMultiPartUpload\x12\x13\n\x0bpart_length\x18\x01 \x01(\x03\x12\x13\n\x0bupload_urls\x18\x02 \x03(\t\x12\x16\n\x0e\x63ompletion_url\x18\x03 \x01(\t\"\xce\x02\n\x06Object\x12\x11\n\tobject_id\x18\x01 \x01(\t\x12H\n\x18\x66unction_handle_metadata\x18\x03 \x01(\x0b\x32$.modal.client.FunctionHandleMetadataH\x00\x12\x42\n\x15mount_handle_metadata\x18\x04 \x01(\x0b\x32!.modal.client.MountHandleMetadataH\x00\x12\x42\n\x15\x63lass_handle_metadata\x18\x05 \x01(\x0b\x32!.modal.client.ClassHandleMetadataH\x00\x12\x46\n\x17sandbox_handle_metadata\x18\x06 \x01(\x0b\x32#.modal.client.SandboxHandleMetadataH\x00\x42\x17\n\x15handle_metadata_oneof\"%\n\x10ObjectDependency\x12\x11\n\tobject_id\x18\x01 \x01(\t\"\xc2\x01\n\x17ProxyGetOrCreateRequest\x12\x17\n\x0f\x64\x65ployment_name\x18\x01 \x01(\t\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x18\n\x10\x65nvironment_name\x18\x03 \x01(\t\x12>\n\x14object_creation_type\x18\x04 \x01(\x0e\x32 .modal.client.ObjectCreationType\",\n\x18ProxyGetOrCreateResponse\x12\x10\n\x08proxy_id\x18\x01 \x01(\t\"\\\n\tProxyInfo\x12\x12\n\nelastic_ip\x18\x01 \x01(\t\x12\x11\n\tproxy_key\x18\x02 \x01(\t\x12\x13\n\x0bremote_addr\x18\x03 \x01(\t\x12\x13\n\x0bremote_port\x18\x04 \x01(\x05\"\x86\x02\n\x07PTYInfo\x12\x0f\n\x07\x65nabled\x18\x01 \x01(\x08\x12\x12\n\nwinsz_rows\x18\x02 \x01(\r\x12\x12\n\nwinsz_cols\x18\x03 \x01(\r\x12\x10\n\x08\x65nv_term\x18\x04 \x01(\t\x12\x15\n\renv_colorterm\x18\x05 \x01(\t\x12\x18\n\x10\x65nv_term_program\x18\x06 \x01(\t\x12/\n\x08pty_type\x18\x07 \x01(\x0e\x32\x1d.modal.client.PTYInfo.PTYType\"N\n\x07PTYType\x12\x18\n\x14PTY_TYPE_UNSPECIFIED\x10\x00\x12\x15\n\x11PTY_TYPE_FUNCTION\x10\x01\x12\x12\n\x0ePTY_TYPE_SHELL\x10\x02\"?\n\x12QueueCreateRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x19\n\x11\x65xisting_queue_id\x18\x02 \x01(\t\"\'\n\x13QueueCreateResponse\x12\x10\n\x08queue_id\x18\x01 \x01(\t\"\xc2\x01\n\x17QueueGetOrCreateRequest\x12\x17\n\x0f\x64\x65ployment_name\x18\x01 \x01(\t\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x18\n\x10\x65nvironment_name\x18\x03 \x01(\t\x12>\n\x14object_creation_type\x18\x04 \x01(\x0e\x32 .modal.client.ObjectCreationType\",\n\x18QueueGetOrCreateResponse\x12\x10\n\x08queue_id\x18\x01 \x01(\t\"]\n\x0fQueueGetRequest\x12\x10\n\x08queue_id\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x03 \x01(\x02\x12\x10\n\x08n_values\x18\x04 \x01(\x05\x12\x15\n\rpartition_key\x18\x05 \x01(\x0c\"\"\n\x10QueueGetResponse\x12\x0e\n\x06values\x18\x02 \x03(\x0c\")\n\x15QueueHeartbeatRequest\x12\x10\n\x08queue_id\x18\x01 \x01(\t\"i\n\x0fQueuePutRequest\x12\x10\n\x08queue_id\x18\x01 \x01(\t\x12\x0e\n\x06values\x18\x04 \x03(\x0c\x12\x15\n\rpartition_key\x18\x05 \x01(\x0c\x12\x1d\n\x15partition_ttl_seconds\x18\x06 \x01(\x05\":\n\x0fQueueLenRequest\x12\x10\n\x08queue_id\x18\x01 \x01(\t\x12\x15\n\rpartition_key\x18\x02 \x01(\x0c\"\x1f\n\x10QueueLenResponse\x12\x0b\n\x03len\x18\x01 \x01(\x05\"r\n\x15QueueNextItemsRequest\x12\x10\n\x08queue_id\x18\x01 \x01(\t\x12\x15\n\rpartition_key\x18\x02 \x01(\x0c\x12\x15\n\rlast_entry_id\x18\x03 \x01(\t\x12\x19\n\x11item_poll_timeout\x18\x04 \x01(\x02\",\n\tQueueItem\x12\r\n\x05value\x18\x01 \x01(\x0c\x12\x10\n\x08\x65ntry_id\x18\x02 \x01(\t\"@\n\x16QueueNextItemsResponse\x12&\n\x05items\x18\x01 \x03(\x0b\x32\x17.modal.client.QueueItem\"M\n\tRateLimit\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x31\n\x08interval\x18\x02 \x01(\x0e\x32\x1f.modal.client.RateLimitInterval\"u\n\tResources\x12\x11\n\tmemory_mb\x18\x02 \x01(\r\x12\x11\n\tmilli_cpu\x18\x03 \x01(\r\x12+\n\ngpu_config\x18\x04 \x01(\x0b\x32\x17.modal.client.GPUConfig\x12\x15\n\rmemory_mb_max\x18\x05 \x01(\r\"d\n\x07S3Mount\x12\x13\n\x0b\x62ucket_name\x18\x01 \x01(\t\x12\x12\n\nmount_path\x18\x02 \x01(\t\x12\x1d\n\x15\x63redentials_secret_id\x18\x03 \x01(\t\x12\x11\n\tread_only\x18\x04 \x01(\x08\"\x99\x04\n\x07Sandbox\x12\x17\n\x0f\x65ntrypoint_args\x18\x01 \x03(\t\x12\x11\n\tmount_ids\x18\x02 \x03(\t\x12\x10\n\x08image_id\x18\x03 \x01(\t\x12\x12\n\nsecret_ids\x18\x04 \x03(\t\x12*\n\tresources\x18\x05 \x01(\x0b\x32\x17.modal.client.Resources\x12\x33\n\x0e\x63loud_provider\x18\x06 \x01(\x0e\x32\x1b.modal.client.CloudProvider\x12\x14\n\x0ctimeout_secs\x18\x07 \x01(\r\x12\x14\n\x07workdir\x18\x08 \x01(\tH\x00\x88\x01\x01\x12\x33\n\nnfs_mounts\x18\t \x03(\x0b\x32\x1f.modal.client.SharedVolumeMount\x12\x15\n\rruntime_debug\x18\n \x01(\x08\x12\x15\n\rblock_network\x18\x0b \x01(\x08\x12(\n\ts3_mounts\x18\x0c \x03(\x0b\x32\x15.modal.client.S3Mount\x12;\n\x13\x63loud_bucket_mounts\x18\x0e \x03(\x0b\x32\x1e.modal.client.CloudBucketMount\x12\x30\n\rvolume_mounts\x18\r \x03(\x0b\x32\x19.modal.client.VolumeMount\x12\'\n\x08pty_info\x18\x0f \x01(\x0b\x32\x15.modal.client.PTYInfoB\n\n\x08_workdir\"W\n\x14SandboxCreateRequest\x12\x14\n\x06\x61pp_id\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\x12)\n\ndefinition\x18\x02 \x01(\x0b\x32\x15.modal.client.Sandbox\"+\n\x15SandboxCreateResponse\x12\x12\n\nsandbox_id\x18\x01 \x01(\t\"-\n\x17SandboxGetTaskIdRequest\x12\x12\n\nsandbox_id\x18\x01 \x01(\t\"+\n\x18SandboxGetTaskIdResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t\"\x8a\x01\n\x15SandboxGetLogsRequest\x12\x12\n\nsandbox_id\x18\x01 \x01(\t\x12\x35\n\x0f\x66ile_descriptor\x18\x02 \x01(\x0e\x32\x1c.modal.client.FileDescriptor\x12\x0f\n\x07timeout\x18\x03 \x01(\x02\x12\x15\n\rlast_entry_id\x18\x04 \x01(\t\"Y\n\x18SandboxStdinWriteRequest\x12\x12\n\nsandbox_id\x18\x01 \x01(\t\x12\r\n\x05input\x18\x02 \x01(\x0c\x12\r\n\x05index\x18\x03 \x01(\r\x12\x0b\n\x03\x65of\x18\x04 \x01(\x08\"\x1b\n\x19SandboxStdinWriteResponse\"D\n\x15SandboxHandleMetadata\x12+\n\x06result\x18\x01 \x01(\x0b\x32\x1b.modal.client.GenericResult\"\x83\x01\n\x0bSandboxInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12)\n\ndefinition\x18\x02 \x01(\x0b\x32\x15.modal.client.Sandbox\x12\x12\n\ncreated_at\x18\x03 \x01(\x01\x12)\n\ttask_info\x18\x04 \x01(\x0b\x32\x16.modal.client.TaskInfo\">\n\x12SandboxListRequest\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x18\n\x10\x62\x65\x66ore_timestamp\x18\x02 \x01(\x01\"C\n\x13SandboxListResponse\x12,\n\tsandboxes\x18\x01 \x03(\x0b\x32\x19.modal.client.SandboxInfo\"-\n\x17SandboxTerminateRequest\x12\x12\n\nsandbox_id\x18\x01 \x01(\t\"P\n\x18SandboxTerminateResponse\x12\x34\n\x0f\x65xisting_result\x18\x01 \x01(\x0b\x32\x1b.modal.client.GenericResult\"9\n\x12SandboxWaitRequest\x12\x12\n\nsandbox_id\x18\x01 \x01(\t\x12\x0f\n\x07timeout\x18\x02 \x01(\x02\"B\n\x13SandboxWaitResponse\x12+\n\x06result\x18\x01 \x01(\x0b\x32\x1b.modal.client.GenericResult\"\x8e\x02\n\x08Schedule\x12+\n\x04\x63ron\x18\x01 \x01(\x0b\x32\x1b.modal.client.Schedule.CronH\x00\x12/\n\x06period\x18\x02 \x01(\x0b\x32\x1d.modal.client.Schedule.PeriodH\x00\x1a\x1b\n\x04\x43ron\x12\x13\n\x0b\x63ron_string\x18\x01 \x01(\t\x1au\n\x06Period\x12\r\n\x05years\x18\x01 \x01(\x05\x12\x0e\n\x06months\x18\x02 \x01(\x05\x12\r\n\x05weeks\x18\x03 \x01(\x05\x12\x0c\n\x04\x64\x61ys\x18\x04 \x01(\x05\x12\r\n\x05hours\x18\x05 \x01(\x05\x12\x0f\n\x07minutes\x18\x06 \x01(\x05\x12\x0f\n\x07seconds\x18\x07 \x01(\x02\x42\x10\n\x0eschedule_oneof\"\xd0\x01\n\x13SecretCreateRequest\x12@\n\x08\x65nv_dict\x18\x01 \x03(\x0b\x32..modal.client.SecretCreateRequest.EnvDictEntry\x12\x14\n\x06\x61pp_id\x18\x02 \x01(\tB\x04\x80\xb5\x18\x01\x12\x15\n\rtemplate_type\x18\x03 \x01(\t\x12\x1a\n\x12\x65xisting_secret_id\x18\x04 \x01(\t\x1a.\n\x0c\x45nvDictEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\")\n\x14SecretCreateResponse\x12\x11\n\tsecret_id\x18\x01 \x01(\t\"\xca\x02\n\x18SecretGetOrCreateRequest\x12\x17\n\x0f\x64\x65ployment_name\x18\x01 \x01(\t\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x18\n\x10\x65nvironment_name\x18\x03 \x01(\t\x12>\n\x14object_creation_type\x18\x04 \x01(\x0e\x32 .modal.client.ObjectCreationType\x12\x45\n\x08\x65nv_dict\x18\x05 \x03(\x0b\x32\x33.modal.client.SecretGetOrCreateRequest.EnvDictEntry\x12\x0e\n\x06\x61pp_id\x18\x06 \x01(\t\x1a.\n\x0c\x45nvDictEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\".\n\x19SecretGetOrCreateResponse\x12\x11\n\tsecret_id\x18\x01 \x01(\t\"c\n\x0eSecretListItem\x12\r\n\x05label\x18\x01 \x01(\t\x12\x12\n\ncreated_at\x18\x02 \x01(\x01\x12\x14\n\x0clast_used_at\x18\x03 \x01(\x01\x12\x18\n\x10\x65nvironment_name\x18\x04 \x01(\t\"-\n\x11SecretListRequest\x12\x18\n\x10\x65nvironment_name\x18\x01 \x01(\t\"[\n\x12SecretListResponse\x12+\n\x05items\x18\x01 \x03(\x0b\x32\x1c.modal.client.SecretListItem\x12\x18\n\x10\x65nvironment_name\x18\x02 \x01(\t\"\xd9\x01\n\x1eSharedVolumeGetOrCreateRequest\x12\x17\n\x0f\x64\x65ployment_name\x18\x01 \x01(\t\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x18\n\x10\x65nvironment_name\x18\x03 \x01(\t\x12>\n\x14object_creation_type\x18\x04 \x01(\x0e\x32 .modal.client.ObjectCreationType\x12\x0e\n\x06\x61pp_id\x18\x05 \x01(\t\";\n\x1fSharedVolumeGetOrCreateResponse\x12\x18\n\x10shared_volume_id\x18\x01 \x01(\t\"8\n\x1cSharedVolumeHeartbeatRequest\x12\x18\n\x10shared_volume_id\x18\x01 \x01(\t\"f\n\x19SharedVolumeCreateRequest\x12\x14\n\x06\x61pp_id\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\x12\x33\n\x0e\x63loud_provider\x18\x02 \x01(\x0e\x32\x1b.modal.client.CloudProvider\"6\n\x1aSharedVolumeCreateResponse\x12\x18\n\x10shared_volume_id\x18\x01 \x01(\t\"\x88\x01\n\x14SharedVolumeListItem\x12\r\n\x05label\x18\x01 \x01(\t\x12\x18\n\x10shared_volume_id\x18\x02 \x01(\t\x12\x12\n\ncreated_at\x18\x03 \x01(\x01\x12\x33\n\x0e\x63loud_provider\x18\x04 \x01(\x0e\x32\x1b.modal.client.CloudProvider\"3\n\x17SharedVolumeListRequest\x12\x18\n\x10\x65nvironment_name\x18\x01 \x01(\t\"g\n\x18SharedVolumeListResponse\x12\x31\n\x05items\x18\x01 \x03(\x0b\x32\".modal.client.SharedVolumeListItem\x12\x18\n\x10\x65nvironment_name\x18\x02 \x01(\t\"F\n\x1cSharedVolumeListFilesRequest\x12\x18\n\x10shared_volume_id\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\"\xa7\x01\n\x1aSharedVolumePutFileRequest\x12\x1e\n\x10shared_volume_id\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x12\n\nsha256_hex\x18\x03 \x01(\t\x12\x0e\n\x04\x64\x61ta\x18\x04 \x01(\x0cH\x00\x12\x16\n\x0c\x64\x61ta_blob_id\x18\x05 \x01(\tH\x00\x12\x11\n\tresumable\x18\x06 \x01(\x08\x42\x0c\n\ndata_oneof\"-\n\x1bSharedVolumePutFileResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\"D\n\x1aSharedVolumeGetFileRequest\x12\x18\n\x10shared_volume_id\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\"S\n\x1bSharedVolumeGetFileResponse\x12\x0e\n\x04\x64\x61ta\x18\x01 \x01(\x0cH\x00\x12\x16\n\x0c\x64\x61ta_blob_id\x18\x02 \x01(\tH\x00\x42\x0c\n\ndata_oneof\"`\n\x1dSharedVolumeRemoveFileRequest\x12\x1e\n\x10shared_volume_id\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x11\n\trecursive\x18\x03 \x01(\x08\"\xa1\x01\n\x1aSharedVolumeListFilesEntry\x12\x0c\n\x04path\x18\x01 \x01(\t\x12?\n\x04type\x18\x02 \x01(\x0e\x32\x31.modal.client.SharedVolumeListFilesEntry.FileType\"4\n\x08\x46ileType\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x08\n\x04\x46ILE\x10\x01\x12\r\n\tDIRECTORY\x10\x02\"Z\n\x1dSharedVolumeListFilesResponse\x12\x39\n\x07\x65ntries\x18\x01 \x03(\x0b\x32(.modal.client.SharedVolumeListFilesEntry\"\x92\x01\n\x11SharedVolumeMount\x12\x12\n\nmount_path\x18\x01 \x01(\t\x12\x18\n\x10shared_volume_id\x18\x02 \x01(\t\x12\x33\n\x0e\x63loud_provider\x18\x03 \x01(\x0e\x32\x1b.modal.client.CloudProvider\x12\x1a\n\x12\x61llow_cross_region\x18\x04 \x01(\x08\".\n\x19TaskCurrentInputsResponse\x12\x11\n\tinput_ids\x18\x01 \x03(\t\"l\n\x08TaskInfo\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nstarted_at\x18\x02 \x01(\x01\x12\x13\n\x0b\x66inished_at\x18\x03 \x01(\x01\x12+\n\x06result\x18\x04 \x01(\x0b\x32\x1b.modal.client.GenericResult\"\xee\x01\n\x08TaskLogs\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\x12+\n\ntask_state\x18\x06 \x01(\x0e\x32\x17.modal.client.TaskState\x12\x11\n\ttimestamp\x18\x07 \x01(\x01\x12\x35\n\x0f\x66ile_descriptor\x18\x08 \x01(\x0e\x32\x1c.modal.client.FileDescriptor\x12\x31\n\rtask_progress\x18\t \x01(\x0b\x32\x1a.modal.client.TaskProgress\x12\x18\n\x10\x66unction_call_id\x18\n \x01(\t\x12\x10\n\x08input_id\x18\x0b \x01(\t\"\x11\n\x0fTaskListRequest\":\n\x10TaskListResponse\x12&\n\x05tasks\x18\x01 \x03(\x0b\x32\x17.modal.client.TaskStats\"\xc6\x01\n\rTaskLogsBatch\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12%\n\x05items\x18\x02 \x03(\x0b\x32\x16.modal.client.TaskLogs\x12\x10\n\x08\x65ntry_id\x18\x05 \x01(\t\x12\x10\n\x08\x61pp_done\x18\n \x01(\x08\x12\x13\n\x0b\x66unction_id\x18\x0b \x01(\t\x12\x10\n\x08input_id\x18\x0c \x01(\t\x12\x10\n\x08image_id\x18\r \x01(\t\x12\x0b\n\x03\x65of\x18\x0e \x01(\x08\x12\x13\n\x0bpty_exec_id\x18\x0f \x01(\t\"p\n\x0cTaskProgress\x12\x0b\n\x03len\x18\x01 \x01(\x04\x12\x0b\n\x03pos\x18\x02 \x01(\x04\x12\x31\n\rprogress_type\x18\x03 \x01(\x0e\x32\x1a.modal.client.ProgressType\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\"@\n\x11TaskResultRequest\x12+\n\x06result\x18\x02 \x01(\x0b\x32\x1b.modal.client.GenericResult\"Y\n\tTaskStats\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x0e\n\x06\x61pp_id\x18\x02 \x01(\t\x12\x17\n\x0f\x61pp_description\x18\x03 \x01(\t\x12\x12\n\nstarted_at\x18\x04 \x01(\x01\"V\n\x16TokenFlowCreateRequest\x12\x12\n\nutm_source\x18\x03 \x01(\t\x12\x16\n\x0elocalhost_port\x18\x04 \x01(\x05\x12\x10\n\x08next_url\x18\x05 \x01(\t\"d\n\x17TokenFlowCreateResponse\x12\x15\n\rtoken_flow_id\x18\x01 \x01(\t\x12\x0f\n\x07web_url\x18\x02 \x01(\t\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x13\n\x0bwait_secret\x18\x04 \x01(\t\"S\n\x14TokenFlowWaitRequest\x12\x0f\n\x07timeout\x18\x01 \x01(\x02\x12\x15\n\rtoken_flow_id\x18\x02 \x01(\t\x12\x13\n\x0bwait_secret\x18\x03 \x01(\t\"l\n\x15TokenFlowWaitResponse\x12\x10\n\x08token_id\x18\x01 \x01(\t\x12\x14\n\x0ctoken_secret\x18\x02 \x01(\t\x12\x0f\n\x07timeout\x18\x03 \x01(\x08\x12\x1a\n\x12workspace_username\x18\x04 \x01(\t\"7\n\x12TunnelStartRequest\x12\x0c\n\x04port\x18\x01 \x01(\r\x12\x13\n\x0bunencrypted\x18\x02 \x01(\x08\"\x99\x01\n\x13TunnelStartResponse\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0c\n\x04port\x18\x02 \x01(\r\x12\x1d\n\x10unencrypted_host\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x1d\n\x10unencrypted_port\x18\x04 \x01(\rH\x01\x88\x01\x01\x42\x13\n\x11_unencrypted_hostB\x13\n\x11_unencrypted_port\"!\n\x11TunnelStopRequest\x12\x0c\n\x04port\x18\x01 \x01(\r\"$\n\x12TunnelStopResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\"\xd3\x01\n\x18VolumeGetOrCreateRequest\x12\x17\n\x0f\x64\x65ployment_name\x18\x01 \x01(\t\x12\x34\n\tnamespace\x18\x02 \x01(\x0e\x32!.modal.client.DeploymentNamespace\x12\x18\n\x10\x65nvironment_name\x18\x03 \x01(\t\x12>\n\x14object_creation_type\x18\x04 \x01(\x0e\x32 .modal.client.ObjectCreationType\x12\x0e\n\x06\x61pp_id\x18\x05 \x01(\t\".\n\x19VolumeGetOrCreateResponse\x12\x11\n\tvolume_id\x18\x01 \x01(\t\"+\n\x16VolumeHeartbeatRequest\x12\x11\n\tvolume_id\x18\x01 \x01(\t\"+\n\x13VolumeCreateRequest\x12\x14\n\x06\x61pp_id\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\")\n\x14VolumeCreateResponse\x12\x11\n\tvolume_id\x18\x01 \x01(\t\".\n\x13VolumeCommitRequest\x12\x17\n\tvolume_id\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\"+\n\x14VolumeCommitResponse\x12\x13\n\x0bskip_reload\x18\x01 \x01(\x08\"F\n\x13VolumeDeleteRequest\x12\x11\n\tvolume_id\x18\x01 \x01(\t\x12\x1c\n\x10\x65nvironment_name\x18\x02 \x01(\tB\x02\x18\x01\"S\n\x14VolumeGetFileRequest\x12\x11\n\tvolume_id\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\x0c\x12\r\n\x05start\x18\x03 \x01(\x04\x12\x0b\n\x03len\x18\x04 \x01(\x04\"w\n\x15VolumeGetFileResponse\x12\x0e\n\x04\x64\x61ta\x18\x01 \x01(\x0cH\x00\x12\x16\n\x0c\x64\x61ta_blob_id\x18\x02 \x01(\tH\x00\x12\x0c\n\x04size\x18\x03 \x01(\x04\x12\r\n\x05start\x18\x04 \x01(\x04\x12\x0b\n\x03len\x18\x05 \x01(\x04\x42\x0c\n\ndata_oneof\"\xbf\x01\n\x14VolumeListFilesEntry\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x39\n\x04type\x18\x02 \x01(\x0e\x32+.modal.client.VolumeListFilesEntry.FileType\x12\r\n\x05mtime\x18\x03 \x01(\x04\x12\x0c\n\x04size\x18\x04 \x01(\x04\"A\n\x08\x46ileType\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x08\n\x04\x46ILE\x10\x01\x12\r\n\tDIRECTORY\x10\x02\x12\x0b\n\x07SYMLINK\x10\x03\"c\n\x16VolumeListFilesRequest\x12\x11\n\tvolume_id\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x18\n\x0bmax_entries\x18\x03 \x01(\x05H\x00\x88\x01\x01\x42\x0e\n\x0c_max_entries\"N\n\x17VolumeListFilesResponse\x12\x33\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\".modal.client.VolumeListFilesEntry\"F\n\x0eVolumeListItem\x12\r\n\x05label\x18\x01 \x01(\t\x12\x11\n\tvolume_id\x18\x02 \x01(\t\x12\x12\n\ncreated_at\x18\x03 \x01(\x01\"-\n\x11VolumeListRequest\x12\x18\n\x10\x65nvironment_name\x18\x01 \x01(\t\"[\n\x12VolumeListResponse\x12+\n\x05items\x18\x01 \x03(\x0b\x32\x1c.modal.client.VolumeListItem\x12\x18\n\x10\x65nvironment_name\x18\x02 \x01(\t\"(\n\x13VolumeReloadRequest\x12\x11\n\tvolume_id\x18\x01 \x01(\t\"}\n\x15VolumePutFilesRequest\x12\x11\n\tvolume_id\x18\x01 \x01(\t\x12&\n\x05\x66iles\x18\x02 \x03(\x0b\x32\x17.modal.client.MountFile\x12)\n!disallow_overwrite_existing_files\x18\x03 \x01(\x08\"S\n\x17VolumeRemoveFileRequest\x12\x17\n\tvolume_id\x18\x01 \x01(\tB\x04\x80\xb5\x18\x01\x12\x0c\n\x04path\x18\x02 \x01(\x0c\x12\x11\n\trecursive\x18\x03 \x01(\x08\"c\n\x16VolumeCopyFilesRequest\x12\x11\n\tvolume_id\x18\x01 \x01(\t\x12\x11\n\tsrc_paths\x18\x02 \x03(\x0c\x12\x10\n\x08\x64st_path\x18\x03 \x01(\x0c\x12\x11\n\trecursive\x18\x04 \x01(\x08\"V\n\x0bVolumeMount\x12\x11\n\tvolume_id\x18\x01 \x01(\t\x12\x12\n\nmount_path\x18\x02 \x01(\t\x12 \n\x18\x61llow_background_commits\x18\x03 \x01(\x08\"\x8d\x02\n\rWebhookConfig\x12\'\n\x04type\x18\x01 \x01(\x0e\x32\x19.modal.client.WebhookType\x12\x0e\n\x06method\x18\x02 \x01(\t\x12\x18\n\x10requested_suffix\x18\x04 \x01(\t\x12\x32\n\nasync_mode\x18\x05 \x01(\x0e\x32\x1e.modal.client.WebhookAsyncMode\x12\x38\n\x0e\x63ustom_domains\x18\x06 \x03(\x0b\x32 .modal.client.CustomDomainConfig\x12\x17\n\x0fweb_server_port\x18\x07 \x01(\r\x12\"\n\x1aweb_server_startup_timeout\x18\x08 \x01(\x02\"N\n\nWebUrlInfo\x12\x11\n\ttruncated\x18\x01 \x01(\x08\x12\x17\n\x0fhas_unique_hash\x18\x02 \x01(\x08\x12\x14\n\x0clabel_stolen\x18\x03 \x01(\x08\"K\n\x1bWorkspaceNameLookupResponse\x12\x1a\n\x0eworkspace_name\x18\x01 \x01(\tB\x02\x18\x01\x12\x10\n\x08username\x18\x02 \x01(\t\"^\n\x14RuntimeOutputMessage\x12\x35\n\x0f\x66ile_descriptor\x18\x01 \x01(\x0e\x32\x1c.modal.client.FileDescriptor\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x82\x01\n\x12RuntimeOutputBatch\x12\x31\n\x05items\x18\x01 \x03(\x0b\x32\".modal.client.RuntimeOutputMessage\x12\x13\n\x0b\x62\x61tch_index\x18\x02 \x01(\x04\x12\x16\n\texit_code\x18\x03 \x01(\x05H\x00\x88\x01\x01\x42\x0c\n\n_exit_code\"=\n\x13RuntimeInputMessage\x12\x0f\n\x07message\x18\x01 \x01(\x0c\x12\x15\n\rmessage_index\x18\x02 \x01(\x04*\x83\x01\n\x13\x41ppDeployVisibility\x12%\n!APP_DEPLOY_VISIBILITY_UNSPECIFIED\x10\x00\x12#\n\x1f\x41PP_DEPLOY_VISIBILITY_WORKSPACE\x10\x01\x12 \n\x1c\x41PP_DEPLOY_VISIBILITY_PUBLIC\x10\x02*\xf5\x01\n\x13\x41ppDisconnectReason\x12%\n!APP_DISCONNECT_REASON_UNSPECIFIED\x10\x00\x12)\n%APP_DISCONNECT_REASON_LOCAL_EXCEPTION\x10\x01\x12,\n(APP_DISCONNECT_REASON_KEYBOARD_INTERRUPT\x10\x02\x12.\n*APP_DISCONNECT_REASON_ENTRYPOINT_COMPLETED\x10\x03\x12.\n*APP_DISCONNECT_REASON_DEPLOYMENT_EXCEPTION\x10\x04*\x8d\x02\n\x08\x41ppState\x12\x19\n\x15\x41PP_STATE_UNSPECIFIED\x10\x00\x12\x17\n\x13\x41PP_STATE_EPHEMERAL\x10\x01\x12\x16\n\x12\x41PP_STATE_DETACHED\x10\x02\x12\x16\n\x12\x41PP_STATE_DEPLOYED\x10\x03\x12\x16\n\x12\x41PP_STATE_STOPPING\x10\x04\x12\x15\n\x11\x41PP_STATE_STOPPED\x10\x05\x12\x1a\n\x16\x41PP_STATE_INITIALIZING\x10\x06\x12\x16\n\x12\x41PP_STATE_DISABLED\x10\x07\x12#\n\x1f\x41PP_STATE_DETACHED_DISCONNECTED\x10\x08\x12\x15\n\x11\x41PP_STATE_DERIVED\x10\t*\x85\x01\n\rAppStopSource\x12\x1f\n\x1b\x41PP_STOP_SOURCE_UNSPECIFIED\x10\x00\x12\x17\n\x13\x41PP_STOP_SOURCE_CLI\x10\x01\x12!\n\x1d\x41PP_STOP_SOURCE_PYTHON_CLIENT\x10\x02\x12\x17\n\x13\x41PP_STOP_SOURCE_WEB\x10\x03*\x91\x01\n\x11\x43\x65rtificateStatus\x12\x1e\n\x1a\x43\x45RTIFICATE_STATUS_PENDING\x10\x00\x12\x1d\n\x19\x43\x45RTIFICATE_STATUS_ISSUED\x10\x01\x12\x1d\n\x19\x43\x45RTIFICATE_STATUS_FAILED\x10\x02\x12\x1e\n\x1a\x43\x45RTIFICATE_STATUS_REVOKED\x10\x03*\xb1\x01\n\x10\x43heckpointStatus\x12!\n\x1d\x43HECKPOINT_STATUS_UNSPECIFIED\x10\x00\x12\x1d\n\x19\x43HECKPOINT_STATUS_PENDING\x10\x01\x12 \n\x1c\x43HECKPOINT_STATUS_PROCESSING\x10\x02\x12\x1b\n\x17\x43HECKPOINT_STATUS_READY\x10\x03\x12\x1c\n\x18\x43HECKPOINT_STATUS_FAILED\x10\x04*\xb0\x01\n\nClientType\x12\x1b\n\x17\x43LIENT_TYPE_UNSPECIFIED\x10\x00\x12\x16\n\x12\x43LIENT_TYPE_CLIENT\x10\x01\x12\x1a\n\x12\x43LIENT_TYPE_WORKER\x10\x02\x1a\x02\x08\x01\x12\x19\n\x15\x43LIENT_TYPE_CONTAINER\x10\x03\x12\x1a\n\x12\x43LIENT_TYPE_SERVER\x10\x04\x1a\x02\x08\x01\x12\x1a\n\x16\x43LIENT_TYPE_WEB_SERVER\x10\x05*\x90\x01\n\rCloudProvider\x12\x1e\n\x1a\x43LOUD_PROVIDER_UNSPECIFIED\x10\x00\x12\x16\n\x12\x43LOUD_PROVIDER_AWS\x10\x01\x12\x16\n\x12\x43LOUD_PROVIDER_GCP\x10\x02\x12\x17\n\x13\x43LOUD_PROVIDER_AUTO\x10\x03\x12\x16\n\x12\x43LOUD_PROVIDER_OCI\x10\x04*w\n\nDataFormat\x12\x1b\n\x17\x44\x41TA_FORMAT_UNSPECIFIED\x10\x00\x12\x16\n\x12\x44\x41TA_FORMAT_PICKLE\x10\x01\x12\x14\n\x10\x44\x41TA_FORMAT_ASGI\x10\x02\x12\x1e\n\x1a\x44\x41TA_FORMAT_GENERATOR_DONE\x10\x03*\x80\x01\n\x13\x44\x65ploymentNamespace\x12$\n DEPLOYMENT_NAMESPACE_UNSPECIFIED\x10\x00\x12\"\n\x1e\x44\x45PLOYMENT_NAMESPACE_WORKSPACE\x10\x01\x12\x1f\n\x1b\x44\x45PLOYMENT_NAMESPACE_GLOBAL\x10\x03*Z\n\rDNSRecordType\x12\x15\n\x11\x44NS_RECORD_TYPE_A\x10\x00\x12\x17\n\x13\x44NS_RECORD_TYPE_TXT\x10\x01\x12\x19\n\x15\x44NS_RECORD_TYPE_CNAME\x10\x02*\x83\x01\n\x0e\x46ileDescriptor\x12\x1f\n\x1b\x46ILE_DESCRIPTOR_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x46ILE_DESCRIPTOR_STDOUT\x10\x01\x12\x1a\n\x16\x46ILE_DESCRIPTOR_STDERR\x10\x02\x12\x18\n\x14\x46ILE_DESCRIPTOR_INFO\x10\x03*p\n\x10\x46unctionCallType\x12\"\n\x1e\x46UNCTION_CALL_TYPE_UNSPECIFIED\x10\x00\x12\x1c\n\x18\x46UNCTION_CALL_TYPE_UNARY\x10\x01\x12\x1a\n\x16\x46UNCTION_CALL_TYPE_MAP\x10\x02*\x82\x02\n\x07GPUType\x12\x18\n\x14GPU_TYPE_UNSPECIFIED\x10\x00\x12\x0f\n\x0bGPU_TYPE_T4\x10\x01\x12\x11\n\rGPU_TYPE_A100\x10\x02\x12\x11\n\rGPU_TYPE_A10G\x10\x03\x12\x10\n\x0cGPU_TYPE_ANY\x10\x04\x12\x19\n\x11GPU_TYPE_A100_20G\x10\x05\x1a\x02\x08\x01\x12\x1f\n\x17GPU_TYPE_A100_40GB_MANY\x10\x06\x1a\x02\x08\x01\x12\x1c\n\x14GPU_TYPE_INFERENTIA2\x10\x07\x1a\x02\x08\x01\x12\x16\n\x12GPU_TYPE_A100_80GB\x10\x08\x12\x0f\n\x0bGPU_TYPE_L4\x10\t\x12\x11\n\rGPU_TYPE_H100\x10\n*\xa0\x02\n\x12ObjectCreationType\x12$\n OBJECT_CREATION_TYPE_UNSPECIFIED\x10\x00\x12*\n&OBJECT_CREATION_TYPE_CREATE_IF_MISSING\x10\x01\x12.\n*OBJECT_CREATION_TYPE_CREATE_FAIL_IF_EXISTS\x10\x02\x12\x33\n/OBJECT_CREATION_TYPE_CREATE_OVERWRITE_IF_EXISTS\x10\x03\x12/\n+OBJECT_CREATION_TYPE_ANONYMOUS_OWNED_BY_APP\x10\x04\x12\"\n\x1eOBJECT_CREATION_TYPE_EPHEMERAL\x10\x05*>\n\x0cProgressType\x12\x19\n\x15IMAGE_SNAPSHOT_UPLOAD\x10\x00\x12\x13\n\x0f\x46UNCTION_QUEUED\x10\x01*x\n\x11RateLimitInterval\x12#\n\x1fRATE_LIMIT_INTERVAL_UNSPECIFIED\x10\x00\x12\x1e\n\x1aRATE_LIMIT_INTERVAL_SECOND\x10\x01\x12\x1e\n\x1aRATE_LIMIT_INTERVAL_MINUTE\x10\x02*\xb2\x01\n\x10RegistryAuthType\x12\"\n\x1eREGISTRY_AUTH_TYPE_UNSPECIFIED\x10\x00\x12\x1a\n\x16REGISTRY_AUTH_TYPE_AWS\x10\x01\x12\x1a\n\x16REGISTRY_AUTH_TYPE_GCP\x10\x02\x12\x1d\n\x19REGISTRY_AUTH_TYPE_PUBLIC\x10\x03\x12#\n\x1fREGISTRY_AUTH_TYPE_STATIC_CREDS\x10\x04*\xdc\x02\n\tTaskState\x12\x1a\n\x16TASK_STATE_UNSPECIFIED\x10\x00\x12\x16\n\x12TASK_STATE_CREATED\x10\x06\x12\x15\n\x11TASK_STATE_QUEUED\x10\x01\x12\x1e\n\x1aTASK_STATE_WORKER_ASSIGNED\x10\x02\x12\x1c\n\x18TASK_STATE_LOADING_IMAGE\x10\x03\x12\x15\n\x11TASK_STATE_ACTIVE\x10\x04\x12\x18\n\x14TASK_STATE_COMPLETED\x10\x05\x12!\n\x1dTASK_STATE_CREATING_CONTAINER\x10\x07\x12\x13\n\x0fTASK_STATE_IDLE\x10\x08\x12\x1a\n\x16TASK_STATE_PREEMPTIBLE\x10\t\x12\x18\n\x14TASK_STATE_PREEMPTED\x10\n\x12\'\n#TASK_STATE_LOADING_CHECKPOINT_IMAGE\x10\x0b*\x99\x01\n\x0bWebhookType\x12\x1c\n\x18WEBHOOK_TYPE_UNSPECIFIED\x10\x00\x12\x19\n\x15WEBHOOK_TYPE_ASGI_APP\x10\x01\x12\x19\n\x15WEBHOOK_TYPE_FUNCTION\x10\x02\x12\x19\n\x15WEBHOOK_TYPE_WSGI_APP\x10\x03\x12\x1b\n\x17WEBHOOK_TYPE_WEB_SERVER\x10\x04*\x9a\x01\n\x10WebhookAsyncMode\x12\"\n\x1eWEBHOOK_ASYNC_MODE_UNSPECIFIED\x10\x00\x12\x1f\n\x1bWEBHOOK_ASYNC_MODE_DISABLED\x10\x02\x12\x1e\n\x1aWEBHOOK_ASYNC_MODE_TRIGGER\x10\x03\x12\x1b\n\x17WEBHOOK_ASYNC_MODE_AUTO\x10\x04\"\x04\x08\x01\x10\x01\x32\x9aN\n\x0bModalClient\x12L\n\tAppCreate\x12\x1e.modal.client.AppCreateRequest\x1a\x1f.modal.client.AppCreateResponse\x12W\n\x13\x41ppClientDisconnect\x12(.modal.client.AppClientDisconnectRequest\x1a\x16.google.protobuf.Empty\x12L\n\nAppGetLogs\x12\x1f.modal.client.AppGetLogsRequest\x1a\x1b.modal.client.TaskLogsBatch0\x01\x12K\n\rAppSetObjects\x12\".modal.client.AppSetObjectsRequest\x1a\x16.google.protobuf.Empty\x12X\n\rAppGetObjects\x12\".modal.client.AppGetObjectsRequest\x1a#.modal.client.AppGetObjectsResponse\x12\x46\n\x07\x41ppList\x12\x1c.modal.client.AppListRequest\x1a\x1d.modal.client.AppListResponse\x12^\n\x0f\x41ppLookupObject\x12$.modal.client.AppLookupObjectRequest\x1a%.modal.client.AppLookupObjectResponse\x12L\n\tAppDeploy\x12\x1e.modal.client.AppDeployRequest\x1a\x1f.modal.client.AppDeployResponse\x12p\n\x15\x41ppDeploySingleObject\x12*.modal.client.AppDeploySingleObjectRequest\x1a+.modal.client.AppDeploySingleObjectResponse\x12s\n\x16\x41ppGetByDeploymentName\x12+.modal.client.AppGetByDeploymentNameRequest\x1a,.modal.client.AppGetByDeploymentNameResponse\x12?\n\x07\x41ppStop\x12\x1c.modal.client.AppStopRequest\x1a\x16.google.protobuf.Empty\x12I\n\x0c\x41ppHeartbeat\x12!.modal.client.AppHeartbeatRequest\x1a\x16.google.protobuf.Empty\x12O\n\nBlobCreate\x12\x1f.modal.client.BlobCreateRequest\x1a .modal.client.BlobCreateResponse\x12\x46\n\x07\x42lobGet\x12\x1c.modal.client.BlobGetRequest\x1a\x1d.modal.client.BlobGetResponse\x12R\n\x0b\x43lassCreate\x12 .modal.client.ClassCreateRequest\x1a!.modal.client.ClassCreateResponse\x12I\n\x08\x43lassGet\x12\x1d.modal.client.ClassGetRequest\x1a\x1e.modal.client.ClassGetResponse\x12U\n\x0c\x43lientCreate\x12!.modal.client.ClientCreateRequest\x1a\".modal.client.ClientCreateResponse\x12H\n\x0b\x43lientHello\x12\x16.google.protobuf.Empty\x1a!.modal.client.ClientHelloResponse\x12O\n\x0f\x43lientHeartbeat\x12$.modal.client.ClientHeartbeatRequest\x1a\x16.google.protobuf.Empty\x12g\n\x12\x43ontainerHeartbeat\x12\'.modal.client.ContainerHeartbeatRequest\x1a(.modal.client.ContainerHeartbeatResponse\x12X\n\rContainerExec\x12\".modal.client.ContainerExecRequest\x1a#.modal.client.ContainerExecResponse\x12i\n\x16\x43ontainerExecGetOutput\x12+.modal.client.ContainerExecGetOutputRequest\x1a .modal.client.RuntimeOutputBatch0\x01\x12[\n\x15\x43ontainerExecPutInput\x12*.modal.client.ContainerExecPutInputRequest\x1a\x16.google.protobuf.Empty\x12W\n\x13\x43ontainerCheckpoint\x12(.modal.client.ContainerCheckpointRequest\x1a\x16.google.protobuf.Empty\x12\x43\n\tDictClear\x12\x1e.modal.client.DictClearRequest\x1a\x16.google.protobuf.Empty\x12O\n\nDictCreate\x12\x1f.modal.client.DictCreateRequest\x1a .modal.client.DictCreateResponse\x12^\n\x0f\x44ictGetOrCreate\x12$.modal.client.DictGetOrCreateRequest\x1a%.modal.client.DictGetOrCreateResponse\x12K\n\rDictHeartbeat\x12\".modal.client.DictHeartbeatRequest\x1a\x16.google.protobuf.Empty\x12O\n\nDictUpdate\x12\x1f.modal.client.DictUpdateRequest\x1a .modal.client.DictUpdateResponse\x12\x46\n\x07\x44ictGet\x12\x1c.modal.client.DictGetRequest\x1a\x1d.modal.client.DictGetResponse\x12\x46\n\x07\x44ictPop\x12\x1c.modal.client.DictPopRequest\x1a\x1d.modal.client.DictPopResponse\x12U\n\x0c\x44ictContains\x12!.modal.client.DictContainsRequest\x1a\".modal.client.DictContainsResponse\x12\x46\n\x07\x44ictLen\x12\x1c.modal.client.DictLenRequest\x1a\x1d.modal.client.DictLenResponse\x12U\n\x0c\x44omainCreate\x12!.modal.client.DomainCreateRequest\x1a\".modal.client.DomainCreateResponse\x12O\n\nDomainList\x12\x1f.modal.client.DomainListRequest\x1a .modal.client.DomainListResponse\x12v\n\x17\x44omainCertificateVerify\x12,.modal.client.DomainCertificateVerifyRequest\x1a-.modal.client.DomainCertificateVerifyResponse\x12S\n\x11\x45nvironmentCreate\x12&.modal.client.EnvironmentCreateRequest\x1a\x16.google.protobuf.Empty\x12P\n\x0f\x45nvironmentList\x12\x16.google.protobuf.Empty\x1a%.modal.client.EnvironmentListResponse\x12S\n\x11\x45nvironmentDelete\x12&.modal.client.EnvironmentDeleteRequest\x1a\x16.google.protobuf.Empty\x12^\n\x11\x45nvironmentUpdate\x12&.modal.client.EnvironmentUpdateRequest\x1a!.modal.client.EnvironmentListItem\x12g\n\x12\x46unctionBindParams\x12\'.modal.client.FunctionBindParamsRequest\x1a(.modal.client.FunctionBindParamsResponse\x12[\n\x0e\x46unctionCreate\x12#.modal.client.FunctionCreateRequest\x1a$.modal.client.FunctionCreateResponse\x12R\n\x0b\x46unctionGet\x12 .modal.client.FunctionGetRequest\x1a!.modal.client.FunctionGetResponse\x12m\n\x14\x46unctionGetCallGraph\x12).modal.client.FunctionGetCallGraphRequest\x1a*.modal.client.FunctionGetCallGraphResponse\x12\x64\n\x17\x46unctionGetCurrentStats\x12,.modal.client.FunctionGetCurrentStatsRequest\x1a\x1b.modal.client.FunctionStats\x12\x64\n\x11\x46unctionGetInputs\x12&.modal.client.FunctionGetInputsRequest\x1a\'.modal.client.FunctionGetInputsResponse\x12g\n\x12\x46unctionGetOutputs\x12\'.modal.client.FunctionGetOutputsRequest\x1a(.modal.client.FunctionGetOutputsResponse\x12p\n\x15\x46unctionGetSerialized\x12*.modal.client.FunctionGetSerializedRequest\x1a+.modal.client.FunctionGetSerializedResponse\x12R\n\x0b\x46unctionMap\x12 .modal.client.FunctionMapRequest\x1a!.modal.client.FunctionMapResponse\x12\x64\n\x11\x46unctionPrecreate\x12&.modal.client.FunctionPrecreateRequest\x1a\'.modal.client.FunctionPrecreateResponse\x12\x64\n\x11\x46unctionPutInputs\x12&.modal.client.FunctionPutInputsRequest\x1a\'.modal.client.FunctionPutInputsResponse\x12U\n\x12\x46unctionPutOutputs\x12\'.modal.client.FunctionPutOutputsRequest\x1a\x16.google.protobuf.Empty\x12\x8b\x01\n\x1e\x46unctionUpdateSchedulingParams\x12\x33.modal.client.FunctionUpdateSchedulingParamsRequest\x1a\x34.modal.client.FunctionUpdateSchedulingParamsResponse\x12U\n\x12\x46unctionCallCancel\x12\'.modal.client.FunctionCallCancelRequest\x1a\x16.google.protobuf.Empty\x12\x61\n\x10\x46unctionCallList\x12%.modal.client.FunctionCallListRequest\x1a&.modal.client.FunctionCallListResponse\x12\\\n\x15\x46unctionCallGetDataIn\x12(.modal.client.FunctionCallGetDataRequest\x1a\x17.modal.client.DataChunk0\x01\x12]\n\x16\x46unctionCallGetDataOut\x12(.modal.client.FunctionCallGetDataRequest\x1a\x17.modal.client.DataChunk0\x01\x12Z\n\x16\x46unctionCallPutDataOut\x12(.modal.client.FunctionCallPutDataRequest\x1a\x16.google.protobuf.Empty\x12G\n\x15\x46unctionStartPtyShell\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\x12\x61\n\x10ImageGetOrCreate\x12%.modal.client.ImageGetOrCreateRequest\x1a&.modal.client.ImageGetOrCreateResponse\x12i\n\x12ImageJoinStreaming\x12\'.modal.client.ImageJoinStreamingRequest\x1a(.modal.client.ImageJoinStreamingResponse0\x01\x12U\n\x0cMountPutFile\x12!.modal.client.MountPutFileRequest\x1a\".modal.client.MountPutFileResponse\x12O\n\nMountBuild\x12\x1f.modal.client.MountBuildRequest\x1a .modal.client.MountBuildResponse\x12\x61\n\x10MountGetOrCreate\x12%.modal.client.MountGetOrCreateRequest\x1a&.modal.client.MountGetOrCreateResponse\x12\x61\n\x10ProxyGetOrCreate\x12%.modal.client.ProxyGetOrCreateRequest\x1a&.modal.client.ProxyGetOrCreateResponse\x12R\n\x0bQueueCreate\x12 .modal.client.QueueCreateRequest\x1a!.modal.client.QueueCreateResponse\x12\x61\n\x10QueueGetOrCreate\x12%.modal.client.QueueGetOrCreateRequest\x1a&.modal.client.QueueGetOrCreateResponse\x12I\n\x08QueueGet\x12\x1d.modal.client.QueueGetRequest\x1a\x1e.modal.client.QueueGetResponse\x12M\n\x0eQueueHeartbeat\x12#.modal.client.QueueHeartbeatRequest\x1a\x16.google.protobuf.Empty\x12\x41\n\x08QueuePut\x12\x1d.modal.client.QueuePutRequest\x1a\x16.google.protobuf.Empty\x12I\n\x08QueueLen\x12\x1d.modal.client.QueueLenRequest\x1a\x1e.modal.client.QueueLenResponse\x12[\n\x0eQueueNextItems\x12#.modal.client.QueueNextItemsRequest\x1a$.modal.client.QueueNextItemsResponse\x12X\n\rSandboxCreate\x12\".modal.client.SandboxCreateRequest\x1a#.modal.client.SandboxCreateResponse\x12\x61\n\x10SandboxGetTaskId\x12%.modal.client.SandboxGetTaskIdRequest\x1a&.modal.client.SandboxGetTaskIdResponse\x12T\n\x0eSandboxGetLogs\x12#.modal.client.SandboxGetLogsRequest\x1a\x1b.modal.client.TaskLogsBatch0\x01\x12R\n\x0bSandboxWait\x12 .modal.client.SandboxWaitRequest\x1a!.modal.client.SandboxWaitResponse\x12R\n\x0bSandboxList\x12 .modal.client.SandboxListRequest\x1a!.modal.client.SandboxListResponse\x12\x61\n\x10SandboxTerminate\x12%.modal.client.SandboxTerminateRequest\x1a&.modal.client.SandboxTerminateResponse\x12\x64\n\x11SandboxStdinWrite\x12&.modal.client.SandboxStdinWriteRequest\x1a\'.modal.client.SandboxStdinWriteResponse\x12U\n\x0cSecretCreate\x12!.modal.client.SecretCreateRequest\x1a\".modal.client.SecretCreateResponse\x12\x64\n\x11SecretGetOrCreate\x12&.modal.client.SecretGetOrCreateRequest\x1a\'.modal.client.SecretGetOrCreateResponse\x12O\n\nSecretList\x12\x1f.modal.client.SecretListRequest\x1a .modal.client.SecretListResponse\x12v\n\x17SharedVolumeGetOrCreate\x12,.modal.client.SharedVolumeGetOrCreateRequest\x1a-.modal.client.SharedVolumeGetOrCreateResponse\x12g\n\x12SharedVolumeCreate\x12\'.modal.client.SharedVolumeCreateRequest\x1a(.modal.client.SharedVolumeCreateResponse\x12[\n\x15SharedVolumeHeartbeat\x12*.modal.client.SharedVolumeHeartbeatRequest\x1a\x16.google.protobuf.Empty\x12\x61\n\x10SharedVolumeList\x12%.modal.client.SharedVolumeListRequest\x1a&.modal.client.SharedVolumeListResponse\x12p\n\x15SharedVolumeListFiles\x12*.modal.client.SharedVolumeListFilesRequest\x1a+.modal.client.SharedVolumeListFilesResponse\x12x\n\x1bSharedVolumeListFilesStream\x12*.modal.client.SharedVolumeListFilesRequest\x1a+.modal.client.SharedVolumeListFilesResponse0\x01\x12j\n\x13SharedVolumePutFile\x12(.modal.client.SharedVolumePutFileRequest\x1a).modal.client.SharedVolumePutFileResponse\x12j\n\x13SharedVolumeGetFile\x12(.modal.client.SharedVolumeGetFileRequest\x1a).modal.client.SharedVolumeGetFileResponse\x12]\n\x16SharedVolumeRemoveFile\x12+.modal.client.SharedVolumeRemoveFileRequest\x1a\x16.google.protobuf.Empty\x12\x45\n\nTaskResult\x12\x1f.modal.client.TaskResultRequest\x1a\x16.google.protobuf.Empty\x12I\n\x08TaskList\x12\x1d.modal.client.TaskListRequest\x1a\x1e.modal.client.TaskListResponse\x12T\n\x11TaskCurrentInputs\x12\x16.google.protobuf.Empty\x1a\'.modal.client.TaskCurrentInputsResponse\x12^\n\x0fTokenFlowCreate\x12$.modal.client.TokenFlowCreateRequest\x1a%.modal.client.TokenFlowCreateResponse\x12X\n\rTokenFlowWait\x12\".modal.client.TokenFlowWaitRequest\x1a#.modal.client.TokenFlowWaitResponse\x12R\n\x0bTunnelStart\x12 .modal.client.TunnelStartRequest\x1a!.modal.client.TunnelStartResponse\x12O\n\nTunnelStop\x12\x1f.modal.client.TunnelStopRequest\x1a .modal.client.TunnelStopResponse\x12\x64\n\x11VolumeGetOrCreate\x12&.modal.client.VolumeGetOrCreateRequest\x1a\'.modal.client.VolumeGetOrCreateResponse\x12U\n\x0cVolumeCreate\x12!.modal.client.VolumeCreateRequest\x1a\".modal.client.VolumeCreateResponse\x12O\n\x0fVolumeHeartbeat\x12$.modal.client.VolumeHeartbeatRequest\x1a\x16.google.protobuf.Empty\x12U\n\x0cVolumeCommit\x12!.modal.client.VolumeCommitRequest\x1a\".modal.client.VolumeCommitResponse\x12I\n\x0cVolumeDelete\x12!.modal.client.VolumeDeleteRequest\x1a\x16.google.protobuf.Empty\x12X\n\rVolumeGetFile\x12\".modal.client.VolumeGetFileRequest\x1a#.modal.client.VolumeGetFileResponse\x12O\n\nVolumeList\x12\x1f.modal.client.VolumeListRequest\x1a .modal.client.VolumeListResponse\x12`\n\x0fVolumeListFiles\x12$.modal.client.VolumeListFilesRequest\x1a%.modal.client.VolumeListFilesResponse0\x01\x12M\n\x0eVolumePutFiles\x12#.modal.client.VolumePutFilesRequest\x1a\x16.google.protobuf.Empty\x12I\n\x0cVolumeReload\x12!.modal.client.VolumeReloadRequest\x1a\x16.google.protobuf.Empty\x12Q\n\x10VolumeRemoveFile\x12%.modal.client.VolumeRemoveFileRequest\x1a\x16.google.protobuf.Empty\x12O\n\x0fVolumeCopyFiles\x12$.modal.client.VolumeCopyFilesRequest\x1a\x16.google.protobuf.Empty\x12X\n\x13WorkspaceNameLookup\x12\x16.google.protobuf.Empty\x1a).modal.client.WorkspaceNameLookupResponseb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'modal_proto.api_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _CLIENTTYPE.values_by_name["CLIENT_TYPE_WORKER"]._options = None
+  _CLIENTTYPE.values_by_name["CLIENT_TYPE_WORKER"]._serialized_options = b'\010\001'
+  _CLIENTTYPE.values_by_name["CLIENT_TYPE_SERVER"]._options = None
+  _CLIENTTYPE.values_by_name["CLIENT_TYPE_SERVER"]._serialized_options = b'\010\001'
+  _GPUTYPE.values_by_name["GPU_TYPE_A100_20G"]._options = None
+  _GPUTYPE.values_by_name["GPU_TYPE_A100_20G"]._serialized_options = b'\010\001'
+  _GPUTYPE.values_by_name["GPU_TYPE_A100_40GB_MANY"]._options = None
+  _GPUTYPE.values_by_name["GPU_TYPE_A100_40GB_MANY"]._serialized_options = b'\010\001'
+  _GPUTYPE.values_by_name["GPU_TYPE_INFERENTIA2"]._options = None
+  _GPUTYPE.values_by_name["GPU_TYPE_INFERENTIA2"]._serialized_options = b'\010\001'
+  _APPCREATEREQUEST.fields_by_name['client_id']._options = None
+  _APPCREATEREQUEST.fields_by_name['client_id']._serialized_options = b'\200\265\030\001'
+  _APPCREATEREQUEST.fields_by_name['detach']._options = None
+  _APPCREATEREQUEST.fields_by_name['detach']._serialized_options = b'\030\001'
+  _APPCREATEREQUEST.fields_by_name['initializing']._options = None
+  _APPCREATEREQUEST.fields_by_name['initializing']._serialized_options = b'\030\001'
+  _APPSTOPREQUEST.fields_by_name['app_id']._options = None
+  _APPSTOPREQUEST.fields_by_name['app_id']._serialized_options = b'\200\265\030\001'
+  _APPDEPLOYREQUEST.fields_by_name['app_id']._options = None
+  _APPDEPLOYREQUEST.fields_by_name['app_id']._serialized_options = b'\200\265\030\001'
+  _APPSETOBJECTSREQUEST_INDEXEDOBJECTIDSENTRY._options = None
+  _APPSETOBJECTSREQUEST_INDEXEDOBJECTIDSENTRY._serialized_options = b'8\001'
+  _CLASSCREATEREQUEST.fields_by_name['app_id']._options = None
+  _CLASSCREATEREQUEST.fields_by_name['app_id']._serialized_options = b'\200\265\030\001'
+  _CLIENTCREATEREQUEST.fields_by_name['client_type']._options = None
+  _CLIENTCREATEREQUEST.fields_by_name['client_type']._serialized_options = b'\200\265\030\001'
+  _CONTAINERARGUMENTS_TRACINGCONTEXTENTRY._options = None
+  _CONTAINERARGUMENTS_TRACINGCONTEXTENTRY._serialized_options = b'8\001'
+  _DICTCREATEREQUEST.fields_by_name['app_id']._options = None
+  _DICTCREATEREQUEST.fields_by_name['app_id']._serialized_options = b'\200\265\030\001'
+  _DOMAINCREATEREQUEST.fields_by_name['domain_name']._options = None
+  _DOMAINCREATEREQUEST.fields_by_name['domain_name']._serialized_options = b'\200\265\030\001'
+  _FUNCTIONCREATEREQUEST.fields_by_name['app_id']._options = None
+  _FUNCTIONCREATEREQUEST.fields_by_name['app_id']._serialized_options = b'\200\265\030\001'
+  _FUNCTIONPRECREATEREQUEST.fields_by_name['function_name']._options = None
+  _FUNCTIONPRECREATEREQUEST.fields_by_name['function_name']._serialized_options = b'\200\265\030\001'
+  _IMAGEGETORCREATEREQUEST.fields_by_name['app_id']._options = None
+  _IMAGEGETORCREATEREQUEST.fields_by_name['app_id']._serialized_options = b'\200\265\030\001'
+  _MOUNTBUILDREQUEST.fields_by_name['app_id']._options = None
+  _MOUNTBUILDREQUEST.fields_by_name['app_id']._serialized_options = b'\200\265\030\001'
+  _SANDBOXCREATEREQUEST.fields_by_name['app_id']._options = None
+  _SANDBOXCREATEREQUEST.fields_by_name['app_id']._serialized_options = b'\200\265\030\001'
+  _SECRETCREATEREQUEST_ENVDICTENTRY._options = None
+  _SECRETCREATEREQUEST_ENVDICTENTRY._serialized_options = b'8\001'
+  _SECRETCREATEREQUEST.fields_by_name['app_id']._options = None
+  _SECRETCREATEREQUEST.fields_by_name['app_id']._serialized_options = b'\200\265\030\001'
+  _SECRETGETORCREATEREQUEST_ENVDICTENTRY._options = None
+  _SECRETGETORCREATEREQUEST_ENVDICTENTRY._serialized_options = b'8\001'
+  _SHAREDVOLUMECREATEREQUEST.fields_by_name['app_id']._options = None
+  _SHAREDVOLUMECREATEREQUEST.fields_by_name['app_id']._serialized_options = b'\200\265\030\001'
+  _SHAREDVOLUMEPUTFILEREQUEST.fields_by_name['shared_volume_id']._options = None
+  _SHAREDVOLUMEPUTFILEREQUEST.fields_by_name['shared_volume_id']._serialized_options = b'\200\265\030\001'
+  _SHAREDVOLUMEREMOVEFILEREQUEST.fields_by_name['shared_volume_id']._options = None
+  _SHAREDVOLUMEREMOVEFILEREQUEST.fields_by_name['shared_volume_id']._serialized_options = b'\200\265\030\001'
+  _VOLUMECREATEREQUEST.fields_by_name['app_id']._options = None
+  _VOLUMECREATEREQUEST.fields_by_name['app_id']._serialized_options = b'\200\265\030\001'
+  _VOLUMECOMMITREQUEST.fields_by_name['volume_id']._options = None
+  _VOLUMECOMMITREQUEST.fields_by_name['volume_id']._serialized_options = b'\200\265\030\001'
+  _VOLUMEDELETEREQUEST.fields_by_name['environment_name']._options = None
+  _VOLUMEDELETEREQUEST.fields_by_name['environment_name']._serialized_options = b'\030\001'
+  _VOLUMEREMOVEFILEREQUEST.fields_by_name['volume_id']._options = None
+  _VOLUMEREMOVEFILEREQUEST.fields_by_name['volume_id']._serialized_options = b'\200\265\030\001'
+  _WORKSPACENAMELOOKUPRESPONSE.fields_by_name['workspace_name']._options = None
+  _WORKSPACENAMELOOKUPRESPONSE.fields_by_name['workspace_name']._serialized_options = b'\030\001'
+  _globals['_APPDEPLOYVISIBILITY']._serialized_start=31322
+  _globals['_APPDEPLOYVISIBILITY']._serialized_end=31453
+  _globals['_APPDISCONNECTREASON']._serialized_start=31456
+  _globals['_APPDISCONNECTREASON']._serialized_end=31701
+  _globals['_APPSTATE']._serialized_start=31704
+  _globals['_APPSTATE']._serialized_end=31973
+  _globals['_APPSTOPSOURCE']._serialized_start=31976
+  _globals['_APPSTOPSOURCE']._serialized_end=32109
+  _globals['_CERTIFICATESTATUS']._serialized_start=32112
+  _globals['_CERTIFICATESTATUS']._serialized_end=32257
+  _globals['_CHECKPOINTSTATUS']._serialized_start=32260
+  _globals['_CHECKPOINTSTATUS']._serialized_end=32437
+  _globals['_CLIENTTYPE']._serialized_start=32440
+  _globals['_CLIENTTYPE']._serialized_end=32616
+  _globals['_CLOUDPROVIDER']._serialized_start=32619
+  _globals['_CLOUDPROVIDER']._serialized_end=32763
+  _globals['_DATAFORMAT']._serialized_start=32765
+  _globals['_DATAFORMAT']._serialized_end=32884
+  _globals['_DEPLOYMENTNAMESPACE']._serialized_start=32887
+  _globals['_DEPLOYMENTNAMESPACE']._serialized_end=33015
+  _globals['_DNSRECORDTYPE']._serialized_start=33017
+  _globals['_DNSRECORDTYPE']._serialized_end=33107
+  _globals['_FILEDESCRIPTOR']._serialized_start=33110
+  _globals['_FILEDESCRIPTOR']._serialized_end=33241
+  _globals['_FUNCTIONCALLTYPE']._serialized_start=33243
+  _globals['_FUNCTIONCALLTYPE']._serialized_end=33355
+  _globals['_GPUTYPE']._serialized_start=33358
+  _globals['_GPUTYPE']._serialized_end=33616
+  _globals['_OBJECTCREATIONTYPE']._serialized_start=33619
+  _globals['_OBJECTCREATIONTYPE']._serialized_end=33907
+  _globals['_PROGRESSTYPE']._serialized_start=33909
+  _globals['_PROGRESSTYPE']._serialized_end=33971
+  _globals['_RATELIMITINTERVAL']._serialized_start=33973
+  _globals['_RATELIMITINTERVAL']._serialized_end=34093
+  _globals['_REGISTRYAUTHTYPE']._serialized_start=34096
+  _globals['_REGISTRYAUTHTYPE']._serialized_end=34274
+  _globals['_TASKSTATE']._serialized_start=34277
+  _globals['_TASKSTATE']._serialized_end=34625
+  _globals['_WEBHOOKTYPE']._serialized_start=34628
+  _globals['_WEBHOOKTYPE']._serialized_end=34781
+  _globals['_WEBHOOKASYNCMODE']._serialized_start=34784
+  _globals['_WEBHOOKASYNCMODE']._serialized_end=34938
+  _globals['_CLOUDBUCKETMOUNT']._serialized_start=128
+  _globals['_CLOUDBUCKETMOUNT']._serialized_end=364
+  _globals['_CLOUDBUCKETMOUNT_BUCKETTYPE']._serialized_start=327
+  _globals['_CLOUDBUCKETMOUNT_BUCKETTYPE']._serialized_end=364
+  _globals['_APPCLIENTDISCONNECTREQUEST']._serialized_start=366
+  _globals['_APPCLIENTDISCONNECTREQUEST']._serialized_end=480
+  _globals['_APPCREATEREQUEST']._serialized_start=483
+  _globals['_APPCREATEREQUEST']._serialized_end=662
+  _globals['_APPCREATERESPONSE']._serialized_start=664
+  _globals['_APPCREATERESPONSE']._serialized_end=721
+  _globals['_APPSTOPREQUEST']._serialized_start=723
+  _globals['_APPSTOPREQUEST']._serialized_end=806
+  _globals['_APPDEPLOYREQUEST']._serialized_start=809
+  _globals['_APPDEPLOYREQUEST']._serialized_end=995
+  _globals['_APPDEPLOYRESPONSE']._serialized_start=997
+  _globals['_APPDEPLOYRESPONSE']._serialized_end=1029
+  _globals['_APPDEPLOYSINGLEOBJECTREQUEST']._serialized_start=1032
+  _globals['_APPDEPLOYSINGLEOBJECTREQUEST']._serialized_end=1175
+  _globals['_APPDEPLOYSINGLEOBJECTRESPONSE']._serialized_start=1177
+  _globals['_APPDEPLOYSINGLEOBJECTRESPONSE']._serialized_end=1224
+  _globals['_APPGETBYDEPLOYMENTNAMEREQUEST']._serialized_start=1226
+  _globals['_APPGETBYDEPLOYMENTNAMEREQUEST']._serialized_end=1351
+  _globals['_APPGETBYDEPLOYMENTNAMERESPONSE']._serialized_start=1353
+  _globals['_APPGETBYDEPLOYMENTNAMERESPONSE']._serialized_end=1401
+  _globals['_APPGETLOGSREQUEST']._serialized_start=1404
+  _globals['_APPGETLOGSREQUEST']._serialized_end=1590
+  _globals['_APPGETOBJECTSREQUEST']._serialized_start=1592
+  _globals['_APPGETOBJECTSREQUEST']._serialized_end=1657
+  _globals['_APPGETOBJECTSITEM']._serialized_start=1659
+  _globals['_APPGETOBJECTSITEM']._serialized_end=1729
+  _globals['_APPGETOBJECTSRESPONSE']._serialized_start=1731
+  _globals['_APPGETOBJECTSRESPONSE']._serialized_end=1802
+  _globals['_APPHEARTBEATREQUEST']._serialized_start=1804
+  _globals['_APPHEARTBEATREQUEST']._serialized_end=1841
+  _globals['_APPLISTREQUEST']._serialized_start=1843
+  _globals['_APPLISTREQUEST']._serialized_end=1885
+  _globals['_APPLISTRESPONSE']._serialized_start=1887
+  _globals['_APPLISTRESPONSE']._serialized_end=1942
+  _globals['_APPLOOKUPOBJECTREQUEST']._serialized_start=1945
+  _globals['_APPLOOKUPOBJECTREQUEST']._serialized_end=2129
+  _globals['_APPLOOKUPOBJECTRESPONSE']._serialized_start=2131
+  _globals['_APPLOOKUPOBJECTRESPONSE']._serialized_end=2210
+  _globals['_APPSETOBJECTSREQUEST']._serialized_start=2213
+  _globals['_APPSETOBJECTSREQUEST']._serialized_end=2516
+  _globals['_APPSETOBJECTSREQUEST_INDEXEDOBJECTIDSENTRY']._serialized_start=2461
+  _globals['_APPSETOBJECTSREQUEST_INDEXEDOBJECTIDSENTRY']._serialized_end=2516
+  _globals['_APPSTATS']._serialized_start=2519
+  _globals['_APPSTATS']._serialized_end=2728
+  _globals['_ASGI']._serialized_start=2731
+  _globals['_ASGI']._serialized_end=4558
+  _globals['_ASGI_HTTP']._serialized_start=3551
+  _globals['_ASGI_HTTP']._serialized_end=3748
+  _globals['_ASGI_HTTPREQUEST']._serialized_start=3750
+  _globals['_ASGI_HTTPREQUEST']._serialized_end=3796
+  _globals['_ASGI_HTTPRESPONSESTART']._serialized_start=3798
+  _globals['_ASGI_HTTPRESPONSESTART']._serialized_end=3868
+  _globals['_ASGI_HTTPRESPONSEBODY']._serialized_start=3870
+  _globals['_ASGI_HTTPRESPONSEBODY']._serialized_end=3921
+  _globals['_ASGI_HTTPRESPONSETRAILERS']._serialized_start=3923
+  _globals['_ASGI_HTTPRESPONSETRAILERS']._serialized_end=3985
+  _globals['_ASGI_HTTPDISCONNECT']._serialized_start=3987
+  _globals['_ASGI_HTTPDISCONNECT']._serialized_end=4003
+  _globals['_ASGI_WEBSOCKET']._serialized_start=4006
+  _globals['_ASGI_WEBSOCKET']._serialized_end=4214
+  _globals['_ASGI_WEBSOCKETCONNECT']._serialized_start=4216
+  _globals['_ASGI_WEBSOCKETCONNECT']._serialized_end=4234
+  _globals['_ASGI_WEBSOCKETACCEPT']._serialized_start=4236
+  _globals['_ASGI_WEBSOCKETACCEPT']._serialized_end=4312
+  _globals['_ASGI_WEBSOCKETRECEIVE']._serialized_start=4314
+  _globals['_ASGI_WEBSOCKETRECEIVE']._serialized_end=4376
+  _globals['_ASGI_WEBSOCKETSEND']._serialized_start=4378
+  _globals['_ASGI_WEBSOCKETSEND']._serialized_end=4437
+  _globals['_ASGI_WEBSOCKETDISCONNECT']._serialized_start=4439
+  _globals['_ASGI_WEBSOCKETDISCONNECT']._serialized_end=4488
+  _globals['_ASGI_WEBSOCKETCLOSE']._serialized_start=4490
+  _globals['_ASGI_WEBSOCKETCLOSE']._serialized_end=4550
+  _globals['_BASEIMAGE']._serialized_start=4560
+  _globals['_BASEIMAGE']._serialized_end=4615
+  _globals['_BLOBCREATEREQUEST']._serialized_start=4617
+  _globals['_BLOBCREATEREQUEST']._serialized_end=4712
+  _globals['_BLOBCREATERESPONSE']._serialized_start=4715
+  _globals['_BLOBCREATERESPONSE']._serialized_end=4847
+  _globals['_BLOBGETREQUEST']._serialized_start=4849
+  _globals['_BLOBGETREQUEST']._serialized_end=4882
+  _globals['_BLOBGETRESPONSE']._serialized_start=4884
+  _globals['_BLOBGETRESPONSE']._serialized_end=4923
+  _globals['_CHECKPOINTINFO']._serialized_start=4925
+  _globals['_CHECKPOINTINFO']._serialized_end=5030
+  _globals['_CLASSCREATEREQUEST']._serialized_start=5032
+  _globals['_CLASSCREATEREQUEST']._serialized_end=5145
+  _globals['_CLASSCREATERESPONSE']._serialized_start=5147
+  _globals['_CLASSCREATERESPONSE']._serialized_end=5246
+  _globals['_CLASSGETREQUEST']._serialized_start=5249
+  _globals['_CLASSGETREQUEST']._serialized_end=5434
+  _globals['_CLASSGETRESPONSE']._serialized_start=5436
+  _globals['_CLASSGETRESPONSE']._serialized_end=5532
+  _globals['_CLASSHANDLEMETADATA']._serialized_start=5534
+  _globals['_CLASSHANDLEMETADATA']._serialized_end=5599
+  _globals['_CLASSMETHOD']._serialized_start=5602
+  _globals['_CLASSMETHOD']._serialized_end=5731
+  _globals['_CLIENTCREATEREQUEST']._serialized_start=5733
+  _globals['_CLIENTCREATEREQUEST']._serialized_end=5824
+  _globals['_CLIENTCREATERESPONSE']._serialized_start=5826
+  _globals['_CLIENTCREATERESPONSE']._serialized_end=5911
+  _globals['_CLIENTHELLORESPONSE']._serialized_start=5913
+  _globals['_CLIENTHELLORESPONSE']._serialized_end=5982
+  _globals['_CLIENTHEARTBEATREQUEST']._serialized_start=5984
+  _globals['_CLIENTHEARTBEATREQUEST']._serialized_end=6087
+  _globals['_CONTAINERARGUMENTS']._serialized_start=6090
+  _globals['_CONTAINERARGUMENTS']._serialized_end=6505
+  _globals['_CONTAINERARGUMENTS_TRACINGCONTEXTENTRY']._serialized_start=6434
+  _globals['_CONTAINERARGUMENTS_TRACINGCONTEXTENTRY']._serialized_end=6487
+  _globals['_CANCELINPUTEVENT']._serialized_start=6507
+  _globals['_CANCELINPUTEVENT']._serialized_end=6544
+  _globals['_CONTAINERHEARTBEATRESPONSE']._serialized_start=6546
+  _globals['_CONTAINERHEARTBEATRESPONSE']._serialized_end=6662
+  _globals['_CONTAINERHEARTBEATREQUEST']._serialized_start=6665
+  _globals['_CONTAINERHEARTBEATREQUEST']._serialized_end=6798
+  _globals['_CONTAINERCHECKPOINTREQUEST']._serialized_start=6800
+  _globals['_CONTAINERCHECKPOINTREQUEST']._serialized_end=6851
+  _globals['_CONTAINEREXECREQUEST']._serialized_start=6854
+  _globals['_CONTAINEREXECREQUEST']._serialized_end=7011
+  _globals['_CONTAINEREXECGETOUTPUTREQUEST']._serialized_start=7013
+  _globals['_CONTAINEREXECGETOUTPUTREQUEST']._serialized_end=7104
+  _globals['_CONTAINEREXECPUTINPUTREQUEST']._serialized_start=7106
+  _globals['_CONTAINEREXECPUTINPUTREQUEST']._serialized_end=7203
+  _globals['_CONTAINEREXECRESPONSE']._serialized_start=7205
+  _globals['_CONTAINEREXECRESPONSE']._serialized_end=7245
+  _globals['_CUSTOMDOMAINCONFIG']._serialized_start=7247
+  _globals['_CUSTOMDOMAINCONFIG']._serialized_end=7281
+  _globals['_CUSTOMDOMAININFO']._serialized_start=7283
+  _globals['_CUSTOMDOMAININFO']._serialized_end=7314
+  _globals['_DATACHUNK']._serialized_start=7316
+  _globals['_DATACHUNK']._serialized_end=7443
+  _globals['_DICTCLEARREQUEST']._serialized_start=7445
+  _globals['_DICTCLEARREQUEST']._serialized_end=7480
+  _globals['_DICTCONTAINSREQUEST']._serialized_start=7482
+  _globals['_DICTCONTAINSREQUEST']._serialized_end=7533
+  _globals['_DICTCONTAINSRESPONSE']._serialized_start=7535
+  _globals['_DICTCONTAINSRESPONSE']._serialized_end=7572
+  _globals['_DICTCREATEREQUEST']._serialized_start=7574
+  _globals['_DICTCREATEREQUEST']._serialized_end=7680
+  _globals['_DICTCREATERESPONSE']._serialized_start=7682
+  _globals['_DICTCREATERESPONSE']._serialized_end=7719
+  _globals['_DICTGETORCREATEREQUEST']._serialized_start=7722
+  _globals['_DICTGETORCREATEREQUEST']._serialized_end=7954
+  _globals['_DICTGETORCREATERESPONSE']._serialized_start=7956
+  _globals['_DICTGETORCREATERESPONSE']._serialized_end=7998
+  _globals['_DICTENTRY']._serialized_start=8000
+  _globals['_DICTENTRY']._serialized_end=8039
+  _globals['_DICTGETREQUEST']._serialized_start=8041
+  _globals['_DICTGETREQUEST']._serialized_end=8087
+  _globals['_DICTGETRESPONSE']._serialized_start=8089
+  _globals['_DICTGETRESPONSE']._serialized_end=8151
+  _globals['_DICTHEARTBEATREQUEST']._serialized_start=8153
+  _globals['_DICTHEARTBEATREQUEST']._serialized_end=8192
+  _globals['_DICTLENREQUEST']._serialized_start=8194
+  _globals['_DICTLENREQUEST']._serialized_end=8227
+  _globals['_DICTLENRESPONSE']._serialized_start=8229
+  _globals['_DICTLENRESPONSE']._serialized_end=8259
+  _globals['_DICTPOPREQUEST']._serialized_start=8261
+  _globals['_DICTPOPREQUEST']._serialized_end=8307
+  _globals['_DICTPOPRESPONSE']._serialized_start=8309
+  _globals['_DICTPOPRESPONSE']._serialized_end=8371
+  _globals['_DICTUPDATEREQUEST']._serialized_start=8373
+  _globals['_DICTUPDATEREQUEST']._serialized_end=8451
+  _globals['_DICTUPDATERESPONSE']._serialized_start=8453
+  _globals['_DICTUPDATERESPONSE']._serialized_end=8473
+  _globals['_DNSRECORD']._serialized_start=8475
+  _globals['_DNSRECORD']._serialized_end=8558
+  _globals['_DOMAINCREATEREQUEST']._serialized_start=8560
+  _globals['_DOMAINCREATEREQUEST']._serialized_end=8608
+  _globals['_DOMAINCREATERESPONSE']._serialized_start=8610
+  _globals['_DOMAINCREATERESPONSE']._serialized_end=8697
+  _globals['_DOMAINLISTREQUEST']._serialized_start=8699
+  _globals['_DOMAINLISTREQUEST']._serialized_end=8718
+  _globals['_DOMAIN']._serialized_start=8721
+  _globals['_DOMAIN']._serialized_end=8896
+  _globals['_DOMAINLISTRESPONSE']._serialized_start=8898
+  _globals['_DOMAINLISTRESPONSE']._serialized_end=8957
+  _globals['_DOMAINCERTIFICATEVERIFYREQUEST']._serialized_start=8959
+  _globals['_DOMAINCERTIFICATEVERIFYREQUEST']._serialized_end=9010
+  _globals['_DOMAINCERTIFICATEVERIFYRESPONSE']._serialized_start=9012
+  _globals['_DOMAINCERTIFICATEVERIFYRESPONSE']._serialized_end=9083
+  _globals['_ENVIRONMENTCREATEREQUEST']._serialized_start=9085
+  _globals['_ENVIRONMENTCREATEREQUEST']._serialized_end=9125
+  _globals['_ENVIRONMENTDELETEREQUEST']._serialized_start=9127
+  _globals['_ENVIRONMENTDELETEREQUEST']._serialized_end=9167
+  _globals['_ENVIRONMENTLISTITEM']._serialized_start=9169
+  _globals['_ENVIRONMENTLISTITEM']._serialized_end=9228
+  _globals['_ENVIRONMENTLISTRESPONSE']._serialized_start=9230
+  _globals['_ENVIRONMENTLISTRESPONSE']._serialized_end=9305
+  _globals['_ENVIRONMENTUPDATEREQUEST']._serialized_start=9308
+  _globals['_ENVIRONMENTUPDATEREQUEST']._serialized_end=9450
+  _globals['_FUNCTIONCALLPUTDATAREQUEST']._serialized_start=9452
+  _globals['_FUNCTIONCALLPUTDATAREQUEST']._serialized_end=9552
+  _globals['_FUNCTIONCALLGETDATAREQUEST']._serialized_start=9554
+  _globals['_FUNCTIONCALLGETDATAREQUEST']._serialized_end=9628
+  _globals['_FUNCTION']._serialized_start=9631
+  _globals['_FUNCTION']._serialized_end=11539
+  _globals['_FUNCTION_DEFINITIONTYPE']._serialized_start=11258
+  _globals['_FUNCTION_DEFINITIONTYPE']._serialized_end=11365
+  _globals['_FUNCTION_FUNCTIONTYPE']._serialized_start=11367
+  _globals['_FUNCTION_FUNCTIONTYPE']._serialized_end=11469
+  _globals['_SCHEDULERPLACEMENT']._serialized_start=11541
+  _globals['_SCHEDULERPLACEMENT']._serialized_end=11665
+  _globals['_FUNCTIONHANDLEMETADATA']._serialized_start=11668
+  _globals['_FUNCTIONHANDLEMETADATA']._serialized_end=11811
+  _globals['_FUNCTIONCREATEREQUEST']._serialized_start=11814
+  _globals['_FUNCTIONCREATEREQUEST']._serialized_end=11973
+  _globals['_FUNCTIONOPTIONS']._serialized_start=11976
+  _globals['_FUNCTIONOPTIONS']._serialized_end=12559
+  _globals['_FUNCTIONPRECREATEREQUEST']._serialized_start=12562
+  _globals['_FUNCTIONPRECREATEREQUEST']._serialized_end=12776
+  _globals['_FUNCTIONPRECREATERESPONSE']._serialized_start=12778
+  _globals['_FUNCTIONPRECREATERESPONSE']._serialized_end=12889
+  _globals['_FUNCTIONBINDPARAMSREQUEST']._serialized_start=12892
+  _globals['_FUNCTIONBINDPARAMSREQUEST']._serialized_end=13050
+  _globals['_FUNCTIONBINDPARAMSRESPONSE']._serialized_start=13052
+  _globals['_FUNCTIONBINDPARAMSRESPONSE']._serialized_end=13170
+  _globals['_FUNCTIONCREATERESPONSE']._serialized_start=13173
+  _globals['_FUNCTIONCREATERESPONSE']._serialized_end=13388
+  _globals['_FUNCTIONGETREQUEST']._serialized_start=13391
+  _globals['_FUNCTIONGETREQUEST']._serialized_end=13529
+  _globals['_FUNCTIONGETRESPONSE']._serialized_start=13531
+  _globals['_FUNCTIONGETRESPONSE']._serialized_end=13636
+  _globals['_FUNCTIONUPDATESCHEDULINGPARAMSREQUEST']._serialized_start=13638
+  _globals['_FUNCTIONUPDATESCHEDULINGPARAMSREQUEST']._serialized_end=13731
+  _globals['_FUNCTIONUPDATESCHEDULINGPARAMSRESPONSE']._serialized_start=13733
+  _globals['_FUNCTIONUPDATESCHEDULINGPARAMSRESPONSE']._serialized_end=13773
+  _globals['_FUNCTIONGETINPUTSITEM']._serialized_start=13776
+  _globals['_FUNCTIONGETINPUTSITEM']._serialized_end=13914
+  _globals['_FUNCTIONGETINPUTSREQUEST']._serialized_start=13916
+  _globals['_FUNCTIONGETINPUTSREQUEST']._serialized_end=14037
+  _globals['_FUNCTIONGETINPUTSRESPONSE']._serialized_start=14039
+  _globals['_FUNCTIONGETINPUTSRESPONSE']._serialized_end=14154
+  _globals['_FUNCTIONGETOUTPUTSITEM']._serialized_start=14157
+  _globals['_FUNCTIONGETOUTPUTSITEM']._serialized_end=14323
+  _globals['_FUNCTIONGETOUTPUTSREQUEST']._serialized_start=14326
+  _globals['_FUNCTIONGETOUTPUTSREQUEST']._serialized_end=14465
+  _globals['_FUNCTIONGETOUTPUTSRESPONSE']._serialized_start=14467
+  _globals['_FUNCTIONGETOUTPUTSRESPONSE']._serialized_end=14587
+  _globals['_FUNCTIONGETSERIALIZEDREQUEST']._serialized_start=14589
+  _globals['_FUNCTIONGETSERIALIZEDREQUEST']._serialized_end=14640
+  _globals['_FUNCTIONGETSERIALIZEDRESPONSE']._serialized_start=14642
+  _globals['_FUNCTIONGETSERIALIZEDRESPONSE']._serialized_end=14728
+  _globals['_FUNCTIONINPUT']._serialized_start=14731
+  _globals['_FUNCTIONINPUT']._serialized_end=14868
+  _globals['_FUNCTIONMAPREQUEST']._serialized_start=14871
+  _globals['_FUNCTIONMAPREQUEST']._serialized_end=15087
+  _globals['_FUNCTIONMAPRESPONSE']._serialized_start=15089
+  _globals['_FUNCTIONMAPRESPONSE']._serialized_end=15207
+  _globals['_FUNCTIONPUTINPUTSITEM']._serialized_start=15209
+  _globals['_FUNCTIONPUTINPUTSITEM']._serialized_end=15289
+  _globals['_FUNCTIONPUTINPUTSREQUEST']._serialized_start=15291
+  _globals['_FUNCTIONPUTINPUTSREQUEST']._serialized_end=15417
+  _globals['_FUNCTIONPUTINPUTSRESPONSEITEM']._serialized_start=15419
+  _globals['_FUNCTIONPUTINPUTSRESPONSEITEM']._serialized_end=15481
+  _globals['_FUNCTIONPUTINPUTSRESPONSE']._serialized_start=15483
+  _globals['_FUNCTIONPUTINPUTSRESPONSE']._serialized_end=15571
+  _globals['_FUNCTIONPUTOUTPUTSITEM']._serialized_start=15574
+  _globals['_FUNCTIONPUTOUTPUTSITEM']._serialized_end=15780
+  _globals['_FUNCTIONPUTOUTPUTSREQUEST']._serialized_start=15782
+  _globals['_FUNCTIONPUTOUTPUTSREQUEST']._serialized_end=15864
+  _globals['_FUNCTIONRETRYPOLICY']._serialized_start=15866
+  _globals['_FUNCTIONRETRYPOLICY']._serialized_end=15981
+  _globals['_FUNCTIONGETCALLGRAPHREQUEST']._serialized_start=15983
+  _globals['_FUNCTIONGETCALLGRAPHREQUEST']._serialized_end=16038
+  _globals['_INPUTCALLGRAPHINFO']._serialized_start=16041
+  _globals['_INPUTCALLGRAPHINFO']._serialized_end=16181
+  _globals['_FUNCTIONCALLCALLGRAPHINFO']._serialized_start=16183
+  _globals['_FUNCTIONCALLCALLGRAPHINFO']._serialized_end=16305
+  _globals['_FUNCTIONGETCALLGRAPHRESPONSE']._serialized_start=16308
+  _globals['_FUNCTIONGETCALLGRAPHRESPONSE']._serialized_end=16453
+  _globals['_FUNCTIONCALLCANCELREQUEST']._serialized_start=16455
+  _globals['_FUNCTIONCALLCANCELREQUEST']._serialized_end=16508
+  _globals['_FUNCTIONCALLLISTREQUEST']._serialized_start=16510
+  _globals['_FUNCTIONCALLLISTREQUEST']._serialized_end=16556
+  _globals['_FUNCTIONCALLINFO']._serialized_start=16559
+  _globals['_FUNCTIONCALLINFO']._serialized_end=17010
+  _globals['_FUNCTIONCALLLISTRESPONSE']._serialized_start=17012
+  _globals['_FUNCTIONCALLLISTRESPONSE']._serialized_end=17094
+  _globals['_FUNCTIONGETCURRENTSTATSREQUEST']._serialized_start=17096
+  _globals['_FUNCTIONGETCURRENTSTATSREQUEST']._serialized_end=17149
+  _globals['_FUNCTIONSTATS']._serialized_start=17151
+  _globals['_FUNCTIONSTATS']._serialized_end=17234
+  _globals['_GENERATORDONE']._serialized_start=17236
+  _globals['_GENERATORDONE']._serialized_end=17272
+  _globals['_GENERICRESULT']._serialized_start=17275
+  _globals['_GENERICRESULT']._serialized_end=17913
+  _globals['_GENERICRESULT_GENERICSTATUS']._serialized_start=17587
+  _globals['_GENERICRESULT_GENERICSTATUS']._serialized_end=17782
+  _globals['_GENERICRESULT_GENERATORSTATUS']._serialized_start=17784
+  _globals['_GENERICRESULT_GENERATORSTATUS']._serialized_end=17899
+  _globals['_GPUCONFIG']._serialized_start=17915
+  _globals['_GPUCONFIG']._serialized_end=17994
+  _globals['_BUILDFUNCTION']._serialized_start=17996
+  _globals['_BUILDFUNCTION']._serialized_end=18092
+  _globals['_IMAGE']._serialized_start=18095
+  _globals['_IMAGE']._serialized_end=18572
+  _globals['_IMAGECONTEXTFILE']._serialized_start=18574
+  _globals['_IMAGECONTEXTFILE']._serialized_end=18624
+  _globals['_IMAGEGETORCREATEREQUEST']._serialized_start=18627
+  _globals['_IMAGEGETORCREATEREQUEST']._serialized_end=18864
+  _globals['_IMAGEGETORCREATERESPONSE']._serialized_start=18866
+  _globals['_IMAGEGETORCREATERESPONSE']._serialized_end=18910
+  _globals['_IMAGEJOINSTREAMINGREQUEST']._serialized_start=18912
+  _globals['_IMAGEJOINSTREAMINGREQUEST']._serialized_end=18997
+  _globals['_IMAGEJOINSTREAMINGRESPONSE']._serialized_start=19000
+  _globals['_IMAGEJOINSTREAMINGRESPONSE']._serialized_end=19147
+  _globals['_IMAGEREGISTRYCONFIG']._serialized_start=19149
+  _globals['_IMAGEREGISTRYCONFIG']._serialized_end=19249
+  _globals['_INPUTINFO']._serialized_start=19252
+  _globals['_INPUTINFO']._serialized_end=19405
+  _globals['_INPUTCATEGORYINFO']._serialized_start=19407
+  _globals['_INPUTCATEGORYINFO']._serialized_end=19482
+  _globals['_MOUNTBUILDREQUEST']._serialized_start=19484
+  _globals['_MOUNTBUILDREQUEST']._serialized_end=19592
+  _globals['_MOUNTBUILDRESPONSE']._serialized_start=19594
+  _globals['_MOUNTBUILDRESPONSE']._serialized_end=19692
+  _globals['_MOUNTGETORCREATEREQUEST']._serialized_start=19695
+  _globals['_MOUNTGETORCREATEREQUEST']._serialized_end=19945
+  _globals['_MOUNTGETORCREATERESPONSE']._serialized_start=19947
+  _globals['_MOUNTGETORCREATERESPONSE']._serialized_end=20051
+  _globals['_MOUNTHANDLEMETADATA']._serialized_start=20053
+  _globals['_MOUNTHANDLEMETADATA']._serialized_end=20111
+  _globals['_MOUNTFILE']._serialized_start=20113
+  _globals['_MOUNTFILE']._serialized_end=20218
+  _globals['_MOUNTPUTFILEREQUEST']._serialized_start=20220
+  _globals['_MOUNTPUTFILEREQUEST']._serialized_end=20315
+  _globals['_MOUNTPUTFILERESPONSE']._serialized_start=20317
+  _globals['_MOUNTPUTFILERESPONSE']._serialized_end=20355
+  _globals['_MULTIPARTUPLOAD']._serialized_start=20357
+  _globals['_MULTIPARTUPLOAD']._serialized_end=20440
+  _globals['_OBJECT']._serialized_start=20443
+  _globals['_OBJECT']._serialized_end=20777
+  _globals['_OBJECTDEPENDENCY']._serialized_start=20779
+  _globals['_OBJECTDEPENDENCY']._serialized_end=20816
+  _globals['_PROXYGETORCREATEREQUEST']._serialized_start=20819
+  _globals['_PROXYGETORCREATEREQUEST']._serialized_end=21013
+  _globals['_PROXYGETORCREATERESPONSE']._serialized_start=21015
+  _globals['_PROXYGETORCREATERESPONSE']._serialized_end=21059
+  _globals['_PROXYINFO']._serialized_start=21061
+  _globals['_PROXYINFO']._serialized_end=21153
+  _globals['_PTYINFO']._serialized_start=21156
+  _globals['_PTYINFO']._serialized_end=21418
+  _globals['_PTYINFO_PTYTYPE']._serialized_start=21340
+  _globals['_PTYINFO_PTYTYPE']._serialized_end=21418
+  _globals['_QUEUECREATEREQUEST']._serialized_start=21420
+  _globals['_QUEUECREATEREQUEST']._serialized_end=21483
+  _globals['_QUEUECREATERESPONSE']._serialized_start=21485
+  _globals['_QUEUECREATERESPONSE']._serialized_end=21524
+  _globals['_QUEUEGETORCREATEREQUEST']._serialized_start=21527
+  _globals['_QUEUEGETORCREATEREQUEST']._serialized_end=21721
+  _globals['_QUEUEGETORCREATERESPONSE']._serialized_start=21723
+  _globals['_QUEUEGETORCREATERESPONSE']._serialized_end=21767
+  _globals['_QUEUEGETREQUEST']._serialized_start=21769
+  _globals['_QUEUEGETREQUEST']._serialized_end=21862
+  _globals['_QUEUEGETRESPONSE']._serialized_start=21864
+  _globals['_QUEUEGETRESPONSE']._serialized_end=21898
+  _globals['_QUEUEHEARTBEATREQUEST']._serialized_start=21900
+  _globals['_QUEUEHEARTBEATREQUEST']._serialized_end=21941
+  _globals['_QUEUEPUTREQUEST']._serialized_start=21943
+  _globals['_QUEUEPUTREQUEST']._serialized_end=22048
+  _globals['_QUEUELENREQUEST']._serialized_start=22050
+  _globals['_QUEUELENREQUEST']._serialized_end=22108
+  _globals['_QUEUELENRESPONSE']._serialized_start=22110
+  _globals['_QUEUELENRESPONSE']._serialized_end=22141
+  _globals['_QUEUENEXTITEMSREQUEST']._serialized_start=22143
+  _globals['_QUEUENEXTITEMSREQUEST']._serialized_end=22257
+  _globals['_QUEUEITEM']._serialized_start=22259
+  _globals['_QUEUEITEM']._serialized_end=22303
+  _globals['_QUEUENEXTITEMSRESPONSE']._serialized_start=22305
+  _globals['_QUEUENEXTITEMSRESPONSE']._serialized_end=22369
+  _globals['_RATELIMIT']._serialized_start=22371
+  _globals['_RATELIMIT']._serialized_end=22448
+  _globals['_RESOURCES']._serialized_start=22450
+  _globals['_RESOURCES']._serialized_end=22567
+  _globals['_S3MOUNT']._serialized_start=22569
+  _globals['_S3MOUNT']._serialized_end=22669
+  _globals['_SANDBOX']._serialized_start=22672
+  _globals['_SANDBOX']._serialized_end=23209
+  _globals['_SANDBOXCREATEREQUEST']._serialized_start=23211
+  _globals['_SANDBOXCREATEREQUEST']._serialized_end=23298
+  _globals['_SANDBOXCREATERESPONSE']._serialized_start=23300
+  _globals['_SANDBOXCREATERESPONSE']._serialized_end=23343
+  _globals['_SANDBOXGETTASKIDREQUEST']._serialized_start=23345
+  _globals['_SANDBOXGETTASKIDREQUEST']._serialized_end=23390
+  _globals['_SANDBOXGETTASKIDRESPONSE']._serialized_start=23392
+  _globals['_SANDBOXGETTASKIDRESPONSE']._serialized_end=23435
+  _globals['_SANDBOXGETLOGSREQUEST']._serialized_start=23438
+  _globals['_SANDBOXGETLOGSREQUEST']._serialized_end=23576
+  _globals['_SANDBOXSTDINWRITEREQUEST']._serialized_start=23578
+  _globals['_SANDBOXSTDINWRITEREQUEST']._serialized_end=23667
+  _globals['_SANDBOXSTDINWRITERESPONSE']._serialized_start=23669
+  _globals['_SANDBOXSTDINWRITERESPONSE']._serialized_end=23696
+  _globals['_SANDBOXHANDLEMETADATA']._serialized_start=23698
+  _globals['_SANDBOXHANDLEMETADATA']._serialized_end=23766
+  _globals['_SANDBOXINFO']._serialized_start=23769
+  _globals['_SANDBOXINFO']._serialized_end=23900
+  _globals['_SANDBOXLISTREQUEST']._serialized_start=23902
+  _globals['_SANDBOXLISTREQUEST']._serialized_end=23964
+  _globals['_SANDBOXLISTRESPONSE']._serialized_start=23966
+  _globals['_SANDBOXLISTRESPONSE']._serialized_end=24033
+  _globals['_SANDBOXTERMINATEREQUEST']._serialized_start=24035
+  _globals['_SANDBOXTERMINATEREQUEST']._serialized_end=24080
+  _globals['_SANDBOXTERMINATERESPONSE']._serialized_start=24082
+  _globals['_SANDBOXTERMINATERESPONSE']._serialized_end=24162
+  _globals['_SANDBOXWAITREQUEST']._serialized_start=24164
+  _globals['_SANDBOXWAITREQUEST']._serialized_end=24221
+  _globals['_SANDBOXWAITRESPONSE']._serialized_start=24223
+  _globals['_SANDBOXWAITRESPONSE']._serialized_end=24289
+  _globals['_SCHEDULE']._serialized_start=24292
+  _globals['_SCHEDULE']._serialized_end=24562
+  _globals['_SCHEDULE_CRON']._serialized_start=24398
+  _globals['_SCHEDULE_CRON']._serialized_end=24425
+  _globals['_SCHEDULE_PERIOD']._serialized_start=24427
+  _globals['_SCHEDULE_PERIOD']._serialized_end=24544
+  _globals['_SECRETCREATEREQUEST']._serialized_start=24565
+  _globals['_SECRETCREATEREQUEST']._serialized_end=24773
+  _globals['_SECRETCREATEREQUEST_ENVDICTENTRY']._serialized_start=24727
+  _globals['_SECRETCREATEREQUEST_ENVDICTENTRY']._serialized_end=24773
+  _globals['_SECRETCREATERESPONSE']._serialized_start=24775
+  _globals['_SECRETCREATERESPONSE']._serialized_end=24816
+  _globals['_SECRETGETORCREATEREQUEST']._serialized_start=24819
+  _globals['_SECRETGETORCREATEREQUEST']._serialized_end=25149
+  _globals['_SECRETGETORCREATEREQUEST_ENVDICTENTRY']._serialized_start=24727
+  _globals['_SECRETGETORCREATEREQUEST_ENVDICTENTRY']._serialized_end=24773
+  _globals['_SECRETGETORCREATERESPONSE']._serialized_start=25151
+  _globals['_SECRETGETORCREATERESPONSE']._serialized_end=25197
+  _globals['_SECRETLISTITEM']._serialized_start=25199
+  _globals['_SECRETLISTITEM']._serialized_end=25298
+  _globals['_SECRETLISTREQUEST']._serialized_start=25300
+  _globals['_SECRETLISTREQUEST']._serialized_end=25345
+  _globals['_SECRETLISTRESPONSE']._serialized_start=25347
+  _globals['_SECRETLISTRESPONSE']._serialized_end=25438
+  _globals['_SHAREDVOLUMEGETORCREATEREQUEST']._serialized_start=25441
+  _globals['_SHAREDVOLUMEGETORCREATEREQUEST']._serialized_end=25658
+  _globals['_SHAREDVOLUMEGETORCREATERESPONSE']._serialized_start=25660
+  _globals['_SHAREDVOLUMEGETORCREATERESPONSE']._serialized_end=25719
+  _globals['_SHAREDVOLUMEHEARTBEATREQUEST']._serialized_start=25721
+  _globals['_SHAREDVOLUMEHEARTBEATREQUEST']._serialized_end=25777
+  _globals['_SHAREDVOLUMECREATEREQUEST']._serialized_start=25779
+  _globals['_SHAREDVOLUMECREATEREQUEST']._serialized_end=25881
+  _globals['_SHAREDVOLUMECREATERESPONSE']._serialized_start=25883
+  _globals['_SHAREDVOLUMECREATERESPONSE']._serialized_end=25937
+  _globals['_SHAREDVOLUMELISTITEM']._serialized_start=25940
+  _globals['_SHAREDVOLUMELISTITEM']._serialized_end=26076
+  _globals['_SHAREDVOLUMELISTREQUEST']._serialized_start=26078
+  _globals['_SHAREDVOLUMELISTREQUEST']._serialized_end=26129
+  _globals['_SHAREDVOLUMELISTRESPONSE']._serialized_start=26131
+  _globals['_SHAREDVOLUMELISTRESPONSE']._serialized_end=26234
+  _globals['_SHAREDVOLUMELISTFILESREQUEST']._serialized_start=26236
+  _globals['_SHAREDVOLUMELISTFILESREQUEST']._serialized_end=26306
+  _globals['_SHAREDVOLUMEPUTFILEREQUEST']._serialized_start=26309
+  _globals['_SHAREDVOLUMEPUTFILEREQUEST']._serialized_end=26476
+  _globals['_SHAREDVOLUMEPUTFILERESPONSE']._serialized_start=26478
+  _globals['_SHAREDVOLUMEPUTFILERESPONSE']._serialized_end=26523
+  _globals['_SHAREDVOLUMEGETFILEREQUEST']._serialized_start=26525
+  _globals['_SHAREDVOLUMEGETFILEREQUEST']._serialized_end=26593
+  _globals['_SHAREDVOLUMEGETFILERESPONSE']._serialized_start=26595
+  _globals['_SHAREDVOLUMEGETFILERESPONSE']._serialized_end=26678
+  _globals['_SHAREDVOLUMEREMOVEFILEREQUEST']._serialized_start=26680
+  _globals['_SHAREDVOLUMEREMOVEFILEREQUEST']._serialized_end=26776
+  _globals['_SHAREDVOLUMELISTFILESENTRY']._serialized_start=26779
+  _globals['_SHAREDVOLUMELISTFILESENTRY']._serialized_end=26940
+  _globals['_SHAREDVOLUMELISTFILESENTRY_FILETYPE']._serialized_start=26888
+  _globals['_SHAREDVOLUMELISTFILESENTRY_FILETYPE']._serialized_end=26940
+  _globals['_SHAREDVOLUMELISTFILESRESPONSE']._serialized_start=26942
+  _globals['_SHAREDVOLUMELISTFILESRESPONSE']._serialized_end=27032
+  _globals['_SHAREDVOLUMEMOUNT']._serialized_start=27035
+  _globals['_SHAREDVOLUMEMOUNT']._serialized_end=27181
+  _globals['_TASKCURRENTINPUTSRESPONSE']._serialized_start=27183
+  _globals['_TASKCURRENTINPUTSRESPONSE']._serialized_end=27229
+  _globals['_TASKINFO']._serialized_start=27231
+  _globals['_TASKINFO']._serialized_end=27339
+  _globals['_TASKLOGS']._serialized_start=27342
+  _globals['_TASKLOGS']._serialized_end=27580
+  _globals['_TASKLISTREQUEST']._serialized_start=27582
+  _globals['_TASKLISTREQUEST']._serialized_end=27599
+  _globals['_TASKLISTRESPONSE']._serialized_start=27601
+  _globals['_TASKLISTRESPONSE']._serialized_end=27659
+  _globals['_TASKLOGSBATCH']._serialized_start=27662
+  _globals['_TASKLOGSBATCH']._serialized_end=27860
+  _globals['_TASKPROGRESS']._serialized_start=27862
+  _globals['_TASKPROGRESS']._serialized_end=27974
+  _globals['_TASKRESULTREQUEST']._serialized_start=27976
+  _globals['_TASKRESULTREQUEST']._serialized_end=28040
+  _globals['_TASKSTATS']._serialized_start=28042
+  _globals['_TASKSTATS']._serialized_end=28131
+  _globals['_TOKENFLOWCREATEREQUEST']._serialized_start=28133
+  _globals['_TOKENFLOWCREATEREQUEST']._serialized_end=28219
+  _globals['_TOKENFLOWCREATERESPONSE']._serialized_start=28221
+  _globals['_TOKENFLOWCREATERESPONSE']._serialized_end=28321
+  _globals['_TOKENFLOWWAITREQUEST']._serialized_start=28323
+  _globals['_TOKENFLOWWAITREQUEST']._serialized_end=28406
+  _globals['_TOKENFLOWWAITRESPONSE']._serialized_start=28408
+  _globals['_TOKENFLOWWAITRESPONSE']._serialized_end=28516
+  _globals['_TUNNELSTARTREQUEST']._serialized_start=28518
+  _globals['_TUNNELSTARTREQUEST']._serialized_end=28573
+  _globals['_TUNNELSTARTRESPONSE']._serialized_start=28576
+  _globals['_TUNNELSTARTRESPONSE']._serialized_end=28729
+  _globals['_TUNNELSTOPREQUEST']._serialized_start=28731
+  _globals['_TUNNELSTOPREQUEST']._serialized_end=28764
+  _globals['_TUNNELSTOPRESPONSE']._serialized_start=28766
+  _globals['_TUNNELSTOPRESPONSE']._serialized_end=28802
+  _globals['_VOLUMEGETORCREATEREQUEST']._serialized_start=28805
+  _globals['_VOLUMEGETORCREATEREQUEST']._serialized_end=29016
+  _globals['_VOLUMEGETORCREATERESPONSE']._serialized_start=29018
+  _globals['_VOLUMEGETORCREATERESPONSE']._serialized_end=29064
+  _globals['_VOLUMEHEARTBEATREQUEST']._serialized_start=29066
+  _globals['_VOLUMEHEARTBEATREQUEST']._serialized_end=29109
+  _globals['_VOLUMECREATEREQUEST']._serialized_start=29111
+  _globals['_VOLUMECREATEREQUEST']._serialized_end=29154
+  _globals['_VOLUMECREATERESPONSE']._serialized_start=29156
+  _globals['_VOLUMECREATERESPONSE']._serialized_end=29197
+  _globals['_VOLUMECOMMITREQUEST']._serialized_start=29199
+  _globals['_VOLUMECOMMITREQUEST']._serialized_end=29245
+  _globals['_VOLUMECOMMITRESPONSE']._serialized_start=29247
+  _globals['_VOLUMECOMMITRESPONSE']._serialized_end=29290
+  _globals['_VOLUMEDELETEREQUEST']._serialized_start=29292
+  _globals['_VOLUMEDELETEREQUEST']._serialized_end=29362
+  _globals['_VOLUMEGETFILEREQUEST']._serialized_start=29364
+  _globals['_VOLUMEGETFILEREQUEST']._serialized_end=29447
+  _globals['_VOLUMEGETFILERESPONSE']._serialized_start=29449
+  _globals['_VOLUMEGETFILERESPONSE']._serialized_end=29568
+  _globals['_VOLUMELISTFILESENTRY']._serialized_start=29571
+  _globals['_VOLUMELISTFILESENTRY']._serialized_end=29762
+  _globals['_VOLUMELISTFILESENTRY_FILETYPE']._serialized_start=29697
+  _globals['_VOLUMELISTFILESENTRY_FILETYPE']._serialized_end=29762
+  _globals['_VOLUMELISTFILESREQUEST']._serialized_start=29764
+  _globals['_VOLUMELISTFILESREQUEST']._serialized_end=29863
+  _globals['_VOLUMELISTFILESRESPONSE']._serialized_start=29865
+  _globals['_VOLUMELISTFILESRESPONSE']._serialized_end=29943
+  _globals['_VOLUMELISTITEM']._serialized_start=29945
+  _globals['_VOLUMELISTITEM']._serialized_end=30015
+  _globals['_VOLUMELISTREQUEST']._serialized_start=30017
+  _globals['_VOLUMELISTREQUEST']._serialized_end=30062
+  _globals['_VOLUMELISTRESPONSE']._serialized_start=30064
+  _globals['_VOLUMELISTRESPONSE']._serialized_end=30155
+  _globals['_VOLUMERELOADREQUEST']._serialized_start=30157
+  _globals['_VOLUMERELOADREQUEST']._serialized_end=30197
+  _globals['_VOLUMEPUTFILESREQUEST']._serialized_start=30199
+  _globals['_VOLUMEPUTFILESREQUEST']._serialized_end=30324
+  _globals['_VOLUMEREMOVEFILEREQUEST']._serialized_start=30326
+  _globals['_VOLUMEREMOVEFILEREQUEST']._serialized_end=30409
+  _globals['_VOLUMECOPYFILESREQUEST']._serialized_start=30411
+  _globals['_VOLUMECOPYFILESREQUEST']._serialized_end=30510
+  _globals['_VOLUMEMOUNT']._serialized_start=30512
+  _globals['_VOLUMEMOUNT']._serialized_end=30598
+  _globals['_WEBHOOKCONFIG']._serialized_start=30601
+  _globals['_WEBHOOKCONFIG']._serialized_end=30870
+  _globals['_WEBURLINFO']._serialized_start=30872
+  _globals['_WEBURLINFO']._serialized_end=30950
+  _globals['_WORKSPACENAMELOOKUPRESPONSE']._serialized_start=30952
+  _globals['_WORKSPACENAMELOOKUPRESPONSE']._serialized_end=31027
+  _globals['_RUNTIMEOUTPUTMESSAGE']._serialized_start=31029
+  _globals['_RUNTIMEOUTPUTMESSAGE']._serialized_end=31123
+  _globals['_RUNTIMEOUTPUTBATCH']._serialized_start=31126
+  _globals['_RUNTIMEOUTPUTBATCH']._serialized_end=31256
+  _globals['_RUNTIMEINPUTMESSAGE']._serialized_start=31258
+  _globals['_RUNTIMEINPUTMESSAGE']._serialized_end=31319
+  _globals['_MODALCLIENT']._serialized_start=34941
+  _globals['_MODALCLIENT']._serialized_end=44951
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,6487 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+import builtins
+import collections.abc
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.internal.enum_type_wrapper
+import google.protobuf.message
+import google.protobuf.wrappers_pb2
+import sys
+import typing
+
+if sys.version_info >= (3, 10):
+    import typing as typing_extensions
+else:
+    import typing_extensions
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+class _AppDeployVisibility:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _AppDeployVisibilityEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_AppDeployVisibility.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    APP_DEPLOY_VISIBILITY_UNSPECIFIED: _AppDeployVisibility.ValueType  # 0
+    APP_DEPLOY_VISIBILITY_WORKSPACE: _AppDeployVisibility.ValueType  # 1
+    APP_DEPLOY_VISIBILITY_PUBLIC: _AppDeployVisibility.ValueType  # 2
+
+class AppDeployVisibility(_AppDeployVisibility, metaclass=_AppDeployVisibilityEnumTypeWrapper): ...
+
+APP_DEPLOY_VISIBILITY_UNSPECIFIED: AppDeployVisibility.ValueType  # 0
+APP_DEPLOY_VISIBILITY_WORKSPACE: AppDeployVisibility.ValueType  # 1
+APP_DEPLOY_VISIBILITY_PUBLIC: AppDeployVisibility.ValueType  # 2
+global___AppDeployVisibility = AppDeployVisibility
+
+class _AppDisconnectReason:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _AppDisconnectReasonEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_AppDisconnectReason.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    APP_DISCONNECT_REASON_UNSPECIFIED: _AppDisconnectReason.ValueType  # 0
+    APP_DISCONNECT_REASON_LOCAL_EXCEPTION: _AppDisconnectReason.ValueType  # 1
+    APP_DISCONNECT_REASON_KEYBOARD_INTERRUPT: _AppDisconnectReason.ValueType  # 2
+    APP_DISCONNECT_REASON_ENTRYPOINT_COMPLETED: _AppDisconnectReason.ValueType  # 3
+    APP_DISCONNECT_REASON_DEPLOYMENT_EXCEPTION: _AppDisconnectReason.ValueType  # 4
+
+class AppDisconnectReason(_AppDisconnectReason, metaclass=_AppDisconnectReasonEnumTypeWrapper): ...
+
+APP_DISCONNECT_REASON_UNSPECIFIED: AppDisconnectReason.ValueType  # 0
+APP_DISCONNECT_REASON_LOCAL_EXCEPTION: AppDisconnectReason.ValueType  # 1
+APP_DISCONNECT_REASON_KEYBOARD_INTERRUPT: AppDisconnectReason.ValueType  # 2
+APP_DISCONNECT_REASON_ENTRYPOINT_COMPLETED: AppDisconnectReason.ValueType  # 3
+APP_DISCONNECT_REASON_DEPLOYMENT_EXCEPTION: AppDisconnectReason.ValueType  # 4
+global___AppDisconnectReason = AppDisconnectReason
+
+class _AppState:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _AppStateEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_AppState.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    APP_STATE_UNSPECIFIED: _AppState.ValueType  # 0
+    APP_STATE_EPHEMERAL: _AppState.ValueType  # 1
+    """Will be discharged when the client disconnects"""
+    APP_STATE_DETACHED: _AppState.ValueType  # 2
+    APP_STATE_DEPLOYED: _AppState.ValueType  # 3
+    """Will be discharged when overwritten"""
+    APP_STATE_STOPPING: _AppState.ValueType  # 4
+    """Winding down app due to user termination."""
+    APP_STATE_STOPPED: _AppState.ValueType  # 5
+    """Stopped"""
+    APP_STATE_INITIALIZING: _AppState.ValueType  # 6
+    """App is created and in process of deployment."""
+    APP_STATE_DISABLED: _AppState.ValueType  # 7
+    """Same as stopped but prevented from being garbage collected"""
+    APP_STATE_DETACHED_DISCONNECTED: _AppState.ValueType  # 8
+    """App is detached and local client has disconnected."""
+    APP_STATE_DERIVED: _AppState.ValueType  # 9
+    """App is derived from another workspace. Acts as a static, immutable group of functions."""
+
+class AppState(_AppState, metaclass=_AppStateEnumTypeWrapper):
+    """NOTE: make sure to update the frontend if we add a new state here
+    https://github.com/modal-labs/modal/blob/main/frontend/src/routes/(dashboard)/%5B%5Bworkspace%5D%5D/apps/+page.svelte#L95
+    """
+
+APP_STATE_UNSPECIFIED: AppState.ValueType  # 0
+APP_STATE_EPHEMERAL: AppState.ValueType  # 1
+"""Will be discharged when the client disconnects"""
+APP_STATE_DETACHED: AppState.ValueType  # 2
+APP_STATE_DEPLOYED: AppState.ValueType  # 3
+"""Will be discharged when overwritten"""
+APP_STATE_STOPPING: AppState.ValueType  # 4
+"""Winding down app due to user termination."""
+APP_STATE_STOPPED: AppState.ValueType  # 5
+"""Stopped"""
+APP_STATE_INITIALIZING: AppState.ValueType  # 6
+"""App is created and in process of deployment."""
+APP_STATE_DISABLED: AppState.ValueType  # 7
+"""Same as stopped but prevented from being garbage collected"""
+APP_STATE_DETACHED_DISCONNECTED: AppState.ValueType  # 8
+"""App is detached and local client has disconnected."""
+APP_STATE_DERIVED: AppState.ValueType  # 9
+"""App is derived from another workspace. Acts as a static, immutable group of functions."""
+global___AppState = AppState
+
+class _AppStopSource:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _AppStopSourceEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_AppStopSource.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    APP_STOP_SOURCE_UNSPECIFIED: _AppStopSource.ValueType  # 0
+    APP_STOP_SOURCE_CLI: _AppStopSource.ValueType  # 1
+    APP_STOP_SOURCE_PYTHON_CLIENT: _AppStopSource.ValueType  # 2
+    APP_STOP_SOURCE_WEB: _AppStopSource.ValueType  # 3
+
+class AppStopSource(_AppStopSource, metaclass=_AppStopSourceEnumTypeWrapper): ...
+
+APP_STOP_SOURCE_UNSPECIFIED: AppStopSource.ValueType  # 0
+APP_STOP_SOURCE_CLI: AppStopSource.ValueType  # 1
+APP_STOP_SOURCE_PYTHON_CLIENT: AppStopSource.ValueType  # 2
+APP_STOP_SOURCE_WEB: AppStopSource.ValueType  # 3
+global___AppStopSource = AppStopSource
+
+class _CertificateStatus:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _CertificateStatusEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_CertificateStatus.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    CERTIFICATE_STATUS_PENDING: _CertificateStatus.ValueType  # 0
+    CERTIFICATE_STATUS_ISSUED: _CertificateStatus.ValueType  # 1
+    CERTIFICATE_STATUS_FAILED: _CertificateStatus.ValueType  # 2
+    CERTIFICATE_STATUS_REVOKED: _CertificateStatus.ValueType  # 3
+
+class CertificateStatus(_CertificateStatus, metaclass=_CertificateStatusEnumTypeWrapper): ...
+
+CERTIFICATE_STATUS_PENDING: CertificateStatus.ValueType  # 0
+CERTIFICATE_STATUS_ISSUED: CertificateStatus.ValueType  # 1
+CERTIFICATE_STATUS_FAILED: CertificateStatus.ValueType  # 2
+CERTIFICATE_STATUS_REVOKED: CertificateStatus.ValueType  # 3
+global___CertificateStatus = CertificateStatus
+
+class _CheckpointStatus:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _CheckpointStatusEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_CheckpointStatus.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    CHECKPOINT_STATUS_UNSPECIFIED: _CheckpointStatus.ValueType  # 0
+    CHECKPOINT_STATUS_PENDING: _CheckpointStatus.ValueType  # 1
+    CHECKPOINT_STATUS_PROCESSING: _CheckpointStatus.ValueType  # 2
+    CHECKPOINT_STATUS_READY: _CheckpointStatus.ValueType  # 3
+    CHECKPOINT_STATUS_FAILED: _CheckpointStatus.ValueType  # 4
+
+class CheckpointStatus(_CheckpointStatus, metaclass=_CheckpointStatusEnumTypeWrapper): ...
+
+CHECKPOINT_STATUS_UNSPECIFIED: CheckpointStatus.ValueType  # 0
+CHECKPOINT_STATUS_PENDING: CheckpointStatus.ValueType  # 1
+CHECKPOINT_STATUS_PROCESSING: CheckpointStatus.ValueType  # 2
+CHECKPOINT_STATUS_READY: CheckpointStatus.ValueType  # 3
+CHECKPOINT_STATUS_FAILED: CheckpointStatus.ValueType  # 4
+global___CheckpointStatus = CheckpointStatus
+
+class _ClientType:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _ClientTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_ClientType.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    CLIENT_TYPE_UNSPECIFIED: _ClientType.ValueType  # 0
+    CLIENT_TYPE_CLIENT: _ClientType.ValueType  # 1
+    CLIENT_TYPE_WORKER: _ClientType.ValueType  # 2
+    CLIENT_TYPE_CONTAINER: _ClientType.ValueType  # 3
+    CLIENT_TYPE_SERVER: _ClientType.ValueType  # 4
+    CLIENT_TYPE_WEB_SERVER: _ClientType.ValueType  # 5
+
+class ClientType(_ClientType, metaclass=_ClientTypeEnumTypeWrapper): ...
+
+CLIENT_TYPE_UNSPECIFIED: ClientType.ValueType  # 0
+CLIENT_TYPE_CLIENT: ClientType.ValueType  # 1
+CLIENT_TYPE_WORKER: ClientType.ValueType  # 2
+CLIENT_TYPE_CONTAINER: ClientType.ValueType  # 3
+CLIENT_TYPE_SERVER: ClientType.ValueType  # 4
+CLIENT_TYPE_WEB_SERVER: ClientType.ValueType  # 5
+global___ClientType = ClientType
+
+class _CloudProvider:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _CloudProviderEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_CloudProvider.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    CLOUD_PROVIDER_UNSPECIFIED: _CloudProvider.ValueType  # 0
+    CLOUD_PROVIDER_AWS: _CloudProvider.ValueType  # 1
+    CLOUD_PROVIDER_GCP: _CloudProvider.ValueType  # 2
+    CLOUD_PROVIDER_AUTO: _CloudProvider.ValueType  # 3
+    CLOUD_PROVIDER_OCI: _CloudProvider.ValueType  # 4
+
+class CloudProvider(_CloudProvider, metaclass=_CloudProviderEnumTypeWrapper): ...
+
+CLOUD_PROVIDER_UNSPECIFIED: CloudProvider.ValueType  # 0
+CLOUD_PROVIDER_AWS: CloudProvider.ValueType  # 1
+CLOUD_PROVIDER_GCP: CloudProvider.ValueType  # 2
+CLOUD_PROVIDER_AUTO: CloudProvider.ValueType  # 3
+CLOUD_PROVIDER_OCI: CloudProvider.ValueType  # 4
+global___CloudProvider = CloudProvider
+
+class _DataFormat:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _DataFormatEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_DataFormat.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    DATA_FORMAT_UNSPECIFIED: _DataFormat.ValueType  # 0
+    DATA_FORMAT_PICKLE: _DataFormat.ValueType  # 1
+    """Cloudpickle"""
+    DATA_FORMAT_ASGI: _DataFormat.ValueType  # 2
+    """"Asgi" protobuf message"""
+    DATA_FORMAT_GENERATOR_DONE: _DataFormat.ValueType  # 3
+    """"GeneratorDone" protobuf message"""
+
+class DataFormat(_DataFormat, metaclass=_DataFormatEnumTypeWrapper):
+    """Which data format a binary message is encoded with."""
+
+DATA_FORMAT_UNSPECIFIED: DataFormat.ValueType  # 0
+DATA_FORMAT_PICKLE: DataFormat.ValueType  # 1
+"""Cloudpickle"""
+DATA_FORMAT_ASGI: DataFormat.ValueType  # 2
+""""Asgi" protobuf message"""
+DATA_FORMAT_GENERATOR_DONE: DataFormat.ValueType  # 3
+""""GeneratorDone" protobuf message"""
+global___DataFormat = DataFormat
+
+class _DeploymentNamespace:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _DeploymentNamespaceEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_DeploymentNamespace.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    DEPLOYMENT_NAMESPACE_UNSPECIFIED: _DeploymentNamespace.ValueType  # 0
+    DEPLOYMENT_NAMESPACE_WORKSPACE: _DeploymentNamespace.ValueType  # 1
+    DEPLOYMENT_NAMESPACE_GLOBAL: _DeploymentNamespace.ValueType  # 3
+
+class DeploymentNamespace(_DeploymentNamespace, metaclass=_DeploymentNamespaceEnumTypeWrapper): ...
+
+DEPLOYMENT_NAMESPACE_UNSPECIFIED: DeploymentNamespace.ValueType  # 0
+DEPLOYMENT_NAMESPACE_WORKSPACE: DeploymentNamespace.ValueType  # 1
+DEPLOYMENT_NAMESPACE_GLOBAL: DeploymentNamespace.ValueType  # 3
+global___DeploymentNamespace = DeploymentNamespace
+
+class _DNSRecordType:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _DNSRecordTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_DNSRecordType.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    DNS_RECORD_TYPE_A: _DNSRecordType.ValueType  # 0
+    DNS_RECORD_TYPE_TXT: _DNSRecordType.ValueType  # 1
+    DNS_RECORD_TYPE_CNAME: _DNSRecordType.ValueType  # 2
+
+class DNSRecordType(_DNSRecordType, metaclass=_DNSRecordTypeEnumTypeWrapper): ...
+
+DNS_RECORD_TYPE_A: DNSRecordType.ValueType  # 0
+DNS_RECORD_TYPE_TXT: DNSRecordType.ValueType  # 1
+DNS_RECORD_TYPE_CNAME: DNSRecordType.ValueType  # 2
+global___DNSRecordType = DNSRecordType
+
+class _FileDescriptor:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _FileDescriptorEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_FileDescriptor.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    FILE_DESCRIPTOR_UNSPECIFIED: _FileDescriptor.ValueType  # 0
+    FILE_DESCRIPTOR_STDOUT: _FileDescriptor.ValueType  # 1
+    FILE_DESCRIPTOR_STDERR: _FileDescriptor.ValueType  # 2
+    FILE_DESCRIPTOR_INFO: _FileDescriptor.ValueType  # 3
+
+class FileDescriptor(_FileDescriptor, metaclass=_FileDescriptorEnumTypeWrapper): ...
+
+FILE_DESCRIPTOR_UNSPECIFIED: FileDescriptor.ValueType  # 0
+FILE_DESCRIPTOR_STDOUT: FileDescriptor.ValueType  # 1
+FILE_DESCRIPTOR_STDERR: FileDescriptor.ValueType  # 2
+FILE_DESCRIPTOR_INFO: FileDescriptor.ValueType  # 3
+global___FileDescriptor = FileDescriptor
+
+class _FunctionCallType:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _FunctionCallTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_FunctionCallType.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    FUNCTION_CALL_TYPE_UNSPECIFIED: _FunctionCallType.ValueType  # 0
+    FUNCTION_CALL_TYPE_UNARY: _FunctionCallType.ValueType  # 1
+    FUNCTION_CALL_TYPE_MAP: _FunctionCallType.ValueType  # 2
+
+class FunctionCallType(_FunctionCallType, metaclass=_FunctionCallTypeEnumTypeWrapper): ...
+
+FUNCTION_CALL_TYPE_UNSPECIFIED: FunctionCallType.ValueType  # 0
+FUNCTION_CALL_TYPE_UNARY: FunctionCallType.ValueType  # 1
+FUNCTION_CALL_TYPE_MAP: FunctionCallType.ValueType  # 2
+global___FunctionCallType = FunctionCallType
+
+class _GPUType:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _GPUTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_GPUType.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    GPU_TYPE_UNSPECIFIED: _GPUType.ValueType  # 0
+    GPU_TYPE_T4: _GPUType.ValueType  # 1
+    GPU_TYPE_A100: _GPUType.ValueType  # 2
+    GPU_TYPE_A10G: _GPUType.ValueType  # 3
+    GPU_TYPE_ANY: _GPUType.ValueType  # 4
+    GPU_TYPE_A100_20G: _GPUType.ValueType  # 5
+    GPU_TYPE_A100_40GB_MANY: _GPUType.ValueType  # 6
+    GPU_TYPE_INFERENTIA2: _GPUType.ValueType  # 7
+    GPU_TYPE_A100_80GB: _GPUType.ValueType  # 8
+    GPU_TYPE_L4: _GPUType.ValueType  # 9
+    GPU_TYPE_H100: _GPUType.ValueType  # 10
+
+class GPUType(_GPUType, metaclass=_GPUTypeEnumTypeWrapper): ...
+
+GPU_TYPE_UNSPECIFIED: GPUType.ValueType  # 0
+GPU_TYPE_T4: GPUType.ValueType  # 1
+GPU_TYPE_A100: GPUType.ValueType  # 2
+GPU_TYPE_A10G: GPUType.ValueType  # 3
+GPU_TYPE_ANY: GPUType.ValueType  # 4
+GPU_TYPE_A100_20G: GPUType.ValueType  # 5
+GPU_TYPE_A100_40GB_MANY: GPUType.ValueType  # 6
+GPU_TYPE_INFERENTIA2: GPUType.ValueType  # 7
+GPU_TYPE_A100_80GB: GPUType.ValueType  # 8
+GPU_TYPE_L4: GPUType.ValueType  # 9
+GPU_TYPE_H100: GPUType.ValueType  # 10
+global___GPUType = GPUType
+
+class _ObjectCreationType:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _ObjectCreationTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_ObjectCreationType.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    OBJECT_CREATION_TYPE_UNSPECIFIED: _ObjectCreationType.ValueType  # 0
+    """just lookup"""
+    OBJECT_CREATION_TYPE_CREATE_IF_MISSING: _ObjectCreationType.ValueType  # 1
+    OBJECT_CREATION_TYPE_CREATE_FAIL_IF_EXISTS: _ObjectCreationType.ValueType  # 2
+    OBJECT_CREATION_TYPE_CREATE_OVERWRITE_IF_EXISTS: _ObjectCreationType.ValueType  # 3
+    OBJECT_CREATION_TYPE_ANONYMOUS_OWNED_BY_APP: _ObjectCreationType.ValueType  # 4
+    """deprecate at some point"""
+    OBJECT_CREATION_TYPE_EPHEMERAL: _ObjectCreationType.ValueType  # 5
+
+class ObjectCreationType(_ObjectCreationType, metaclass=_ObjectCreationTypeEnumTypeWrapper): ...
+
+OBJECT_CREATION_TYPE_UNSPECIFIED: ObjectCreationType.ValueType  # 0
+"""just lookup"""
+OBJECT_CREATION_TYPE_CREATE_IF_MISSING: ObjectCreationType.ValueType  # 1
+OBJECT_CREATION_TYPE_CREATE_FAIL_IF_EXISTS: ObjectCreationType.ValueType  # 2
+OBJECT_CREATION_TYPE_CREATE_OVERWRITE_IF_EXISTS: ObjectCreationType.ValueType  # 3
+OBJECT_CREATION_TYPE_ANONYMOUS_OWNED_BY_APP: ObjectCreationType.ValueType  # 4
+"""deprecate at some point"""
+OBJECT_CREATION_TYPE_EPHEMERAL: ObjectCreationType.ValueType  # 5
+global___ObjectCreationType = ObjectCreationType
+
+class _ProgressType:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _ProgressTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_ProgressType.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    IMAGE_SNAPSHOT_UPLOAD: _ProgressType.ValueType  # 0
+    """TODO(erikbern): shouldn't be zero, and needs prefix"""
+    FUNCTION_QUEUED: _ProgressType.ValueType  # 1
+    """TODO(erikbern): needs_prefix"""
+
+class ProgressType(_ProgressType, metaclass=_ProgressTypeEnumTypeWrapper): ...
+
+IMAGE_SNAPSHOT_UPLOAD: ProgressType.ValueType  # 0
+"""TODO(erikbern): shouldn't be zero, and needs prefix"""
+FUNCTION_QUEUED: ProgressType.ValueType  # 1
+"""TODO(erikbern): needs_prefix"""
+global___ProgressType = ProgressType
+
+class _RateLimitInterval:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _RateLimitIntervalEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_RateLimitInterval.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    RATE_LIMIT_INTERVAL_UNSPECIFIED: _RateLimitInterval.ValueType  # 0
+    RATE_LIMIT_INTERVAL_SECOND: _RateLimitInterval.ValueType  # 1
+    RATE_LIMIT_INTERVAL_MINUTE: _RateLimitInterval.ValueType  # 2
+
+class RateLimitInterval(_RateLimitInterval, metaclass=_RateLimitIntervalEnumTypeWrapper): ...
+
+RATE_LIMIT_INTERVAL_UNSPECIFIED: RateLimitInterval.ValueType  # 0
+RATE_LIMIT_INTERVAL_SECOND: RateLimitInterval.ValueType  # 1
+RATE_LIMIT_INTERVAL_MINUTE: RateLimitInterval.ValueType  # 2
+global___RateLimitInterval = RateLimitInterval
+
+class _RegistryAuthType:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _RegistryAuthTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_RegistryAuthType.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    REGISTRY_AUTH_TYPE_UNSPECIFIED: _RegistryAuthType.ValueType  # 0
+    """Older clients send this instead of "public"."""
+    REGISTRY_AUTH_TYPE_AWS: _RegistryAuthType.ValueType  # 1
+    REGISTRY_AUTH_TYPE_GCP: _RegistryAuthType.ValueType  # 2
+    REGISTRY_AUTH_TYPE_PUBLIC: _RegistryAuthType.ValueType  # 3
+    REGISTRY_AUTH_TYPE_STATIC_CREDS: _RegistryAuthType.ValueType  # 4
+
+class RegistryAuthType(_RegistryAuthType, metaclass=_RegistryAuthTypeEnumTypeWrapper): ...
+
+REGISTRY_AUTH_TYPE_UNSPECIFIED: RegistryAuthType.ValueType  # 0
+"""Older clients send this instead of "public"."""
+REGISTRY_AUTH_TYPE_AWS: RegistryAuthType.ValueType  # 1
+REGISTRY_AUTH_TYPE_GCP: RegistryAuthType.ValueType  # 2
+REGISTRY_AUTH_TYPE_PUBLIC: RegistryAuthType.ValueType  # 3
+REGISTRY_AUTH_TYPE_STATIC_CREDS: RegistryAuthType.ValueType  # 4
+global___RegistryAuthType = RegistryAuthType
+
+class _TaskState:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _TaskStateEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_TaskState.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    TASK_STATE_UNSPECIFIED: _TaskState.ValueType  # 0
+    TASK_STATE_CREATED: _TaskState.ValueType  # 6
+    TASK_STATE_QUEUED: _TaskState.ValueType  # 1
+    TASK_STATE_WORKER_ASSIGNED: _TaskState.ValueType  # 2
+    TASK_STATE_LOADING_IMAGE: _TaskState.ValueType  # 3
+    TASK_STATE_ACTIVE: _TaskState.ValueType  # 4
+    TASK_STATE_COMPLETED: _TaskState.ValueType  # 5
+    TASK_STATE_CREATING_CONTAINER: _TaskState.ValueType  # 7
+    TASK_STATE_IDLE: _TaskState.ValueType  # 8
+    TASK_STATE_PREEMPTIBLE: _TaskState.ValueType  # 9
+    TASK_STATE_PREEMPTED: _TaskState.ValueType  # 10
+    TASK_STATE_LOADING_CHECKPOINT_IMAGE: _TaskState.ValueType  # 11
+
+class TaskState(_TaskState, metaclass=_TaskStateEnumTypeWrapper): ...
+
+TASK_STATE_UNSPECIFIED: TaskState.ValueType  # 0
+TASK_STATE_CREATED: TaskState.ValueType  # 6
+TASK_STATE_QUEUED: TaskState.ValueType  # 1
+TASK_STATE_WORKER_ASSIGNED: TaskState.ValueType  # 2
+TASK_STATE_LOADING_IMAGE: TaskState.ValueType  # 3
+TASK_STATE_ACTIVE: TaskState.ValueType  # 4
+TASK_STATE_COMPLETED: TaskState.ValueType  # 5
+TASK_STATE_CREATING_CONTAINER: TaskState.ValueType  # 7
+TASK_STATE_IDLE: TaskState.ValueType  # 8
+TASK_STATE_PREEMPTIBLE: TaskState.ValueType  # 9
+TASK_STATE_PREEMPTED: TaskState.ValueType  # 10
+TASK_STATE_LOADING_CHECKPOINT_IMAGE: TaskState.ValueType  # 11
+global___TaskState = TaskState
+
+class _WebhookType:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _WebhookTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_WebhookType.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    WEBHOOK_TYPE_UNSPECIFIED: _WebhookType.ValueType  # 0
+    WEBHOOK_TYPE_ASGI_APP: _WebhookType.ValueType  # 1
+    WEBHOOK_TYPE_FUNCTION: _WebhookType.ValueType  # 2
+    WEBHOOK_TYPE_WSGI_APP: _WebhookType.ValueType  # 3
+    WEBHOOK_TYPE_WEB_SERVER: _WebhookType.ValueType  # 4
+
+class WebhookType(_WebhookType, metaclass=_WebhookTypeEnumTypeWrapper): ...
+
+WEBHOOK_TYPE_UNSPECIFIED: WebhookType.ValueType  # 0
+WEBHOOK_TYPE_ASGI_APP: WebhookType.ValueType  # 1
+WEBHOOK_TYPE_FUNCTION: WebhookType.ValueType  # 2
+WEBHOOK_TYPE_WSGI_APP: WebhookType.ValueType  # 3
+WEBHOOK_TYPE_WEB_SERVER: WebhookType.ValueType  # 4
+global___WebhookType = WebhookType
+
+class _WebhookAsyncMode:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _WebhookAsyncModeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_WebhookAsyncMode.ValueType], builtins.type):  # noqa: F821
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    WEBHOOK_ASYNC_MODE_UNSPECIFIED: _WebhookAsyncMode.ValueType  # 0
+    WEBHOOK_ASYNC_MODE_DISABLED: _WebhookAsyncMode.ValueType  # 2
+    """no redirect, fail after timeout"""
+    WEBHOOK_ASYNC_MODE_TRIGGER: _WebhookAsyncMode.ValueType  # 3
+    """return immediately, roughly same as old wait_for_response=False"""
+    WEBHOOK_ASYNC_MODE_AUTO: _WebhookAsyncMode.ValueType  # 4
+    """redirect to polling endpoint if execution time nears the http timeout"""
+
+class WebhookAsyncMode(_WebhookAsyncMode, metaclass=_WebhookAsyncModeEnumTypeWrapper): ...
+
+WEBHOOK_ASYNC_MODE_UNSPECIFIED: WebhookAsyncMode.ValueType  # 0
+WEBHOOK_ASYNC_MODE_DISABLED: WebhookAsyncMode.ValueType  # 2
+"""no redirect, fail after timeout"""
+WEBHOOK_ASYNC_MODE_TRIGGER: WebhookAsyncMode.ValueType  # 3
+"""return immediately, roughly same as old wait_for_response=False"""
+WEBHOOK_ASYNC_MODE_AUTO: WebhookAsyncMode.ValueType  # 4
+"""redirect to polling endpoint if execution time nears the http timeout"""
+global___WebhookAsyncMode = WebhookAsyncMode
+
+class CloudBucketMount(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class _BucketType:
+        ValueType = typing.NewType("ValueType", builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+
+    class _BucketTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[CloudBucketMount._BucketType.ValueType], builtins.type):  # noqa: F821
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        UNSPECIFIED: CloudBucketMount._BucketType.ValueType  # 0
+        S3: CloudBucketMount._BucketType.ValueType  # 1
+
+    class BucketType(_BucketType, metaclass=_BucketTypeEnumTypeWrapper): ...
+    UNSPECIFIED: CloudBucketMount.BucketType.ValueType  # 0
+    S3: CloudBucketMount.BucketType.ValueType  # 1
+
+    BUCKET_NAME_FIELD_NUMBER: builtins.int
+    MOUNT_PATH_FIELD_NUMBER: builtins.int
+    CREDENTIALS_SECRET_ID_FIELD_NUMBER: builtins.int
+    READ_ONLY_FIELD_NUMBER: builtins.int
+    REQUESTER_PAYS_FIELD_NUMBER: builtins.int
+    BUCKET_TYPE_FIELD_NUMBER: builtins.int
+    bucket_name: builtins.str
+    mount_path: builtins.str
+    credentials_secret_id: builtins.str
+    read_only: builtins.bool
+    requester_pays: builtins.bool
+    bucket_type: global___CloudBucketMount.BucketType.ValueType
+    def __init__(
+        self,
+        *,
+        bucket_name: builtins.str = ...,
+        mount_path: builtins.str = ...,
+        credentials_secret_id: builtins.str = ...,
+        read_only: builtins.bool = ...,
+        requester_pays: builtins.bool = ...,
+        bucket_type: global___CloudBucketMount.BucketType.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["bucket_name", b"bucket_name", "bucket_type", b"bucket_type", "credentials_secret_id", b"credentials_secret_id", "mount_path", b"mount_path", "read_only", b"read_only", "requester_pays", b"requester_pays"]) -> None: ...
+
+global___CloudBucketMount = CloudBucketMount
+
+class AppClientDisconnectRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    REASON_FIELD_NUMBER: builtins.int
+    EXCEPTION_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    reason: global___AppDisconnectReason.ValueType
+    exception: builtins.str
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        reason: global___AppDisconnectReason.ValueType = ...,
+        exception: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "exception", b"exception", "reason", b"reason"]) -> None: ...
+
+global___AppClientDisconnectRequest = AppClientDisconnectRequest
+
+class AppCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CLIENT_ID_FIELD_NUMBER: builtins.int
+    DESCRIPTION_FIELD_NUMBER: builtins.int
+    DETACH_FIELD_NUMBER: builtins.int
+    INITIALIZING_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    APP_STATE_FIELD_NUMBER: builtins.int
+    client_id: builtins.str
+    description: builtins.str
+    """Human readable label for the app"""
+    detach: builtins.bool
+    """replaced by app_state in 0.55.3904"""
+    initializing: builtins.bool
+    """replaced by app_state in 0.55.3904"""
+    environment_name: builtins.str
+    app_state: global___AppState.ValueType
+    def __init__(
+        self,
+        *,
+        client_id: builtins.str = ...,
+        description: builtins.str = ...,
+        detach: builtins.bool = ...,
+        initializing: builtins.bool = ...,
+        environment_name: builtins.str = ...,
+        app_state: global___AppState.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_state", b"app_state", "client_id", b"client_id", "description", b"description", "detach", b"detach", "environment_name", b"environment_name", "initializing", b"initializing"]) -> None: ...
+
+global___AppCreateRequest = AppCreateRequest
+
+class AppCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    APP_LOGS_URL_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    app_logs_url: builtins.str
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        app_logs_url: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "app_logs_url", b"app_logs_url"]) -> None: ...
+
+global___AppCreateResponse = AppCreateResponse
+
+class AppStopRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    SOURCE_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    source: global___AppStopSource.ValueType
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        source: global___AppStopSource.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "source", b"source"]) -> None: ...
+
+global___AppStopRequest = AppStopRequest
+
+class AppDeployRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    NAME_FIELD_NUMBER: builtins.int
+    OBJECT_ENTITY_FIELD_NUMBER: builtins.int
+    VISIBILITY_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    namespace: global___DeploymentNamespace.ValueType
+    name: builtins.str
+    object_entity: builtins.str
+    visibility: global___AppDeployVisibility.ValueType
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        name: builtins.str = ...,
+        object_entity: builtins.str = ...,
+        visibility: global___AppDeployVisibility.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "name", b"name", "namespace", b"namespace", "object_entity", b"object_entity", "visibility", b"visibility"]) -> None: ...
+
+global___AppDeployRequest = AppDeployRequest
+
+class AppDeployResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    URL_FIELD_NUMBER: builtins.int
+    url: builtins.str
+    def __init__(
+        self,
+        *,
+        url: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["url", b"url"]) -> None: ...
+
+global___AppDeployResponse = AppDeployResponse
+
+class AppDeploySingleObjectRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_ID_FIELD_NUMBER: builtins.int
+    name: builtins.str
+    namespace: global___DeploymentNamespace.ValueType
+    environment_name: builtins.str
+    object_id: builtins.str
+    def __init__(
+        self,
+        *,
+        name: builtins.str = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        environment_name: builtins.str = ...,
+        object_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["environment_name", b"environment_name", "name", b"name", "namespace", b"namespace", "object_id", b"object_id"]) -> None: ...
+
+global___AppDeploySingleObjectRequest = AppDeploySingleObjectRequest
+
+class AppDeploySingleObjectResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id"]) -> None: ...
+
+global___AppDeploySingleObjectResponse = AppDeploySingleObjectResponse
+
+class AppGetByDeploymentNameRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    NAME_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    namespace: global___DeploymentNamespace.ValueType
+    name: builtins.str
+    environment_name: builtins.str
+    def __init__(
+        self,
+        *,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        name: builtins.str = ...,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["environment_name", b"environment_name", "name", b"name", "namespace", b"namespace"]) -> None: ...
+
+global___AppGetByDeploymentNameRequest = AppGetByDeploymentNameRequest
+
+class AppGetByDeploymentNameResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id"]) -> None: ...
+
+global___AppGetByDeploymentNameResponse = AppGetByDeploymentNameResponse
+
+class AppGetLogsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    LAST_ENTRY_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    TASK_ID_FIELD_NUMBER: builtins.int
+    FILE_DESCRIPTOR_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    timeout: builtins.float
+    last_entry_id: builtins.str
+    function_id: builtins.str
+    input_id: builtins.str
+    task_id: builtins.str
+    file_descriptor: global___FileDescriptor.ValueType
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        timeout: builtins.float = ...,
+        last_entry_id: builtins.str = ...,
+        function_id: builtins.str = ...,
+        input_id: builtins.str = ...,
+        task_id: builtins.str = ...,
+        file_descriptor: global___FileDescriptor.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "file_descriptor", b"file_descriptor", "function_id", b"function_id", "input_id", b"input_id", "last_entry_id", b"last_entry_id", "task_id", b"task_id", "timeout", b"timeout"]) -> None: ...
+
+global___AppGetLogsRequest = AppGetLogsRequest
+
+class AppGetObjectsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    INCLUDE_UNINDEXED_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    include_unindexed: builtins.bool
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        include_unindexed: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "include_unindexed", b"include_unindexed"]) -> None: ...
+
+global___AppGetObjectsRequest = AppGetObjectsRequest
+
+class AppGetObjectsItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TAG_FIELD_NUMBER: builtins.int
+    OBJECT_FIELD_NUMBER: builtins.int
+    tag: builtins.str
+    @property
+    def object(self) -> global___Object: ...
+    def __init__(
+        self,
+        *,
+        tag: builtins.str = ...,
+        object: global___Object | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["object", b"object"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["object", b"object", "tag", b"tag"]) -> None: ...
+
+global___AppGetObjectsItem = AppGetObjectsItem
+
+class AppGetObjectsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ITEMS_FIELD_NUMBER: builtins.int
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___AppGetObjectsItem]: ...
+    def __init__(
+        self,
+        *,
+        items: collections.abc.Iterable[global___AppGetObjectsItem] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["items", b"items"]) -> None: ...
+
+global___AppGetObjectsResponse = AppGetObjectsResponse
+
+class AppHeartbeatRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id"]) -> None: ...
+
+global___AppHeartbeatRequest = AppHeartbeatRequest
+
+class AppListRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    environment_name: builtins.str
+    def __init__(
+        self,
+        *,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["environment_name", b"environment_name"]) -> None: ...
+
+global___AppListRequest = AppListRequest
+
+class AppListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APPS_FIELD_NUMBER: builtins.int
+    @property
+    def apps(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___AppStats]: ...
+    def __init__(
+        self,
+        *,
+        apps: collections.abc.Iterable[global___AppStats] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["apps", b"apps"]) -> None: ...
+
+global___AppListResponse = AppListResponse
+
+class AppLookupObjectRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    APP_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_TAG_FIELD_NUMBER: builtins.int
+    OBJECT_ID_FIELD_NUMBER: builtins.int
+    OBJECT_ENTITY_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    namespace: global___DeploymentNamespace.ValueType
+    app_name: builtins.str
+    object_tag: builtins.str
+    object_id: builtins.str
+    object_entity: builtins.str
+    environment_name: builtins.str
+    def __init__(
+        self,
+        *,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        app_name: builtins.str = ...,
+        object_tag: builtins.str = ...,
+        object_id: builtins.str = ...,
+        object_entity: builtins.str = ...,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_name", b"app_name", "environment_name", b"environment_name", "namespace", b"namespace", "object_entity", b"object_entity", "object_id", b"object_id", "object_tag", b"object_tag"]) -> None: ...
+
+global___AppLookupObjectRequest = AppLookupObjectRequest
+
+class AppLookupObjectResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    OBJECT_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    @property
+    def object(self) -> global___Object: ...
+    app_id: builtins.str
+    def __init__(
+        self,
+        *,
+        object: global___Object | None = ...,
+        app_id: builtins.str = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["object", b"object"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "object", b"object"]) -> None: ...
+
+global___AppLookupObjectResponse = AppLookupObjectResponse
+
+class AppSetObjectsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class IndexedObjectIdsEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        value: builtins.str
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: builtins.str = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    INDEXED_OBJECT_IDS_FIELD_NUMBER: builtins.int
+    CLIENT_ID_FIELD_NUMBER: builtins.int
+    UNINDEXED_OBJECT_IDS_FIELD_NUMBER: builtins.int
+    NEW_APP_STATE_FIELD_NUMBER: builtins.int
+    SINGLE_OBJECT_ID_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    @property
+    def indexed_object_ids(self) -> google.protobuf.internal.containers.ScalarMap[builtins.str, builtins.str]: ...
+    client_id: builtins.str
+    @property
+    def unindexed_object_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    new_app_state: global___AppState.ValueType
+    """promotes an app from initializing to this new state"""
+    single_object_id: builtins.str
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        indexed_object_ids: collections.abc.Mapping[builtins.str, builtins.str] | None = ...,
+        client_id: builtins.str = ...,
+        unindexed_object_ids: collections.abc.Iterable[builtins.str] | None = ...,
+        new_app_state: global___AppState.ValueType = ...,
+        single_object_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "client_id", b"client_id", "indexed_object_ids", b"indexed_object_ids", "new_app_state", b"new_app_state", "single_object_id", b"single_object_id", "unindexed_object_ids", b"unindexed_object_ids"]) -> None: ...
+
+global___AppSetObjectsRequest = AppSetObjectsRequest
+
+class AppStats(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    DESCRIPTION_FIELD_NUMBER: builtins.int
+    STATE_FIELD_NUMBER: builtins.int
+    CREATED_AT_FIELD_NUMBER: builtins.int
+    STOPPED_AT_FIELD_NUMBER: builtins.int
+    N_RUNNING_TASKS_FIELD_NUMBER: builtins.int
+    OBJECT_ENTITY_FIELD_NUMBER: builtins.int
+    NAME_FIELD_NUMBER: builtins.int
+    DEPLOYED_AT_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    description: builtins.str
+    state: global___AppState.ValueType
+    created_at: builtins.float
+    stopped_at: builtins.float
+    n_running_tasks: builtins.int
+    object_entity: builtins.str
+    name: builtins.str
+    deployed_at: builtins.float
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        description: builtins.str = ...,
+        state: global___AppState.ValueType = ...,
+        created_at: builtins.float = ...,
+        stopped_at: builtins.float = ...,
+        n_running_tasks: builtins.int = ...,
+        object_entity: builtins.str = ...,
+        name: builtins.str = ...,
+        deployed_at: builtins.float = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "created_at", b"created_at", "deployed_at", b"deployed_at", "description", b"description", "n_running_tasks", b"n_running_tasks", "name", b"name", "object_entity", b"object_entity", "state", b"state", "stopped_at", b"stopped_at"]) -> None: ...
+
+global___AppStats = AppStats
+
+class Asgi(google.protobuf.message.Message):
+    """A web endpoint connection-related message.
+
+    Modal's internal web endpoint runtime effectively acts as a global web server
+    that schedules requests to tasks that are spawned on-demand, so we need an
+    internal protocol to model HTTP requests. This is that protocol.
+
+    We base this protocol on Python's ASGI specification, which is a popular
+    interface between applications and web servers.
+
+    ASGI Spec: https://asgi.readthedocs.io/en/latest/specs/www.html
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class Http(google.protobuf.message.Message):
+        """Message of type "http" (connection scope)"""
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        HTTP_VERSION_FIELD_NUMBER: builtins.int
+        METHOD_FIELD_NUMBER: builtins.int
+        SCHEME_FIELD_NUMBER: builtins.int
+        PATH_FIELD_NUMBER: builtins.int
+        QUERY_STRING_FIELD_NUMBER: builtins.int
+        HEADERS_FIELD_NUMBER: builtins.int
+        CLIENT_HOST_FIELD_NUMBER: builtins.int
+        CLIENT_PORT_FIELD_NUMBER: builtins.int
+        http_version: builtins.str
+        method: builtins.str
+        scheme: builtins.str
+        path: builtins.str
+        query_string: builtins.bytes
+        @property
+        def headers(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.bytes]:
+            """Flat list of alternating header names and values"""
+        client_host: builtins.str
+        client_port: builtins.int
+        def __init__(
+            self,
+            *,
+            http_version: builtins.str = ...,
+            method: builtins.str = ...,
+            scheme: builtins.str = ...,
+            path: builtins.str = ...,
+            query_string: builtins.bytes = ...,
+            headers: collections.abc.Iterable[builtins.bytes] | None = ...,
+            client_host: builtins.str | None = ...,
+            client_port: builtins.int | None = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["_client_host", b"_client_host", "_client_port", b"_client_port", "client_host", b"client_host", "client_port", b"client_port"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["_client_host", b"_client_host", "_client_port", b"_client_port", "client_host", b"client_host", "client_port", b"client_port", "headers", b"headers", "http_version", b"http_version", "method", b"method", "path", b"path", "query_string", b"query_string", "scheme", b"scheme"]) -> None: ...
+        @typing.overload
+        def WhichOneof(self, oneof_group: typing_extensions.Literal["_client_host", b"_client_host"]) -> typing_extensions.Literal["client_host"] | None: ...
+        @typing.overload
+        def WhichOneof(self, oneof_group: typing_extensions.Literal["_client_port", b"_client_port"]) -> typing_extensions.Literal["client_port"] | None: ...
+
+    class HttpRequest(google.protobuf.message.Message):
+        """Message of type "http.request" """
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        BODY_FIELD_NUMBER: builtins.int
+        MORE_BODY_FIELD_NUMBER: builtins.int
+        body: builtins.bytes
+        more_body: builtins.bool
+        def __init__(
+            self,
+            *,
+            body: builtins.bytes = ...,
+            more_body: builtins.bool = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["body", b"body", "more_body", b"more_body"]) -> None: ...
+
+    class HttpResponseStart(google.protobuf.message.Message):
+        """Message of type "http.response.start" """
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        STATUS_FIELD_NUMBER: builtins.int
+        HEADERS_FIELD_NUMBER: builtins.int
+        TRAILERS_FIELD_NUMBER: builtins.int
+        status: builtins.int
+        @property
+        def headers(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.bytes]:
+            """Flat list of alternating header names and values"""
+        trailers: builtins.bool
+        def __init__(
+            self,
+            *,
+            status: builtins.int = ...,
+            headers: collections.abc.Iterable[builtins.bytes] | None = ...,
+            trailers: builtins.bool = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["headers", b"headers", "status", b"status", "trailers", b"trailers"]) -> None: ...
+
+    class HttpResponseBody(google.protobuf.message.Message):
+        """Message of type "http.response.body" """
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        BODY_FIELD_NUMBER: builtins.int
+        MORE_BODY_FIELD_NUMBER: builtins.int
+        body: builtins.bytes
+        more_body: builtins.bool
+        def __init__(
+            self,
+            *,
+            body: builtins.bytes = ...,
+            more_body: builtins.bool = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["body", b"body", "more_body", b"more_body"]) -> None: ...
+
+    class HttpResponseTrailers(google.protobuf.message.Message):
+        """Message of type "http.response.trailers" """
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        HEADERS_FIELD_NUMBER: builtins.int
+        MORE_TRAILERS_FIELD_NUMBER: builtins.int
+        @property
+        def headers(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.bytes]:
+            """Flat list of alternating header names and values"""
+        more_trailers: builtins.bool
+        def __init__(
+            self,
+            *,
+            headers: collections.abc.Iterable[builtins.bytes] | None = ...,
+            more_trailers: builtins.bool = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["headers", b"headers", "more_trailers", b"more_trailers"]) -> None: ...
+
+    class HttpDisconnect(google.protobuf.message.Message):
+        """Message of type "http.disconnect" """
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        def __init__(
+            self,
+        ) -> None: ...
+
+    class Websocket(google.protobuf.message.Message):
+        """Message of type "websocket" (connection scope)"""
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        HTTP_VERSION_FIELD_NUMBER: builtins.int
+        SCHEME_FIELD_NUMBER: builtins.int
+        PATH_FIELD_NUMBER: builtins.int
+        QUERY_STRING_FIELD_NUMBER: builtins.int
+        HEADERS_FIELD_NUMBER: builtins.int
+        CLIENT_HOST_FIELD_NUMBER: builtins.int
+        CLIENT_PORT_FIELD_NUMBER: builtins.int
+        SUBPROTOCOLS_FIELD_NUMBER: builtins.int
+        http_version: builtins.str
+        """We don't support RFC 8441 yet, so this will always be "1.1" """
+        scheme: builtins.str
+        path: builtins.str
+        query_string: builtins.bytes
+        @property
+        def headers(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.bytes]:
+            """Flat list of alternating header names and values"""
+        client_host: builtins.str
+        client_port: builtins.int
+        @property
+        def subprotocols(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+        def __init__(
+            self,
+            *,
+            http_version: builtins.str = ...,
+            scheme: builtins.str = ...,
+            path: builtins.str = ...,
+            query_string: builtins.bytes = ...,
+            headers: collections.abc.Iterable[builtins.bytes] | None = ...,
+            client_host: builtins.str | None = ...,
+            client_port: builtins.int | None = ...,
+            subprotocols: collections.abc.Iterable[builtins.str] | None = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["_client_host", b"_client_host", "_client_port", b"_client_port", "client_host", b"client_host", "client_port", b"client_port"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["_client_host", b"_client_host", "_client_port", b"_client_port", "client_host", b"client_host", "client_port", b"client_port", "headers", b"headers", "http_version", b"http_version", "path", b"path", "query_string", b"query_string", "scheme", b"scheme", "subprotocols", b"subprotocols"]) -> None: ...
+        @typing.overload
+        def WhichOneof(self, oneof_group: typing_extensions.Literal["_client_host", b"_client_host"]) -> typing_extensions.Literal["client_host"] | None: ...
+        @typing.overload
+        def WhichOneof(self, oneof_group: typing_extensions.Literal["_client_port", b"_client_port"]) -> typing_extensions.Literal["client_port"] | None: ...
+
+    class WebsocketConnect(google.protobuf.message.Message):
+        """Message of type "websocket.connect" """
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        def __init__(
+            self,
+        ) -> None: ...
+
+    class WebsocketAccept(google.protobuf.message.Message):
+        """Message of type "websocket.accept" """
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        SUBPROTOCOL_FIELD_NUMBER: builtins.int
+        HEADERS_FIELD_NUMBER: builtins.int
+        subprotocol: builtins.str
+        @property
+        def headers(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.bytes]:
+            """Flat list of alternating header names and values"""
+        def __init__(
+            self,
+            *,
+            subprotocol: builtins.str | None = ...,
+            headers: collections.abc.Iterable[builtins.bytes] | None = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["_subprotocol", b"_subprotocol", "subprotocol", b"subprotocol"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["_subprotocol", b"_subprotocol", "headers", b"headers", "subprotocol", b"subprotocol"]) -> None: ...
+        def WhichOneof(self, oneof_group: typing_extensions.Literal["_subprotocol", b"_subprotocol"]) -> typing_extensions.Literal["subprotocol"] | None: ...
+
+    class WebsocketReceive(google.protobuf.message.Message):
+        """Message of type "websocket.receive" """
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        BYTES_FIELD_NUMBER: builtins.int
+        TEXT_FIELD_NUMBER: builtins.int
+        bytes: builtins.bytes
+        text: builtins.str
+        def __init__(
+            self,
+            *,
+            bytes: builtins.bytes = ...,
+            text: builtins.str = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["bytes", b"bytes", "content", b"content", "text", b"text"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["bytes", b"bytes", "content", b"content", "text", b"text"]) -> None: ...
+        def WhichOneof(self, oneof_group: typing_extensions.Literal["content", b"content"]) -> typing_extensions.Literal["bytes", "text"] | None: ...
+
+    class WebsocketSend(google.protobuf.message.Message):
+        """Message of type "websocket.send" """
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        BYTES_FIELD_NUMBER: builtins.int
+        TEXT_FIELD_NUMBER: builtins.int
+        bytes: builtins.bytes
+        text: builtins.str
+        def __init__(
+            self,
+            *,
+            bytes: builtins.bytes = ...,
+            text: builtins.str = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["bytes", b"bytes", "content", b"content", "text", b"text"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["bytes", b"bytes", "content", b"content", "text", b"text"]) -> None: ...
+        def WhichOneof(self, oneof_group: typing_extensions.Literal["content", b"content"]) -> typing_extensions.Literal["bytes", "text"] | None: ...
+
+    class WebsocketDisconnect(google.protobuf.message.Message):
+        """Message of type "websocket.disconnect" """
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        CODE_FIELD_NUMBER: builtins.int
+        code: builtins.int
+        def __init__(
+            self,
+            *,
+            code: builtins.int | None = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["_code", b"_code", "code", b"code"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["_code", b"_code", "code", b"code"]) -> None: ...
+        def WhichOneof(self, oneof_group: typing_extensions.Literal["_code", b"_code"]) -> typing_extensions.Literal["code"] | None: ...
+
+    class WebsocketClose(google.protobuf.message.Message):
+        """Message of type "websocket.close" """
+
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        CODE_FIELD_NUMBER: builtins.int
+        REASON_FIELD_NUMBER: builtins.int
+        code: builtins.int
+        reason: builtins.str
+        def __init__(
+            self,
+            *,
+            code: builtins.int | None = ...,
+            reason: builtins.str = ...,
+        ) -> None: ...
+        def HasField(self, field_name: typing_extensions.Literal["_code", b"_code", "code", b"code"]) -> builtins.bool: ...
+        def ClearField(self, field_name: typing_extensions.Literal["_code", b"_code", "code", b"code", "reason", b"reason"]) -> None: ...
+        def WhichOneof(self, oneof_group: typing_extensions.Literal["_code", b"_code"]) -> typing_extensions.Literal["code"] | None: ...
+
+    HTTP_FIELD_NUMBER: builtins.int
+    HTTP_REQUEST_FIELD_NUMBER: builtins.int
+    HTTP_RESPONSE_START_FIELD_NUMBER: builtins.int
+    HTTP_RESPONSE_BODY_FIELD_NUMBER: builtins.int
+    HTTP_RESPONSE_TRAILERS_FIELD_NUMBER: builtins.int
+    HTTP_DISCONNECT_FIELD_NUMBER: builtins.int
+    WEBSOCKET_FIELD_NUMBER: builtins.int
+    WEBSOCKET_CONNECT_FIELD_NUMBER: builtins.int
+    WEBSOCKET_ACCEPT_FIELD_NUMBER: builtins.int
+    WEBSOCKET_RECEIVE_FIELD_NUMBER: builtins.int
+    WEBSOCKET_SEND_FIELD_NUMBER: builtins.int
+    WEBSOCKET_DISCONNECT_FIELD_NUMBER: builtins.int
+    WEBSOCKET_CLOSE_FIELD_NUMBER: builtins.int
+    @property
+    def http(self) -> global___Asgi.Http: ...
+    @property
+    def http_request(self) -> global___Asgi.HttpRequest: ...
+    @property
+    def http_response_start(self) -> global___Asgi.HttpResponseStart: ...
+    @property
+    def http_response_body(self) -> global___Asgi.HttpResponseBody: ...
+    @property
+    def http_response_trailers(self) -> global___Asgi.HttpResponseTrailers: ...
+    @property
+    def http_disconnect(self) -> global___Asgi.HttpDisconnect: ...
+    @property
+    def websocket(self) -> global___Asgi.Websocket: ...
+    @property
+    def websocket_connect(self) -> global___Asgi.WebsocketConnect: ...
+    @property
+    def websocket_accept(self) -> global___Asgi.WebsocketAccept: ...
+    @property
+    def websocket_receive(self) -> global___Asgi.WebsocketReceive: ...
+    @property
+    def websocket_send(self) -> global___Asgi.WebsocketSend: ...
+    @property
+    def websocket_disconnect(self) -> global___Asgi.WebsocketDisconnect: ...
+    @property
+    def websocket_close(self) -> global___Asgi.WebsocketClose: ...
+    def __init__(
+        self,
+        *,
+        http: global___Asgi.Http | None = ...,
+        http_request: global___Asgi.HttpRequest | None = ...,
+        http_response_start: global___Asgi.HttpResponseStart | None = ...,
+        http_response_body: global___Asgi.HttpResponseBody | None = ...,
+        http_response_trailers: global___Asgi.HttpResponseTrailers | None = ...,
+        http_disconnect: global___Asgi.HttpDisconnect | None = ...,
+        websocket: global___Asgi.Websocket | None = ...,
+        websocket_connect: global___Asgi.WebsocketConnect | None = ...,
+        websocket_accept: global___Asgi.WebsocketAccept | None = ...,
+        websocket_receive: global___Asgi.WebsocketReceive | None = ...,
+        websocket_send: global___Asgi.WebsocketSend | None = ...,
+        websocket_disconnect: global___Asgi.WebsocketDisconnect | None = ...,
+        websocket_close: global___Asgi.WebsocketClose | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["http", b"http", "http_disconnect", b"http_disconnect", "http_request", b"http_request", "http_response_body", b"http_response_body", "http_response_start", b"http_response_start", "http_response_trailers", b"http_response_trailers", "type", b"type", "websocket", b"websocket", "websocket_accept", b"websocket_accept", "websocket_close", b"websocket_close", "websocket_connect", b"websocket_connect", "websocket_disconnect", b"websocket_disconnect", "websocket_receive", b"websocket_receive", "websocket_send", b"websocket_send"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["http", b"http", "http_disconnect", b"http_disconnect", "http_request", b"http_request", "http_response_body", b"http_response_body", "http_response_start", b"http_response_start", "http_response_trailers", b"http_response_trailers", "type", b"type", "websocket", b"websocket", "websocket_accept", b"websocket_accept", "websocket_close", b"websocket_close", "websocket_connect", b"websocket_connect", "websocket_disconnect", b"websocket_disconnect", "websocket_receive", b"websocket_receive", "websocket_send", b"websocket_send"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["type", b"type"]) -> typing_extensions.Literal["http", "http_request", "http_response_start", "http_response_body", "http_response_trailers", "http_disconnect", "websocket", "websocket_connect", "websocket_accept", "websocket_receive", "websocket_send", "websocket_disconnect", "websocket_close"] | None: ...
+
+global___Asgi = Asgi
+
+class BaseImage(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    IMAGE_ID_FIELD_NUMBER: builtins.int
+    DOCKER_TAG_FIELD_NUMBER: builtins.int
+    image_id: builtins.str
+    docker_tag: builtins.str
+    def __init__(
+        self,
+        *,
+        image_id: builtins.str = ...,
+        docker_tag: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["docker_tag", b"docker_tag", "image_id", b"image_id"]) -> None: ...
+
+global___BaseImage = BaseImage
+
+class BlobCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CONTENT_MD5_FIELD_NUMBER: builtins.int
+    CONTENT_SHA256_BASE64_FIELD_NUMBER: builtins.int
+    CONTENT_LENGTH_FIELD_NUMBER: builtins.int
+    content_md5: builtins.str
+    """TODO(erikbern): how are these garbage collected?
+    Shouldn't they belong to an app?
+    """
+    content_sha256_base64: builtins.str
+    content_length: builtins.int
+    def __init__(
+        self,
+        *,
+        content_md5: builtins.str = ...,
+        content_sha256_base64: builtins.str = ...,
+        content_length: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["content_length", b"content_length", "content_md5", b"content_md5", "content_sha256_base64", b"content_sha256_base64"]) -> None: ...
+
+global___BlobCreateRequest = BlobCreateRequest
+
+class BlobCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    BLOB_ID_FIELD_NUMBER: builtins.int
+    UPLOAD_URL_FIELD_NUMBER: builtins.int
+    MULTIPART_FIELD_NUMBER: builtins.int
+    blob_id: builtins.str
+    upload_url: builtins.str
+    @property
+    def multipart(self) -> global___MultiPartUpload: ...
+    def __init__(
+        self,
+        *,
+        blob_id: builtins.str = ...,
+        upload_url: builtins.str = ...,
+        multipart: global___MultiPartUpload | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["multipart", b"multipart", "upload_type_oneof", b"upload_type_oneof", "upload_url", b"upload_url"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["blob_id", b"blob_id", "multipart", b"multipart", "upload_type_oneof", b"upload_type_oneof", "upload_url", b"upload_url"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["upload_type_oneof", b"upload_type_oneof"]) -> typing_extensions.Literal["upload_url", "multipart"] | None: ...
+
+global___BlobCreateResponse = BlobCreateResponse
+
+class BlobGetRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    BLOB_ID_FIELD_NUMBER: builtins.int
+    blob_id: builtins.str
+    def __init__(
+        self,
+        *,
+        blob_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["blob_id", b"blob_id"]) -> None: ...
+
+global___BlobGetRequest = BlobGetRequest
+
+class BlobGetResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DOWNLOAD_URL_FIELD_NUMBER: builtins.int
+    download_url: builtins.str
+    def __init__(
+        self,
+        *,
+        download_url: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["download_url", b"download_url"]) -> None: ...
+
+global___BlobGetResponse = BlobGetResponse
+
+class CheckpointInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CHECKSUM_FIELD_NUMBER: builtins.int
+    STATUS_FIELD_NUMBER: builtins.int
+    CHECKPOINT_ID_FIELD_NUMBER: builtins.int
+    checksum: builtins.str
+    status: global___CheckpointStatus.ValueType
+    checkpoint_id: builtins.str
+    def __init__(
+        self,
+        *,
+        checksum: builtins.str = ...,
+        status: global___CheckpointStatus.ValueType = ...,
+        checkpoint_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["checkpoint_id", b"checkpoint_id", "checksum", b"checksum", "status", b"status"]) -> None: ...
+
+global___CheckpointInfo = CheckpointInfo
+
+class ClassCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    EXISTING_CLASS_ID_FIELD_NUMBER: builtins.int
+    METHODS_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    existing_class_id: builtins.str
+    @property
+    def methods(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___ClassMethod]: ...
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        existing_class_id: builtins.str = ...,
+        methods: collections.abc.Iterable[global___ClassMethod] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "existing_class_id", b"existing_class_id", "methods", b"methods"]) -> None: ...
+
+global___ClassCreateRequest = ClassCreateRequest
+
+class ClassCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CLASS_ID_FIELD_NUMBER: builtins.int
+    HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    class_id: builtins.str
+    @property
+    def handle_metadata(self) -> global___ClassHandleMetadata: ...
+    def __init__(
+        self,
+        *,
+        class_id: builtins.str = ...,
+        handle_metadata: global___ClassHandleMetadata | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["handle_metadata", b"handle_metadata"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["class_id", b"class_id", "handle_metadata", b"handle_metadata"]) -> None: ...
+
+global___ClassCreateResponse = ClassCreateResponse
+
+class ClassGetRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_TAG_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    LOOKUP_PUBLISHED_FIELD_NUMBER: builtins.int
+    WORKSPACE_NAME_FIELD_NUMBER: builtins.int
+    app_name: builtins.str
+    object_tag: builtins.str
+    namespace: global___DeploymentNamespace.ValueType
+    environment_name: builtins.str
+    lookup_published: builtins.bool
+    """Lookup class on app published by another workspace"""
+    workspace_name: builtins.str
+    def __init__(
+        self,
+        *,
+        app_name: builtins.str = ...,
+        object_tag: builtins.str = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        environment_name: builtins.str = ...,
+        lookup_published: builtins.bool = ...,
+        workspace_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_name", b"app_name", "environment_name", b"environment_name", "lookup_published", b"lookup_published", "namespace", b"namespace", "object_tag", b"object_tag", "workspace_name", b"workspace_name"]) -> None: ...
+
+global___ClassGetRequest = ClassGetRequest
+
+class ClassGetResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CLASS_ID_FIELD_NUMBER: builtins.int
+    HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    class_id: builtins.str
+    @property
+    def handle_metadata(self) -> global___ClassHandleMetadata: ...
+    def __init__(
+        self,
+        *,
+        class_id: builtins.str = ...,
+        handle_metadata: global___ClassHandleMetadata | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["handle_metadata", b"handle_metadata"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["class_id", b"class_id", "handle_metadata", b"handle_metadata"]) -> None: ...
+
+global___ClassGetResponse = ClassGetResponse
+
+class ClassHandleMetadata(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    METHODS_FIELD_NUMBER: builtins.int
+    @property
+    def methods(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___ClassMethod]: ...
+    def __init__(
+        self,
+        *,
+        methods: collections.abc.Iterable[global___ClassMethod] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["methods", b"methods"]) -> None: ...
+
+global___ClassHandleMetadata = ClassHandleMetadata
+
+class ClassMethod(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_NAME_FIELD_NUMBER: builtins.int
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    function_name: builtins.str
+    function_id: builtins.str
+    @property
+    def function_handle_metadata(self) -> global___FunctionHandleMetadata:
+        """Class methods need to hydrate all functions on the class"""
+    def __init__(
+        self,
+        *,
+        function_name: builtins.str = ...,
+        function_id: builtins.str = ...,
+        function_handle_metadata: global___FunctionHandleMetadata | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["function_handle_metadata", b"function_handle_metadata"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_handle_metadata", b"function_handle_metadata", "function_id", b"function_id", "function_name", b"function_name"]) -> None: ...
+
+global___ClassMethod = ClassMethod
+
+class ClientCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CLIENT_TYPE_FIELD_NUMBER: builtins.int
+    VERSION_FIELD_NUMBER: builtins.int
+    client_type: global___ClientType.ValueType
+    version: builtins.str
+    def __init__(
+        self,
+        *,
+        client_type: global___ClientType.ValueType = ...,
+        version: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["client_type", b"client_type", "version", b"version"]) -> None: ...
+
+global___ClientCreateRequest = ClientCreateRequest
+
+class ClientCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CLIENT_ID_FIELD_NUMBER: builtins.int
+    ERROR_FIELD_NUMBER: builtins.int
+    DEPRECATION_WARNING_FIELD_NUMBER: builtins.int
+    client_id: builtins.str
+    error: builtins.str
+    deprecation_warning: builtins.str
+    def __init__(
+        self,
+        *,
+        client_id: builtins.str = ...,
+        error: builtins.str = ...,
+        deprecation_warning: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["client_id", b"client_id", "deprecation_warning", b"deprecation_warning", "error", b"error"]) -> None: ...
+
+global___ClientCreateResponse = ClientCreateResponse
+
+class ClientHelloResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    WARNING_FIELD_NUMBER: builtins.int
+    IMAGE_BUILDER_VERSION_FIELD_NUMBER: builtins.int
+    warning: builtins.str
+    image_builder_version: builtins.str
+    def __init__(
+        self,
+        *,
+        warning: builtins.str = ...,
+        image_builder_version: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["image_builder_version", b"image_builder_version", "warning", b"warning"]) -> None: ...
+
+global___ClientHelloResponse = ClientHelloResponse
+
+class ClientHeartbeatRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CLIENT_ID_FIELD_NUMBER: builtins.int
+    CURRENT_INPUT_ID_FIELD_NUMBER: builtins.int
+    CURRENT_INPUT_STARTED_AT_FIELD_NUMBER: builtins.int
+    client_id: builtins.str
+    current_input_id: builtins.str
+    current_input_started_at: builtins.float
+    def __init__(
+        self,
+        *,
+        client_id: builtins.str = ...,
+        current_input_id: builtins.str = ...,
+        current_input_started_at: builtins.float = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["client_id", b"client_id", "current_input_id", b"current_input_id", "current_input_started_at", b"current_input_started_at"]) -> None: ...
+
+global___ClientHeartbeatRequest = ClientHeartbeatRequest
+
+class ContainerArguments(google.protobuf.message.Message):
+    """This is used to pass data from the worker to the container"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class TracingContextEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        value: builtins.str
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: builtins.str = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    TASK_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_DEF_FIELD_NUMBER: builtins.int
+    PROXY_INFO_FIELD_NUMBER: builtins.int
+    TRACING_CONTEXT_FIELD_NUMBER: builtins.int
+    SERIALIZED_PARAMS_FIELD_NUMBER: builtins.int
+    RUNTIME_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    CHECKPOINT_ID_FIELD_NUMBER: builtins.int
+    task_id: builtins.str
+    function_id: builtins.str
+    app_id: builtins.str
+    @property
+    def function_def(self) -> global___Function: ...
+    @property
+    def proxy_info(self) -> global___ProxyInfo: ...
+    @property
+    def tracing_context(self) -> google.protobuf.internal.containers.ScalarMap[builtins.str, builtins.str]: ...
+    serialized_params: builtins.bytes
+    runtime: builtins.str
+    environment_name: builtins.str
+    checkpoint_id: builtins.str
+    def __init__(
+        self,
+        *,
+        task_id: builtins.str = ...,
+        function_id: builtins.str = ...,
+        app_id: builtins.str = ...,
+        function_def: global___Function | None = ...,
+        proxy_info: global___ProxyInfo | None = ...,
+        tracing_context: collections.abc.Mapping[builtins.str, builtins.str] | None = ...,
+        serialized_params: builtins.bytes = ...,
+        runtime: builtins.str = ...,
+        environment_name: builtins.str = ...,
+        checkpoint_id: builtins.str | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_checkpoint_id", b"_checkpoint_id", "checkpoint_id", b"checkpoint_id", "function_def", b"function_def", "proxy_info", b"proxy_info"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_checkpoint_id", b"_checkpoint_id", "app_id", b"app_id", "checkpoint_id", b"checkpoint_id", "environment_name", b"environment_name", "function_def", b"function_def", "function_id", b"function_id", "proxy_info", b"proxy_info", "runtime", b"runtime", "serialized_params", b"serialized_params", "task_id", b"task_id", "tracing_context", b"tracing_context"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_checkpoint_id", b"_checkpoint_id"]) -> typing_extensions.Literal["checkpoint_id"] | None: ...
+
+global___ContainerArguments = ContainerArguments
+
+class CancelInputEvent(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    INPUT_IDS_FIELD_NUMBER: builtins.int
+    @property
+    def input_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        input_ids: collections.abc.Iterable[builtins.str] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["input_ids", b"input_ids"]) -> None: ...
+
+global___CancelInputEvent = CancelInputEvent
+
+class ContainerHeartbeatResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CANCEL_INPUT_EVENT_FIELD_NUMBER: builtins.int
+    @property
+    def cancel_input_event(self) -> global___CancelInputEvent: ...
+    def __init__(
+        self,
+        *,
+        cancel_input_event: global___CancelInputEvent | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_cancel_input_event", b"_cancel_input_event", "cancel_input_event", b"cancel_input_event"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_cancel_input_event", b"_cancel_input_event", "cancel_input_event", b"cancel_input_event"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_cancel_input_event", b"_cancel_input_event"]) -> typing_extensions.Literal["cancel_input_event"] | None: ...
+
+global___ContainerHeartbeatResponse = ContainerHeartbeatResponse
+
+class ContainerHeartbeatRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CURRENT_INPUT_ID_FIELD_NUMBER: builtins.int
+    CURRENT_INPUT_STARTED_AT_FIELD_NUMBER: builtins.int
+    SUPPORTS_GRACEFUL_INPUT_CANCELLATION_FIELD_NUMBER: builtins.int
+    current_input_id: builtins.str
+    current_input_started_at: builtins.float
+    supports_graceful_input_cancellation: builtins.bool
+    """implicitly also means we support long polling. Can be removed once v0.57 is no longer supported"""
+    def __init__(
+        self,
+        *,
+        current_input_id: builtins.str = ...,
+        current_input_started_at: builtins.float = ...,
+        supports_graceful_input_cancellation: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["current_input_id", b"current_input_id", "current_input_started_at", b"current_input_started_at", "supports_graceful_input_cancellation", b"supports_graceful_input_cancellation"]) -> None: ...
+
+global___ContainerHeartbeatRequest = ContainerHeartbeatRequest
+
+class ContainerCheckpointRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CHECKPOINT_ID_FIELD_NUMBER: builtins.int
+    checkpoint_id: builtins.str
+    def __init__(
+        self,
+        *,
+        checkpoint_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["checkpoint_id", b"checkpoint_id"]) -> None: ...
+
+global___ContainerCheckpointRequest = ContainerCheckpointRequest
+
+class ContainerExecRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TASK_ID_FIELD_NUMBER: builtins.int
+    COMMAND_FIELD_NUMBER: builtins.int
+    PTY_INFO_FIELD_NUMBER: builtins.int
+    TERMINATE_CONTAINER_ON_EXIT_FIELD_NUMBER: builtins.int
+    RUNTIME_DEBUG_FIELD_NUMBER: builtins.int
+    task_id: builtins.str
+    @property
+    def command(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    @property
+    def pty_info(self) -> global___PTYInfo: ...
+    terminate_container_on_exit: builtins.bool
+    """Send SIGTERM to running container on exit of exec command."""
+    runtime_debug: builtins.bool
+    """For internal debugging use only."""
+    def __init__(
+        self,
+        *,
+        task_id: builtins.str = ...,
+        command: collections.abc.Iterable[builtins.str] | None = ...,
+        pty_info: global___PTYInfo | None = ...,
+        terminate_container_on_exit: builtins.bool = ...,
+        runtime_debug: builtins.bool = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["pty_info", b"pty_info"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["command", b"command", "pty_info", b"pty_info", "runtime_debug", b"runtime_debug", "task_id", b"task_id", "terminate_container_on_exit", b"terminate_container_on_exit"]) -> None: ...
+
+global___ContainerExecRequest = ContainerExecRequest
+
+class ContainerExecGetOutputRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    EXEC_ID_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    LAST_BATCH_INDEX_FIELD_NUMBER: builtins.int
+    exec_id: builtins.str
+    timeout: builtins.float
+    last_batch_index: builtins.int
+    def __init__(
+        self,
+        *,
+        exec_id: builtins.str = ...,
+        timeout: builtins.float = ...,
+        last_batch_index: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["exec_id", b"exec_id", "last_batch_index", b"last_batch_index", "timeout", b"timeout"]) -> None: ...
+
+global___ContainerExecGetOutputRequest = ContainerExecGetOutputRequest
+
+class ContainerExecPutInputRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    EXEC_ID_FIELD_NUMBER: builtins.int
+    INPUT_FIELD_NUMBER: builtins.int
+    exec_id: builtins.str
+    @property
+    def input(self) -> global___RuntimeInputMessage: ...
+    def __init__(
+        self,
+        *,
+        exec_id: builtins.str = ...,
+        input: global___RuntimeInputMessage | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["input", b"input"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["exec_id", b"exec_id", "input", b"input"]) -> None: ...
+
+global___ContainerExecPutInputRequest = ContainerExecPutInputRequest
+
+class ContainerExecResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    EXEC_ID_FIELD_NUMBER: builtins.int
+    exec_id: builtins.str
+    def __init__(
+        self,
+        *,
+        exec_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["exec_id", b"exec_id"]) -> None: ...
+
+global___ContainerExecResponse = ContainerExecResponse
+
+class CustomDomainConfig(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: builtins.int
+    name: builtins.str
+    def __init__(
+        self,
+        *,
+        name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["name", b"name"]) -> None: ...
+
+global___CustomDomainConfig = CustomDomainConfig
+
+class CustomDomainInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    URL_FIELD_NUMBER: builtins.int
+    url: builtins.str
+    def __init__(
+        self,
+        *,
+        url: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["url", b"url"]) -> None: ...
+
+global___CustomDomainInfo = CustomDomainInfo
+
+class DataChunk(google.protobuf.message.Message):
+    """Chunks of data that can be streamed in and out of tasks."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DATA_FORMAT_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    DATA_BLOB_ID_FIELD_NUMBER: builtins.int
+    INDEX_FIELD_NUMBER: builtins.int
+    data_format: global___DataFormat.ValueType
+    data: builtins.bytes
+    data_blob_id: builtins.str
+    index: builtins.int
+    """Index of this data chunk in the stream."""
+    def __init__(
+        self,
+        *,
+        data_format: global___DataFormat.ValueType = ...,
+        data: builtins.bytes = ...,
+        data_blob_id: builtins.str = ...,
+        index: builtins.int = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_oneof", b"data_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_format", b"data_format", "data_oneof", b"data_oneof", "index", b"index"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["data_oneof", b"data_oneof"]) -> typing_extensions.Literal["data", "data_blob_id"] | None: ...
+
+global___DataChunk = DataChunk
+
+class DictClearRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DICT_ID_FIELD_NUMBER: builtins.int
+    dict_id: builtins.str
+    def __init__(
+        self,
+        *,
+        dict_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id", b"dict_id"]) -> None: ...
+
+global___DictClearRequest = DictClearRequest
+
+class DictContainsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DICT_ID_FIELD_NUMBER: builtins.int
+    KEY_FIELD_NUMBER: builtins.int
+    dict_id: builtins.str
+    key: builtins.bytes
+    def __init__(
+        self,
+        *,
+        dict_id: builtins.str = ...,
+        key: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id", b"dict_id", "key", b"key"]) -> None: ...
+
+global___DictContainsRequest = DictContainsRequest
+
+class DictContainsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FOUND_FIELD_NUMBER: builtins.int
+    found: builtins.bool
+    def __init__(
+        self,
+        *,
+        found: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["found", b"found"]) -> None: ...
+
+global___DictContainsResponse = DictContainsResponse
+
+class DictCreateRequest(google.protobuf.message.Message):
+    """Will be superseded by DictGetOrCreateRequest"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DATA_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    EXISTING_DICT_ID_FIELD_NUMBER: builtins.int
+    @property
+    def data(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___DictEntry]: ...
+    app_id: builtins.str
+    existing_dict_id: builtins.str
+    def __init__(
+        self,
+        *,
+        data: collections.abc.Iterable[global___DictEntry] | None = ...,
+        app_id: builtins.str = ...,
+        existing_dict_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "data", b"data", "existing_dict_id", b"existing_dict_id"]) -> None: ...
+
+global___DictCreateRequest = DictCreateRequest
+
+class DictCreateResponse(google.protobuf.message.Message):
+    """Will be superseded by DictGetOrCreateResponse"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DICT_ID_FIELD_NUMBER: builtins.int
+    dict_id: builtins.str
+    def __init__(
+        self,
+        *,
+        dict_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id", b"dict_id"]) -> None: ...
+
+global___DictCreateResponse = DictCreateResponse
+
+class DictGetOrCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DEPLOYMENT_NAME_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_CREATION_TYPE_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    deployment_name: builtins.str
+    namespace: global___DeploymentNamespace.ValueType
+    environment_name: builtins.str
+    object_creation_type: global___ObjectCreationType.ValueType
+    @property
+    def data(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___DictEntry]: ...
+    def __init__(
+        self,
+        *,
+        deployment_name: builtins.str = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        environment_name: builtins.str = ...,
+        object_creation_type: global___ObjectCreationType.ValueType = ...,
+        data: collections.abc.Iterable[global___DictEntry] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data", b"data", "deployment_name", b"deployment_name", "environment_name", b"environment_name", "namespace", b"namespace", "object_creation_type", b"object_creation_type"]) -> None: ...
+
+global___DictGetOrCreateRequest = DictGetOrCreateRequest
+
+class DictGetOrCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DICT_ID_FIELD_NUMBER: builtins.int
+    dict_id: builtins.str
+    def __init__(
+        self,
+        *,
+        dict_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id", b"dict_id"]) -> None: ...
+
+global___DictGetOrCreateResponse = DictGetOrCreateResponse
+
+class DictEntry(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    KEY_FIELD_NUMBER: builtins.int
+    VALUE_FIELD_NUMBER: builtins.int
+    key: builtins.bytes
+    value: builtins.bytes
+    def __init__(
+        self,
+        *,
+        key: builtins.bytes = ...,
+        value: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+global___DictEntry = DictEntry
+
+class DictGetRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DICT_ID_FIELD_NUMBER: builtins.int
+    KEY_FIELD_NUMBER: builtins.int
+    dict_id: builtins.str
+    key: builtins.bytes
+    def __init__(
+        self,
+        *,
+        dict_id: builtins.str = ...,
+        key: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id", b"dict_id", "key", b"key"]) -> None: ...
+
+global___DictGetRequest = DictGetRequest
+
+class DictGetResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FOUND_FIELD_NUMBER: builtins.int
+    VALUE_FIELD_NUMBER: builtins.int
+    found: builtins.bool
+    value: builtins.bytes
+    def __init__(
+        self,
+        *,
+        found: builtins.bool = ...,
+        value: builtins.bytes | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_value", b"_value", "value", b"value"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_value", b"_value", "found", b"found", "value", b"value"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_value", b"_value"]) -> typing_extensions.Literal["value"] | None: ...
+
+global___DictGetResponse = DictGetResponse
+
+class DictHeartbeatRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DICT_ID_FIELD_NUMBER: builtins.int
+    dict_id: builtins.str
+    def __init__(
+        self,
+        *,
+        dict_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id", b"dict_id"]) -> None: ...
+
+global___DictHeartbeatRequest = DictHeartbeatRequest
+
+class DictLenRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DICT_ID_FIELD_NUMBER: builtins.int
+    dict_id: builtins.str
+    def __init__(
+        self,
+        *,
+        dict_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id", b"dict_id"]) -> None: ...
+
+global___DictLenRequest = DictLenRequest
+
+class DictLenResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    LEN_FIELD_NUMBER: builtins.int
+    len: builtins.int
+    def __init__(
+        self,
+        *,
+        len: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["len", b"len"]) -> None: ...
+
+global___DictLenResponse = DictLenResponse
+
+class DictPopRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DICT_ID_FIELD_NUMBER: builtins.int
+    KEY_FIELD_NUMBER: builtins.int
+    dict_id: builtins.str
+    key: builtins.bytes
+    def __init__(
+        self,
+        *,
+        dict_id: builtins.str = ...,
+        key: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id", b"dict_id", "key", b"key"]) -> None: ...
+
+global___DictPopRequest = DictPopRequest
+
+class DictPopResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FOUND_FIELD_NUMBER: builtins.int
+    VALUE_FIELD_NUMBER: builtins.int
+    found: builtins.bool
+    value: builtins.bytes
+    def __init__(
+        self,
+        *,
+        found: builtins.bool = ...,
+        value: builtins.bytes | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_value", b"_value", "value", b"value"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_value", b"_value", "found", b"found", "value", b"value"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_value", b"_value"]) -> typing_extensions.Literal["value"] | None: ...
+
+global___DictPopResponse = DictPopResponse
+
+class DictUpdateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DICT_ID_FIELD_NUMBER: builtins.int
+    UPDATES_FIELD_NUMBER: builtins.int
+    dict_id: builtins.str
+    @property
+    def updates(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___DictEntry]: ...
+    def __init__(
+        self,
+        *,
+        dict_id: builtins.str = ...,
+        updates: collections.abc.Iterable[global___DictEntry] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dict_id", b"dict_id", "updates", b"updates"]) -> None: ...
+
+global___DictUpdateRequest = DictUpdateRequest
+
+class DictUpdateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+
+global___DictUpdateResponse = DictUpdateResponse
+
+class DNSRecord(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TYPE_FIELD_NUMBER: builtins.int
+    NAME_FIELD_NUMBER: builtins.int
+    VALUE_FIELD_NUMBER: builtins.int
+    type: global___DNSRecordType.ValueType
+    name: builtins.str
+    value: builtins.str
+    def __init__(
+        self,
+        *,
+        type: global___DNSRecordType.ValueType = ...,
+        name: builtins.str = ...,
+        value: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["name", b"name", "type", b"type", "value", b"value"]) -> None: ...
+
+global___DNSRecord = DNSRecord
+
+class DomainCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DOMAIN_NAME_FIELD_NUMBER: builtins.int
+    domain_name: builtins.str
+    def __init__(
+        self,
+        *,
+        domain_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["domain_name", b"domain_name"]) -> None: ...
+
+global___DomainCreateRequest = DomainCreateRequest
+
+class DomainCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DOMAIN_ID_FIELD_NUMBER: builtins.int
+    DNS_RECORDS_FIELD_NUMBER: builtins.int
+    domain_id: builtins.str
+    @property
+    def dns_records(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___DNSRecord]: ...
+    def __init__(
+        self,
+        *,
+        domain_id: builtins.str = ...,
+        dns_records: collections.abc.Iterable[global___DNSRecord] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dns_records", b"dns_records", "domain_id", b"domain_id"]) -> None: ...
+
+global___DomainCreateResponse = DomainCreateResponse
+
+class DomainListRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+
+global___DomainListRequest = DomainListRequest
+
+class Domain(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DOMAIN_ID_FIELD_NUMBER: builtins.int
+    DOMAIN_NAME_FIELD_NUMBER: builtins.int
+    CREATED_AT_FIELD_NUMBER: builtins.int
+    CERTIFICATE_STATUS_FIELD_NUMBER: builtins.int
+    DNS_RECORDS_FIELD_NUMBER: builtins.int
+    domain_id: builtins.str
+    domain_name: builtins.str
+    created_at: builtins.float
+    certificate_status: global___CertificateStatus.ValueType
+    @property
+    def dns_records(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___DNSRecord]: ...
+    def __init__(
+        self,
+        *,
+        domain_id: builtins.str = ...,
+        domain_name: builtins.str = ...,
+        created_at: builtins.float = ...,
+        certificate_status: global___CertificateStatus.ValueType = ...,
+        dns_records: collections.abc.Iterable[global___DNSRecord] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["certificate_status", b"certificate_status", "created_at", b"created_at", "dns_records", b"dns_records", "domain_id", b"domain_id", "domain_name", b"domain_name"]) -> None: ...
+
+global___Domain = Domain
+
+class DomainListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DOMAINS_FIELD_NUMBER: builtins.int
+    @property
+    def domains(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___Domain]: ...
+    def __init__(
+        self,
+        *,
+        domains: collections.abc.Iterable[global___Domain] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["domains", b"domains"]) -> None: ...
+
+global___DomainListResponse = DomainListResponse
+
+class DomainCertificateVerifyRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DOMAIN_ID_FIELD_NUMBER: builtins.int
+    domain_id: builtins.str
+    def __init__(
+        self,
+        *,
+        domain_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["domain_id", b"domain_id"]) -> None: ...
+
+global___DomainCertificateVerifyRequest = DomainCertificateVerifyRequest
+
+class DomainCertificateVerifyResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DOMAIN_FIELD_NUMBER: builtins.int
+    @property
+    def domain(self) -> global___Domain: ...
+    def __init__(
+        self,
+        *,
+        domain: global___Domain | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["domain", b"domain"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["domain", b"domain"]) -> None: ...
+
+global___DomainCertificateVerifyResponse = DomainCertificateVerifyResponse
+
+class EnvironmentCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: builtins.int
+    name: builtins.str
+    def __init__(
+        self,
+        *,
+        name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["name", b"name"]) -> None: ...
+
+global___EnvironmentCreateRequest = EnvironmentCreateRequest
+
+class EnvironmentDeleteRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: builtins.int
+    name: builtins.str
+    def __init__(
+        self,
+        *,
+        name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["name", b"name"]) -> None: ...
+
+global___EnvironmentDeleteRequest = EnvironmentDeleteRequest
+
+class EnvironmentListItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: builtins.int
+    WEBHOOK_SUFFIX_FIELD_NUMBER: builtins.int
+    name: builtins.str
+    webhook_suffix: builtins.str
+    def __init__(
+        self,
+        *,
+        name: builtins.str = ...,
+        webhook_suffix: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["name", b"name", "webhook_suffix", b"webhook_suffix"]) -> None: ...
+
+global___EnvironmentListItem = EnvironmentListItem
+
+class EnvironmentListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ITEMS_FIELD_NUMBER: builtins.int
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___EnvironmentListItem]: ...
+    def __init__(
+        self,
+        *,
+        items: collections.abc.Iterable[global___EnvironmentListItem] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["items", b"items"]) -> None: ...
+
+global___EnvironmentListResponse = EnvironmentListResponse
+
+class EnvironmentUpdateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CURRENT_NAME_FIELD_NUMBER: builtins.int
+    NAME_FIELD_NUMBER: builtins.int
+    WEB_SUFFIX_FIELD_NUMBER: builtins.int
+    current_name: builtins.str
+    @property
+    def name(self) -> google.protobuf.wrappers_pb2.StringValue: ...
+    @property
+    def web_suffix(self) -> google.protobuf.wrappers_pb2.StringValue: ...
+    def __init__(
+        self,
+        *,
+        current_name: builtins.str = ...,
+        name: google.protobuf.wrappers_pb2.StringValue | None = ...,
+        web_suffix: google.protobuf.wrappers_pb2.StringValue | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["name", b"name", "web_suffix", b"web_suffix"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["current_name", b"current_name", "name", b"name", "web_suffix", b"web_suffix"]) -> None: ...
+
+global___EnvironmentUpdateRequest = EnvironmentUpdateRequest
+
+class FunctionCallPutDataRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    DATA_CHUNKS_FIELD_NUMBER: builtins.int
+    function_call_id: builtins.str
+    @property
+    def data_chunks(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___DataChunk]: ...
+    def __init__(
+        self,
+        *,
+        function_call_id: builtins.str = ...,
+        data_chunks: collections.abc.Iterable[global___DataChunk] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data_chunks", b"data_chunks", "function_call_id", b"function_call_id"]) -> None: ...
+
+global___FunctionCallPutDataRequest = FunctionCallPutDataRequest
+
+class FunctionCallGetDataRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    LAST_INDEX_FIELD_NUMBER: builtins.int
+    function_call_id: builtins.str
+    last_index: builtins.int
+    def __init__(
+        self,
+        *,
+        function_call_id: builtins.str = ...,
+        last_index: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id", b"function_call_id", "last_index", b"last_index"]) -> None: ...
+
+global___FunctionCallGetDataRequest = FunctionCallGetDataRequest
+
+class Function(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class _DefinitionType:
+        ValueType = typing.NewType("ValueType", builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+
+    class _DefinitionTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[Function._DefinitionType.ValueType], builtins.type):  # noqa: F821
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        DEFINITION_TYPE_UNSPECIFIED: Function._DefinitionType.ValueType  # 0
+        DEFINITION_TYPE_SERIALIZED: Function._DefinitionType.ValueType  # 1
+        DEFINITION_TYPE_FILE: Function._DefinitionType.ValueType  # 2
+
+    class DefinitionType(_DefinitionType, metaclass=_DefinitionTypeEnumTypeWrapper): ...
+    DEFINITION_TYPE_UNSPECIFIED: Function.DefinitionType.ValueType  # 0
+    DEFINITION_TYPE_SERIALIZED: Function.DefinitionType.ValueType  # 1
+    DEFINITION_TYPE_FILE: Function.DefinitionType.ValueType  # 2
+
+    class _FunctionType:
+        ValueType = typing.NewType("ValueType", builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+
+    class _FunctionTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[Function._FunctionType.ValueType], builtins.type):  # noqa: F821
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        FUNCTION_TYPE_UNSPECIFIED: Function._FunctionType.ValueType  # 0
+        FUNCTION_TYPE_GENERATOR: Function._FunctionType.ValueType  # 1
+        FUNCTION_TYPE_FUNCTION: Function._FunctionType.ValueType  # 2
+
+    class FunctionType(_FunctionType, metaclass=_FunctionTypeEnumTypeWrapper): ...
+    FUNCTION_TYPE_UNSPECIFIED: Function.FunctionType.ValueType  # 0
+    FUNCTION_TYPE_GENERATOR: Function.FunctionType.ValueType  # 1
+    FUNCTION_TYPE_FUNCTION: Function.FunctionType.ValueType  # 2
+
+    MODULE_NAME_FIELD_NUMBER: builtins.int
+    FUNCTION_NAME_FIELD_NUMBER: builtins.int
+    MOUNT_IDS_FIELD_NUMBER: builtins.int
+    IMAGE_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_SERIALIZED_FIELD_NUMBER: builtins.int
+    DEFINITION_TYPE_FIELD_NUMBER: builtins.int
+    FUNCTION_TYPE_FIELD_NUMBER: builtins.int
+    RESOURCES_FIELD_NUMBER: builtins.int
+    SECRET_IDS_FIELD_NUMBER: builtins.int
+    RATE_LIMIT_FIELD_NUMBER: builtins.int
+    WEBHOOK_CONFIG_FIELD_NUMBER: builtins.int
+    SHARED_VOLUME_MOUNTS_FIELD_NUMBER: builtins.int
+    PROXY_ID_FIELD_NUMBER: builtins.int
+    RETRY_POLICY_FIELD_NUMBER: builtins.int
+    CONCURRENCY_LIMIT_FIELD_NUMBER: builtins.int
+    KEEP_WARM_FIELD_NUMBER: builtins.int
+    TIMEOUT_SECS_FIELD_NUMBER: builtins.int
+    PTY_INFO_FIELD_NUMBER: builtins.int
+    CLASS_SERIALIZED_FIELD_NUMBER: builtins.int
+    TASK_IDLE_TIMEOUT_SECS_FIELD_NUMBER: builtins.int
+    CLOUD_PROVIDER_FIELD_NUMBER: builtins.int
+    WARM_POOL_SIZE_FIELD_NUMBER: builtins.int
+    WEB_URL_FIELD_NUMBER: builtins.int
+    WEB_URL_INFO_FIELD_NUMBER: builtins.int
+    RUNTIME_FIELD_NUMBER: builtins.int
+    STUB_NAME_FIELD_NUMBER: builtins.int
+    VOLUME_MOUNTS_FIELD_NUMBER: builtins.int
+    ALLOW_CONCURRENT_INPUTS_FIELD_NUMBER: builtins.int
+    CUSTOM_DOMAIN_INFO_FIELD_NUMBER: builtins.int
+    WORKER_ID_FIELD_NUMBER: builtins.int
+    RUNTIME_DEBUG_FIELD_NUMBER: builtins.int
+    IS_BUILDER_FUNCTION_FIELD_NUMBER: builtins.int
+    IS_AUTO_SNAPSHOT_FIELD_NUMBER: builtins.int
+    IS_METHOD_FIELD_NUMBER: builtins.int
+    IS_CHECKPOINTING_FUNCTION_FIELD_NUMBER: builtins.int
+    CHECKPOINTING_ENABLED_FIELD_NUMBER: builtins.int
+    CHECKPOINT_FIELD_NUMBER: builtins.int
+    OBJECT_DEPENDENCIES_FIELD_NUMBER: builtins.int
+    BLOCK_NETWORK_FIELD_NUMBER: builtins.int
+    MAX_INPUTS_FIELD_NUMBER: builtins.int
+    S3_MOUNTS_FIELD_NUMBER: builtins.int
+    CLOUD_BUCKET_MOUNTS_FIELD_NUMBER: builtins.int
+    _EXPERIMENTAL_BOOST_FIELD_NUMBER: builtins.int
+    _EXPERIMENTAL_SCHEDULER_FIELD_NUMBER: builtins.int
+    _EXPERIMENTAL_SCHEDULER_PLACEMENT_FIELD_NUMBER: builtins.int
+    module_name: builtins.str
+    function_name: builtins.str
+    @property
+    def mount_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    image_id: builtins.str
+    function_serialized: builtins.bytes
+    definition_type: global___Function.DefinitionType.ValueType
+    function_type: global___Function.FunctionType.ValueType
+    @property
+    def resources(self) -> global___Resources: ...
+    @property
+    def secret_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    @property
+    def rate_limit(self) -> global___RateLimit: ...
+    @property
+    def webhook_config(self) -> global___WebhookConfig: ...
+    @property
+    def shared_volume_mounts(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SharedVolumeMount]: ...
+    proxy_id: builtins.str
+    @property
+    def retry_policy(self) -> global___FunctionRetryPolicy: ...
+    concurrency_limit: builtins.int
+    keep_warm: builtins.bool
+    timeout_secs: builtins.int
+    @property
+    def pty_info(self) -> global___PTYInfo: ...
+    class_serialized: builtins.bytes
+    task_idle_timeout_secs: builtins.int
+    cloud_provider: global___CloudProvider.ValueType
+    warm_pool_size: builtins.int
+    web_url: builtins.str
+    @property
+    def web_url_info(self) -> global___WebUrlInfo: ...
+    runtime: builtins.str
+    """If set, overrides the runtime used by the function, either "runc" or "gvisor"."""
+    stub_name: builtins.str
+    @property
+    def volume_mounts(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___VolumeMount]: ...
+    allow_concurrent_inputs: builtins.int
+    @property
+    def custom_domain_info(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___CustomDomainInfo]: ...
+    worker_id: builtins.str
+    """For internal debugging use only."""
+    runtime_debug: builtins.bool
+    """For internal debugging use only."""
+    is_builder_function: builtins.bool
+    """TODO: combine into enum?"""
+    is_auto_snapshot: builtins.bool
+    is_method: builtins.bool
+    is_checkpointing_function: builtins.bool
+    checkpointing_enabled: builtins.bool
+    """Checkpoint and restore"""
+    @property
+    def checkpoint(self) -> global___CheckpointInfo: ...
+    @property
+    def object_dependencies(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___ObjectDependency]: ...
+    block_network: builtins.bool
+    max_inputs: builtins.int
+    @property
+    def s3_mounts(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___S3Mount]: ...
+    @property
+    def cloud_bucket_mounts(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___CloudBucketMount]: ...
+    _experimental_boost: builtins.bool
+    _experimental_scheduler: builtins.bool
+    """If set, tasks will be scheduled using the new scheduler, which also knows
+    to look at fine-grained placement constraints.
+    """
+    @property
+    def _experimental_scheduler_placement(self) -> global___SchedulerPlacement: ...
+    def __init__(
+        self,
+        *,
+        module_name: builtins.str = ...,
+        function_name: builtins.str = ...,
+        mount_ids: collections.abc.Iterable[builtins.str] | None = ...,
+        image_id: builtins.str = ...,
+        function_serialized: builtins.bytes = ...,
+        definition_type: global___Function.DefinitionType.ValueType = ...,
+        function_type: global___Function.FunctionType.ValueType = ...,
+        resources: global___Resources | None = ...,
+        secret_ids: collections.abc.Iterable[builtins.str] | None = ...,
+        rate_limit: global___RateLimit | None = ...,
+        webhook_config: global___WebhookConfig | None = ...,
+        shared_volume_mounts: collections.abc.Iterable[global___SharedVolumeMount] | None = ...,
+        proxy_id: builtins.str | None = ...,
+        retry_policy: global___FunctionRetryPolicy | None = ...,
+        concurrency_limit: builtins.int = ...,
+        keep_warm: builtins.bool = ...,
+        timeout_secs: builtins.int = ...,
+        pty_info: global___PTYInfo | None = ...,
+        class_serialized: builtins.bytes = ...,
+        task_idle_timeout_secs: builtins.int = ...,
+        cloud_provider: global___CloudProvider.ValueType | None = ...,
+        warm_pool_size: builtins.int = ...,
+        web_url: builtins.str = ...,
+        web_url_info: global___WebUrlInfo | None = ...,
+        runtime: builtins.str = ...,
+        stub_name: builtins.str = ...,
+        volume_mounts: collections.abc.Iterable[global___VolumeMount] | None = ...,
+        allow_concurrent_inputs: builtins.int = ...,
+        custom_domain_info: collections.abc.Iterable[global___CustomDomainInfo] | None = ...,
+        worker_id: builtins.str = ...,
+        runtime_debug: builtins.bool = ...,
+        is_builder_function: builtins.bool = ...,
+        is_auto_snapshot: builtins.bool = ...,
+        is_method: builtins.bool = ...,
+        is_checkpointing_function: builtins.bool = ...,
+        checkpointing_enabled: builtins.bool = ...,
+        checkpoint: global___CheckpointInfo | None = ...,
+        object_dependencies: collections.abc.Iterable[global___ObjectDependency] | None = ...,
+        block_network: builtins.bool = ...,
+        max_inputs: builtins.int = ...,
+        s3_mounts: collections.abc.Iterable[global___S3Mount] | None = ...,
+        cloud_bucket_mounts: collections.abc.Iterable[global___CloudBucketMount] | None = ...,
+        _experimental_boost: builtins.bool = ...,
+        _experimental_scheduler: builtins.bool = ...,
+        _experimental_scheduler_placement: global___SchedulerPlacement | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["X_experimental_scheduler_placement", b"X_experimental_scheduler_placement", "_cloud_provider", b"_cloud_provider", "_experimental_scheduler_placement", b"_experimental_scheduler_placement", "_proxy_id", b"_proxy_id", "checkpoint", b"checkpoint", "cloud_provider", b"cloud_provider", "proxy_id", b"proxy_id", "pty_info", b"pty_info", "rate_limit", b"rate_limit", "resources", b"resources", "retry_policy", b"retry_policy", "web_url_info", b"web_url_info", "webhook_config", b"webhook_config"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["X_experimental_scheduler_placement", b"X_experimental_scheduler_placement", "_cloud_provider", b"_cloud_provider", "_experimental_boost", b"_experimental_boost", "_experimental_scheduler", b"_experimental_scheduler", "_experimental_scheduler_placement", b"_experimental_scheduler_placement", "_proxy_id", b"_proxy_id", "allow_concurrent_inputs", b"allow_concurrent_inputs", "block_network", b"block_network", "checkpoint", b"checkpoint", "checkpointing_enabled", b"checkpointing_enabled", "class_serialized", b"class_serialized", "cloud_bucket_mounts", b"cloud_bucket_mounts", "cloud_provider", b"cloud_provider", "concurrency_limit", b"concurrency_limit", "custom_domain_info", b"custom_domain_info", "definition_type", b"definition_type", "function_name", b"function_name", "function_serialized", b"function_serialized", "function_type", b"function_type", "image_id", b"image_id", "is_auto_snapshot", b"is_auto_snapshot", "is_builder_function", b"is_builder_function", "is_checkpointing_function", b"is_checkpointing_function", "is_method", b"is_method", "keep_warm", b"keep_warm", "max_inputs", b"max_inputs", "module_name", b"module_name", "mount_ids", b"mount_ids", "object_dependencies", b"object_dependencies", "proxy_id", b"proxy_id", "pty_info", b"pty_info", "rate_limit", b"rate_limit", "resources", b"resources", "retry_policy", b"retry_policy", "runtime", b"runtime", "runtime_debug", b"runtime_debug", "s3_mounts", b"s3_mounts", "secret_ids", b"secret_ids", "shared_volume_mounts", b"shared_volume_mounts", "stub_name", b"stub_name", "task_idle_timeout_secs", b"task_idle_timeout_secs", "timeout_secs", b"timeout_secs", "volume_mounts", b"volume_mounts", "warm_pool_size", b"warm_pool_size", "web_url", b"web_url", "web_url_info", b"web_url_info", "webhook_config", b"webhook_config", "worker_id", b"worker_id"]) -> None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["X_experimental_scheduler_placement", b"X_experimental_scheduler_placement"]) -> typing_extensions.Literal["_experimental_scheduler_placement"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_cloud_provider", b"_cloud_provider"]) -> typing_extensions.Literal["cloud_provider"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_proxy_id", b"_proxy_id"]) -> typing_extensions.Literal["proxy_id"] | None: ...
+
+global___Function = Function
+
+class SchedulerPlacement(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    _REGION_FIELD_NUMBER: builtins.int
+    _ZONE_FIELD_NUMBER: builtins.int
+    _LIFECYCLE_FIELD_NUMBER: builtins.int
+    _region: builtins.str
+    """TODO(irfansharif):
+    - Fold in cloud, resource needs here too.
+    - Allow specifying list of regions, zones, cloud, fallback and alternative
+      GPU types.
+    """
+    _zone: builtins.str
+    _lifecycle: builtins.str
+    """"on-demand" or "spot", else ignored"""
+    def __init__(
+        self,
+        *,
+        _region: builtins.str | None = ...,
+        _zone: builtins.str | None = ...,
+        _lifecycle: builtins.str | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["X_lifecycle", b"X_lifecycle", "X_region", b"X_region", "X_zone", b"X_zone", "_lifecycle", b"_lifecycle", "_region", b"_region", "_zone", b"_zone"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["X_lifecycle", b"X_lifecycle", "X_region", b"X_region", "X_zone", b"X_zone", "_lifecycle", b"_lifecycle", "_region", b"_region", "_zone", b"_zone"]) -> None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["X_lifecycle", b"X_lifecycle"]) -> typing_extensions.Literal["_lifecycle"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["X_region", b"X_region"]) -> typing_extensions.Literal["_region"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["X_zone", b"X_zone"]) -> typing_extensions.Literal["_zone"] | None: ...
+
+global___SchedulerPlacement = SchedulerPlacement
+
+class FunctionHandleMetadata(google.protobuf.message.Message):
+    """contains all the info about a function that is needed to trigger the right
+    behaviour when using a FunctionHandler. Notably excludes things purely
+    used for *executing* the function in a container entrypoint
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_NAME_FIELD_NUMBER: builtins.int
+    FUNCTION_TYPE_FIELD_NUMBER: builtins.int
+    WEB_URL_FIELD_NUMBER: builtins.int
+    IS_METHOD_FIELD_NUMBER: builtins.int
+    function_name: builtins.str
+    """Should be a subset and use IDs/types from `Function` above"""
+    function_type: global___Function.FunctionType.ValueType
+    web_url: builtins.str
+    is_method: builtins.bool
+    def __init__(
+        self,
+        *,
+        function_name: builtins.str = ...,
+        function_type: global___Function.FunctionType.ValueType = ...,
+        web_url: builtins.str = ...,
+        is_method: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_name", b"function_name", "function_type", b"function_type", "is_method", b"is_method", "web_url", b"web_url"]) -> None: ...
+
+global___FunctionHandleMetadata = FunctionHandleMetadata
+
+class FunctionCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    SCHEDULE_FIELD_NUMBER: builtins.int
+    EXISTING_FUNCTION_ID_FIELD_NUMBER: builtins.int
+    @property
+    def function(self) -> global___Function: ...
+    app_id: builtins.str
+    @property
+    def schedule(self) -> global___Schedule: ...
+    existing_function_id: builtins.str
+    def __init__(
+        self,
+        *,
+        function: global___Function | None = ...,
+        app_id: builtins.str = ...,
+        schedule: global___Schedule | None = ...,
+        existing_function_id: builtins.str = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["function", b"function", "schedule", b"schedule"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "existing_function_id", b"existing_function_id", "function", b"function", "schedule", b"schedule"]) -> None: ...
+
+global___FunctionCreateRequest = FunctionCreateRequest
+
+class FunctionOptions(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SECRET_IDS_FIELD_NUMBER: builtins.int
+    MOUNT_IDS_FIELD_NUMBER: builtins.int
+    RESOURCES_FIELD_NUMBER: builtins.int
+    RETRY_POLICY_FIELD_NUMBER: builtins.int
+    CONCURRENCY_LIMIT_FIELD_NUMBER: builtins.int
+    TIMEOUT_SECS_FIELD_NUMBER: builtins.int
+    TASK_IDLE_TIMEOUT_SECS_FIELD_NUMBER: builtins.int
+    WARM_POOL_SIZE_FIELD_NUMBER: builtins.int
+    VOLUME_MOUNTS_FIELD_NUMBER: builtins.int
+    ALLOW_CONCURRENT_INPUTS_FIELD_NUMBER: builtins.int
+    REPLACE_VOLUME_MOUNTS_FIELD_NUMBER: builtins.int
+    REPLACE_SECRET_IDS_FIELD_NUMBER: builtins.int
+    @property
+    def secret_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    @property
+    def mount_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]:
+        """Currently not supported"""
+    @property
+    def resources(self) -> global___Resources: ...
+    @property
+    def retry_policy(self) -> global___FunctionRetryPolicy: ...
+    concurrency_limit: builtins.int
+    timeout_secs: builtins.int
+    task_idle_timeout_secs: builtins.int
+    warm_pool_size: builtins.int
+    @property
+    def volume_mounts(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___VolumeMount]: ...
+    allow_concurrent_inputs: builtins.int
+    replace_volume_mounts: builtins.bool
+    replace_secret_ids: builtins.bool
+    def __init__(
+        self,
+        *,
+        secret_ids: collections.abc.Iterable[builtins.str] | None = ...,
+        mount_ids: collections.abc.Iterable[builtins.str] | None = ...,
+        resources: global___Resources | None = ...,
+        retry_policy: global___FunctionRetryPolicy | None = ...,
+        concurrency_limit: builtins.int | None = ...,
+        timeout_secs: builtins.int | None = ...,
+        task_idle_timeout_secs: builtins.int | None = ...,
+        warm_pool_size: builtins.int | None = ...,
+        volume_mounts: collections.abc.Iterable[global___VolumeMount] | None = ...,
+        allow_concurrent_inputs: builtins.int | None = ...,
+        replace_volume_mounts: builtins.bool = ...,
+        replace_secret_ids: builtins.bool = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_allow_concurrent_inputs", b"_allow_concurrent_inputs", "_concurrency_limit", b"_concurrency_limit", "_resources", b"_resources", "_retry_policy", b"_retry_policy", "_task_idle_timeout_secs", b"_task_idle_timeout_secs", "_timeout_secs", b"_timeout_secs", "_warm_pool_size", b"_warm_pool_size", "allow_concurrent_inputs", b"allow_concurrent_inputs", "concurrency_limit", b"concurrency_limit", "resources", b"resources", "retry_policy", b"retry_policy", "task_idle_timeout_secs", b"task_idle_timeout_secs", "timeout_secs", b"timeout_secs", "warm_pool_size", b"warm_pool_size"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_allow_concurrent_inputs", b"_allow_concurrent_inputs", "_concurrency_limit", b"_concurrency_limit", "_resources", b"_resources", "_retry_policy", b"_retry_policy", "_task_idle_timeout_secs", b"_task_idle_timeout_secs", "_timeout_secs", b"_timeout_secs", "_warm_pool_size", b"_warm_pool_size", "allow_concurrent_inputs", b"allow_concurrent_inputs", "concurrency_limit", b"concurrency_limit", "mount_ids", b"mount_ids", "replace_secret_ids", b"replace_secret_ids", "replace_volume_mounts", b"replace_volume_mounts", "resources", b"resources", "retry_policy", b"retry_policy", "secret_ids", b"secret_ids", "task_idle_timeout_secs", b"task_idle_timeout_secs", "timeout_secs", b"timeout_secs", "volume_mounts", b"volume_mounts", "warm_pool_size", b"warm_pool_size"]) -> None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_allow_concurrent_inputs", b"_allow_concurrent_inputs"]) -> typing_extensions.Literal["allow_concurrent_inputs"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_concurrency_limit", b"_concurrency_limit"]) -> typing_extensions.Literal["concurrency_limit"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_resources", b"_resources"]) -> typing_extensions.Literal["resources"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_retry_policy", b"_retry_policy"]) -> typing_extensions.Literal["retry_policy"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_task_idle_timeout_secs", b"_task_idle_timeout_secs"]) -> typing_extensions.Literal["task_idle_timeout_secs"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_timeout_secs", b"_timeout_secs"]) -> typing_extensions.Literal["timeout_secs"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_warm_pool_size", b"_warm_pool_size"]) -> typing_extensions.Literal["warm_pool_size"] | None: ...
+
+global___FunctionOptions = FunctionOptions
+
+class FunctionPrecreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_NAME_FIELD_NUMBER: builtins.int
+    EXISTING_FUNCTION_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_TYPE_FIELD_NUMBER: builtins.int
+    WEBHOOK_CONFIG_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    function_name: builtins.str
+    existing_function_id: builtins.str
+    function_type: global___Function.FunctionType.ValueType
+    @property
+    def webhook_config(self) -> global___WebhookConfig: ...
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        function_name: builtins.str = ...,
+        existing_function_id: builtins.str = ...,
+        function_type: global___Function.FunctionType.ValueType = ...,
+        webhook_config: global___WebhookConfig | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["webhook_config", b"webhook_config"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "existing_function_id", b"existing_function_id", "function_name", b"function_name", "function_type", b"function_type", "webhook_config", b"webhook_config"]) -> None: ...
+
+global___FunctionPrecreateRequest = FunctionPrecreateRequest
+
+class FunctionPrecreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    function_id: builtins.str
+    @property
+    def handle_metadata(self) -> global___FunctionHandleMetadata: ...
+    def __init__(
+        self,
+        *,
+        function_id: builtins.str = ...,
+        handle_metadata: global___FunctionHandleMetadata | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["handle_metadata", b"handle_metadata"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_id", b"function_id", "handle_metadata", b"handle_metadata"]) -> None: ...
+
+global___FunctionPrecreateResponse = FunctionPrecreateResponse
+
+class FunctionBindParamsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    SERIALIZED_PARAMS_FIELD_NUMBER: builtins.int
+    FUNCTION_OPTIONS_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    function_id: builtins.str
+    serialized_params: builtins.bytes
+    @property
+    def function_options(self) -> global___FunctionOptions: ...
+    environment_name: builtins.str
+    def __init__(
+        self,
+        *,
+        function_id: builtins.str = ...,
+        serialized_params: builtins.bytes = ...,
+        function_options: global___FunctionOptions | None = ...,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["function_options", b"function_options"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["environment_name", b"environment_name", "function_id", b"function_id", "function_options", b"function_options", "serialized_params", b"serialized_params"]) -> None: ...
+
+global___FunctionBindParamsRequest = FunctionBindParamsRequest
+
+class FunctionBindParamsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    BOUND_FUNCTION_ID_FIELD_NUMBER: builtins.int
+    HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    bound_function_id: builtins.str
+    @property
+    def handle_metadata(self) -> global___FunctionHandleMetadata: ...
+    def __init__(
+        self,
+        *,
+        bound_function_id: builtins.str = ...,
+        handle_metadata: global___FunctionHandleMetadata | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["handle_metadata", b"handle_metadata"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["bound_function_id", b"bound_function_id", "handle_metadata", b"handle_metadata"]) -> None: ...
+
+global___FunctionBindParamsResponse = FunctionBindParamsResponse
+
+class FunctionCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    WEB_URL_FIELD_NUMBER: builtins.int
+    WEB_URL_INFO_FIELD_NUMBER: builtins.int
+    FUNCTION_FIELD_NUMBER: builtins.int
+    HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    function_id: builtins.str
+    web_url: builtins.str
+    """Deprecated - needed until 0.51 is the minimum version"""
+    @property
+    def web_url_info(self) -> global___WebUrlInfo:
+        """Deprecated - needed until 0.51 is the minimum version"""
+    @property
+    def function(self) -> global___Function: ...
+    @property
+    def handle_metadata(self) -> global___FunctionHandleMetadata: ...
+    def __init__(
+        self,
+        *,
+        function_id: builtins.str = ...,
+        web_url: builtins.str = ...,
+        web_url_info: global___WebUrlInfo | None = ...,
+        function: global___Function | None = ...,
+        handle_metadata: global___FunctionHandleMetadata | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["function", b"function", "handle_metadata", b"handle_metadata", "web_url_info", b"web_url_info"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function", b"function", "function_id", b"function_id", "handle_metadata", b"handle_metadata", "web_url", b"web_url", "web_url_info", b"web_url_info"]) -> None: ...
+
+global___FunctionCreateResponse = FunctionCreateResponse
+
+class FunctionGetRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_TAG_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    app_name: builtins.str
+    object_tag: builtins.str
+    namespace: global___DeploymentNamespace.ValueType
+    environment_name: builtins.str
+    def __init__(
+        self,
+        *,
+        app_name: builtins.str = ...,
+        object_tag: builtins.str = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_name", b"app_name", "environment_name", b"environment_name", "namespace", b"namespace", "object_tag", b"object_tag"]) -> None: ...
+
+global___FunctionGetRequest = FunctionGetRequest
+
+class FunctionGetResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    function_id: builtins.str
+    @property
+    def handle_metadata(self) -> global___FunctionHandleMetadata: ...
+    def __init__(
+        self,
+        *,
+        function_id: builtins.str = ...,
+        handle_metadata: global___FunctionHandleMetadata | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["handle_metadata", b"handle_metadata"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_id", b"function_id", "handle_metadata", b"handle_metadata"]) -> None: ...
+
+global___FunctionGetResponse = FunctionGetResponse
+
+class FunctionUpdateSchedulingParamsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    WARM_POOL_SIZE_OVERRIDE_FIELD_NUMBER: builtins.int
+    function_id: builtins.str
+    warm_pool_size_override: builtins.int
+    def __init__(
+        self,
+        *,
+        function_id: builtins.str = ...,
+        warm_pool_size_override: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_id", b"function_id", "warm_pool_size_override", b"warm_pool_size_override"]) -> None: ...
+
+global___FunctionUpdateSchedulingParamsRequest = FunctionUpdateSchedulingParamsRequest
+
+class FunctionUpdateSchedulingParamsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+
+global___FunctionUpdateSchedulingParamsResponse = FunctionUpdateSchedulingParamsResponse
+
+class FunctionGetInputsItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    INPUT_FIELD_NUMBER: builtins.int
+    KILL_SWITCH_FIELD_NUMBER: builtins.int
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    input_id: builtins.str
+    @property
+    def input(self) -> global___FunctionInput: ...
+    kill_switch: builtins.bool
+    function_call_id: builtins.str
+    def __init__(
+        self,
+        *,
+        input_id: builtins.str = ...,
+        input: global___FunctionInput | None = ...,
+        kill_switch: builtins.bool = ...,
+        function_call_id: builtins.str = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["input", b"input"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id", b"function_call_id", "input", b"input", "input_id", b"input_id", "kill_switch", b"kill_switch"]) -> None: ...
+
+global___FunctionGetInputsItem = FunctionGetInputsItem
+
+class FunctionGetInputsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    MAX_VALUES_FIELD_NUMBER: builtins.int
+    AVERAGE_CALL_TIME_FIELD_NUMBER: builtins.int
+    INPUT_CONCURRENCY_FIELD_NUMBER: builtins.int
+    function_id: builtins.str
+    max_values: builtins.int
+    average_call_time: builtins.float
+    input_concurrency: builtins.int
+    """Container aims to fetch multiple inputs at the same time"""
+    def __init__(
+        self,
+        *,
+        function_id: builtins.str = ...,
+        max_values: builtins.int = ...,
+        average_call_time: builtins.float = ...,
+        input_concurrency: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["average_call_time", b"average_call_time", "function_id", b"function_id", "input_concurrency", b"input_concurrency", "max_values", b"max_values"]) -> None: ...
+
+global___FunctionGetInputsRequest = FunctionGetInputsRequest
+
+class FunctionGetInputsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    INPUTS_FIELD_NUMBER: builtins.int
+    RATE_LIMIT_SLEEP_DURATION_FIELD_NUMBER: builtins.int
+    @property
+    def inputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionGetInputsItem]: ...
+    rate_limit_sleep_duration: builtins.float
+    """How long to sleep before requesting another input."""
+    def __init__(
+        self,
+        *,
+        inputs: collections.abc.Iterable[global___FunctionGetInputsItem] | None = ...,
+        rate_limit_sleep_duration: builtins.float = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["inputs", b"inputs", "rate_limit_sleep_duration", b"rate_limit_sleep_duration"]) -> None: ...
+
+global___FunctionGetInputsResponse = FunctionGetInputsResponse
+
+class FunctionGetOutputsItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    RESULT_FIELD_NUMBER: builtins.int
+    IDX_FIELD_NUMBER: builtins.int
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    GEN_INDEX_FIELD_NUMBER: builtins.int
+    DATA_FORMAT_FIELD_NUMBER: builtins.int
+    @property
+    def result(self) -> global___GenericResult: ...
+    idx: builtins.int
+    input_id: builtins.str
+    gen_index: builtins.int
+    """Deprecated, only used in client version <0.57"""
+    data_format: global___DataFormat.ValueType
+    """for result.data_oneof"""
+    def __init__(
+        self,
+        *,
+        result: global___GenericResult | None = ...,
+        idx: builtins.int = ...,
+        input_id: builtins.str = ...,
+        gen_index: builtins.int = ...,
+        data_format: global___DataFormat.ValueType = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["result", b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data_format", b"data_format", "gen_index", b"gen_index", "idx", b"idx", "input_id", b"input_id", "result", b"result"]) -> None: ...
+
+global___FunctionGetOutputsItem = FunctionGetOutputsItem
+
+class FunctionGetOutputsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    MAX_VALUES_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    LAST_ENTRY_ID_FIELD_NUMBER: builtins.int
+    CLEAR_ON_SUCCESS_FIELD_NUMBER: builtins.int
+    function_call_id: builtins.str
+    max_values: builtins.int
+    timeout: builtins.float
+    last_entry_id: builtins.str
+    clear_on_success: builtins.bool
+    """expires *any* remaining outputs soon after this call, not just the returned ones"""
+    def __init__(
+        self,
+        *,
+        function_call_id: builtins.str = ...,
+        max_values: builtins.int = ...,
+        timeout: builtins.float = ...,
+        last_entry_id: builtins.str = ...,
+        clear_on_success: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["clear_on_success", b"clear_on_success", "function_call_id", b"function_call_id", "last_entry_id", b"last_entry_id", "max_values", b"max_values", "timeout", b"timeout"]) -> None: ...
+
+global___FunctionGetOutputsRequest = FunctionGetOutputsRequest
+
+class FunctionGetOutputsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    IDXS_FIELD_NUMBER: builtins.int
+    OUTPUTS_FIELD_NUMBER: builtins.int
+    LAST_ENTRY_ID_FIELD_NUMBER: builtins.int
+    @property
+    def idxs(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]: ...
+    @property
+    def outputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionGetOutputsItem]: ...
+    last_entry_id: builtins.str
+    def __init__(
+        self,
+        *,
+        idxs: collections.abc.Iterable[builtins.int] | None = ...,
+        outputs: collections.abc.Iterable[global___FunctionGetOutputsItem] | None = ...,
+        last_entry_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["idxs", b"idxs", "last_entry_id", b"last_entry_id", "outputs", b"outputs"]) -> None: ...
+
+global___FunctionGetOutputsResponse = FunctionGetOutputsResponse
+
+class FunctionGetSerializedRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    function_id: builtins.str
+    def __init__(
+        self,
+        *,
+        function_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_id", b"function_id"]) -> None: ...
+
+global___FunctionGetSerializedRequest = FunctionGetSerializedRequest
+
+class FunctionGetSerializedResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_SERIALIZED_FIELD_NUMBER: builtins.int
+    CLASS_SERIALIZED_FIELD_NUMBER: builtins.int
+    function_serialized: builtins.bytes
+    class_serialized: builtins.bytes
+    def __init__(
+        self,
+        *,
+        function_serialized: builtins.bytes = ...,
+        class_serialized: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["class_serialized", b"class_serialized", "function_serialized", b"function_serialized"]) -> None: ...
+
+global___FunctionGetSerializedResponse = FunctionGetSerializedResponse
+
+class FunctionInput(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ARGS_FIELD_NUMBER: builtins.int
+    ARGS_BLOB_ID_FIELD_NUMBER: builtins.int
+    FINAL_INPUT_FIELD_NUMBER: builtins.int
+    DATA_FORMAT_FIELD_NUMBER: builtins.int
+    args: builtins.bytes
+    args_blob_id: builtins.str
+    final_input: builtins.bool
+    data_format: global___DataFormat.ValueType
+    """For args_oneof."""
+    def __init__(
+        self,
+        *,
+        args: builtins.bytes = ...,
+        args_blob_id: builtins.str = ...,
+        final_input: builtins.bool = ...,
+        data_format: global___DataFormat.ValueType = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["args", b"args", "args_blob_id", b"args_blob_id", "args_oneof", b"args_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["args", b"args", "args_blob_id", b"args_blob_id", "args_oneof", b"args_oneof", "data_format", b"data_format", "final_input", b"final_input"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["args_oneof", b"args_oneof"]) -> typing_extensions.Literal["args", "args_blob_id"] | None: ...
+
+global___FunctionInput = FunctionInput
+
+class FunctionMapRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    PARENT_INPUT_ID_FIELD_NUMBER: builtins.int
+    RETURN_EXCEPTIONS_FIELD_NUMBER: builtins.int
+    FUNCTION_CALL_TYPE_FIELD_NUMBER: builtins.int
+    PIPELINED_INPUTS_FIELD_NUMBER: builtins.int
+    function_id: builtins.str
+    parent_input_id: builtins.str
+    return_exceptions: builtins.bool
+    function_call_type: global___FunctionCallType.ValueType
+    @property
+    def pipelined_inputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionPutInputsItem]: ...
+    def __init__(
+        self,
+        *,
+        function_id: builtins.str = ...,
+        parent_input_id: builtins.str = ...,
+        return_exceptions: builtins.bool = ...,
+        function_call_type: global___FunctionCallType.ValueType = ...,
+        pipelined_inputs: collections.abc.Iterable[global___FunctionPutInputsItem] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_type", b"function_call_type", "function_id", b"function_id", "parent_input_id", b"parent_input_id", "pipelined_inputs", b"pipelined_inputs", "return_exceptions", b"return_exceptions"]) -> None: ...
+
+global___FunctionMapRequest = FunctionMapRequest
+
+class FunctionMapResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    PIPELINED_INPUTS_FIELD_NUMBER: builtins.int
+    function_call_id: builtins.str
+    @property
+    def pipelined_inputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionPutInputsResponseItem]: ...
+    def __init__(
+        self,
+        *,
+        function_call_id: builtins.str = ...,
+        pipelined_inputs: collections.abc.Iterable[global___FunctionPutInputsResponseItem] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id", b"function_call_id", "pipelined_inputs", b"pipelined_inputs"]) -> None: ...
+
+global___FunctionMapResponse = FunctionMapResponse
+
+class FunctionPutInputsItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    IDX_FIELD_NUMBER: builtins.int
+    INPUT_FIELD_NUMBER: builtins.int
+    idx: builtins.int
+    @property
+    def input(self) -> global___FunctionInput: ...
+    def __init__(
+        self,
+        *,
+        idx: builtins.int = ...,
+        input: global___FunctionInput | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["input", b"input"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["idx", b"idx", "input", b"input"]) -> None: ...
+
+global___FunctionPutInputsItem = FunctionPutInputsItem
+
+class FunctionPutInputsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    INPUTS_FIELD_NUMBER: builtins.int
+    function_id: builtins.str
+    function_call_id: builtins.str
+    @property
+    def inputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionPutInputsItem]: ...
+    def __init__(
+        self,
+        *,
+        function_id: builtins.str = ...,
+        function_call_id: builtins.str = ...,
+        inputs: collections.abc.Iterable[global___FunctionPutInputsItem] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id", b"function_call_id", "function_id", b"function_id", "inputs", b"inputs"]) -> None: ...
+
+global___FunctionPutInputsRequest = FunctionPutInputsRequest
+
+class FunctionPutInputsResponseItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    IDX_FIELD_NUMBER: builtins.int
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    idx: builtins.int
+    input_id: builtins.str
+    def __init__(
+        self,
+        *,
+        idx: builtins.int = ...,
+        input_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["idx", b"idx", "input_id", b"input_id"]) -> None: ...
+
+global___FunctionPutInputsResponseItem = FunctionPutInputsResponseItem
+
+class FunctionPutInputsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    INPUTS_FIELD_NUMBER: builtins.int
+    @property
+    def inputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionPutInputsResponseItem]: ...
+    def __init__(
+        self,
+        *,
+        inputs: collections.abc.Iterable[global___FunctionPutInputsResponseItem] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["inputs", b"inputs"]) -> None: ...
+
+global___FunctionPutInputsResponse = FunctionPutInputsResponse
+
+class FunctionPutOutputsItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    RESULT_FIELD_NUMBER: builtins.int
+    INPUT_STARTED_AT_FIELD_NUMBER: builtins.int
+    OUTPUT_CREATED_AT_FIELD_NUMBER: builtins.int
+    GEN_INDEX_FIELD_NUMBER: builtins.int
+    DATA_FORMAT_FIELD_NUMBER: builtins.int
+    input_id: builtins.str
+    @property
+    def result(self) -> global___GenericResult: ...
+    input_started_at: builtins.float
+    output_created_at: builtins.float
+    gen_index: builtins.int
+    """Deprecated, only used in client version <0.57"""
+    data_format: global___DataFormat.ValueType
+    """for result.data_oneof"""
+    def __init__(
+        self,
+        *,
+        input_id: builtins.str = ...,
+        result: global___GenericResult | None = ...,
+        input_started_at: builtins.float = ...,
+        output_created_at: builtins.float = ...,
+        gen_index: builtins.int = ...,
+        data_format: global___DataFormat.ValueType = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["result", b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data_format", b"data_format", "gen_index", b"gen_index", "input_id", b"input_id", "input_started_at", b"input_started_at", "output_created_at", b"output_created_at", "result", b"result"]) -> None: ...
+
+global___FunctionPutOutputsItem = FunctionPutOutputsItem
+
+class FunctionPutOutputsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    OUTPUTS_FIELD_NUMBER: builtins.int
+    @property
+    def outputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionPutOutputsItem]: ...
+    def __init__(
+        self,
+        *,
+        outputs: collections.abc.Iterable[global___FunctionPutOutputsItem] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["outputs", b"outputs"]) -> None: ...
+
+global___FunctionPutOutputsRequest = FunctionPutOutputsRequest
+
+class FunctionRetryPolicy(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    BACKOFF_COEFFICIENT_FIELD_NUMBER: builtins.int
+    INITIAL_DELAY_MS_FIELD_NUMBER: builtins.int
+    MAX_DELAY_MS_FIELD_NUMBER: builtins.int
+    RETRIES_FIELD_NUMBER: builtins.int
+    backoff_coefficient: builtins.float
+    initial_delay_ms: builtins.int
+    max_delay_ms: builtins.int
+    retries: builtins.int
+    """NOTE: two-byte field number not used for special reason. copy-paste error. Ref: PR #2542"""
+    def __init__(
+        self,
+        *,
+        backoff_coefficient: builtins.float = ...,
+        initial_delay_ms: builtins.int = ...,
+        max_delay_ms: builtins.int = ...,
+        retries: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["backoff_coefficient", b"backoff_coefficient", "initial_delay_ms", b"initial_delay_ms", "max_delay_ms", b"max_delay_ms", "retries", b"retries"]) -> None: ...
+
+global___FunctionRetryPolicy = FunctionRetryPolicy
+
+class FunctionGetCallGraphRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    function_call_id: builtins.str
+    """TODO: use input_id once we switch client submit API to return those."""
+    def __init__(
+        self,
+        *,
+        function_call_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id", b"function_call_id"]) -> None: ...
+
+global___FunctionGetCallGraphRequest = FunctionGetCallGraphRequest
+
+class InputCallGraphInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    STATUS_FIELD_NUMBER: builtins.int
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    TASK_ID_FIELD_NUMBER: builtins.int
+    input_id: builtins.str
+    status: global___GenericResult.GenericStatus.ValueType
+    function_call_id: builtins.str
+    task_id: builtins.str
+    def __init__(
+        self,
+        *,
+        input_id: builtins.str = ...,
+        status: global___GenericResult.GenericStatus.ValueType = ...,
+        function_call_id: builtins.str = ...,
+        task_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id", b"function_call_id", "input_id", b"input_id", "status", b"status", "task_id", b"task_id"]) -> None: ...
+
+global___InputCallGraphInfo = InputCallGraphInfo
+
+class FunctionCallCallGraphInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    PARENT_INPUT_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_NAME_FIELD_NUMBER: builtins.int
+    MODULE_NAME_FIELD_NUMBER: builtins.int
+    function_call_id: builtins.str
+    parent_input_id: builtins.str
+    function_name: builtins.str
+    module_name: builtins.str
+    def __init__(
+        self,
+        *,
+        function_call_id: builtins.str = ...,
+        parent_input_id: builtins.str = ...,
+        function_name: builtins.str = ...,
+        module_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id", b"function_call_id", "function_name", b"function_name", "module_name", b"module_name", "parent_input_id", b"parent_input_id"]) -> None: ...
+
+global___FunctionCallCallGraphInfo = FunctionCallCallGraphInfo
+
+class FunctionGetCallGraphResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    INPUTS_FIELD_NUMBER: builtins.int
+    FUNCTION_CALLS_FIELD_NUMBER: builtins.int
+    @property
+    def inputs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___InputCallGraphInfo]: ...
+    @property
+    def function_calls(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionCallCallGraphInfo]: ...
+    def __init__(
+        self,
+        *,
+        inputs: collections.abc.Iterable[global___InputCallGraphInfo] | None = ...,
+        function_calls: collections.abc.Iterable[global___FunctionCallCallGraphInfo] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_calls", b"function_calls", "inputs", b"inputs"]) -> None: ...
+
+global___FunctionGetCallGraphResponse = FunctionGetCallGraphResponse
+
+class FunctionCallCancelRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    function_call_id: builtins.str
+    def __init__(
+        self,
+        *,
+        function_call_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_call_id", b"function_call_id"]) -> None: ...
+
+global___FunctionCallCancelRequest = FunctionCallCancelRequest
+
+class FunctionCallListRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    function_id: builtins.str
+    def __init__(
+        self,
+        *,
+        function_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_id", b"function_id"]) -> None: ...
+
+global___FunctionCallListRequest = FunctionCallListRequest
+
+class FunctionCallInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    IDX_FIELD_NUMBER: builtins.int
+    CREATED_AT_FIELD_NUMBER: builtins.int
+    SCHEDULED_AT_FIELD_NUMBER: builtins.int
+    PENDING_INPUTS_FIELD_NUMBER: builtins.int
+    FAILED_INPUTS_FIELD_NUMBER: builtins.int
+    SUCCEEDED_INPUTS_FIELD_NUMBER: builtins.int
+    TIMEOUT_INPUTS_FIELD_NUMBER: builtins.int
+    CANCELLED_INPUTS_FIELD_NUMBER: builtins.int
+    TOTAL_INPUTS_FIELD_NUMBER: builtins.int
+    function_call_id: builtins.str
+    idx: builtins.int
+    created_at: builtins.float
+    """when the call was created"""
+    scheduled_at: builtins.float
+    """if cron job, when run was scheduled"""
+    @property
+    def pending_inputs(self) -> global___InputCategoryInfo: ...
+    @property
+    def failed_inputs(self) -> global___InputCategoryInfo: ...
+    @property
+    def succeeded_inputs(self) -> global___InputCategoryInfo: ...
+    @property
+    def timeout_inputs(self) -> global___InputCategoryInfo: ...
+    @property
+    def cancelled_inputs(self) -> global___InputCategoryInfo: ...
+    total_inputs: builtins.int
+    def __init__(
+        self,
+        *,
+        function_call_id: builtins.str = ...,
+        idx: builtins.int = ...,
+        created_at: builtins.float = ...,
+        scheduled_at: builtins.float = ...,
+        pending_inputs: global___InputCategoryInfo | None = ...,
+        failed_inputs: global___InputCategoryInfo | None = ...,
+        succeeded_inputs: global___InputCategoryInfo | None = ...,
+        timeout_inputs: global___InputCategoryInfo | None = ...,
+        cancelled_inputs: global___InputCategoryInfo | None = ...,
+        total_inputs: builtins.int = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["cancelled_inputs", b"cancelled_inputs", "failed_inputs", b"failed_inputs", "pending_inputs", b"pending_inputs", "succeeded_inputs", b"succeeded_inputs", "timeout_inputs", b"timeout_inputs"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["cancelled_inputs", b"cancelled_inputs", "created_at", b"created_at", "failed_inputs", b"failed_inputs", "function_call_id", b"function_call_id", "idx", b"idx", "pending_inputs", b"pending_inputs", "scheduled_at", b"scheduled_at", "succeeded_inputs", b"succeeded_inputs", "timeout_inputs", b"timeout_inputs", "total_inputs", b"total_inputs"]) -> None: ...
+
+global___FunctionCallInfo = FunctionCallInfo
+
+class FunctionCallListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_CALLS_FIELD_NUMBER: builtins.int
+    @property
+    def function_calls(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___FunctionCallInfo]: ...
+    def __init__(
+        self,
+        *,
+        function_calls: collections.abc.Iterable[global___FunctionCallInfo] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_calls", b"function_calls"]) -> None: ...
+
+global___FunctionCallListResponse = FunctionCallListResponse
+
+class FunctionGetCurrentStatsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    function_id: builtins.str
+    def __init__(
+        self,
+        *,
+        function_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["function_id", b"function_id"]) -> None: ...
+
+global___FunctionGetCurrentStatsRequest = FunctionGetCurrentStatsRequest
+
+class FunctionStats(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    BACKLOG_FIELD_NUMBER: builtins.int
+    NUM_ACTIVE_TASKS_FIELD_NUMBER: builtins.int
+    NUM_TOTAL_TASKS_FIELD_NUMBER: builtins.int
+    backlog: builtins.int
+    num_active_tasks: builtins.int
+    num_total_tasks: builtins.int
+    def __init__(
+        self,
+        *,
+        backlog: builtins.int = ...,
+        num_active_tasks: builtins.int = ...,
+        num_total_tasks: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["backlog", b"backlog", "num_active_tasks", b"num_active_tasks", "num_total_tasks", b"num_total_tasks"]) -> None: ...
+
+global___FunctionStats = FunctionStats
+
+class GeneratorDone(google.protobuf.message.Message):
+    """Sent as the output when a generator finishes running."""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ITEMS_TOTAL_FIELD_NUMBER: builtins.int
+    items_total: builtins.int
+    def __init__(
+        self,
+        *,
+        items_total: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["items_total", b"items_total"]) -> None: ...
+
+global___GeneratorDone = GeneratorDone
+
+class GenericResult(google.protobuf.message.Message):
+    """Used for both tasks and function outputs"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class _GenericStatus:
+        ValueType = typing.NewType("ValueType", builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+
+    class _GenericStatusEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[GenericResult._GenericStatus.ValueType], builtins.type):  # noqa: F821
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        GENERIC_STATUS_UNSPECIFIED: GenericResult._GenericStatus.ValueType  # 0
+        GENERIC_STATUS_SUCCESS: GenericResult._GenericStatus.ValueType  # 1
+        GENERIC_STATUS_FAILURE: GenericResult._GenericStatus.ValueType  # 2
+        GENERIC_STATUS_TERMINATED: GenericResult._GenericStatus.ValueType  # 3
+        """Used when a task was killed using an external signal."""
+        GENERIC_STATUS_TIMEOUT: GenericResult._GenericStatus.ValueType  # 4
+        GENERIC_STATUS_INIT_FAILURE: GenericResult._GenericStatus.ValueType  # 5
+        """Used when the user's function fails to initialize (ex. S3 mount failed due to invalid credentials).
+        Terminates the function and all remaining inputs.
+        """
+
+    class GenericStatus(_GenericStatus, metaclass=_GenericStatusEnumTypeWrapper): ...
+    GENERIC_STATUS_UNSPECIFIED: GenericResult.GenericStatus.ValueType  # 0
+    GENERIC_STATUS_SUCCESS: GenericResult.GenericStatus.ValueType  # 1
+    GENERIC_STATUS_FAILURE: GenericResult.GenericStatus.ValueType  # 2
+    GENERIC_STATUS_TERMINATED: GenericResult.GenericStatus.ValueType  # 3
+    """Used when a task was killed using an external signal."""
+    GENERIC_STATUS_TIMEOUT: GenericResult.GenericStatus.ValueType  # 4
+    GENERIC_STATUS_INIT_FAILURE: GenericResult.GenericStatus.ValueType  # 5
+    """Used when the user's function fails to initialize (ex. S3 mount failed due to invalid credentials).
+    Terminates the function and all remaining inputs.
+    """
+
+    class _GeneratorStatus:
+        ValueType = typing.NewType("ValueType", builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+
+    class _GeneratorStatusEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[GenericResult._GeneratorStatus.ValueType], builtins.type):  # noqa: F821
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        GENERATOR_STATUS_UNSPECIFIED: GenericResult._GeneratorStatus.ValueType  # 0
+        GENERATOR_STATUS_INCOMPLETE: GenericResult._GeneratorStatus.ValueType  # 1
+        GENERATOR_STATUS_COMPLETE: GenericResult._GeneratorStatus.ValueType  # 2
+
+    class GeneratorStatus(_GeneratorStatus, metaclass=_GeneratorStatusEnumTypeWrapper): ...
+    GENERATOR_STATUS_UNSPECIFIED: GenericResult.GeneratorStatus.ValueType  # 0
+    GENERATOR_STATUS_INCOMPLETE: GenericResult.GeneratorStatus.ValueType  # 1
+    GENERATOR_STATUS_COMPLETE: GenericResult.GeneratorStatus.ValueType  # 2
+
+    STATUS_FIELD_NUMBER: builtins.int
+    EXCEPTION_FIELD_NUMBER: builtins.int
+    EXITCODE_FIELD_NUMBER: builtins.int
+    TRACEBACK_FIELD_NUMBER: builtins.int
+    SERIALIZED_TB_FIELD_NUMBER: builtins.int
+    TB_LINE_CACHE_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    DATA_BLOB_ID_FIELD_NUMBER: builtins.int
+    GEN_STATUS_FIELD_NUMBER: builtins.int
+    PROPAGATION_REASON_FIELD_NUMBER: builtins.int
+    status: global___GenericResult.GenericStatus.ValueType
+    """Status of the task or function output."""
+    exception: builtins.str
+    """Exception message for failures, if available."""
+    exitcode: builtins.int
+    """Status code of the container entrypoint or builder process if it terminates unexpectedly."""
+    traceback: builtins.str
+    """String value of the Python traceback."""
+    serialized_tb: builtins.bytes
+    """Pickled traceback object."""
+    tb_line_cache: builtins.bytes
+    """Pickled line cache for traceback object."""
+    data: builtins.bytes
+    """Inline data of the result."""
+    data_blob_id: builtins.str
+    """Blob ID for large data."""
+    gen_status: global___GenericResult.GeneratorStatus.ValueType
+    """Deprecated, only used in client version <0.57"""
+    propagation_reason: builtins.str
+    """(?)"""
+    def __init__(
+        self,
+        *,
+        status: global___GenericResult.GenericStatus.ValueType = ...,
+        exception: builtins.str = ...,
+        exitcode: builtins.int = ...,
+        traceback: builtins.str = ...,
+        serialized_tb: builtins.bytes = ...,
+        tb_line_cache: builtins.bytes = ...,
+        data: builtins.bytes = ...,
+        data_blob_id: builtins.str = ...,
+        gen_status: global___GenericResult.GeneratorStatus.ValueType = ...,
+        propagation_reason: builtins.str = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_oneof", b"data_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_oneof", b"data_oneof", "exception", b"exception", "exitcode", b"exitcode", "gen_status", b"gen_status", "propagation_reason", b"propagation_reason", "serialized_tb", b"serialized_tb", "status", b"status", "tb_line_cache", b"tb_line_cache", "traceback", b"traceback"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["data_oneof", b"data_oneof"]) -> typing_extensions.Literal["data", "data_blob_id"] | None: ...
+
+global___GenericResult = GenericResult
+
+class GPUConfig(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TYPE_FIELD_NUMBER: builtins.int
+    COUNT_FIELD_NUMBER: builtins.int
+    MEMORY_FIELD_NUMBER: builtins.int
+    type: global___GPUType.ValueType
+    count: builtins.int
+    memory: builtins.int
+    def __init__(
+        self,
+        *,
+        type: global___GPUType.ValueType = ...,
+        count: builtins.int = ...,
+        memory: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["count", b"count", "memory", b"memory", "type", b"type"]) -> None: ...
+
+global___GPUConfig = GPUConfig
+
+class BuildFunction(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DEFINITION_FIELD_NUMBER: builtins.int
+    GLOBALS_FIELD_NUMBER: builtins.int
+    INPUT_FIELD_NUMBER: builtins.int
+    definition: builtins.str
+    globals: builtins.bytes
+    @property
+    def input(self) -> global___FunctionInput: ...
+    def __init__(
+        self,
+        *,
+        definition: builtins.str = ...,
+        globals: builtins.bytes = ...,
+        input: global___FunctionInput | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["input", b"input"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["definition", b"definition", "globals", b"globals", "input", b"input"]) -> None: ...
+
+global___BuildFunction = BuildFunction
+
+class Image(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    BASE_IMAGES_FIELD_NUMBER: builtins.int
+    DOCKERFILE_COMMANDS_FIELD_NUMBER: builtins.int
+    CONTEXT_FILES_FIELD_NUMBER: builtins.int
+    VERSION_FIELD_NUMBER: builtins.int
+    SECRET_IDS_FIELD_NUMBER: builtins.int
+    GPU_FIELD_NUMBER: builtins.int
+    CONTEXT_MOUNT_ID_FIELD_NUMBER: builtins.int
+    GPU_CONFIG_FIELD_NUMBER: builtins.int
+    IMAGE_REGISTRY_CONFIG_FIELD_NUMBER: builtins.int
+    BUILD_FUNCTION_DEF_FIELD_NUMBER: builtins.int
+    BUILD_FUNCTION_GLOBALS_FIELD_NUMBER: builtins.int
+    RUNTIME_FIELD_NUMBER: builtins.int
+    RUNTIME_DEBUG_FIELD_NUMBER: builtins.int
+    BUILD_FUNCTION_FIELD_NUMBER: builtins.int
+    @property
+    def base_images(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___BaseImage]: ...
+    @property
+    def dockerfile_commands(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    @property
+    def context_files(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___ImageContextFile]: ...
+    version: builtins.str
+    @property
+    def secret_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    gpu: builtins.bool
+    """Part of Image definition, because presence of GPU drivers
+    affects the image that's built.
+    Note: field 13 is getting replaced field 16. The client now sends both fields,
+    but the server still only reads field 13.
+    """
+    context_mount_id: builtins.str
+    @property
+    def gpu_config(self) -> global___GPUConfig: ...
+    @property
+    def image_registry_config(self) -> global___ImageRegistryConfig: ...
+    build_function_def: builtins.str
+    """deprecated after 0.58.96"""
+    build_function_globals: builtins.bytes
+    """deprecated after 0.58.96"""
+    runtime: builtins.str
+    """If set, overrides the runtime used by the function. Specify either "runc" or "gvisor"."""
+    runtime_debug: builtins.bool
+    """Not included in image definition checksum as debug features do not affect built image."""
+    @property
+    def build_function(self) -> global___BuildFunction: ...
+    def __init__(
+        self,
+        *,
+        base_images: collections.abc.Iterable[global___BaseImage] | None = ...,
+        dockerfile_commands: collections.abc.Iterable[builtins.str] | None = ...,
+        context_files: collections.abc.Iterable[global___ImageContextFile] | None = ...,
+        version: builtins.str = ...,
+        secret_ids: collections.abc.Iterable[builtins.str] | None = ...,
+        gpu: builtins.bool = ...,
+        context_mount_id: builtins.str = ...,
+        gpu_config: global___GPUConfig | None = ...,
+        image_registry_config: global___ImageRegistryConfig | None = ...,
+        build_function_def: builtins.str = ...,
+        build_function_globals: builtins.bytes = ...,
+        runtime: builtins.str = ...,
+        runtime_debug: builtins.bool = ...,
+        build_function: global___BuildFunction | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["build_function", b"build_function", "gpu_config", b"gpu_config", "image_registry_config", b"image_registry_config"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["base_images", b"base_images", "build_function", b"build_function", "build_function_def", b"build_function_def", "build_function_globals", b"build_function_globals", "context_files", b"context_files", "context_mount_id", b"context_mount_id", "dockerfile_commands", b"dockerfile_commands", "gpu", b"gpu", "gpu_config", b"gpu_config", "image_registry_config", b"image_registry_config", "runtime", b"runtime", "runtime_debug", b"runtime_debug", "secret_ids", b"secret_ids", "version", b"version"]) -> None: ...
+
+global___Image = Image
+
+class ImageContextFile(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FILENAME_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    filename: builtins.str
+    data: builtins.bytes
+    def __init__(
+        self,
+        *,
+        filename: builtins.str = ...,
+        data: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data", b"data", "filename", b"filename"]) -> None: ...
+
+global___ImageContextFile = ImageContextFile
+
+class ImageGetOrCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    IMAGE_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    EXISTING_IMAGE_ID_FIELD_NUMBER: builtins.int
+    BUILD_FUNCTION_ID_FIELD_NUMBER: builtins.int
+    FORCE_BUILD_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    BUILDER_VERSION_FIELD_NUMBER: builtins.int
+    @property
+    def image(self) -> global___Image: ...
+    app_id: builtins.str
+    existing_image_id: builtins.str
+    """ignored"""
+    build_function_id: builtins.str
+    force_build: builtins.bool
+    namespace: global___DeploymentNamespace.ValueType
+    builder_version: builtins.str
+    def __init__(
+        self,
+        *,
+        image: global___Image | None = ...,
+        app_id: builtins.str = ...,
+        existing_image_id: builtins.str = ...,
+        build_function_id: builtins.str = ...,
+        force_build: builtins.bool = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        builder_version: builtins.str = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["image", b"image"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "build_function_id", b"build_function_id", "builder_version", b"builder_version", "existing_image_id", b"existing_image_id", "force_build", b"force_build", "image", b"image", "namespace", b"namespace"]) -> None: ...
+
+global___ImageGetOrCreateRequest = ImageGetOrCreateRequest
+
+class ImageGetOrCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    IMAGE_ID_FIELD_NUMBER: builtins.int
+    image_id: builtins.str
+    def __init__(
+        self,
+        *,
+        image_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["image_id", b"image_id"]) -> None: ...
+
+global___ImageGetOrCreateResponse = ImageGetOrCreateResponse
+
+class ImageJoinStreamingRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    IMAGE_ID_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    LAST_ENTRY_ID_FIELD_NUMBER: builtins.int
+    image_id: builtins.str
+    timeout: builtins.float
+    last_entry_id: builtins.str
+    def __init__(
+        self,
+        *,
+        image_id: builtins.str = ...,
+        timeout: builtins.float = ...,
+        last_entry_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["image_id", b"image_id", "last_entry_id", b"last_entry_id", "timeout", b"timeout"]) -> None: ...
+
+global___ImageJoinStreamingRequest = ImageJoinStreamingRequest
+
+class ImageJoinStreamingResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    RESULT_FIELD_NUMBER: builtins.int
+    TASK_LOGS_FIELD_NUMBER: builtins.int
+    ENTRY_ID_FIELD_NUMBER: builtins.int
+    EOF_FIELD_NUMBER: builtins.int
+    @property
+    def result(self) -> global___GenericResult: ...
+    @property
+    def task_logs(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___TaskLogs]: ...
+    entry_id: builtins.str
+    eof: builtins.bool
+    def __init__(
+        self,
+        *,
+        result: global___GenericResult | None = ...,
+        task_logs: collections.abc.Iterable[global___TaskLogs] | None = ...,
+        entry_id: builtins.str = ...,
+        eof: builtins.bool = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["result", b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["entry_id", b"entry_id", "eof", b"eof", "result", b"result", "task_logs", b"task_logs"]) -> None: ...
+
+global___ImageJoinStreamingResponse = ImageJoinStreamingResponse
+
+class ImageRegistryConfig(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    REGISTRY_AUTH_TYPE_FIELD_NUMBER: builtins.int
+    SECRET_ID_FIELD_NUMBER: builtins.int
+    registry_auth_type: global___RegistryAuthType.ValueType
+    secret_id: builtins.str
+    def __init__(
+        self,
+        *,
+        registry_auth_type: global___RegistryAuthType.ValueType = ...,
+        secret_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["registry_auth_type", b"registry_auth_type", "secret_id", b"secret_id"]) -> None: ...
+
+global___ImageRegistryConfig = ImageRegistryConfig
+
+class InputInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    IDX_FIELD_NUMBER: builtins.int
+    TASK_ID_FIELD_NUMBER: builtins.int
+    STARTED_AT_FIELD_NUMBER: builtins.int
+    FINISHED_AT_FIELD_NUMBER: builtins.int
+    TASK_STARTUP_TIME_FIELD_NUMBER: builtins.int
+    TASK_FIRST_INPUT_FIELD_NUMBER: builtins.int
+    input_id: builtins.str
+    idx: builtins.int
+    task_id: builtins.str
+    started_at: builtins.float
+    finished_at: builtins.float
+    task_startup_time: builtins.float
+    task_first_input: builtins.bool
+    def __init__(
+        self,
+        *,
+        input_id: builtins.str = ...,
+        idx: builtins.int = ...,
+        task_id: builtins.str = ...,
+        started_at: builtins.float = ...,
+        finished_at: builtins.float = ...,
+        task_startup_time: builtins.float = ...,
+        task_first_input: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["finished_at", b"finished_at", "idx", b"idx", "input_id", b"input_id", "started_at", b"started_at", "task_first_input", b"task_first_input", "task_id", b"task_id", "task_startup_time", b"task_startup_time"]) -> None: ...
+
+global___InputInfo = InputInfo
+
+class InputCategoryInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TOTAL_FIELD_NUMBER: builtins.int
+    LATEST_FIELD_NUMBER: builtins.int
+    total: builtins.int
+    @property
+    def latest(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___InputInfo]: ...
+    def __init__(
+        self,
+        *,
+        total: builtins.int = ...,
+        latest: collections.abc.Iterable[global___InputInfo] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["latest", b"latest", "total", b"total"]) -> None: ...
+
+global___InputCategoryInfo = InputCategoryInfo
+
+class MountBuildRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    EXISTING_MOUNT_ID_FIELD_NUMBER: builtins.int
+    FILES_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    existing_mount_id: builtins.str
+    @property
+    def files(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___MountFile]: ...
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        existing_mount_id: builtins.str = ...,
+        files: collections.abc.Iterable[global___MountFile] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "existing_mount_id", b"existing_mount_id", "files", b"files"]) -> None: ...
+
+global___MountBuildRequest = MountBuildRequest
+
+class MountBuildResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    MOUNT_ID_FIELD_NUMBER: builtins.int
+    HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    mount_id: builtins.str
+    @property
+    def handle_metadata(self) -> global___MountHandleMetadata: ...
+    def __init__(
+        self,
+        *,
+        mount_id: builtins.str = ...,
+        handle_metadata: global___MountHandleMetadata | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["handle_metadata", b"handle_metadata"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["handle_metadata", b"handle_metadata", "mount_id", b"mount_id"]) -> None: ...
+
+global___MountBuildResponse = MountBuildResponse
+
+class MountGetOrCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DEPLOYMENT_NAME_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_CREATION_TYPE_FIELD_NUMBER: builtins.int
+    FILES_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    deployment_name: builtins.str
+    namespace: global___DeploymentNamespace.ValueType
+    environment_name: builtins.str
+    object_creation_type: global___ObjectCreationType.ValueType
+    @property
+    def files(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___MountFile]: ...
+    app_id: builtins.str
+    """only used with OBJECT_CREATION_TYPE_ANONYMOUS_OWNED_BY_APP"""
+    def __init__(
+        self,
+        *,
+        deployment_name: builtins.str = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        environment_name: builtins.str = ...,
+        object_creation_type: global___ObjectCreationType.ValueType = ...,
+        files: collections.abc.Iterable[global___MountFile] | None = ...,
+        app_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "deployment_name", b"deployment_name", "environment_name", b"environment_name", "files", b"files", "namespace", b"namespace", "object_creation_type", b"object_creation_type"]) -> None: ...
+
+global___MountGetOrCreateRequest = MountGetOrCreateRequest
+
+class MountGetOrCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    MOUNT_ID_FIELD_NUMBER: builtins.int
+    HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    mount_id: builtins.str
+    @property
+    def handle_metadata(self) -> global___MountHandleMetadata: ...
+    def __init__(
+        self,
+        *,
+        mount_id: builtins.str = ...,
+        handle_metadata: global___MountHandleMetadata | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["handle_metadata", b"handle_metadata"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["handle_metadata", b"handle_metadata", "mount_id", b"mount_id"]) -> None: ...
+
+global___MountGetOrCreateResponse = MountGetOrCreateResponse
+
+class MountHandleMetadata(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    CONTENT_CHECKSUM_SHA256_HEX_FIELD_NUMBER: builtins.int
+    content_checksum_sha256_hex: builtins.str
+    def __init__(
+        self,
+        *,
+        content_checksum_sha256_hex: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["content_checksum_sha256_hex", b"content_checksum_sha256_hex"]) -> None: ...
+
+global___MountHandleMetadata = MountHandleMetadata
+
+class MountFile(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FILENAME_FIELD_NUMBER: builtins.int
+    SHA256_HEX_FIELD_NUMBER: builtins.int
+    SIZE_FIELD_NUMBER: builtins.int
+    MODE_FIELD_NUMBER: builtins.int
+    filename: builtins.str
+    sha256_hex: builtins.str
+    """SHA-256 checksum of the file."""
+    size: builtins.int
+    """Size of the file in bytes — ignored in MountBuild()."""
+    mode: builtins.int
+    """Unix file permission bits `st_mode`."""
+    def __init__(
+        self,
+        *,
+        filename: builtins.str = ...,
+        sha256_hex: builtins.str = ...,
+        size: builtins.int | None = ...,
+        mode: builtins.int | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_mode", b"_mode", "_size", b"_size", "mode", b"mode", "size", b"size"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_mode", b"_mode", "_size", b"_size", "filename", b"filename", "mode", b"mode", "sha256_hex", b"sha256_hex", "size", b"size"]) -> None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_mode", b"_mode"]) -> typing_extensions.Literal["mode"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_size", b"_size"]) -> typing_extensions.Literal["size"] | None: ...
+
+global___MountFile = MountFile
+
+class MountPutFileRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SHA256_HEX_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    DATA_BLOB_ID_FIELD_NUMBER: builtins.int
+    sha256_hex: builtins.str
+    data: builtins.bytes
+    data_blob_id: builtins.str
+    def __init__(
+        self,
+        *,
+        sha256_hex: builtins.str = ...,
+        data: builtins.bytes = ...,
+        data_blob_id: builtins.str = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_oneof", b"data_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_oneof", b"data_oneof", "sha256_hex", b"sha256_hex"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["data_oneof", b"data_oneof"]) -> typing_extensions.Literal["data", "data_blob_id"] | None: ...
+
+global___MountPutFileRequest = MountPutFileRequest
+
+class MountPutFileResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    EXISTS_FIELD_NUMBER: builtins.int
+    exists: builtins.bool
+    def __init__(
+        self,
+        *,
+        exists: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["exists", b"exists"]) -> None: ...
+
+global___MountPutFileResponse = MountPutFileResponse
+
+class MultiPartUpload(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PART_LENGTH_FIELD_NUMBER: builtins.int
+    UPLOAD_URLS_FIELD_NUMBER: builtins.int
+    COMPLETION_URL_FIELD_NUMBER: builtins.int
+    part_length: builtins.int
+    """split upload based on this part length - all except the last part must have this length"""
+    @property
+    def upload_urls(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    completion_url: builtins.str
+    def __init__(
+        self,
+        *,
+        part_length: builtins.int = ...,
+        upload_urls: collections.abc.Iterable[builtins.str] | None = ...,
+        completion_url: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["completion_url", b"completion_url", "part_length", b"part_length", "upload_urls", b"upload_urls"]) -> None: ...
+
+global___MultiPartUpload = MultiPartUpload
+
+class Object(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    OBJECT_ID_FIELD_NUMBER: builtins.int
+    FUNCTION_HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    MOUNT_HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    CLASS_HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    SANDBOX_HANDLE_METADATA_FIELD_NUMBER: builtins.int
+    object_id: builtins.str
+    @property
+    def function_handle_metadata(self) -> global___FunctionHandleMetadata: ...
+    @property
+    def mount_handle_metadata(self) -> global___MountHandleMetadata: ...
+    @property
+    def class_handle_metadata(self) -> global___ClassHandleMetadata: ...
+    @property
+    def sandbox_handle_metadata(self) -> global___SandboxHandleMetadata: ...
+    def __init__(
+        self,
+        *,
+        object_id: builtins.str = ...,
+        function_handle_metadata: global___FunctionHandleMetadata | None = ...,
+        mount_handle_metadata: global___MountHandleMetadata | None = ...,
+        class_handle_metadata: global___ClassHandleMetadata | None = ...,
+        sandbox_handle_metadata: global___SandboxHandleMetadata | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["class_handle_metadata", b"class_handle_metadata", "function_handle_metadata", b"function_handle_metadata", "handle_metadata_oneof", b"handle_metadata_oneof", "mount_handle_metadata", b"mount_handle_metadata", "sandbox_handle_metadata", b"sandbox_handle_metadata"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["class_handle_metadata", b"class_handle_metadata", "function_handle_metadata", b"function_handle_metadata", "handle_metadata_oneof", b"handle_metadata_oneof", "mount_handle_metadata", b"mount_handle_metadata", "object_id", b"object_id", "sandbox_handle_metadata", b"sandbox_handle_metadata"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["handle_metadata_oneof", b"handle_metadata_oneof"]) -> typing_extensions.Literal["function_handle_metadata", "mount_handle_metadata", "class_handle_metadata", "sandbox_handle_metadata"] | None: ...
+
+global___Object = Object
+
+class ObjectDependency(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    OBJECT_ID_FIELD_NUMBER: builtins.int
+    object_id: builtins.str
+    def __init__(
+        self,
+        *,
+        object_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["object_id", b"object_id"]) -> None: ...
+
+global___ObjectDependency = ObjectDependency
+
+class ProxyGetOrCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DEPLOYMENT_NAME_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_CREATION_TYPE_FIELD_NUMBER: builtins.int
+    deployment_name: builtins.str
+    namespace: global___DeploymentNamespace.ValueType
+    environment_name: builtins.str
+    object_creation_type: global___ObjectCreationType.ValueType
+    """must be UNSPECIFIED"""
+    def __init__(
+        self,
+        *,
+        deployment_name: builtins.str = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        environment_name: builtins.str = ...,
+        object_creation_type: global___ObjectCreationType.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["deployment_name", b"deployment_name", "environment_name", b"environment_name", "namespace", b"namespace", "object_creation_type", b"object_creation_type"]) -> None: ...
+
+global___ProxyGetOrCreateRequest = ProxyGetOrCreateRequest
+
+class ProxyGetOrCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PROXY_ID_FIELD_NUMBER: builtins.int
+    proxy_id: builtins.str
+    def __init__(
+        self,
+        *,
+        proxy_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["proxy_id", b"proxy_id"]) -> None: ...
+
+global___ProxyGetOrCreateResponse = ProxyGetOrCreateResponse
+
+class ProxyInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ELASTIC_IP_FIELD_NUMBER: builtins.int
+    PROXY_KEY_FIELD_NUMBER: builtins.int
+    REMOTE_ADDR_FIELD_NUMBER: builtins.int
+    REMOTE_PORT_FIELD_NUMBER: builtins.int
+    elastic_ip: builtins.str
+    proxy_key: builtins.str
+    remote_addr: builtins.str
+    remote_port: builtins.int
+    def __init__(
+        self,
+        *,
+        elastic_ip: builtins.str = ...,
+        proxy_key: builtins.str = ...,
+        remote_addr: builtins.str = ...,
+        remote_port: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["elastic_ip", b"elastic_ip", "proxy_key", b"proxy_key", "remote_addr", b"remote_addr", "remote_port", b"remote_port"]) -> None: ...
+
+global___ProxyInfo = ProxyInfo
+
+class PTYInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class _PTYType:
+        ValueType = typing.NewType("ValueType", builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+
+    class _PTYTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[PTYInfo._PTYType.ValueType], builtins.type):  # noqa: F821
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        PTY_TYPE_UNSPECIFIED: PTYInfo._PTYType.ValueType  # 0
+        """Nothing"""
+        PTY_TYPE_FUNCTION: PTYInfo._PTYType.ValueType  # 1
+        """Run function in PTY"""
+        PTY_TYPE_SHELL: PTYInfo._PTYType.ValueType  # 2
+        """Replace function with shell"""
+
+    class PTYType(_PTYType, metaclass=_PTYTypeEnumTypeWrapper): ...
+    PTY_TYPE_UNSPECIFIED: PTYInfo.PTYType.ValueType  # 0
+    """Nothing"""
+    PTY_TYPE_FUNCTION: PTYInfo.PTYType.ValueType  # 1
+    """Run function in PTY"""
+    PTY_TYPE_SHELL: PTYInfo.PTYType.ValueType  # 2
+    """Replace function with shell"""
+
+    ENABLED_FIELD_NUMBER: builtins.int
+    WINSZ_ROWS_FIELD_NUMBER: builtins.int
+    WINSZ_COLS_FIELD_NUMBER: builtins.int
+    ENV_TERM_FIELD_NUMBER: builtins.int
+    ENV_COLORTERM_FIELD_NUMBER: builtins.int
+    ENV_TERM_PROGRAM_FIELD_NUMBER: builtins.int
+    PTY_TYPE_FIELD_NUMBER: builtins.int
+    enabled: builtins.bool
+    """Soon deprecated"""
+    winsz_rows: builtins.int
+    winsz_cols: builtins.int
+    env_term: builtins.str
+    env_colorterm: builtins.str
+    env_term_program: builtins.str
+    pty_type: global___PTYInfo.PTYType.ValueType
+    def __init__(
+        self,
+        *,
+        enabled: builtins.bool = ...,
+        winsz_rows: builtins.int = ...,
+        winsz_cols: builtins.int = ...,
+        env_term: builtins.str = ...,
+        env_colorterm: builtins.str = ...,
+        env_term_program: builtins.str = ...,
+        pty_type: global___PTYInfo.PTYType.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["enabled", b"enabled", "env_colorterm", b"env_colorterm", "env_term", b"env_term", "env_term_program", b"env_term_program", "pty_type", b"pty_type", "winsz_cols", b"winsz_cols", "winsz_rows", b"winsz_rows"]) -> None: ...
+
+global___PTYInfo = PTYInfo
+
+class QueueCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    EXISTING_QUEUE_ID_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    existing_queue_id: builtins.str
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        existing_queue_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "existing_queue_id", b"existing_queue_id"]) -> None: ...
+
+global___QueueCreateRequest = QueueCreateRequest
+
+class QueueCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    QUEUE_ID_FIELD_NUMBER: builtins.int
+    queue_id: builtins.str
+    def __init__(
+        self,
+        *,
+        queue_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["queue_id", b"queue_id"]) -> None: ...
+
+global___QueueCreateResponse = QueueCreateResponse
+
+class QueueGetOrCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DEPLOYMENT_NAME_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_CREATION_TYPE_FIELD_NUMBER: builtins.int
+    deployment_name: builtins.str
+    namespace: global___DeploymentNamespace.ValueType
+    environment_name: builtins.str
+    object_creation_type: global___ObjectCreationType.ValueType
+    def __init__(
+        self,
+        *,
+        deployment_name: builtins.str = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        environment_name: builtins.str = ...,
+        object_creation_type: global___ObjectCreationType.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["deployment_name", b"deployment_name", "environment_name", b"environment_name", "namespace", b"namespace", "object_creation_type", b"object_creation_type"]) -> None: ...
+
+global___QueueGetOrCreateRequest = QueueGetOrCreateRequest
+
+class QueueGetOrCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    QUEUE_ID_FIELD_NUMBER: builtins.int
+    queue_id: builtins.str
+    def __init__(
+        self,
+        *,
+        queue_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["queue_id", b"queue_id"]) -> None: ...
+
+global___QueueGetOrCreateResponse = QueueGetOrCreateResponse
+
+class QueueGetRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    QUEUE_ID_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    N_VALUES_FIELD_NUMBER: builtins.int
+    PARTITION_KEY_FIELD_NUMBER: builtins.int
+    queue_id: builtins.str
+    timeout: builtins.float
+    n_values: builtins.int
+    partition_key: builtins.bytes
+    def __init__(
+        self,
+        *,
+        queue_id: builtins.str = ...,
+        timeout: builtins.float = ...,
+        n_values: builtins.int = ...,
+        partition_key: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["n_values", b"n_values", "partition_key", b"partition_key", "queue_id", b"queue_id", "timeout", b"timeout"]) -> None: ...
+
+global___QueueGetRequest = QueueGetRequest
+
+class QueueGetResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VALUES_FIELD_NUMBER: builtins.int
+    @property
+    def values(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.bytes]: ...
+    def __init__(
+        self,
+        *,
+        values: collections.abc.Iterable[builtins.bytes] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["values", b"values"]) -> None: ...
+
+global___QueueGetResponse = QueueGetResponse
+
+class QueueHeartbeatRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    QUEUE_ID_FIELD_NUMBER: builtins.int
+    queue_id: builtins.str
+    def __init__(
+        self,
+        *,
+        queue_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["queue_id", b"queue_id"]) -> None: ...
+
+global___QueueHeartbeatRequest = QueueHeartbeatRequest
+
+class QueuePutRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    QUEUE_ID_FIELD_NUMBER: builtins.int
+    VALUES_FIELD_NUMBER: builtins.int
+    PARTITION_KEY_FIELD_NUMBER: builtins.int
+    PARTITION_TTL_SECONDS_FIELD_NUMBER: builtins.int
+    queue_id: builtins.str
+    @property
+    def values(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.bytes]: ...
+    partition_key: builtins.bytes
+    partition_ttl_seconds: builtins.int
+    def __init__(
+        self,
+        *,
+        queue_id: builtins.str = ...,
+        values: collections.abc.Iterable[builtins.bytes] | None = ...,
+        partition_key: builtins.bytes = ...,
+        partition_ttl_seconds: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["partition_key", b"partition_key", "partition_ttl_seconds", b"partition_ttl_seconds", "queue_id", b"queue_id", "values", b"values"]) -> None: ...
+
+global___QueuePutRequest = QueuePutRequest
+
+class QueueLenRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    QUEUE_ID_FIELD_NUMBER: builtins.int
+    PARTITION_KEY_FIELD_NUMBER: builtins.int
+    queue_id: builtins.str
+    partition_key: builtins.bytes
+    def __init__(
+        self,
+        *,
+        queue_id: builtins.str = ...,
+        partition_key: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["partition_key", b"partition_key", "queue_id", b"queue_id"]) -> None: ...
+
+global___QueueLenRequest = QueueLenRequest
+
+class QueueLenResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    LEN_FIELD_NUMBER: builtins.int
+    len: builtins.int
+    def __init__(
+        self,
+        *,
+        len: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["len", b"len"]) -> None: ...
+
+global___QueueLenResponse = QueueLenResponse
+
+class QueueNextItemsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    QUEUE_ID_FIELD_NUMBER: builtins.int
+    PARTITION_KEY_FIELD_NUMBER: builtins.int
+    LAST_ENTRY_ID_FIELD_NUMBER: builtins.int
+    ITEM_POLL_TIMEOUT_FIELD_NUMBER: builtins.int
+    queue_id: builtins.str
+    partition_key: builtins.bytes
+    last_entry_id: builtins.str
+    item_poll_timeout: builtins.float
+    """seconds"""
+    def __init__(
+        self,
+        *,
+        queue_id: builtins.str = ...,
+        partition_key: builtins.bytes = ...,
+        last_entry_id: builtins.str = ...,
+        item_poll_timeout: builtins.float = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["item_poll_timeout", b"item_poll_timeout", "last_entry_id", b"last_entry_id", "partition_key", b"partition_key", "queue_id", b"queue_id"]) -> None: ...
+
+global___QueueNextItemsRequest = QueueNextItemsRequest
+
+class QueueItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VALUE_FIELD_NUMBER: builtins.int
+    ENTRY_ID_FIELD_NUMBER: builtins.int
+    value: builtins.bytes
+    entry_id: builtins.str
+    def __init__(
+        self,
+        *,
+        value: builtins.bytes = ...,
+        entry_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["entry_id", b"entry_id", "value", b"value"]) -> None: ...
+
+global___QueueItem = QueueItem
+
+class QueueNextItemsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ITEMS_FIELD_NUMBER: builtins.int
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___QueueItem]: ...
+    def __init__(
+        self,
+        *,
+        items: collections.abc.Iterable[global___QueueItem] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["items", b"items"]) -> None: ...
+
+global___QueueNextItemsResponse = QueueNextItemsResponse
+
+class RateLimit(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    LIMIT_FIELD_NUMBER: builtins.int
+    INTERVAL_FIELD_NUMBER: builtins.int
+    limit: builtins.int
+    interval: global___RateLimitInterval.ValueType
+    def __init__(
+        self,
+        *,
+        limit: builtins.int = ...,
+        interval: global___RateLimitInterval.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["interval", b"interval", "limit", b"limit"]) -> None: ...
+
+global___RateLimit = RateLimit
+
+class Resources(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    MEMORY_MB_FIELD_NUMBER: builtins.int
+    MILLI_CPU_FIELD_NUMBER: builtins.int
+    GPU_CONFIG_FIELD_NUMBER: builtins.int
+    MEMORY_MB_MAX_FIELD_NUMBER: builtins.int
+    memory_mb: builtins.int
+    """MiB"""
+    milli_cpu: builtins.int
+    """milli CPU cores"""
+    @property
+    def gpu_config(self) -> global___GPUConfig: ...
+    memory_mb_max: builtins.int
+    """MiB"""
+    def __init__(
+        self,
+        *,
+        memory_mb: builtins.int = ...,
+        milli_cpu: builtins.int = ...,
+        gpu_config: global___GPUConfig | None = ...,
+        memory_mb_max: builtins.int = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["gpu_config", b"gpu_config"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["gpu_config", b"gpu_config", "memory_mb", b"memory_mb", "memory_mb_max", b"memory_mb_max", "milli_cpu", b"milli_cpu"]) -> None: ...
+
+global___Resources = Resources
+
+class S3Mount(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    BUCKET_NAME_FIELD_NUMBER: builtins.int
+    MOUNT_PATH_FIELD_NUMBER: builtins.int
+    CREDENTIALS_SECRET_ID_FIELD_NUMBER: builtins.int
+    READ_ONLY_FIELD_NUMBER: builtins.int
+    bucket_name: builtins.str
+    mount_path: builtins.str
+    credentials_secret_id: builtins.str
+    read_only: builtins.bool
+    def __init__(
+        self,
+        *,
+        bucket_name: builtins.str = ...,
+        mount_path: builtins.str = ...,
+        credentials_secret_id: builtins.str = ...,
+        read_only: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["bucket_name", b"bucket_name", "credentials_secret_id", b"credentials_secret_id", "mount_path", b"mount_path", "read_only", b"read_only"]) -> None: ...
+
+global___S3Mount = S3Mount
+
+class Sandbox(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ENTRYPOINT_ARGS_FIELD_NUMBER: builtins.int
+    MOUNT_IDS_FIELD_NUMBER: builtins.int
+    IMAGE_ID_FIELD_NUMBER: builtins.int
+    SECRET_IDS_FIELD_NUMBER: builtins.int
+    RESOURCES_FIELD_NUMBER: builtins.int
+    CLOUD_PROVIDER_FIELD_NUMBER: builtins.int
+    TIMEOUT_SECS_FIELD_NUMBER: builtins.int
+    WORKDIR_FIELD_NUMBER: builtins.int
+    NFS_MOUNTS_FIELD_NUMBER: builtins.int
+    RUNTIME_DEBUG_FIELD_NUMBER: builtins.int
+    BLOCK_NETWORK_FIELD_NUMBER: builtins.int
+    S3_MOUNTS_FIELD_NUMBER: builtins.int
+    CLOUD_BUCKET_MOUNTS_FIELD_NUMBER: builtins.int
+    VOLUME_MOUNTS_FIELD_NUMBER: builtins.int
+    PTY_INFO_FIELD_NUMBER: builtins.int
+    @property
+    def entrypoint_args(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    @property
+    def mount_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    image_id: builtins.str
+    @property
+    def secret_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    @property
+    def resources(self) -> global___Resources: ...
+    cloud_provider: global___CloudProvider.ValueType
+    timeout_secs: builtins.int
+    workdir: builtins.str
+    @property
+    def nfs_mounts(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SharedVolumeMount]: ...
+    runtime_debug: builtins.bool
+    """For internal debugging use only."""
+    block_network: builtins.bool
+    @property
+    def s3_mounts(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___S3Mount]: ...
+    @property
+    def cloud_bucket_mounts(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___CloudBucketMount]: ...
+    @property
+    def volume_mounts(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___VolumeMount]: ...
+    @property
+    def pty_info(self) -> global___PTYInfo: ...
+    def __init__(
+        self,
+        *,
+        entrypoint_args: collections.abc.Iterable[builtins.str] | None = ...,
+        mount_ids: collections.abc.Iterable[builtins.str] | None = ...,
+        image_id: builtins.str = ...,
+        secret_ids: collections.abc.Iterable[builtins.str] | None = ...,
+        resources: global___Resources | None = ...,
+        cloud_provider: global___CloudProvider.ValueType = ...,
+        timeout_secs: builtins.int = ...,
+        workdir: builtins.str | None = ...,
+        nfs_mounts: collections.abc.Iterable[global___SharedVolumeMount] | None = ...,
+        runtime_debug: builtins.bool = ...,
+        block_network: builtins.bool = ...,
+        s3_mounts: collections.abc.Iterable[global___S3Mount] | None = ...,
+        cloud_bucket_mounts: collections.abc.Iterable[global___CloudBucketMount] | None = ...,
+        volume_mounts: collections.abc.Iterable[global___VolumeMount] | None = ...,
+        pty_info: global___PTYInfo | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_workdir", b"_workdir", "pty_info", b"pty_info", "resources", b"resources", "workdir", b"workdir"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_workdir", b"_workdir", "block_network", b"block_network", "cloud_bucket_mounts", b"cloud_bucket_mounts", "cloud_provider", b"cloud_provider", "entrypoint_args", b"entrypoint_args", "image_id", b"image_id", "mount_ids", b"mount_ids", "nfs_mounts", b"nfs_mounts", "pty_info", b"pty_info", "resources", b"resources", "runtime_debug", b"runtime_debug", "s3_mounts", b"s3_mounts", "secret_ids", b"secret_ids", "timeout_secs", b"timeout_secs", "volume_mounts", b"volume_mounts", "workdir", b"workdir"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_workdir", b"_workdir"]) -> typing_extensions.Literal["workdir"] | None: ...
+
+global___Sandbox = Sandbox
+
+class SandboxCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    DEFINITION_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    @property
+    def definition(self) -> global___Sandbox: ...
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        definition: global___Sandbox | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["definition", b"definition"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "definition", b"definition"]) -> None: ...
+
+global___SandboxCreateRequest = SandboxCreateRequest
+
+class SandboxCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SANDBOX_ID_FIELD_NUMBER: builtins.int
+    sandbox_id: builtins.str
+    def __init__(
+        self,
+        *,
+        sandbox_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["sandbox_id", b"sandbox_id"]) -> None: ...
+
+global___SandboxCreateResponse = SandboxCreateResponse
+
+class SandboxGetTaskIdRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SANDBOX_ID_FIELD_NUMBER: builtins.int
+    sandbox_id: builtins.str
+    def __init__(
+        self,
+        *,
+        sandbox_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["sandbox_id", b"sandbox_id"]) -> None: ...
+
+global___SandboxGetTaskIdRequest = SandboxGetTaskIdRequest
+
+class SandboxGetTaskIdResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TASK_ID_FIELD_NUMBER: builtins.int
+    task_id: builtins.str
+    def __init__(
+        self,
+        *,
+        task_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["task_id", b"task_id"]) -> None: ...
+
+global___SandboxGetTaskIdResponse = SandboxGetTaskIdResponse
+
+class SandboxGetLogsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SANDBOX_ID_FIELD_NUMBER: builtins.int
+    FILE_DESCRIPTOR_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    LAST_ENTRY_ID_FIELD_NUMBER: builtins.int
+    sandbox_id: builtins.str
+    file_descriptor: global___FileDescriptor.ValueType
+    timeout: builtins.float
+    last_entry_id: builtins.str
+    def __init__(
+        self,
+        *,
+        sandbox_id: builtins.str = ...,
+        file_descriptor: global___FileDescriptor.ValueType = ...,
+        timeout: builtins.float = ...,
+        last_entry_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["file_descriptor", b"file_descriptor", "last_entry_id", b"last_entry_id", "sandbox_id", b"sandbox_id", "timeout", b"timeout"]) -> None: ...
+
+global___SandboxGetLogsRequest = SandboxGetLogsRequest
+
+class SandboxStdinWriteRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SANDBOX_ID_FIELD_NUMBER: builtins.int
+    INPUT_FIELD_NUMBER: builtins.int
+    INDEX_FIELD_NUMBER: builtins.int
+    EOF_FIELD_NUMBER: builtins.int
+    sandbox_id: builtins.str
+    input: builtins.bytes
+    index: builtins.int
+    eof: builtins.bool
+    def __init__(
+        self,
+        *,
+        sandbox_id: builtins.str = ...,
+        input: builtins.bytes = ...,
+        index: builtins.int = ...,
+        eof: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["eof", b"eof", "index", b"index", "input", b"input", "sandbox_id", b"sandbox_id"]) -> None: ...
+
+global___SandboxStdinWriteRequest = SandboxStdinWriteRequest
+
+class SandboxStdinWriteResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+
+global___SandboxStdinWriteResponse = SandboxStdinWriteResponse
+
+class SandboxHandleMetadata(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    RESULT_FIELD_NUMBER: builtins.int
+    @property
+    def result(self) -> global___GenericResult: ...
+    def __init__(
+        self,
+        *,
+        result: global___GenericResult | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["result", b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["result", b"result"]) -> None: ...
+
+global___SandboxHandleMetadata = SandboxHandleMetadata
+
+class SandboxInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ID_FIELD_NUMBER: builtins.int
+    DEFINITION_FIELD_NUMBER: builtins.int
+    CREATED_AT_FIELD_NUMBER: builtins.int
+    TASK_INFO_FIELD_NUMBER: builtins.int
+    id: builtins.str
+    @property
+    def definition(self) -> global___Sandbox: ...
+    created_at: builtins.float
+    @property
+    def task_info(self) -> global___TaskInfo: ...
+    def __init__(
+        self,
+        *,
+        id: builtins.str = ...,
+        definition: global___Sandbox | None = ...,
+        created_at: builtins.float = ...,
+        task_info: global___TaskInfo | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["definition", b"definition", "task_info", b"task_info"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["created_at", b"created_at", "definition", b"definition", "id", b"id", "task_info", b"task_info"]) -> None: ...
+
+global___SandboxInfo = SandboxInfo
+
+class SandboxListRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    BEFORE_TIMESTAMP_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    before_timestamp: builtins.float
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        before_timestamp: builtins.float = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "before_timestamp", b"before_timestamp"]) -> None: ...
+
+global___SandboxListRequest = SandboxListRequest
+
+class SandboxListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SANDBOXES_FIELD_NUMBER: builtins.int
+    @property
+    def sandboxes(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SandboxInfo]: ...
+    def __init__(
+        self,
+        *,
+        sandboxes: collections.abc.Iterable[global___SandboxInfo] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["sandboxes", b"sandboxes"]) -> None: ...
+
+global___SandboxListResponse = SandboxListResponse
+
+class SandboxTerminateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SANDBOX_ID_FIELD_NUMBER: builtins.int
+    sandbox_id: builtins.str
+    def __init__(
+        self,
+        *,
+        sandbox_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["sandbox_id", b"sandbox_id"]) -> None: ...
+
+global___SandboxTerminateRequest = SandboxTerminateRequest
+
+class SandboxTerminateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    EXISTING_RESULT_FIELD_NUMBER: builtins.int
+    @property
+    def existing_result(self) -> global___GenericResult: ...
+    def __init__(
+        self,
+        *,
+        existing_result: global___GenericResult | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["existing_result", b"existing_result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["existing_result", b"existing_result"]) -> None: ...
+
+global___SandboxTerminateResponse = SandboxTerminateResponse
+
+class SandboxWaitRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SANDBOX_ID_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    sandbox_id: builtins.str
+    timeout: builtins.float
+    def __init__(
+        self,
+        *,
+        sandbox_id: builtins.str = ...,
+        timeout: builtins.float = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["sandbox_id", b"sandbox_id", "timeout", b"timeout"]) -> None: ...
+
+global___SandboxWaitRequest = SandboxWaitRequest
+
+class SandboxWaitResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    RESULT_FIELD_NUMBER: builtins.int
+    @property
+    def result(self) -> global___GenericResult: ...
+    def __init__(
+        self,
+        *,
+        result: global___GenericResult | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["result", b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["result", b"result"]) -> None: ...
+
+global___SandboxWaitResponse = SandboxWaitResponse
+
+class Schedule(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class Cron(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        CRON_STRING_FIELD_NUMBER: builtins.int
+        cron_string: builtins.str
+        def __init__(
+            self,
+            *,
+            cron_string: builtins.str = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["cron_string", b"cron_string"]) -> None: ...
+
+    class Period(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        YEARS_FIELD_NUMBER: builtins.int
+        MONTHS_FIELD_NUMBER: builtins.int
+        WEEKS_FIELD_NUMBER: builtins.int
+        DAYS_FIELD_NUMBER: builtins.int
+        HOURS_FIELD_NUMBER: builtins.int
+        MINUTES_FIELD_NUMBER: builtins.int
+        SECONDS_FIELD_NUMBER: builtins.int
+        years: builtins.int
+        months: builtins.int
+        weeks: builtins.int
+        days: builtins.int
+        hours: builtins.int
+        minutes: builtins.int
+        seconds: builtins.float
+        def __init__(
+            self,
+            *,
+            years: builtins.int = ...,
+            months: builtins.int = ...,
+            weeks: builtins.int = ...,
+            days: builtins.int = ...,
+            hours: builtins.int = ...,
+            minutes: builtins.int = ...,
+            seconds: builtins.float = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["days", b"days", "hours", b"hours", "minutes", b"minutes", "months", b"months", "seconds", b"seconds", "weeks", b"weeks", "years", b"years"]) -> None: ...
+
+    CRON_FIELD_NUMBER: builtins.int
+    PERIOD_FIELD_NUMBER: builtins.int
+    @property
+    def cron(self) -> global___Schedule.Cron: ...
+    @property
+    def period(self) -> global___Schedule.Period: ...
+    def __init__(
+        self,
+        *,
+        cron: global___Schedule.Cron | None = ...,
+        period: global___Schedule.Period | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["cron", b"cron", "period", b"period", "schedule_oneof", b"schedule_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["cron", b"cron", "period", b"period", "schedule_oneof", b"schedule_oneof"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["schedule_oneof", b"schedule_oneof"]) -> typing_extensions.Literal["cron", "period"] | None: ...
+
+global___Schedule = Schedule
+
+class SecretCreateRequest(google.protobuf.message.Message):
+    """Not used by client anymore"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class EnvDictEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        value: builtins.str
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: builtins.str = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    ENV_DICT_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    TEMPLATE_TYPE_FIELD_NUMBER: builtins.int
+    EXISTING_SECRET_ID_FIELD_NUMBER: builtins.int
+    @property
+    def env_dict(self) -> google.protobuf.internal.containers.ScalarMap[builtins.str, builtins.str]: ...
+    app_id: builtins.str
+    template_type: builtins.str
+    """todo: not used?"""
+    existing_secret_id: builtins.str
+    def __init__(
+        self,
+        *,
+        env_dict: collections.abc.Mapping[builtins.str, builtins.str] | None = ...,
+        app_id: builtins.str = ...,
+        template_type: builtins.str = ...,
+        existing_secret_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "env_dict", b"env_dict", "existing_secret_id", b"existing_secret_id", "template_type", b"template_type"]) -> None: ...
+
+global___SecretCreateRequest = SecretCreateRequest
+
+class SecretCreateResponse(google.protobuf.message.Message):
+    """Not used by client anymore"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SECRET_ID_FIELD_NUMBER: builtins.int
+    secret_id: builtins.str
+    def __init__(
+        self,
+        *,
+        secret_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["secret_id", b"secret_id"]) -> None: ...
+
+global___SecretCreateResponse = SecretCreateResponse
+
+class SecretGetOrCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class EnvDictEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.str
+        value: builtins.str
+        def __init__(
+            self,
+            *,
+            key: builtins.str = ...,
+            value: builtins.str = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key", b"key", "value", b"value"]) -> None: ...
+
+    DEPLOYMENT_NAME_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_CREATION_TYPE_FIELD_NUMBER: builtins.int
+    ENV_DICT_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    deployment_name: builtins.str
+    namespace: global___DeploymentNamespace.ValueType
+    environment_name: builtins.str
+    object_creation_type: global___ObjectCreationType.ValueType
+    """Not used atm"""
+    @property
+    def env_dict(self) -> google.protobuf.internal.containers.ScalarMap[builtins.str, builtins.str]: ...
+    app_id: builtins.str
+    """only used with OBJECT_CREATION_TYPE_ANONYMOUS_OWNED_BY_APP"""
+    def __init__(
+        self,
+        *,
+        deployment_name: builtins.str = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        environment_name: builtins.str = ...,
+        object_creation_type: global___ObjectCreationType.ValueType = ...,
+        env_dict: collections.abc.Mapping[builtins.str, builtins.str] | None = ...,
+        app_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "deployment_name", b"deployment_name", "env_dict", b"env_dict", "environment_name", b"environment_name", "namespace", b"namespace", "object_creation_type", b"object_creation_type"]) -> None: ...
+
+global___SecretGetOrCreateRequest = SecretGetOrCreateRequest
+
+class SecretGetOrCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SECRET_ID_FIELD_NUMBER: builtins.int
+    secret_id: builtins.str
+    def __init__(
+        self,
+        *,
+        secret_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["secret_id", b"secret_id"]) -> None: ...
+
+global___SecretGetOrCreateResponse = SecretGetOrCreateResponse
+
+class SecretListItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    LABEL_FIELD_NUMBER: builtins.int
+    CREATED_AT_FIELD_NUMBER: builtins.int
+    LAST_USED_AT_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    label: builtins.str
+    created_at: builtins.float
+    last_used_at: builtins.float
+    environment_name: builtins.str
+    def __init__(
+        self,
+        *,
+        label: builtins.str = ...,
+        created_at: builtins.float = ...,
+        last_used_at: builtins.float = ...,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["created_at", b"created_at", "environment_name", b"environment_name", "label", b"label", "last_used_at", b"last_used_at"]) -> None: ...
+
+global___SecretListItem = SecretListItem
+
+class SecretListRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    environment_name: builtins.str
+    """leaving empty will assume a singular environment"""
+    def __init__(
+        self,
+        *,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["environment_name", b"environment_name"]) -> None: ...
+
+global___SecretListRequest = SecretListRequest
+
+class SecretListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ITEMS_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SecretListItem]: ...
+    environment_name: builtins.str
+    """the environment that was listed (useful when relying on "default" logic)"""
+    def __init__(
+        self,
+        *,
+        items: collections.abc.Iterable[global___SecretListItem] | None = ...,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["environment_name", b"environment_name", "items", b"items"]) -> None: ...
+
+global___SecretListResponse = SecretListResponse
+
+class SharedVolumeGetOrCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DEPLOYMENT_NAME_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_CREATION_TYPE_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    deployment_name: builtins.str
+    namespace: global___DeploymentNamespace.ValueType
+    environment_name: builtins.str
+    object_creation_type: global___ObjectCreationType.ValueType
+    app_id: builtins.str
+    """only used with OBJECT_CREATION_TYPE_ANONYMOUS_OWNED_BY_APP"""
+    def __init__(
+        self,
+        *,
+        deployment_name: builtins.str = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        environment_name: builtins.str = ...,
+        object_creation_type: global___ObjectCreationType.ValueType = ...,
+        app_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "deployment_name", b"deployment_name", "environment_name", b"environment_name", "namespace", b"namespace", "object_creation_type", b"object_creation_type"]) -> None: ...
+
+global___SharedVolumeGetOrCreateRequest = SharedVolumeGetOrCreateRequest
+
+class SharedVolumeGetOrCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    shared_volume_id: builtins.str
+    def __init__(
+        self,
+        *,
+        shared_volume_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["shared_volume_id", b"shared_volume_id"]) -> None: ...
+
+global___SharedVolumeGetOrCreateResponse = SharedVolumeGetOrCreateResponse
+
+class SharedVolumeHeartbeatRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    shared_volume_id: builtins.str
+    def __init__(
+        self,
+        *,
+        shared_volume_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["shared_volume_id", b"shared_volume_id"]) -> None: ...
+
+global___SharedVolumeHeartbeatRequest = SharedVolumeHeartbeatRequest
+
+class SharedVolumeCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    CLOUD_PROVIDER_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    cloud_provider: global___CloudProvider.ValueType
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+        cloud_provider: global___CloudProvider.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "cloud_provider", b"cloud_provider"]) -> None: ...
+
+global___SharedVolumeCreateRequest = SharedVolumeCreateRequest
+
+class SharedVolumeCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    shared_volume_id: builtins.str
+    def __init__(
+        self,
+        *,
+        shared_volume_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["shared_volume_id", b"shared_volume_id"]) -> None: ...
+
+global___SharedVolumeCreateResponse = SharedVolumeCreateResponse
+
+class SharedVolumeListItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    LABEL_FIELD_NUMBER: builtins.int
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    CREATED_AT_FIELD_NUMBER: builtins.int
+    CLOUD_PROVIDER_FIELD_NUMBER: builtins.int
+    label: builtins.str
+    """app name of object entity app"""
+    shared_volume_id: builtins.str
+    created_at: builtins.float
+    cloud_provider: global___CloudProvider.ValueType
+    def __init__(
+        self,
+        *,
+        label: builtins.str = ...,
+        shared_volume_id: builtins.str = ...,
+        created_at: builtins.float = ...,
+        cloud_provider: global___CloudProvider.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["cloud_provider", b"cloud_provider", "created_at", b"created_at", "label", b"label", "shared_volume_id", b"shared_volume_id"]) -> None: ...
+
+global___SharedVolumeListItem = SharedVolumeListItem
+
+class SharedVolumeListRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    environment_name: builtins.str
+    def __init__(
+        self,
+        *,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["environment_name", b"environment_name"]) -> None: ...
+
+global___SharedVolumeListRequest = SharedVolumeListRequest
+
+class SharedVolumeListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ITEMS_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SharedVolumeListItem]: ...
+    environment_name: builtins.str
+    def __init__(
+        self,
+        *,
+        items: collections.abc.Iterable[global___SharedVolumeListItem] | None = ...,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["environment_name", b"environment_name", "items", b"items"]) -> None: ...
+
+global___SharedVolumeListResponse = SharedVolumeListResponse
+
+class SharedVolumeListFilesRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    PATH_FIELD_NUMBER: builtins.int
+    shared_volume_id: builtins.str
+    path: builtins.str
+    def __init__(
+        self,
+        *,
+        shared_volume_id: builtins.str = ...,
+        path: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["path", b"path", "shared_volume_id", b"shared_volume_id"]) -> None: ...
+
+global___SharedVolumeListFilesRequest = SharedVolumeListFilesRequest
+
+class SharedVolumePutFileRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    PATH_FIELD_NUMBER: builtins.int
+    SHA256_HEX_FIELD_NUMBER: builtins.int
+    DATA_FIELD_NUMBER: builtins.int
+    DATA_BLOB_ID_FIELD_NUMBER: builtins.int
+    RESUMABLE_FIELD_NUMBER: builtins.int
+    shared_volume_id: builtins.str
+    path: builtins.str
+    sha256_hex: builtins.str
+    data: builtins.bytes
+    data_blob_id: builtins.str
+    resumable: builtins.bool
+    """remove when required client version >= 47"""
+    def __init__(
+        self,
+        *,
+        shared_volume_id: builtins.str = ...,
+        path: builtins.str = ...,
+        sha256_hex: builtins.str = ...,
+        data: builtins.bytes = ...,
+        data_blob_id: builtins.str = ...,
+        resumable: builtins.bool = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_oneof", b"data_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_oneof", b"data_oneof", "path", b"path", "resumable", b"resumable", "sha256_hex", b"sha256_hex", "shared_volume_id", b"shared_volume_id"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["data_oneof", b"data_oneof"]) -> typing_extensions.Literal["data", "data_blob_id"] | None: ...
+
+global___SharedVolumePutFileRequest = SharedVolumePutFileRequest
+
+class SharedVolumePutFileResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    EXISTS_FIELD_NUMBER: builtins.int
+    exists: builtins.bool
+    def __init__(
+        self,
+        *,
+        exists: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["exists", b"exists"]) -> None: ...
+
+global___SharedVolumePutFileResponse = SharedVolumePutFileResponse
+
+class SharedVolumeGetFileRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    PATH_FIELD_NUMBER: builtins.int
+    shared_volume_id: builtins.str
+    path: builtins.str
+    def __init__(
+        self,
+        *,
+        shared_volume_id: builtins.str = ...,
+        path: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["path", b"path", "shared_volume_id", b"shared_volume_id"]) -> None: ...
+
+global___SharedVolumeGetFileRequest = SharedVolumeGetFileRequest
+
+class SharedVolumeGetFileResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DATA_FIELD_NUMBER: builtins.int
+    DATA_BLOB_ID_FIELD_NUMBER: builtins.int
+    data: builtins.bytes
+    data_blob_id: builtins.str
+    def __init__(
+        self,
+        *,
+        data: builtins.bytes = ...,
+        data_blob_id: builtins.str = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_oneof", b"data_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_oneof", b"data_oneof"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["data_oneof", b"data_oneof"]) -> typing_extensions.Literal["data", "data_blob_id"] | None: ...
+
+global___SharedVolumeGetFileResponse = SharedVolumeGetFileResponse
+
+class SharedVolumeRemoveFileRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    PATH_FIELD_NUMBER: builtins.int
+    RECURSIVE_FIELD_NUMBER: builtins.int
+    shared_volume_id: builtins.str
+    path: builtins.str
+    recursive: builtins.bool
+    def __init__(
+        self,
+        *,
+        shared_volume_id: builtins.str = ...,
+        path: builtins.str = ...,
+        recursive: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["path", b"path", "recursive", b"recursive", "shared_volume_id", b"shared_volume_id"]) -> None: ...
+
+global___SharedVolumeRemoveFileRequest = SharedVolumeRemoveFileRequest
+
+class SharedVolumeListFilesEntry(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class _FileType:
+        ValueType = typing.NewType("ValueType", builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+
+    class _FileTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[SharedVolumeListFilesEntry._FileType.ValueType], builtins.type):  # noqa: F821
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        UNSPECIFIED: SharedVolumeListFilesEntry._FileType.ValueType  # 0
+        FILE: SharedVolumeListFilesEntry._FileType.ValueType  # 1
+        DIRECTORY: SharedVolumeListFilesEntry._FileType.ValueType  # 2
+
+    class FileType(_FileType, metaclass=_FileTypeEnumTypeWrapper): ...
+    UNSPECIFIED: SharedVolumeListFilesEntry.FileType.ValueType  # 0
+    FILE: SharedVolumeListFilesEntry.FileType.ValueType  # 1
+    DIRECTORY: SharedVolumeListFilesEntry.FileType.ValueType  # 2
+
+    PATH_FIELD_NUMBER: builtins.int
+    TYPE_FIELD_NUMBER: builtins.int
+    path: builtins.str
+    type: global___SharedVolumeListFilesEntry.FileType.ValueType
+    def __init__(
+        self,
+        *,
+        path: builtins.str = ...,
+        type: global___SharedVolumeListFilesEntry.FileType.ValueType = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["path", b"path", "type", b"type"]) -> None: ...
+
+global___SharedVolumeListFilesEntry = SharedVolumeListFilesEntry
+
+class SharedVolumeListFilesResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ENTRIES_FIELD_NUMBER: builtins.int
+    @property
+    def entries(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___SharedVolumeListFilesEntry]: ...
+    def __init__(
+        self,
+        *,
+        entries: collections.abc.Iterable[global___SharedVolumeListFilesEntry] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["entries", b"entries"]) -> None: ...
+
+global___SharedVolumeListFilesResponse = SharedVolumeListFilesResponse
+
+class SharedVolumeMount(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    MOUNT_PATH_FIELD_NUMBER: builtins.int
+    SHARED_VOLUME_ID_FIELD_NUMBER: builtins.int
+    CLOUD_PROVIDER_FIELD_NUMBER: builtins.int
+    ALLOW_CROSS_REGION_FIELD_NUMBER: builtins.int
+    mount_path: builtins.str
+    shared_volume_id: builtins.str
+    cloud_provider: global___CloudProvider.ValueType
+    allow_cross_region: builtins.bool
+    def __init__(
+        self,
+        *,
+        mount_path: builtins.str = ...,
+        shared_volume_id: builtins.str = ...,
+        cloud_provider: global___CloudProvider.ValueType = ...,
+        allow_cross_region: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["allow_cross_region", b"allow_cross_region", "cloud_provider", b"cloud_provider", "mount_path", b"mount_path", "shared_volume_id", b"shared_volume_id"]) -> None: ...
+
+global___SharedVolumeMount = SharedVolumeMount
+
+class TaskCurrentInputsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    INPUT_IDS_FIELD_NUMBER: builtins.int
+    @property
+    def input_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        input_ids: collections.abc.Iterable[builtins.str] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["input_ids", b"input_ids"]) -> None: ...
+
+global___TaskCurrentInputsResponse = TaskCurrentInputsResponse
+
+class TaskInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ID_FIELD_NUMBER: builtins.int
+    STARTED_AT_FIELD_NUMBER: builtins.int
+    FINISHED_AT_FIELD_NUMBER: builtins.int
+    RESULT_FIELD_NUMBER: builtins.int
+    id: builtins.str
+    started_at: builtins.float
+    finished_at: builtins.float
+    @property
+    def result(self) -> global___GenericResult: ...
+    def __init__(
+        self,
+        *,
+        id: builtins.str = ...,
+        started_at: builtins.float = ...,
+        finished_at: builtins.float = ...,
+        result: global___GenericResult | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["result", b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["finished_at", b"finished_at", "id", b"id", "result", b"result", "started_at", b"started_at"]) -> None: ...
+
+global___TaskInfo = TaskInfo
+
+class TaskLogs(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DATA_FIELD_NUMBER: builtins.int
+    TASK_STATE_FIELD_NUMBER: builtins.int
+    TIMESTAMP_FIELD_NUMBER: builtins.int
+    FILE_DESCRIPTOR_FIELD_NUMBER: builtins.int
+    TASK_PROGRESS_FIELD_NUMBER: builtins.int
+    FUNCTION_CALL_ID_FIELD_NUMBER: builtins.int
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    data: builtins.str
+    task_state: global___TaskState.ValueType
+    timestamp: builtins.float
+    file_descriptor: global___FileDescriptor.ValueType
+    @property
+    def task_progress(self) -> global___TaskProgress: ...
+    function_call_id: builtins.str
+    input_id: builtins.str
+    def __init__(
+        self,
+        *,
+        data: builtins.str = ...,
+        task_state: global___TaskState.ValueType = ...,
+        timestamp: builtins.float = ...,
+        file_descriptor: global___FileDescriptor.ValueType = ...,
+        task_progress: global___TaskProgress | None = ...,
+        function_call_id: builtins.str = ...,
+        input_id: builtins.str = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["task_progress", b"task_progress"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data", b"data", "file_descriptor", b"file_descriptor", "function_call_id", b"function_call_id", "input_id", b"input_id", "task_progress", b"task_progress", "task_state", b"task_state", "timestamp", b"timestamp"]) -> None: ...
+
+global___TaskLogs = TaskLogs
+
+class TaskListRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+
+global___TaskListRequest = TaskListRequest
+
+class TaskListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TASKS_FIELD_NUMBER: builtins.int
+    @property
+    def tasks(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___TaskStats]: ...
+    def __init__(
+        self,
+        *,
+        tasks: collections.abc.Iterable[global___TaskStats] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["tasks", b"tasks"]) -> None: ...
+
+global___TaskListResponse = TaskListResponse
+
+class TaskLogsBatch(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TASK_ID_FIELD_NUMBER: builtins.int
+    ITEMS_FIELD_NUMBER: builtins.int
+    ENTRY_ID_FIELD_NUMBER: builtins.int
+    APP_DONE_FIELD_NUMBER: builtins.int
+    FUNCTION_ID_FIELD_NUMBER: builtins.int
+    INPUT_ID_FIELD_NUMBER: builtins.int
+    IMAGE_ID_FIELD_NUMBER: builtins.int
+    EOF_FIELD_NUMBER: builtins.int
+    PTY_EXEC_ID_FIELD_NUMBER: builtins.int
+    task_id: builtins.str
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___TaskLogs]: ...
+    entry_id: builtins.str
+    app_done: builtins.bool
+    function_id: builtins.str
+    input_id: builtins.str
+    image_id: builtins.str
+    """Used for image logs"""
+    eof: builtins.bool
+    pty_exec_id: builtins.str
+    """Used for interactive functions"""
+    def __init__(
+        self,
+        *,
+        task_id: builtins.str = ...,
+        items: collections.abc.Iterable[global___TaskLogs] | None = ...,
+        entry_id: builtins.str = ...,
+        app_done: builtins.bool = ...,
+        function_id: builtins.str = ...,
+        input_id: builtins.str = ...,
+        image_id: builtins.str = ...,
+        eof: builtins.bool = ...,
+        pty_exec_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_done", b"app_done", "entry_id", b"entry_id", "eof", b"eof", "function_id", b"function_id", "image_id", b"image_id", "input_id", b"input_id", "items", b"items", "pty_exec_id", b"pty_exec_id", "task_id", b"task_id"]) -> None: ...
+
+global___TaskLogsBatch = TaskLogsBatch
+
+class TaskProgress(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    LEN_FIELD_NUMBER: builtins.int
+    POS_FIELD_NUMBER: builtins.int
+    PROGRESS_TYPE_FIELD_NUMBER: builtins.int
+    DESCRIPTION_FIELD_NUMBER: builtins.int
+    len: builtins.int
+    pos: builtins.int
+    progress_type: global___ProgressType.ValueType
+    description: builtins.str
+    def __init__(
+        self,
+        *,
+        len: builtins.int = ...,
+        pos: builtins.int = ...,
+        progress_type: global___ProgressType.ValueType = ...,
+        description: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["description", b"description", "len", b"len", "pos", b"pos", "progress_type", b"progress_type"]) -> None: ...
+
+global___TaskProgress = TaskProgress
+
+class TaskResultRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    RESULT_FIELD_NUMBER: builtins.int
+    @property
+    def result(self) -> global___GenericResult: ...
+    def __init__(
+        self,
+        *,
+        result: global___GenericResult | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["result", b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["result", b"result"]) -> None: ...
+
+global___TaskResultRequest = TaskResultRequest
+
+class TaskStats(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TASK_ID_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    APP_DESCRIPTION_FIELD_NUMBER: builtins.int
+    STARTED_AT_FIELD_NUMBER: builtins.int
+    task_id: builtins.str
+    app_id: builtins.str
+    app_description: builtins.str
+    started_at: builtins.float
+    def __init__(
+        self,
+        *,
+        task_id: builtins.str = ...,
+        app_id: builtins.str = ...,
+        app_description: builtins.str = ...,
+        started_at: builtins.float = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_description", b"app_description", "app_id", b"app_id", "started_at", b"started_at", "task_id", b"task_id"]) -> None: ...
+
+global___TaskStats = TaskStats
+
+class TokenFlowCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    UTM_SOURCE_FIELD_NUMBER: builtins.int
+    LOCALHOST_PORT_FIELD_NUMBER: builtins.int
+    NEXT_URL_FIELD_NUMBER: builtins.int
+    utm_source: builtins.str
+    localhost_port: builtins.int
+    next_url: builtins.str
+    def __init__(
+        self,
+        *,
+        utm_source: builtins.str = ...,
+        localhost_port: builtins.int = ...,
+        next_url: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["localhost_port", b"localhost_port", "next_url", b"next_url", "utm_source", b"utm_source"]) -> None: ...
+
+global___TokenFlowCreateRequest = TokenFlowCreateRequest
+
+class TokenFlowCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TOKEN_FLOW_ID_FIELD_NUMBER: builtins.int
+    WEB_URL_FIELD_NUMBER: builtins.int
+    CODE_FIELD_NUMBER: builtins.int
+    WAIT_SECRET_FIELD_NUMBER: builtins.int
+    token_flow_id: builtins.str
+    web_url: builtins.str
+    code: builtins.str
+    wait_secret: builtins.str
+    def __init__(
+        self,
+        *,
+        token_flow_id: builtins.str = ...,
+        web_url: builtins.str = ...,
+        code: builtins.str = ...,
+        wait_secret: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["code", b"code", "token_flow_id", b"token_flow_id", "wait_secret", b"wait_secret", "web_url", b"web_url"]) -> None: ...
+
+global___TokenFlowCreateResponse = TokenFlowCreateResponse
+
+class TokenFlowWaitRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    TOKEN_FLOW_ID_FIELD_NUMBER: builtins.int
+    WAIT_SECRET_FIELD_NUMBER: builtins.int
+    timeout: builtins.float
+    token_flow_id: builtins.str
+    wait_secret: builtins.str
+    def __init__(
+        self,
+        *,
+        timeout: builtins.float = ...,
+        token_flow_id: builtins.str = ...,
+        wait_secret: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["timeout", b"timeout", "token_flow_id", b"token_flow_id", "wait_secret", b"wait_secret"]) -> None: ...
+
+global___TokenFlowWaitRequest = TokenFlowWaitRequest
+
+class TokenFlowWaitResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TOKEN_ID_FIELD_NUMBER: builtins.int
+    TOKEN_SECRET_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    WORKSPACE_USERNAME_FIELD_NUMBER: builtins.int
+    token_id: builtins.str
+    token_secret: builtins.str
+    timeout: builtins.bool
+    workspace_username: builtins.str
+    def __init__(
+        self,
+        *,
+        token_id: builtins.str = ...,
+        token_secret: builtins.str = ...,
+        timeout: builtins.bool = ...,
+        workspace_username: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["timeout", b"timeout", "token_id", b"token_id", "token_secret", b"token_secret", "workspace_username", b"workspace_username"]) -> None: ...
+
+global___TokenFlowWaitResponse = TokenFlowWaitResponse
+
+class TunnelStartRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PORT_FIELD_NUMBER: builtins.int
+    UNENCRYPTED_FIELD_NUMBER: builtins.int
+    port: builtins.int
+    unencrypted: builtins.bool
+    def __init__(
+        self,
+        *,
+        port: builtins.int = ...,
+        unencrypted: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["port", b"port", "unencrypted", b"unencrypted"]) -> None: ...
+
+global___TunnelStartRequest = TunnelStartRequest
+
+class TunnelStartResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    HOST_FIELD_NUMBER: builtins.int
+    PORT_FIELD_NUMBER: builtins.int
+    UNENCRYPTED_HOST_FIELD_NUMBER: builtins.int
+    UNENCRYPTED_PORT_FIELD_NUMBER: builtins.int
+    host: builtins.str
+    port: builtins.int
+    unencrypted_host: builtins.str
+    unencrypted_port: builtins.int
+    def __init__(
+        self,
+        *,
+        host: builtins.str = ...,
+        port: builtins.int = ...,
+        unencrypted_host: builtins.str | None = ...,
+        unencrypted_port: builtins.int | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_unencrypted_host", b"_unencrypted_host", "_unencrypted_port", b"_unencrypted_port", "unencrypted_host", b"unencrypted_host", "unencrypted_port", b"unencrypted_port"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_unencrypted_host", b"_unencrypted_host", "_unencrypted_port", b"_unencrypted_port", "host", b"host", "port", b"port", "unencrypted_host", b"unencrypted_host", "unencrypted_port", b"unencrypted_port"]) -> None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_unencrypted_host", b"_unencrypted_host"]) -> typing_extensions.Literal["unencrypted_host"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_unencrypted_port", b"_unencrypted_port"]) -> typing_extensions.Literal["unencrypted_port"] | None: ...
+
+global___TunnelStartResponse = TunnelStartResponse
+
+class TunnelStopRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PORT_FIELD_NUMBER: builtins.int
+    port: builtins.int
+    def __init__(
+        self,
+        *,
+        port: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["port", b"port"]) -> None: ...
+
+global___TunnelStopRequest = TunnelStopRequest
+
+class TunnelStopResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    EXISTS_FIELD_NUMBER: builtins.int
+    exists: builtins.bool
+    def __init__(
+        self,
+        *,
+        exists: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["exists", b"exists"]) -> None: ...
+
+global___TunnelStopResponse = TunnelStopResponse
+
+class VolumeGetOrCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DEPLOYMENT_NAME_FIELD_NUMBER: builtins.int
+    NAMESPACE_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    OBJECT_CREATION_TYPE_FIELD_NUMBER: builtins.int
+    APP_ID_FIELD_NUMBER: builtins.int
+    deployment_name: builtins.str
+    namespace: global___DeploymentNamespace.ValueType
+    environment_name: builtins.str
+    object_creation_type: global___ObjectCreationType.ValueType
+    app_id: builtins.str
+    """only used with OBJECT_CREATION_TYPE_ANONYMOUS_OWNED_BY_APP"""
+    def __init__(
+        self,
+        *,
+        deployment_name: builtins.str = ...,
+        namespace: global___DeploymentNamespace.ValueType = ...,
+        environment_name: builtins.str = ...,
+        object_creation_type: global___ObjectCreationType.ValueType = ...,
+        app_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id", "deployment_name", b"deployment_name", "environment_name", b"environment_name", "namespace", b"namespace", "object_creation_type", b"object_creation_type"]) -> None: ...
+
+global___VolumeGetOrCreateRequest = VolumeGetOrCreateRequest
+
+class VolumeGetOrCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["volume_id", b"volume_id"]) -> None: ...
+
+global___VolumeGetOrCreateResponse = VolumeGetOrCreateResponse
+
+class VolumeHeartbeatRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["volume_id", b"volume_id"]) -> None: ...
+
+global___VolumeHeartbeatRequest = VolumeHeartbeatRequest
+
+class VolumeCreateRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    APP_ID_FIELD_NUMBER: builtins.int
+    app_id: builtins.str
+    def __init__(
+        self,
+        *,
+        app_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["app_id", b"app_id"]) -> None: ...
+
+global___VolumeCreateRequest = VolumeCreateRequest
+
+class VolumeCreateResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["volume_id", b"volume_id"]) -> None: ...
+
+global___VolumeCreateResponse = VolumeCreateResponse
+
+class VolumeCommitRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    """NOTE(staffan): Mounting a volume in multiple locations is not supported, so volume_id alone uniquely identifies
+    a volume mount.
+    """
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["volume_id", b"volume_id"]) -> None: ...
+
+global___VolumeCommitRequest = VolumeCommitRequest
+
+class VolumeCommitResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SKIP_RELOAD_FIELD_NUMBER: builtins.int
+    skip_reload: builtins.bool
+    def __init__(
+        self,
+        *,
+        skip_reload: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["skip_reload", b"skip_reload"]) -> None: ...
+
+global___VolumeCommitResponse = VolumeCommitResponse
+
+class VolumeDeleteRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    environment_name: builtins.str
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["environment_name", b"environment_name", "volume_id", b"volume_id"]) -> None: ...
+
+global___VolumeDeleteRequest = VolumeDeleteRequest
+
+class VolumeGetFileRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    PATH_FIELD_NUMBER: builtins.int
+    START_FIELD_NUMBER: builtins.int
+    LEN_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    path: builtins.bytes
+    start: builtins.int
+    len: builtins.int
+    """0 is interpreted as 'read to end'"""
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+        path: builtins.bytes = ...,
+        start: builtins.int = ...,
+        len: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["len", b"len", "path", b"path", "start", b"start", "volume_id", b"volume_id"]) -> None: ...
+
+global___VolumeGetFileRequest = VolumeGetFileRequest
+
+class VolumeGetFileResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    DATA_FIELD_NUMBER: builtins.int
+    DATA_BLOB_ID_FIELD_NUMBER: builtins.int
+    SIZE_FIELD_NUMBER: builtins.int
+    START_FIELD_NUMBER: builtins.int
+    LEN_FIELD_NUMBER: builtins.int
+    data: builtins.bytes
+    data_blob_id: builtins.str
+    size: builtins.int
+    """total file size"""
+    start: builtins.int
+    """file position of first byte returned"""
+    len: builtins.int
+    """number of bytes returned"""
+    def __init__(
+        self,
+        *,
+        data: builtins.bytes = ...,
+        data_blob_id: builtins.str = ...,
+        size: builtins.int = ...,
+        start: builtins.int = ...,
+        len: builtins.int = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_oneof", b"data_oneof"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["data", b"data", "data_blob_id", b"data_blob_id", "data_oneof", b"data_oneof", "len", b"len", "size", b"size", "start", b"start"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["data_oneof", b"data_oneof"]) -> typing_extensions.Literal["data", "data_blob_id"] | None: ...
+
+global___VolumeGetFileResponse = VolumeGetFileResponse
+
+class VolumeListFilesEntry(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    class _FileType:
+        ValueType = typing.NewType("ValueType", builtins.int)
+        V: typing_extensions.TypeAlias = ValueType
+
+    class _FileTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[VolumeListFilesEntry._FileType.ValueType], builtins.type):  # noqa: F821
+        DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+        UNSPECIFIED: VolumeListFilesEntry._FileType.ValueType  # 0
+        FILE: VolumeListFilesEntry._FileType.ValueType  # 1
+        DIRECTORY: VolumeListFilesEntry._FileType.ValueType  # 2
+        SYMLINK: VolumeListFilesEntry._FileType.ValueType  # 3
+
+    class FileType(_FileType, metaclass=_FileTypeEnumTypeWrapper): ...
+    UNSPECIFIED: VolumeListFilesEntry.FileType.ValueType  # 0
+    FILE: VolumeListFilesEntry.FileType.ValueType  # 1
+    DIRECTORY: VolumeListFilesEntry.FileType.ValueType  # 2
+    SYMLINK: VolumeListFilesEntry.FileType.ValueType  # 3
+
+    PATH_FIELD_NUMBER: builtins.int
+    TYPE_FIELD_NUMBER: builtins.int
+    MTIME_FIELD_NUMBER: builtins.int
+    SIZE_FIELD_NUMBER: builtins.int
+    path: builtins.str
+    type: global___VolumeListFilesEntry.FileType.ValueType
+    mtime: builtins.int
+    size: builtins.int
+    def __init__(
+        self,
+        *,
+        path: builtins.str = ...,
+        type: global___VolumeListFilesEntry.FileType.ValueType = ...,
+        mtime: builtins.int = ...,
+        size: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["mtime", b"mtime", "path", b"path", "size", b"size", "type", b"type"]) -> None: ...
+
+global___VolumeListFilesEntry = VolumeListFilesEntry
+
+class VolumeListFilesRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    PATH_FIELD_NUMBER: builtins.int
+    MAX_ENTRIES_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    path: builtins.str
+    max_entries: builtins.int
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+        path: builtins.str = ...,
+        max_entries: builtins.int | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_max_entries", b"_max_entries", "max_entries", b"max_entries"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_max_entries", b"_max_entries", "max_entries", b"max_entries", "path", b"path", "volume_id", b"volume_id"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_max_entries", b"_max_entries"]) -> typing_extensions.Literal["max_entries"] | None: ...
+
+global___VolumeListFilesRequest = VolumeListFilesRequest
+
+class VolumeListFilesResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ENTRIES_FIELD_NUMBER: builtins.int
+    @property
+    def entries(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___VolumeListFilesEntry]: ...
+    def __init__(
+        self,
+        *,
+        entries: collections.abc.Iterable[global___VolumeListFilesEntry] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["entries", b"entries"]) -> None: ...
+
+global___VolumeListFilesResponse = VolumeListFilesResponse
+
+class VolumeListItem(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    LABEL_FIELD_NUMBER: builtins.int
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    CREATED_AT_FIELD_NUMBER: builtins.int
+    label: builtins.str
+    """app name of object entity app"""
+    volume_id: builtins.str
+    created_at: builtins.float
+    def __init__(
+        self,
+        *,
+        label: builtins.str = ...,
+        volume_id: builtins.str = ...,
+        created_at: builtins.float = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["created_at", b"created_at", "label", b"label", "volume_id", b"volume_id"]) -> None: ...
+
+global___VolumeListItem = VolumeListItem
+
+class VolumeListRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    environment_name: builtins.str
+    def __init__(
+        self,
+        *,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["environment_name", b"environment_name"]) -> None: ...
+
+global___VolumeListRequest = VolumeListRequest
+
+class VolumeListResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ITEMS_FIELD_NUMBER: builtins.int
+    ENVIRONMENT_NAME_FIELD_NUMBER: builtins.int
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___VolumeListItem]: ...
+    environment_name: builtins.str
+    def __init__(
+        self,
+        *,
+        items: collections.abc.Iterable[global___VolumeListItem] | None = ...,
+        environment_name: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["environment_name", b"environment_name", "items", b"items"]) -> None: ...
+
+global___VolumeListResponse = VolumeListResponse
+
+class VolumeReloadRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    """NOTE(staffan): Mounting a volume in multiple locations is not supported, so volume_id alone uniquely identifies
+    a volume mount.
+    """
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["volume_id", b"volume_id"]) -> None: ...
+
+global___VolumeReloadRequest = VolumeReloadRequest
+
+class VolumePutFilesRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    FILES_FIELD_NUMBER: builtins.int
+    DISALLOW_OVERWRITE_EXISTING_FILES_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    @property
+    def files(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___MountFile]:
+        """TODO(staffan): This is obviously unfortunately named, but provides what we need - consider renaming."""
+    disallow_overwrite_existing_files: builtins.bool
+    """If set to true, prevent overwriting existing files. (Note that we don't allow overwriting
+    existing directories with uploaded files regardless.)
+    """
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+        files: collections.abc.Iterable[global___MountFile] | None = ...,
+        disallow_overwrite_existing_files: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["disallow_overwrite_existing_files", b"disallow_overwrite_existing_files", "files", b"files", "volume_id", b"volume_id"]) -> None: ...
+
+global___VolumePutFilesRequest = VolumePutFilesRequest
+
+class VolumeRemoveFileRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    PATH_FIELD_NUMBER: builtins.int
+    RECURSIVE_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    path: builtins.bytes
+    recursive: builtins.bool
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+        path: builtins.bytes = ...,
+        recursive: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["path", b"path", "recursive", b"recursive", "volume_id", b"volume_id"]) -> None: ...
+
+global___VolumeRemoveFileRequest = VolumeRemoveFileRequest
+
+class VolumeCopyFilesRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    SRC_PATHS_FIELD_NUMBER: builtins.int
+    DST_PATH_FIELD_NUMBER: builtins.int
+    RECURSIVE_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    @property
+    def src_paths(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.bytes]: ...
+    dst_path: builtins.bytes
+    recursive: builtins.bool
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+        src_paths: collections.abc.Iterable[builtins.bytes] | None = ...,
+        dst_path: builtins.bytes = ...,
+        recursive: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["dst_path", b"dst_path", "recursive", b"recursive", "src_paths", b"src_paths", "volume_id", b"volume_id"]) -> None: ...
+
+global___VolumeCopyFilesRequest = VolumeCopyFilesRequest
+
+class VolumeMount(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    VOLUME_ID_FIELD_NUMBER: builtins.int
+    MOUNT_PATH_FIELD_NUMBER: builtins.int
+    ALLOW_BACKGROUND_COMMITS_FIELD_NUMBER: builtins.int
+    volume_id: builtins.str
+    mount_path: builtins.str
+    allow_background_commits: builtins.bool
+    def __init__(
+        self,
+        *,
+        volume_id: builtins.str = ...,
+        mount_path: builtins.str = ...,
+        allow_background_commits: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["allow_background_commits", b"allow_background_commits", "mount_path", b"mount_path", "volume_id", b"volume_id"]) -> None: ...
+
+global___VolumeMount = VolumeMount
+
+class WebhookConfig(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TYPE_FIELD_NUMBER: builtins.int
+    METHOD_FIELD_NUMBER: builtins.int
+    REQUESTED_SUFFIX_FIELD_NUMBER: builtins.int
+    ASYNC_MODE_FIELD_NUMBER: builtins.int
+    CUSTOM_DOMAINS_FIELD_NUMBER: builtins.int
+    WEB_SERVER_PORT_FIELD_NUMBER: builtins.int
+    WEB_SERVER_STARTUP_TIMEOUT_FIELD_NUMBER: builtins.int
+    type: global___WebhookType.ValueType
+    method: builtins.str
+    requested_suffix: builtins.str
+    async_mode: global___WebhookAsyncMode.ValueType
+    @property
+    def custom_domains(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___CustomDomainConfig]: ...
+    web_server_port: builtins.int
+    web_server_startup_timeout: builtins.float
+    def __init__(
+        self,
+        *,
+        type: global___WebhookType.ValueType = ...,
+        method: builtins.str = ...,
+        requested_suffix: builtins.str = ...,
+        async_mode: global___WebhookAsyncMode.ValueType = ...,
+        custom_domains: collections.abc.Iterable[global___CustomDomainConfig] | None = ...,
+        web_server_port: builtins.int = ...,
+        web_server_startup_timeout: builtins.float = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["async_mode", b"async_mode", "custom_domains", b"custom_domains", "method", b"method", "requested_suffix", b"requested_suffix", "type", b"type", "web_server_port", b"web_server_port", "web_server_startup_timeout", b"web_server_startup_timeout"]) -> None: ...
+
+global___WebhookConfig = WebhookConfig
+
+class WebUrlInfo(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TRUNCATED_FIELD_NUMBER: builtins.int
+    HAS_UNIQUE_HASH_FIELD_NUMBER: builtins.int
+    LABEL_STOLEN_FIELD_NUMBER: builtins.int
+    truncated: builtins.bool
+    has_unique_hash: builtins.bool
+    label_stolen: builtins.bool
+    def __init__(
+        self,
+        *,
+        truncated: builtins.bool = ...,
+        has_unique_hash: builtins.bool = ...,
+        label_stolen: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["has_unique_hash", b"has_unique_hash", "label_stolen", b"label_stolen", "truncated", b"truncated"]) -> None: ...
+
+global___WebUrlInfo = WebUrlInfo
+
+class WorkspaceNameLookupResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    WORKSPACE_NAME_FIELD_NUMBER: builtins.int
+    USERNAME_FIELD_NUMBER: builtins.int
+    workspace_name: builtins.str
+    username: builtins.str
+    def __init__(
+        self,
+        *,
+        workspace_name: builtins.str = ...,
+        username: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["username", b"username", "workspace_name", b"workspace_name"]) -> None: ...
+
+global___WorkspaceNameLookupResponse = WorkspaceNameLookupResponse
+
+class RuntimeOutputMessage(google.protobuf.message.Message):
+    """Used for `modal container exec`"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    FILE_DESCRIPTOR_FIELD_NUMBER: builtins.int
+    MESSAGE_FIELD_NUMBER: builtins.int
+    file_descriptor: global___FileDescriptor.ValueType
+    """only stdout / stderr is used"""
+    message: builtins.str
+    def __init__(
+        self,
+        *,
+        file_descriptor: global___FileDescriptor.ValueType = ...,
+        message: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["file_descriptor", b"file_descriptor", "message", b"message"]) -> None: ...
+
+global___RuntimeOutputMessage = RuntimeOutputMessage
+
+class RuntimeOutputBatch(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ITEMS_FIELD_NUMBER: builtins.int
+    BATCH_INDEX_FIELD_NUMBER: builtins.int
+    EXIT_CODE_FIELD_NUMBER: builtins.int
+    @property
+    def items(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___RuntimeOutputMessage]: ...
+    batch_index: builtins.int
+    exit_code: builtins.int
+    """if an exit code is given, this is the final message that will be sent."""
+    def __init__(
+        self,
+        *,
+        items: collections.abc.Iterable[global___RuntimeOutputMessage] | None = ...,
+        batch_index: builtins.int = ...,
+        exit_code: builtins.int | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["_exit_code", b"_exit_code", "exit_code", b"exit_code"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["_exit_code", b"_exit_code", "batch_index", b"batch_index", "exit_code", b"exit_code", "items", b"items"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions.Literal["_exit_code", b"_exit_code"]) -> typing_extensions.Literal["exit_code"] | None: ...
+
+global___RuntimeOutputBatch = RuntimeOutputBatch
+
+class RuntimeInputMessage(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    MESSAGE_FIELD_NUMBER: builtins.int
+    MESSAGE_INDEX_FIELD_NUMBER: builtins.int
+    message: builtins.bytes
+    message_index: builtins.int
+    def __init__(
+        self,
+        *,
+        message: builtins.bytes = ...,
+        message_index: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["message", b"message", "message_index", b"message_index"]) -> None: ...
+
+global___RuntimeInputMessage = RuntimeInputMessage
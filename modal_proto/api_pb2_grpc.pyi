@@ -0,0 +1,1190 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+import abc
+import collections.abc
+import google.protobuf.empty_pb2
+import grpc
+import modal_proto.api_pb2
+
+class ModalClientStub:
+    def __init__(self, channel: grpc.Channel) -> None: ...
+    AppCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.AppCreateRequest,
+        modal_proto.api_pb2.AppCreateResponse,
+    ]
+    """Apps"""
+    AppClientDisconnect: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.AppClientDisconnectRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    AppGetLogs: grpc.UnaryStreamMultiCallable[
+        modal_proto.api_pb2.AppGetLogsRequest,
+        modal_proto.api_pb2.TaskLogsBatch,
+    ]
+    AppSetObjects: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.AppSetObjectsRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    AppGetObjects: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.AppGetObjectsRequest,
+        modal_proto.api_pb2.AppGetObjectsResponse,
+    ]
+    AppList: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.AppListRequest,
+        modal_proto.api_pb2.AppListResponse,
+    ]
+    AppLookupObject: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.AppLookupObjectRequest,
+        modal_proto.api_pb2.AppLookupObjectResponse,
+    ]
+    AppDeploy: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.AppDeployRequest,
+        modal_proto.api_pb2.AppDeployResponse,
+    ]
+    AppDeploySingleObject: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.AppDeploySingleObjectRequest,
+        modal_proto.api_pb2.AppDeploySingleObjectResponse,
+    ]
+    AppGetByDeploymentName: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.AppGetByDeploymentNameRequest,
+        modal_proto.api_pb2.AppGetByDeploymentNameResponse,
+    ]
+    AppStop: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.AppStopRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    AppHeartbeat: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.AppHeartbeatRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    BlobCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.BlobCreateRequest,
+        modal_proto.api_pb2.BlobCreateResponse,
+    ]
+    """Blobs"""
+    BlobGet: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.BlobGetRequest,
+        modal_proto.api_pb2.BlobGetResponse,
+    ]
+    ClassCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.ClassCreateRequest,
+        modal_proto.api_pb2.ClassCreateResponse,
+    ]
+    """Classes"""
+    ClassGet: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.ClassGetRequest,
+        modal_proto.api_pb2.ClassGetResponse,
+    ]
+    ClientCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.ClientCreateRequest,
+        modal_proto.api_pb2.ClientCreateResponse,
+    ]
+    """Clients"""
+    ClientHello: grpc.UnaryUnaryMultiCallable[
+        google.protobuf.empty_pb2.Empty,
+        modal_proto.api_pb2.ClientHelloResponse,
+    ]
+    ClientHeartbeat: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.ClientHeartbeatRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    ContainerHeartbeat: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.ContainerHeartbeatRequest,
+        modal_proto.api_pb2.ContainerHeartbeatResponse,
+    ]
+    """Container"""
+    ContainerExec: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.ContainerExecRequest,
+        modal_proto.api_pb2.ContainerExecResponse,
+    ]
+    ContainerExecGetOutput: grpc.UnaryStreamMultiCallable[
+        modal_proto.api_pb2.ContainerExecGetOutputRequest,
+        modal_proto.api_pb2.RuntimeOutputBatch,
+    ]
+    ContainerExecPutInput: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.ContainerExecPutInputRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    ContainerCheckpoint: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.ContainerCheckpointRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    """Checkpointing"""
+    DictClear: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DictClearRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    """Dicts"""
+    DictCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DictCreateRequest,
+        modal_proto.api_pb2.DictCreateResponse,
+    ]
+    """Will be superseded by DictGetOrCreate"""
+    DictGetOrCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DictGetOrCreateRequest,
+        modal_proto.api_pb2.DictGetOrCreateResponse,
+    ]
+    DictHeartbeat: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DictHeartbeatRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    DictUpdate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DictUpdateRequest,
+        modal_proto.api_pb2.DictUpdateResponse,
+    ]
+    DictGet: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DictGetRequest,
+        modal_proto.api_pb2.DictGetResponse,
+    ]
+    DictPop: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DictPopRequest,
+        modal_proto.api_pb2.DictPopResponse,
+    ]
+    DictContains: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DictContainsRequest,
+        modal_proto.api_pb2.DictContainsResponse,
+    ]
+    DictLen: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DictLenRequest,
+        modal_proto.api_pb2.DictLenResponse,
+    ]
+    DomainCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DomainCreateRequest,
+        modal_proto.api_pb2.DomainCreateResponse,
+    ]
+    """Domains"""
+    DomainList: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DomainListRequest,
+        modal_proto.api_pb2.DomainListResponse,
+    ]
+    DomainCertificateVerify: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.DomainCertificateVerifyRequest,
+        modal_proto.api_pb2.DomainCertificateVerifyResponse,
+    ]
+    EnvironmentCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.EnvironmentCreateRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    """Environments"""
+    EnvironmentList: grpc.UnaryUnaryMultiCallable[
+        google.protobuf.empty_pb2.Empty,
+        modal_proto.api_pb2.EnvironmentListResponse,
+    ]
+    EnvironmentDelete: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.EnvironmentDeleteRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    EnvironmentUpdate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.EnvironmentUpdateRequest,
+        modal_proto.api_pb2.EnvironmentListItem,
+    ]
+    FunctionBindParams: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionBindParamsRequest,
+        modal_proto.api_pb2.FunctionBindParamsResponse,
+    ]
+    """Functions"""
+    FunctionCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionCreateRequest,
+        modal_proto.api_pb2.FunctionCreateResponse,
+    ]
+    FunctionGet: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionGetRequest,
+        modal_proto.api_pb2.FunctionGetResponse,
+    ]
+    FunctionGetCallGraph: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionGetCallGraphRequest,
+        modal_proto.api_pb2.FunctionGetCallGraphResponse,
+    ]
+    FunctionGetCurrentStats: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionGetCurrentStatsRequest,
+        modal_proto.api_pb2.FunctionStats,
+    ]
+    FunctionGetInputs: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionGetInputsRequest,
+        modal_proto.api_pb2.FunctionGetInputsResponse,
+    ]
+    """For containers to request next call"""
+    FunctionGetOutputs: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionGetOutputsRequest,
+        modal_proto.api_pb2.FunctionGetOutputsResponse,
+    ]
+    """Returns the next result(s) for an entire function call (FunctionMap)"""
+    FunctionGetSerialized: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionGetSerializedRequest,
+        modal_proto.api_pb2.FunctionGetSerializedResponse,
+    ]
+    FunctionMap: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionMapRequest,
+        modal_proto.api_pb2.FunctionMapResponse,
+    ]
+    FunctionPrecreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionPrecreateRequest,
+        modal_proto.api_pb2.FunctionPrecreateResponse,
+    ]
+    FunctionPutInputs: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionPutInputsRequest,
+        modal_proto.api_pb2.FunctionPutInputsResponse,
+    ]
+    FunctionPutOutputs: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionPutOutputsRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    """For containers to return result"""
+    FunctionUpdateSchedulingParams: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionUpdateSchedulingParamsRequest,
+        modal_proto.api_pb2.FunctionUpdateSchedulingParamsResponse,
+    ]
+    FunctionCallCancel: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionCallCancelRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    """Function calls"""
+    FunctionCallList: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionCallListRequest,
+        modal_proto.api_pb2.FunctionCallListResponse,
+    ]
+    FunctionCallGetDataIn: grpc.UnaryStreamMultiCallable[
+        modal_proto.api_pb2.FunctionCallGetDataRequest,
+        modal_proto.api_pb2.DataChunk,
+    ]
+    FunctionCallGetDataOut: grpc.UnaryStreamMultiCallable[
+        modal_proto.api_pb2.FunctionCallGetDataRequest,
+        modal_proto.api_pb2.DataChunk,
+    ]
+    FunctionCallPutDataOut: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.FunctionCallPutDataRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    FunctionStartPtyShell: grpc.UnaryUnaryMultiCallable[
+        google.protobuf.empty_pb2.Empty,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    """Interactive functions"""
+    ImageGetOrCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.ImageGetOrCreateRequest,
+        modal_proto.api_pb2.ImageGetOrCreateResponse,
+    ]
+    """Images"""
+    ImageJoinStreaming: grpc.UnaryStreamMultiCallable[
+        modal_proto.api_pb2.ImageJoinStreamingRequest,
+        modal_proto.api_pb2.ImageJoinStreamingResponse,
+    ]
+    MountPutFile: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.MountPutFileRequest,
+        modal_proto.api_pb2.MountPutFileResponse,
+    ]
+    """Mounts"""
+    MountBuild: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.MountBuildRequest,
+        modal_proto.api_pb2.MountBuildResponse,
+    ]
+    MountGetOrCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.MountGetOrCreateRequest,
+        modal_proto.api_pb2.MountGetOrCreateResponse,
+    ]
+    ProxyGetOrCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.ProxyGetOrCreateRequest,
+        modal_proto.api_pb2.ProxyGetOrCreateResponse,
+    ]
+    """Proxies"""
+    QueueCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.QueueCreateRequest,
+        modal_proto.api_pb2.QueueCreateResponse,
+    ]
+    """Queues"""
+    QueueGetOrCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.QueueGetOrCreateRequest,
+        modal_proto.api_pb2.QueueGetOrCreateResponse,
+    ]
+    QueueGet: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.QueueGetRequest,
+        modal_proto.api_pb2.QueueGetResponse,
+    ]
+    QueueHeartbeat: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.QueueHeartbeatRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    QueuePut: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.QueuePutRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    QueueLen: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.QueueLenRequest,
+        modal_proto.api_pb2.QueueLenResponse,
+    ]
+    QueueNextItems: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.QueueNextItemsRequest,
+        modal_proto.api_pb2.QueueNextItemsResponse,
+    ]
+    SandboxCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SandboxCreateRequest,
+        modal_proto.api_pb2.SandboxCreateResponse,
+    ]
+    """Sandboxes"""
+    SandboxGetTaskId: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SandboxGetTaskIdRequest,
+        modal_proto.api_pb2.SandboxGetTaskIdResponse,
+    ]
+    """needed for modal container exec"""
+    SandboxGetLogs: grpc.UnaryStreamMultiCallable[
+        modal_proto.api_pb2.SandboxGetLogsRequest,
+        modal_proto.api_pb2.TaskLogsBatch,
+    ]
+    SandboxWait: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SandboxWaitRequest,
+        modal_proto.api_pb2.SandboxWaitResponse,
+    ]
+    SandboxList: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SandboxListRequest,
+        modal_proto.api_pb2.SandboxListResponse,
+    ]
+    SandboxTerminate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SandboxTerminateRequest,
+        modal_proto.api_pb2.SandboxTerminateResponse,
+    ]
+    SandboxStdinWrite: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SandboxStdinWriteRequest,
+        modal_proto.api_pb2.SandboxStdinWriteResponse,
+    ]
+    SecretCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SecretCreateRequest,
+        modal_proto.api_pb2.SecretCreateResponse,
+    ]
+    """Secrets
+    Not used by client anymore
+    """
+    SecretGetOrCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SecretGetOrCreateRequest,
+        modal_proto.api_pb2.SecretGetOrCreateResponse,
+    ]
+    SecretList: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SecretListRequest,
+        modal_proto.api_pb2.SecretListResponse,
+    ]
+    SharedVolumeGetOrCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SharedVolumeGetOrCreateRequest,
+        modal_proto.api_pb2.SharedVolumeGetOrCreateResponse,
+    ]
+    """SharedVolumes"""
+    SharedVolumeCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SharedVolumeCreateRequest,
+        modal_proto.api_pb2.SharedVolumeCreateResponse,
+    ]
+    SharedVolumeHeartbeat: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SharedVolumeHeartbeatRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    SharedVolumeList: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SharedVolumeListRequest,
+        modal_proto.api_pb2.SharedVolumeListResponse,
+    ]
+    SharedVolumeListFiles: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SharedVolumeListFilesRequest,
+        modal_proto.api_pb2.SharedVolumeListFilesResponse,
+    ]
+    SharedVolumeListFilesStream: grpc.UnaryStreamMultiCallable[
+        modal_proto.api_pb2.SharedVolumeListFilesRequest,
+        modal_proto.api_pb2.SharedVolumeListFilesResponse,
+    ]
+    SharedVolumePutFile: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SharedVolumePutFileRequest,
+        modal_proto.api_pb2.SharedVolumePutFileResponse,
+    ]
+    SharedVolumeGetFile: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SharedVolumeGetFileRequest,
+        modal_proto.api_pb2.SharedVolumeGetFileResponse,
+    ]
+    SharedVolumeRemoveFile: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.SharedVolumeRemoveFileRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    TaskResult: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.TaskResultRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    """Tasks"""
+    TaskList: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.TaskListRequest,
+        modal_proto.api_pb2.TaskListResponse,
+    ]
+    TaskCurrentInputs: grpc.UnaryUnaryMultiCallable[
+        google.protobuf.empty_pb2.Empty,
+        modal_proto.api_pb2.TaskCurrentInputsResponse,
+    ]
+    """Gets the inputs currently assigned to the requesting task, requires task metadata for auth"""
+    TokenFlowCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.TokenFlowCreateRequest,
+        modal_proto.api_pb2.TokenFlowCreateResponse,
+    ]
+    """Tokens (web auth flow)"""
+    TokenFlowWait: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.TokenFlowWaitRequest,
+        modal_proto.api_pb2.TokenFlowWaitResponse,
+    ]
+    TunnelStart: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.TunnelStartRequest,
+        modal_proto.api_pb2.TunnelStartResponse,
+    ]
+    """Tunnels"""
+    TunnelStop: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.TunnelStopRequest,
+        modal_proto.api_pb2.TunnelStopResponse,
+    ]
+    VolumeGetOrCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.VolumeGetOrCreateRequest,
+        modal_proto.api_pb2.VolumeGetOrCreateResponse,
+    ]
+    """Volumes"""
+    VolumeCreate: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.VolumeCreateRequest,
+        modal_proto.api_pb2.VolumeCreateResponse,
+    ]
+    VolumeHeartbeat: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.VolumeHeartbeatRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    VolumeCommit: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.VolumeCommitRequest,
+        modal_proto.api_pb2.VolumeCommitResponse,
+    ]
+    VolumeDelete: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.VolumeDeleteRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    VolumeGetFile: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.VolumeGetFileRequest,
+        modal_proto.api_pb2.VolumeGetFileResponse,
+    ]
+    VolumeList: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.VolumeListRequest,
+        modal_proto.api_pb2.VolumeListResponse,
+    ]
+    VolumeListFiles: grpc.UnaryStreamMultiCallable[
+        modal_proto.api_pb2.VolumeListFilesRequest,
+        modal_proto.api_pb2.VolumeListFilesResponse,
+    ]
+    VolumePutFiles: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.VolumePutFilesRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    VolumeReload: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.VolumeReloadRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    VolumeRemoveFile: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.VolumeRemoveFileRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    VolumeCopyFiles: grpc.UnaryUnaryMultiCallable[
+        modal_proto.api_pb2.VolumeCopyFilesRequest,
+        google.protobuf.empty_pb2.Empty,
+    ]
+    WorkspaceNameLookup: grpc.UnaryUnaryMultiCallable[
+        google.protobuf.empty_pb2.Empty,
+        modal_proto.api_pb2.WorkspaceNameLookupResponse,
+    ]
+    """Workspaces"""
+
+class ModalClientServicer(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def AppCreate(
+        self,
+        request: modal_proto.api_pb2.AppCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.AppCreateResponse:
+        """Apps"""
+    @abc.abstractmethod
+    def AppClientDisconnect(
+        self,
+        request: modal_proto.api_pb2.AppClientDisconnectRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def AppGetLogs(
+        self,
+        request: modal_proto.api_pb2.AppGetLogsRequest,
+        context: grpc.ServicerContext,
+    ) -> collections.abc.Iterator[modal_proto.api_pb2.TaskLogsBatch]: ...
+    @abc.abstractmethod
+    def AppSetObjects(
+        self,
+        request: modal_proto.api_pb2.AppSetObjectsRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def AppGetObjects(
+        self,
+        request: modal_proto.api_pb2.AppGetObjectsRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.AppGetObjectsResponse: ...
+    @abc.abstractmethod
+    def AppList(
+        self,
+        request: modal_proto.api_pb2.AppListRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.AppListResponse: ...
+    @abc.abstractmethod
+    def AppLookupObject(
+        self,
+        request: modal_proto.api_pb2.AppLookupObjectRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.AppLookupObjectResponse: ...
+    @abc.abstractmethod
+    def AppDeploy(
+        self,
+        request: modal_proto.api_pb2.AppDeployRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.AppDeployResponse: ...
+    @abc.abstractmethod
+    def AppDeploySingleObject(
+        self,
+        request: modal_proto.api_pb2.AppDeploySingleObjectRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.AppDeploySingleObjectResponse: ...
+    @abc.abstractmethod
+    def AppGetByDeploymentName(
+        self,
+        request: modal_proto.api_pb2.AppGetByDeploymentNameRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.AppGetByDeploymentNameResponse: ...
+    @abc.abstractmethod
+    def AppStop(
+        self,
+        request: modal_proto.api_pb2.AppStopRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def AppHeartbeat(
+        self,
+        request: modal_proto.api_pb2.AppHeartbeatRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def BlobCreate(
+        self,
+        request: modal_proto.api_pb2.BlobCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.BlobCreateResponse:
+        """Blobs"""
+    @abc.abstractmethod
+    def BlobGet(
+        self,
+        request: modal_proto.api_pb2.BlobGetRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.BlobGetResponse: ...
+    @abc.abstractmethod
+    def ClassCreate(
+        self,
+        request: modal_proto.api_pb2.ClassCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.ClassCreateResponse:
+        """Classes"""
+    @abc.abstractmethod
+    def ClassGet(
+        self,
+        request: modal_proto.api_pb2.ClassGetRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.ClassGetResponse: ...
+    @abc.abstractmethod
+    def ClientCreate(
+        self,
+        request: modal_proto.api_pb2.ClientCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.ClientCreateResponse:
+        """Clients"""
+    @abc.abstractmethod
+    def ClientHello(
+        self,
+        request: google.protobuf.empty_pb2.Empty,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.ClientHelloResponse: ...
+    @abc.abstractmethod
+    def ClientHeartbeat(
+        self,
+        request: modal_proto.api_pb2.ClientHeartbeatRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def ContainerHeartbeat(
+        self,
+        request: modal_proto.api_pb2.ContainerHeartbeatRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.ContainerHeartbeatResponse:
+        """Container"""
+    @abc.abstractmethod
+    def ContainerExec(
+        self,
+        request: modal_proto.api_pb2.ContainerExecRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.ContainerExecResponse: ...
+    @abc.abstractmethod
+    def ContainerExecGetOutput(
+        self,
+        request: modal_proto.api_pb2.ContainerExecGetOutputRequest,
+        context: grpc.ServicerContext,
+    ) -> collections.abc.Iterator[modal_proto.api_pb2.RuntimeOutputBatch]: ...
+    @abc.abstractmethod
+    def ContainerExecPutInput(
+        self,
+        request: modal_proto.api_pb2.ContainerExecPutInputRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def ContainerCheckpoint(
+        self,
+        request: modal_proto.api_pb2.ContainerCheckpointRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty:
+        """Checkpointing"""
+    @abc.abstractmethod
+    def DictClear(
+        self,
+        request: modal_proto.api_pb2.DictClearRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty:
+        """Dicts"""
+    @abc.abstractmethod
+    def DictCreate(
+        self,
+        request: modal_proto.api_pb2.DictCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.DictCreateResponse:
+        """Will be superseded by DictGetOrCreate"""
+    @abc.abstractmethod
+    def DictGetOrCreate(
+        self,
+        request: modal_proto.api_pb2.DictGetOrCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.DictGetOrCreateResponse: ...
+    @abc.abstractmethod
+    def DictHeartbeat(
+        self,
+        request: modal_proto.api_pb2.DictHeartbeatRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def DictUpdate(
+        self,
+        request: modal_proto.api_pb2.DictUpdateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.DictUpdateResponse: ...
+    @abc.abstractmethod
+    def DictGet(
+        self,
+        request: modal_proto.api_pb2.DictGetRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.DictGetResponse: ...
+    @abc.abstractmethod
+    def DictPop(
+        self,
+        request: modal_proto.api_pb2.DictPopRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.DictPopResponse: ...
+    @abc.abstractmethod
+    def DictContains(
+        self,
+        request: modal_proto.api_pb2.DictContainsRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.DictContainsResponse: ...
+    @abc.abstractmethod
+    def DictLen(
+        self,
+        request: modal_proto.api_pb2.DictLenRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.DictLenResponse: ...
+    @abc.abstractmethod
+    def DomainCreate(
+        self,
+        request: modal_proto.api_pb2.DomainCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.DomainCreateResponse:
+        """Domains"""
+    @abc.abstractmethod
+    def DomainList(
+        self,
+        request: modal_proto.api_pb2.DomainListRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.DomainListResponse: ...
+    @abc.abstractmethod
+    def DomainCertificateVerify(
+        self,
+        request: modal_proto.api_pb2.DomainCertificateVerifyRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.DomainCertificateVerifyResponse: ...
+    @abc.abstractmethod
+    def EnvironmentCreate(
+        self,
+        request: modal_proto.api_pb2.EnvironmentCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty:
+        """Environments"""
+    @abc.abstractmethod
+    def EnvironmentList(
+        self,
+        request: google.protobuf.empty_pb2.Empty,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.EnvironmentListResponse: ...
+    @abc.abstractmethod
+    def EnvironmentDelete(
+        self,
+        request: modal_proto.api_pb2.EnvironmentDeleteRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def EnvironmentUpdate(
+        self,
+        request: modal_proto.api_pb2.EnvironmentUpdateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.EnvironmentListItem: ...
+    @abc.abstractmethod
+    def FunctionBindParams(
+        self,
+        request: modal_proto.api_pb2.FunctionBindParamsRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionBindParamsResponse:
+        """Functions"""
+    @abc.abstractmethod
+    def FunctionCreate(
+        self,
+        request: modal_proto.api_pb2.FunctionCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionCreateResponse: ...
+    @abc.abstractmethod
+    def FunctionGet(
+        self,
+        request: modal_proto.api_pb2.FunctionGetRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionGetResponse: ...
+    @abc.abstractmethod
+    def FunctionGetCallGraph(
+        self,
+        request: modal_proto.api_pb2.FunctionGetCallGraphRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionGetCallGraphResponse: ...
+    @abc.abstractmethod
+    def FunctionGetCurrentStats(
+        self,
+        request: modal_proto.api_pb2.FunctionGetCurrentStatsRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionStats: ...
+    @abc.abstractmethod
+    def FunctionGetInputs(
+        self,
+        request: modal_proto.api_pb2.FunctionGetInputsRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionGetInputsResponse:
+        """For containers to request next call"""
+    @abc.abstractmethod
+    def FunctionGetOutputs(
+        self,
+        request: modal_proto.api_pb2.FunctionGetOutputsRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionGetOutputsResponse:
+        """Returns the next result(s) for an entire function call (FunctionMap)"""
+    @abc.abstractmethod
+    def FunctionGetSerialized(
+        self,
+        request: modal_proto.api_pb2.FunctionGetSerializedRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionGetSerializedResponse: ...
+    @abc.abstractmethod
+    def FunctionMap(
+        self,
+        request: modal_proto.api_pb2.FunctionMapRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionMapResponse: ...
+    @abc.abstractmethod
+    def FunctionPrecreate(
+        self,
+        request: modal_proto.api_pb2.FunctionPrecreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionPrecreateResponse: ...
+    @abc.abstractmethod
+    def FunctionPutInputs(
+        self,
+        request: modal_proto.api_pb2.FunctionPutInputsRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionPutInputsResponse: ...
+    @abc.abstractmethod
+    def FunctionPutOutputs(
+        self,
+        request: modal_proto.api_pb2.FunctionPutOutputsRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty:
+        """For containers to return result"""
+    @abc.abstractmethod
+    def FunctionUpdateSchedulingParams(
+        self,
+        request: modal_proto.api_pb2.FunctionUpdateSchedulingParamsRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionUpdateSchedulingParamsResponse: ...
+    @abc.abstractmethod
+    def FunctionCallCancel(
+        self,
+        request: modal_proto.api_pb2.FunctionCallCancelRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty:
+        """Function calls"""
+    @abc.abstractmethod
+    def FunctionCallList(
+        self,
+        request: modal_proto.api_pb2.FunctionCallListRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.FunctionCallListResponse: ...
+    @abc.abstractmethod
+    def FunctionCallGetDataIn(
+        self,
+        request: modal_proto.api_pb2.FunctionCallGetDataRequest,
+        context: grpc.ServicerContext,
+    ) -> collections.abc.Iterator[modal_proto.api_pb2.DataChunk]: ...
+    @abc.abstractmethod
+    def FunctionCallGetDataOut(
+        self,
+        request: modal_proto.api_pb2.FunctionCallGetDataRequest,
+        context: grpc.ServicerContext,
+    ) -> collections.abc.Iterator[modal_proto.api_pb2.DataChunk]: ...
+    @abc.abstractmethod
+    def FunctionCallPutDataOut(
+        self,
+        request: modal_proto.api_pb2.FunctionCallPutDataRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def FunctionStartPtyShell(
+        self,
+        request: google.protobuf.empty_pb2.Empty,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty:
+        """Interactive functions"""
+    @abc.abstractmethod
+    def ImageGetOrCreate(
+        self,
+        request: modal_proto.api_pb2.ImageGetOrCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.ImageGetOrCreateResponse:
+        """Images"""
+    @abc.abstractmethod
+    def ImageJoinStreaming(
+        self,
+        request: modal_proto.api_pb2.ImageJoinStreamingRequest,
+        context: grpc.ServicerContext,
+    ) -> collections.abc.Iterator[modal_proto.api_pb2.ImageJoinStreamingResponse]: ...
+    @abc.abstractmethod
+    def MountPutFile(
+        self,
+        request: modal_proto.api_pb2.MountPutFileRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.MountPutFileResponse:
+        """Mounts"""
+    @abc.abstractmethod
+    def MountBuild(
+        self,
+        request: modal_proto.api_pb2.MountBuildRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.MountBuildResponse: ...
+    @abc.abstractmethod
+    def MountGetOrCreate(
+        self,
+        request: modal_proto.api_pb2.MountGetOrCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.MountGetOrCreateResponse: ...
+    @abc.abstractmethod
+    def ProxyGetOrCreate(
+        self,
+        request: modal_proto.api_pb2.ProxyGetOrCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.ProxyGetOrCreateResponse:
+        """Proxies"""
+    @abc.abstractmethod
+    def QueueCreate(
+        self,
+        request: modal_proto.api_pb2.QueueCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.QueueCreateResponse:
+        """Queues"""
+    @abc.abstractmethod
+    def QueueGetOrCreate(
+        self,
+        request: modal_proto.api_pb2.QueueGetOrCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.QueueGetOrCreateResponse: ...
+    @abc.abstractmethod
+    def QueueGet(
+        self,
+        request: modal_proto.api_pb2.QueueGetRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.QueueGetResponse: ...
+    @abc.abstractmethod
+    def QueueHeartbeat(
+        self,
+        request: modal_proto.api_pb2.QueueHeartbeatRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def QueuePut(
+        self,
+        request: modal_proto.api_pb2.QueuePutRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def QueueLen(
+        self,
+        request: modal_proto.api_pb2.QueueLenRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.QueueLenResponse: ...
+    @abc.abstractmethod
+    def QueueNextItems(
+        self,
+        request: modal_proto.api_pb2.QueueNextItemsRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.QueueNextItemsResponse: ...
+    @abc.abstractmethod
+    def SandboxCreate(
+        self,
+        request: modal_proto.api_pb2.SandboxCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SandboxCreateResponse:
+        """Sandboxes"""
+    @abc.abstractmethod
+    def SandboxGetTaskId(
+        self,
+        request: modal_proto.api_pb2.SandboxGetTaskIdRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SandboxGetTaskIdResponse:
+        """needed for modal container exec"""
+    @abc.abstractmethod
+    def SandboxGetLogs(
+        self,
+        request: modal_proto.api_pb2.SandboxGetLogsRequest,
+        context: grpc.ServicerContext,
+    ) -> collections.abc.Iterator[modal_proto.api_pb2.TaskLogsBatch]: ...
+    @abc.abstractmethod
+    def SandboxWait(
+        self,
+        request: modal_proto.api_pb2.SandboxWaitRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SandboxWaitResponse: ...
+    @abc.abstractmethod
+    def SandboxList(
+        self,
+        request: modal_proto.api_pb2.SandboxListRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SandboxListResponse: ...
+    @abc.abstractmethod
+    def SandboxTerminate(
+        self,
+        request: modal_proto.api_pb2.SandboxTerminateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SandboxTerminateResponse: ...
+    @abc.abstractmethod
+    def SandboxStdinWrite(
+        self,
+        request: modal_proto.api_pb2.SandboxStdinWriteRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SandboxStdinWriteResponse: ...
+    @abc.abstractmethod
+    def SecretCreate(
+        self,
+        request: modal_proto.api_pb2.SecretCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SecretCreateResponse:
+        """Secrets
+        Not used by client anymore
+        """
+    @abc.abstractmethod
+    def SecretGetOrCreate(
+        self,
+        request: modal_proto.api_pb2.SecretGetOrCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SecretGetOrCreateResponse: ...
+    @abc.abstractmethod
+    def SecretList(
+        self,
+        request: modal_proto.api_pb2.SecretListRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SecretListResponse: ...
+    @abc.abstractmethod
+    def SharedVolumeGetOrCreate(
+        self,
+        request: modal_proto.api_pb2.SharedVolumeGetOrCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SharedVolumeGetOrCreateResponse:
+        """SharedVolumes"""
+    @abc.abstractmethod
+    def SharedVolumeCreate(
+        self,
+        request: modal_proto.api_pb2.SharedVolumeCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SharedVolumeCreateResponse: ...
+    @abc.abstractmethod
+    def SharedVolumeHeartbeat(
+        self,
+        request: modal_proto.api_pb2.SharedVolumeHeartbeatRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def SharedVolumeList(
+        self,
+        request: modal_proto.api_pb2.SharedVolumeListRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SharedVolumeListResponse: ...
+    @abc.abstractmethod
+    def SharedVolumeListFiles(
+        self,
+        request: modal_proto.api_pb2.SharedVolumeListFilesRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SharedVolumeListFilesResponse: ...
+    @abc.abstractmethod
+    def SharedVolumeListFilesStream(
+        self,
+        request: modal_proto.api_pb2.SharedVolumeListFilesRequest,
+        context: grpc.ServicerContext,
+    ) -> collections.abc.Iterator[modal_proto.api_pb2.SharedVolumeListFilesResponse]: ...
+    @abc.abstractmethod
+    def SharedVolumePutFile(
+        self,
+        request: modal_proto.api_pb2.SharedVolumePutFileRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SharedVolumePutFileResponse: ...
+    @abc.abstractmethod
+    def SharedVolumeGetFile(
+        self,
+        request: modal_proto.api_pb2.SharedVolumeGetFileRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.SharedVolumeGetFileResponse: ...
+    @abc.abstractmethod
+    def SharedVolumeRemoveFile(
+        self,
+        request: modal_proto.api_pb2.SharedVolumeRemoveFileRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def TaskResult(
+        self,
+        request: modal_proto.api_pb2.TaskResultRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty:
+        """Tasks"""
+    @abc.abstractmethod
+    def TaskList(
+        self,
+        request: modal_proto.api_pb2.TaskListRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.TaskListResponse: ...
+    @abc.abstractmethod
+    def TaskCurrentInputs(
+        self,
+        request: google.protobuf.empty_pb2.Empty,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.TaskCurrentInputsResponse:
+        """Gets the inputs currently assigned to the requesting task, requires task metadata for auth"""
+    @abc.abstractmethod
+    def TokenFlowCreate(
+        self,
+        request: modal_proto.api_pb2.TokenFlowCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.TokenFlowCreateResponse:
+        """Tokens (web auth flow)"""
+    @abc.abstractmethod
+    def TokenFlowWait(
+        self,
+        request: modal_proto.api_pb2.TokenFlowWaitRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.TokenFlowWaitResponse: ...
+    @abc.abstractmethod
+    def TunnelStart(
+        self,
+        request: modal_proto.api_pb2.TunnelStartRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.TunnelStartResponse:
+        """Tunnels"""
+    @abc.abstractmethod
+    def TunnelStop(
+        self,
+        request: modal_proto.api_pb2.TunnelStopRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.TunnelStopResponse: ...
+    @abc.abstractmethod
+    def VolumeGetOrCreate(
+        self,
+        request: modal_proto.api_pb2.VolumeGetOrCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.VolumeGetOrCreateResponse:
+        """Volumes"""
+    @abc.abstractmethod
+    def VolumeCreate(
+        self,
+        request: modal_proto.api_pb2.VolumeCreateRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.VolumeCreateResponse: ...
+    @abc.abstractmethod
+    def VolumeHeartbeat(
+        self,
+        request: modal_proto.api_pb2.VolumeHeartbeatRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def VolumeCommit(
+        self,
+        request: modal_proto.api_pb2.VolumeCommitRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.VolumeCommitResponse: ...
+    @abc.abstractmethod
+    def VolumeDelete(
+        self,
+        request: modal_proto.api_pb2.VolumeDeleteRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def VolumeGetFile(
+        self,
+        request: modal_proto.api_pb2.VolumeGetFileRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.VolumeGetFileResponse: ...
+    @abc.abstractmethod
+    def VolumeList(
+        self,
+        request: modal_proto.api_pb2.VolumeListRequest,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.VolumeListResponse: ...
+    @abc.abstractmethod
+    def VolumeListFiles(
+        self,
+        request: modal_proto.api_pb2.VolumeListFilesRequest,
+        context: grpc.ServicerContext,
+    ) -> collections.abc.Iterator[modal_proto.api_pb2.VolumeListFilesResponse]: ...
+    @abc.abstractmethod
+    def VolumePutFiles(
+        self,
+        request: modal_proto.api_pb2.VolumePutFilesRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def VolumeReload(
+        self,
+        request: modal_proto.api_pb2.VolumeReloadRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def VolumeRemoveFile(
+        self,
+        request: modal_proto.api_pb2.VolumeRemoveFileRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def VolumeCopyFiles(
+        self,
+        request: modal_proto.api_pb2.VolumeCopyFilesRequest,
+        context: grpc.ServicerContext,
+    ) -> google.protobuf.empty_pb2.Empty: ...
+    @abc.abstractmethod
+    def WorkspaceNameLookup(
+        self,
+        request: google.protobuf.empty_pb2.Empty,
+        context: grpc.ServicerContext,
+    ) -> modal_proto.api_pb2.WorkspaceNameLookupResponse:
+        """Workspaces"""
+
+def add_ModalClientServicer_to_server(servicer: ModalClientServicer, server: grpc.Server) -> None: ...
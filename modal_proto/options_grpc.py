@@ -0,0 +1,3 @@
+# Generated by the Protocol Buffers compiler. DO NOT EDIT!
+# source: modal_proto/options.proto
+# plugin: grpclib.plugin.main
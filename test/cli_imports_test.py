@@ -1,5 +1,7 @@
 # Copyright Modal Labs 2023
+import os
 import pytest
+import sys
 
 from modal._utils.async_utils import synchronizer
 from modal.cli.import_refs import (
@@ -109,6 +111,15 @@ def test_import_object(dir_structure, ref, expected_object_type, mock_dir):
         assert isinstance(_translated_obj, expected_object_type)
 
 
+def test_import_same_script_twice(mock_dir, monkeypatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    with mock_dir(dir_containing_python_package):
+        script_dir = os.path.realpath("pack")
+        import_file_or_module("pack/file.py")
+        import_file_or_module("pack/file.py")
+        assert sys.path.count(script_dir) == 1
+
+
 def test_import_package_and_module_names(monkeypatch, supports_dir):
     # We try to reproduce the package/module naming standard that the `python` command line tool uses,
     # i.e. when loading using a module path (-m flag w/ python) you get a fully qualified package/module name
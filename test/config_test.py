@@ -4,6 +4,7 @@ import pathlib
 import pytest
 import subprocess
 import sys
+from typing import Dict, Optional
 
 import toml
 
@@ -43,6 +44,49 @@ def test_config_env_override():
     assert config["server_url"] == "xyz.corp"
 
 
+def _get_event_loop_policy(env: Optional[Dict[str, Optional[str]]] = None, uvloop_stub: bool = False):
+    # Imports modal in a fresh interpreter, since the uvloop setting is applied at import time
+    if uvloop_stub:
+        setup = (
+            "import types; uvloop = types.ModuleType('uvloop');"
+            " uvloop.EventLoopPolicy = type('EventLoopPolicy', (asyncio.DefaultEventLoopPolicy,), {});"
+            " sys.modules['uvloop'] = uvloop"
+        )
+    else:
+        setup = "sys.modules['uvloop'] = None"  # makes `import uvloop` raise ImportError
+    code = f"import asyncio, sys; {setup}; import modal; print(type(asyncio.get_event_loop_policy()).__name__)"
+    env = {k: v for k, v in {**os.environ, **(env or {})}.items() if v is not None}  # None unsets a variable
+    ret = subprocess.run([sys.executable, "-c", code], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert ret.returncode == 0, ret.stderr.decode()
+    return ret.stdout.decode().strip(), ret.stderr.decode()
+
+
+def test_config_uvloop_not_installed():
+    policy, stderr = _get_event_loop_policy(env={"MODAL_UVLOOP": "1"})
+    assert policy != "EventLoopPolicy"
+    assert "uvloop is enabled in the config but not installed" in stderr
+
+
+def test_config_uvloop_installed():
+    policy, stderr = _get_event_loop_policy(env={"MODAL_UVLOOP": "1"}, uvloop_stub=True)
+    assert policy == "EventLoopPolicy"
+    assert "uvloop" not in stderr
+
+
+@pytest.mark.parametrize("value", [None, "0", "false", "False"])
+def test_config_uvloop_disabled(value):
+    policy, stderr = _get_event_loop_policy(env={"MODAL_UVLOOP": value}, uvloop_stub=True)
+    assert policy != "EventLoopPolicy"
+    assert "uvloop" not in stderr
+
+
+@pytest.mark.parametrize("toml_value, enabled", [("false", False), ("true", True)])
+def test_config_uvloop_toml(modal_config, toml_value, enabled):
+    with modal_config(f"[test]\nactive = true\nuvloop = {toml_value}\n"):
+        policy, _ = _get_event_loop_policy(env={"MODAL_UVLOOP": None}, uvloop_stub=True)
+    assert (policy == "EventLoopPolicy") == enabled
+
+
 def test_config_store_user(servicer, modal_config):
     with modal_config(show_on_error=True) as config_file_path:
         env = {"MODAL_SERVER_URL": servicer.remote_addr}
@@ -81,6 +81,7 @@ class MockClientServicer(api_grpc.ModalClientBase):
         self.rate_limit_sleep_duration = None
         self.fail_get_inputs = False
         self.slow_put_inputs = False
+        self.slow_put_inputs_delay = 0.001
         self.container_inputs = []
         self.container_outputs = []
         self.fc_data_in = defaultdict(lambda: asyncio.Queue())  # unbounded
@@ -605,7 +606,7 @@ class MockClientServicer(api_grpc.ModalClientBase):
             response_items.append(api_pb2.FunctionPutInputsResponseItem(input_id=input_id, idx=item.idx))
             function_call_inputs.append(((item.idx, input_id), (args, kwargs)))
         if self.slow_put_inputs:
-            await asyncio.sleep(0.001)
+            await asyncio.sleep(self.slow_put_inputs_delay)
         await stream.send_message(api_pb2.FunctionPutInputsResponse(inputs=response_items))
 
     async def FunctionGetOutputs(self, stream):
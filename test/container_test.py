@@ -43,10 +43,17 @@ FUNCTION_CALL_ID = "fc-123"
 SLEEP_DELAY = 0.1
 
 
+# Input used by tests that don't pass their own args, serialized once for the whole module
+DEFAULT_INPUT = api_pb2.FunctionInput(args=serialize(((42,), {})), data_format=api_pb2.DATA_FORMAT_PICKLE)
+
+
 def _get_inputs(
-    args: Tuple[Tuple, Dict] = ((42,), {}), n: int = 1, kill_switch=True
+    args: Optional[Tuple[Tuple, Dict]] = None, n: int = 1, kill_switch=True
 ) -> List[api_pb2.FunctionGetInputsResponse]:
-    input_pb = api_pb2.FunctionInput(args=serialize(args), data_format=api_pb2.DATA_FORMAT_PICKLE)
+    if args is None:
+        input_pb = DEFAULT_INPUT
+    else:
+        input_pb = api_pb2.FunctionInput(args=serialize(args), data_format=api_pb2.DATA_FORMAT_PICKLE)
     inputs = [
         *(
             api_pb2.FunctionGetInputsItem(input_id=f"in-xyz{i}", function_call_id="fc-123", input=input_pb)
@@ -267,9 +274,9 @@ def _unwrap_asgi(ret: ContainerResult):
 
 @skip_windows_unix_socket
 def test_success(unix_servicer, event_loop):
-    t0 = time.time()
+    t0 = time.monotonic()
     ret = _run_container(unix_servicer, "test.supports.functions", "square")
-    assert 0 <= time.time() - t0 < EXTRA_TOLERANCE_DELAY
+    assert 0 <= time.monotonic() - t0 < EXTRA_TOLERANCE_DELAY
     assert _unwrap_scalar(ret) == 42**2
 
 
@@ -306,9 +313,9 @@ def test_generator_failure(unix_servicer, capsys):
 
 @skip_windows_unix_socket
 def test_async(unix_servicer):
-    t0 = time.time()
+    t0 = time.monotonic()
     ret = _run_container(unix_servicer, "test.supports.functions", "square_async")
-    assert SLEEP_DELAY <= time.time() - t0 < SLEEP_DELAY + EXTRA_TOLERANCE_DELAY
+    assert SLEEP_DELAY <= time.monotonic() - t0 < SLEEP_DELAY + EXTRA_TOLERANCE_DELAY
     assert _unwrap_scalar(ret) == 42**2
 
 
@@ -334,10 +341,10 @@ def test_keyboardinterrupt(unix_servicer):
 
 @skip_windows_unix_socket
 def test_rate_limited(unix_servicer, event_loop):
-    t0 = time.time()
+    t0 = time.monotonic()
     unix_servicer.rate_limit_sleep_duration = 0.25
     ret = _run_container(unix_servicer, "test.supports.functions", "square")
-    assert 0.25 <= time.time() - t0 < 0.25 + EXTRA_TOLERANCE_DELAY
+    assert 0.25 <= time.monotonic() - t0 < 0.25 + EXTRA_TOLERANCE_DELAY
     assert _unwrap_scalar(ret) == 42**2
 
 
@@ -837,7 +844,7 @@ def test_concurrent_inputs_sync_function(unix_servicer):
     n_inputs = 18
     n_parallel = 6
 
-    t0 = time.time()
+    t0 = time.monotonic()
     ret = _run_container(
         unix_servicer,
         "test.supports.functions",
@@ -847,7 +854,7 @@ def test_concurrent_inputs_sync_function(unix_servicer):
     )
 
     expected_execution = n_inputs / n_parallel * SLEEP_TIME
-    assert expected_execution <= time.time() - t0 < expected_execution + EXTRA_TOLERANCE_DELAY
+    assert expected_execution <= time.monotonic() - t0 < expected_execution + EXTRA_TOLERANCE_DELAY
     outputs = _unwrap_concurrent_input_outputs(n_inputs, n_parallel, ret)
     for i, (squared, input_id, function_call_id) in enumerate(outputs):
         assert squared == 42**2
@@ -860,7 +867,7 @@ def test_concurrent_inputs_async_function(unix_servicer):
     n_inputs = 18
     n_parallel = 6
 
-    t0 = time.time()
+    t0 = time.monotonic()
     ret = _run_container(
         unix_servicer,
         "test.supports.functions",
@@ -870,7 +877,7 @@ def test_concurrent_inputs_async_function(unix_servicer):
     )
 
     expected_execution = n_inputs / n_parallel * SLEEP_TIME
-    assert expected_execution <= time.time() - t0 < expected_execution + EXTRA_TOLERANCE_DELAY
+    assert expected_execution <= time.monotonic() - t0 < expected_execution + EXTRA_TOLERANCE_DELAY
     outputs = _unwrap_concurrent_input_outputs(n_inputs, n_parallel, ret)
     for i, (squared, input_id, function_call_id) in enumerate(outputs):
         assert squared == 42**2
@@ -9,9 +9,10 @@ from synchronicity.exceptions import UserCodeException
 
 import modal
 from modal import Image, Mount, NetworkFileSystem, Proxy, Stub, web_endpoint
+from modal._utils.blob_utils import BLOB_MAX_PARALLELISM
 from modal._vendor import cloudpickle
 from modal.exception import ExecutionError, InvalidError
-from modal.functions import Function, FunctionCall, gather
+from modal.functions import MAP_INVOCATION_CHUNK_SIZE, MAP_INVOCATION_INPUT_BUFFER_SIZE, Function, FunctionCall, gather
 from modal.runner import deploy_stub
 from modal_proto import api_pb2
 
@@ -66,6 +67,33 @@ def test_map(client, servicer, slow_put_inputs):
         assert len(servicer.cleared_function_calls) == 2
 
 
+@pytest.mark.timeout(120)
+def test_map_more_inputs_than_buffer(client, servicer):
+    # slow down the server so that the input generator would run far ahead if it wasn't bounded
+    servicer.slow_put_inputs = True
+    servicer.slow_put_inputs_delay = 0.25
+
+    stub = Stub()
+    dummy_modal = stub.function()(dummy)
+
+    n = 5 * MAP_INVOCATION_INPUT_BUFFER_SIZE + 1
+    n_inputs_start = servicer.n_inputs
+    max_ahead = 0
+
+    def gen():
+        # track how far the input generator gets ahead of the inputs the server has received
+        nonlocal max_ahead
+        for i in range(n):
+            max_ahead = max(max_ahead, i - (servicer.n_inputs - n_inputs_start))
+            yield i
+
+    with stub.run(client=client):
+        assert list(dummy_modal.map(gen(), range(n))) == [2 * i**2 for i in range(n)]
+
+    # at most a full input buffer, the batch being assembled and the inputs being created can be ahead
+    assert max_ahead <= MAP_INVOCATION_INPUT_BUFFER_SIZE + MAP_INVOCATION_CHUNK_SIZE + BLOB_MAX_PARALLELISM
+
+
 _side_effect_count = 0
 
 
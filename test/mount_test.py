@@ -9,7 +9,7 @@ from pathlib import Path
 from modal import Stub
 from modal._utils.blob_utils import LARGE_FILE_LIMIT
 from modal.exception import ModuleNotMountable
-from modal.mount import Mount
+from modal.mount import Mount, module_mount_condition
 
 
 @pytest.mark.asyncio
@@ -160,3 +160,30 @@ def test_chained_entries(test_dir):
     m.update(b"A")
     assert files[0].sha256_hex == m.hexdigest()
     assert files[0].use_blob is False
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="symlinks require privileges on Windows")
+def test_local_dir_recursive_walk(tmpdir):
+    tmpdir.join("a.py").write("a")
+    tmpdir.mkdir("sub").join("b.py").write("b")
+    tmpdir.join("sub").mkdir("deeper").join("c.py").write("c")
+    other = tmpdir.mkdir("other")
+    other.join("d.py").write("d")
+    os.symlink(other, tmpdir.join("sub", "linked"))
+
+    def mount_paths(recursive):
+        m = Mount.from_local_dir(Path(tmpdir), remote_path="/", recursive=recursive)
+        return {remote.as_posix() for _, remote in m.entries[0].get_files_to_upload()}
+
+    # symlinked directories aren't followed, same as os.walk
+    assert mount_paths(True) == {"/a.py", "/sub/b.py", "/sub/deeper/c.py", "/other/d.py"}
+    assert mount_paths(False) == {"/a.py"}
+
+
+def test_module_mount_condition():
+    sep = os.sep
+    assert module_mount_condition(sep.join(["", "pkg", "mod.py"]))
+    assert module_mount_condition(sep.join(["", "pkg", ".hidden_file.py"]))  # only directories are checked
+    assert not module_mount_condition(sep.join(["", "pkg", "mod.pyc"]))
+    assert not module_mount_condition(sep.join(["", "pkg", "__pycache__", "mod.py"]))
+    assert not module_mount_condition(sep.join(["", "pkg", ".git", "sub", "HEAD"]))
@@ -32,6 +32,10 @@ def test_new_hydrated(client):
     with pytest.raises(InvalidError):
         _Object._new_hydrated("xy-123", client, None)
 
+    for bad_id in ["qu123", "qu-12-3"]:
+        with pytest.raises(InvalidError):
+            _Object._new_hydrated(bad_id, client, None)
+
 
 def test_constructor():
     with pytest.raises(InvalidError) as excinfo:
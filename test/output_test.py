@@ -0,0 +1,34 @@
+# Copyright Modal Labs 2024
+from modal._output import LineBufferedOutput
+
+
+def test_line_buffered_output():
+    lines = []
+    stream = LineBufferedOutput(lines.append)
+
+    stream.write("partial")
+    assert lines == []
+
+    stream.write(" line\nsecond\r\nthird")
+    assert lines == ["partial line\nsecond\r\n"]
+
+    stream.write(" done\n")
+    assert lines[-1] == "third done\n"
+
+    stream.write("no newline")
+    stream.finalize()
+    assert lines[-1] == "no newline"
+    assert len(lines) == 3
+
+
+def test_line_buffered_output_carriage_return():
+    lines = []
+    stream = LineBufferedOutput(lines.append)
+
+    stream.write("progress 50%\r")
+    assert lines == ["progress 50%\n"]
+
+    stream.write("progress")
+    stream.write(" 100%\n")
+    assert lines[-1] == "\x1b[1A\rprogress 100%\n"
+    assert len(lines) == 2
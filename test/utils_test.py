@@ -1,11 +1,14 @@
 # Copyright Modal Labs 2022
 import asyncio
+import base64
 import hashlib
 import io
 import pytest
+import tracemalloc
 
 from modal._utils.app_utils import is_valid_app_name, is_valid_subdomain_label
 from modal._utils.blob_utils import BytesIOSegmentPayload
+from modal._utils.hash_utils import get_sha256_hex, get_upload_hashes
 
 
 def test_subdomain_label():
@@ -24,6 +27,13 @@ def test_app_name():
     assert not is_valid_app_name("a" * 65)
 
 
+def test_upload_hashes_with_known_sha256():
+    data = io.BytesIO(b"abc123" * 1000)
+    hashes = get_upload_hashes(data)
+    assert get_upload_hashes(data, sha256_hex=get_sha256_hex(data)) == hashes
+    assert hashes.md5_base64 == base64.b64encode(hashlib.md5(data.getvalue()).digest()).decode("ascii")
+
+
 @pytest.mark.asyncio
 async def test_file_segment_payloads():
     data = io.BytesIO(b"abc123")
@@ -86,3 +96,27 @@ async def test_file_segment_payloads_concurrency():
     p2 = BytesIOSegmentPayload(data2, len(data.getvalue()) // 2, len(data.getvalue()) // 2, chunk_size=100 * 1024)
     await asyncio.gather(p2.write(out2), p1.write(out1))  # type: ignore
     assert out1.value + out2.value == data.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_file_segment_payload_no_copy():
+    payload = b"x" * (8 * 1024 * 1024)  # 8 MiB, fits in a single read chunk
+
+    class DummyOutput:  # AbstractStreamWriter
+        def __init__(self):
+            self.num_bytes = 0
+
+        async def write(self, chunk: bytes):
+            self.num_bytes += len(chunk)
+
+    out = DummyOutput()
+    segment = BytesIOSegmentPayload(io.BytesIO(payload), 0, len(payload))
+    await asyncio.get_running_loop().run_in_executor(None, lambda: None)  # warm up the default executor
+    tracemalloc.start()
+    try:
+        await segment.write(out)  # type: ignore
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert out.num_bytes == len(payload)
+    assert peak < 1024 * 1024  # the payload shouldn't be copied on its way out